@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Board Rendering Benchmark
+=========================
+
+Compares the classic per-cell board drawing in ``TetrisGame.draw_grid``
+with the palette-indexed renderer (one scale and two blits per frame).
+
+How to Run:
+----------
+    python benchmarks/board_render.py
+    python benchmarks/board_render.py --fill 0.9 --frames 2000
+
+Runs without a window by using the SDL dummy video driver.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import Config  # noqa: E402
+from src.game import TetrisGame  # noqa: E402
+from src.leaderboard import Leaderboard  # noqa: E402
+
+
+def fill_board(grid, fraction, seed):
+    """Fill a fraction of the board's lower half with random colors."""
+    rng = random.Random(seed)
+    for y in range(grid.rows // 2, grid.rows):
+        for x in range(grid.cols):
+            if rng.random() < fraction:
+                grid.set_cell(x, y, rng.choice(Config.COLORS))
+
+
+def time_draw(game, frames):
+    """
+    Time ``draw_grid`` over a number of frames.
+    
+    Returns:
+        float: Microseconds per frame
+    """
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.draw_grid()
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    """Run both renderers on the same board and print the timings."""
+    parser = argparse.ArgumentParser(description="Board rendering benchmark")
+    parser.add_argument("--frames", type=int, default=1000)
+    parser.add_argument("--fill", type=float, default=0.7,
+                        help="Fraction of lower-half cells filled")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    leaderboard = Leaderboard(":memory:")
+    for palette in (False, True):
+        game = TetrisGame(leaderboard=leaderboard, palette_renderer=palette)
+        fill_board(game.grid, args.fill, args.seed)
+        name = "palette" if palette else "per-cell"
+        print(f"{name:>9}: {time_draw(game, args.frames):8.1f} us/frame")
+    leaderboard.close()
+
+
+if __name__ == "__main__":
+    main()
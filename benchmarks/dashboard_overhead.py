@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Dashboard Overhead Benchmark
+============================
+
+Measures what publishing to the shared-memory dashboard costs a worker:
+
+- the time of one ``SharedBoards.publish`` and one ``read`` call
+- AutoPlayer pieces per second without publishing, and with a publish
+  after every piece while another process reads all slots at 60 FPS
+  (on a machine with few cores the reader competes for CPU time, and
+  run-to-run noise is larger than the publishing cost itself)
+
+How to Run:
+----------
+    python benchmarks/dashboard_overhead.py
+    python benchmarks/dashboard_overhead.py --pieces 20000
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.dashboard import SharedBoards  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+
+
+def play(pieces, boards=None):
+    """
+    Place pieces with the AutoPlayer, publishing each one if asked.
+    
+    Returns:
+        float: Pieces per second
+    """
+    engine = GameEngine(seed=0)
+    player = AutoPlayer()
+    start = time.perf_counter()
+    for count in range(1, pieces + 1):
+        if engine.game_over:
+            engine.reset_game()
+        engine.place(*player.choose(engine))
+        if boards is not None:
+            boards.publish(0, engine, 1, count, 0.0)
+    return pieces / (time.perf_counter() - start)
+
+
+def read_loop(name, stop):
+    """Read every slot 60 times per second until told to stop."""
+    boards = SharedBoards(name)
+    views = boards.views()
+    while not stop.is_set():
+        for view in views:
+            view.refresh()
+        time.sleep(1 / 60)
+    boards.close()
+
+
+def main():
+    """Report the cost of publishing and reading."""
+    parser = argparse.ArgumentParser(description="Dashboard overhead")
+    parser.add_argument("--pieces", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=64,
+                        help="Slots in the segment")
+    args = parser.parse_args()
+    
+    boards = SharedBoards(create=True, workers=args.workers)
+    try:
+        engine = GameEngine(seed=0)
+        calls = 100000
+        publish = timeit.timeit(
+            lambda: boards.publish(0, engine, 1, 1, 0.0), number=calls
+        )
+        read = timeit.timeit(lambda: boards.read(0), number=calls)
+        print(f"publish: {publish / calls * 1e6:.2f} us, "
+              f"read: {read / calls * 1e6:.2f} us")
+        
+        baseline = play(args.pieces)
+        stop = multiprocessing.Event()
+        reader = multiprocessing.Process(target=read_loop,
+                                         args=(boards.name, stop))
+        reader.start()
+        published = play(args.pieces, boards)
+        stop.set()
+        reader.join()
+        print(f"without dashboard: {baseline:8,.0f} pieces/s")
+        print(f"   with dashboard: {published:8,.0f} pieces/s "
+              f"({published / baseline - 1:+.1%})")
+        print(f"publishing takes {publish / calls * baseline:.2%} of the "
+              f"time of a piece")
+    finally:
+        boards.close()
+        boards.unlink()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Grid Scaling Benchmark
+======================
+
+Measures how collision checks, piece locking and line clears scale with
+board size, from the classic 10x16 board up to 64x1000 and beyond.
+
+Each board is played through the headless GameEngine, so the numbers
+include the real rules, not just Grid calls. Two scenarios:
+
+- ``random``: a random bot moves, turns and drops pieces; games restart
+  on top out, and "lines" adds up every game
+- ``clears``: a tall stack that can never clear fills half the board,
+  with four rows above it missing one cell; every piece is an upright
+  I dropped into that gap, so every lock clears four rows at the top of
+  a tall stack. Only the drop itself is timed, not refilling the rows.
+
+How to Run:
+----------
+    python benchmarks/grid_scaling.py
+    python benchmarks/grid_scaling.py --sizes 10x16 64x1000 256x4000
+    python benchmarks/grid_scaling.py --scenario clears --sizes 64x4000
+
+Educational Purpose:
+-------------------
+Learn about:
+- Benchmarking with time.perf_counter
+- How data layout (bitmasks) affects algorithm scaling
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import Config  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.tetromino import Tetromino  # noqa: E402
+
+DEFAULT_SIZES = ["10x16", "10x1000", "64x16", "64x1000", "256x1000"]
+
+
+def parse_size(text):
+    """
+    Parse a ``COLSxROWS`` string.
+    
+    Args:
+        text (str): Board size such as "64x1000"
+    
+    Returns:
+        tuple: (cols, rows)
+    """
+    cols, rows = text.lower().split("x")
+    return int(cols), int(rows)
+
+
+def run_board(cols, rows, pieces, seed):
+    """
+    Play random pieces on one board size and time them.
+    
+    Args:
+        cols (int): Board width
+        rows (int): Board height
+        pieces (int): Number of pieces to drop
+        seed (int): Random seed for reproducible runs
+    
+    Returns:
+        dict: Timing results for this board
+    """
+    rng = random.Random(seed)
+    engine = GameEngine(rows, cols, seed=seed)
+    checks = 0
+    dropped = 0
+    lines = 0
+    
+    start = time.perf_counter()
+    while dropped < pieces:
+        if engine.game_over:
+            lines += engine.lines_cleared
+            engine.reset_game()
+        for _ in range(rng.randint(0, 3)):
+            engine.rotate()
+        direction = rng.choice((-1, 1))
+        for _ in range(rng.randint(0, cols // 2)):
+            checks += 1
+            if not engine.move(direction):
+                break
+        engine.hard_drop()
+        dropped += 1
+    elapsed = time.perf_counter() - start
+    
+    return {
+        "size": f"{cols}x{rows}",
+        "pieces_per_sec": dropped / elapsed,
+        "us_per_piece": elapsed / dropped * 1e6,
+        "lines": lines + engine.lines_cleared,
+        "moves": checks,
+    }
+
+
+def fill_row(grid, y, holes):
+    """Fill one row except for the given columns."""
+    for x in range(grid.cols):
+        if x not in holes:
+            grid.set_cell(x, y, Config.GARBAGE_COLOR)
+
+
+def run_clears(cols, rows, pieces, seed):
+    """
+    Clear four rows with every piece on top of a tall stack.
+    
+    Args:
+        cols (int): Board width (at least 3)
+        rows (int): Board height (at least 12)
+        pieces (int): Number of pieces to drop
+        seed (int): Random seed for reproducible runs
+    
+    Returns:
+        dict: Timing results for this board
+    """
+    engine = GameEngine(rows, cols, seed=seed)
+    grid = engine.grid
+    stack = rows // 2
+    for y in range(rows - stack, rows):
+        fill_row(grid, y, (1, 2))
+    well = range(rows - stack - 4, rows - stack)
+    elapsed = 0.0
+    
+    for _ in range(pieces):
+        for y in well:
+            fill_row(grid, y, (0,))
+        engine.current_piece = Tetromino(0, cols, rng=engine.rng)
+        start = time.perf_counter()
+        engine.place(1, 0)
+        elapsed += time.perf_counter() - start
+    
+    return {
+        "size": f"{cols}x{rows}",
+        "pieces_per_sec": pieces / elapsed,
+        "us_per_piece": elapsed / pieces * 1e6,
+        "lines": engine.lines_cleared,
+        "moves": 0,
+    }
+
+
+SCENARIOS = {"random": run_board, "clears": run_clears}
+
+
+def main():
+    """Run the benchmark for every requested board size."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", nargs="+", default=DEFAULT_SIZES,
+                        help="Board sizes as COLSxROWS")
+    parser.add_argument("--pieces", type=int, default=20000,
+                        help="Pieces dropped per board size")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--scenario", choices=sorted(SCENARIOS),
+                        default="random")
+    args = parser.parse_args()
+    
+    run = SCENARIOS[args.scenario]
+    print(f"{'board':>10} {'pieces/s':>12} {'us/piece':>10} {'lines':>8}")
+    for text in args.sizes:
+        cols, rows = parse_size(text)
+        result = run(cols, rows, args.pieces, args.seed)
+        print(f"{result['size']:>10} {result['pieces_per_sec']:>12.0f} "
+              f"{result['us_per_piece']:>10.1f} {result['lines']:>8}")
+
+
+if __name__ == "__main__":
+    main()
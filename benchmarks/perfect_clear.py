@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Perfect Clear Solver Benchmark
+==============================
+
+Runs the perfect clear solver on random piece queues from an empty
+board and reports how many it solves and how fast it searches. Every
+solution is replayed with ``GameEngine.place`` to check that it really
+empties the board.
+
+How to Run:
+----------
+    python benchmarks/perfect_clear.py
+    python benchmarks/perfect_clear.py --puzzles 50 --height 4 --budget 5
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.config import Config  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.solver import solve_engine  # noqa: E402
+from src.tetromino import Tetromino  # noqa: E402
+
+
+def replay(engine, queue, placements):
+    """
+    Play a solution, feeding the queue as the next pieces.
+    
+    Returns:
+        bool: True if the board ends up empty
+    """
+    for index, (rotation, x) in enumerate(placements):
+        engine.place(rotation, x)
+        if index < len(queue):
+            engine.next_piece = Tetromino(queue[index], engine.grid.cols)
+    return not any(engine.grid.row_masks)
+
+
+def main():
+    """Solve random puzzles and print a summary."""
+    parser = argparse.ArgumentParser(description="Perfect clear benchmark")
+    parser.add_argument("--puzzles", type=int, default=20)
+    parser.add_argument("--height", type=int, default=4,
+                        help="Highest stack the solver may build")
+    parser.add_argument("--queue", type=int, default=10,
+                        help="Pieces after the current and next piece")
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="Seconds per puzzle")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    rng = random.Random(args.seed)
+    solved = timed_out = nodes = 0
+    start = time.perf_counter()
+    for puzzle in range(args.puzzles):
+        engine = GameEngine(seed=args.seed + puzzle)
+        queue = [rng.randrange(len(Config.SHAPES)) for _ in range(args.queue)]
+        result = solve_engine(engine, queue, args.height, args.budget)
+        nodes += result.nodes
+        timed_out += result.timed_out
+        if result.solved:
+            if not replay(engine, queue, result.placements):
+                raise AssertionError(f"Puzzle {puzzle}: solution does not "
+                                     f"clear the board")
+            solved += 1
+    elapsed = time.perf_counter() - start
+    
+    print(f"{solved}/{args.puzzles} solved, {timed_out} timed out, "
+          f"{nodes} nodes in {elapsed:.1f} s "
+          f"({nodes / elapsed:,.0f} nodes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Placement Cache Benchmark
+=========================
+
+Plays the same AutoPlayer games three times:
+
+- without a cache
+- with a new (cold) cache file, which fills up while playing
+- again after reopening the file (warm), as a later run would
+
+and reports how many decisions were answered by the cache and how fast
+the games ran. All three runs must produce the same scores.
+
+How to Run:
+----------
+    python benchmarks/placement_cache.py
+    python benchmarks/placement_cache.py --games 200 --max-pieces 50
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.autoplayer import play_game, policy_fingerprint  # noqa: E402
+from src.placement_cache import PlacementCache  # noqa: E402
+
+
+def run(games, max_pieces, cache=None):
+    """
+    Play one game per seed.
+    
+    Returns:
+        tuple: (results, pieces per second)
+    """
+    start = time.perf_counter()
+    results = [play_game(seed=seed, max_pieces=max_pieces, cache=cache)
+               for seed in range(games)]
+    pieces = sum(result[2] for result in results)
+    return results, pieces / (time.perf_counter() - start)
+
+
+def main():
+    """Compare games with and without the placement cache."""
+    parser = argparse.ArgumentParser(description="Placement cache benchmark")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--max-pieces", type=int, default=100)
+    parser.add_argument("--memory-size", type=int, default=4096,
+                        help="Positions in the in-memory LRU")
+    args = parser.parse_args()
+    
+    path = os.path.join(tempfile.mkdtemp(), "placements.cache")
+    policy = policy_fingerprint()
+    
+    baseline, speed = run(args.games, args.max_pieces)
+    print(f"{'no cache':>10}: {speed:8,.0f} pieces/s")
+    
+    for name in ("cold", "warm"):
+        cache = PlacementCache(path, policy, memory_size=args.memory_size)
+        results, speed = run(args.games, args.max_pieces, cache)
+        if results != baseline:
+            raise AssertionError(f"{name} cache changed the games")
+        lookups = cache.hits + cache.disk_hits + cache.misses
+        print(f"{name:>10}: {speed:8,.0f} pieces/s, "
+              f"{cache.hits / lookups:6.1%} memory hits, "
+              f"{cache.disk_hits / lookups:6.1%} file hits, "
+              f"{len(cache):,} positions stored")
+        cache.close()
+    print(f"cache file: {os.path.getsize(path) / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
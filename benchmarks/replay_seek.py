@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Replay Seeking Benchmark
+========================
+
+Records a long replay the way a person plays: for every piece the
+AutoPlayer picks a target, the piece is rotated and moved there one key
+press at a time and then falls with gravity, one 60 FPS tick per input.
+That is hundreds of inputs per piece.
+
+It then seeks to random points, once by re-simulating from the start
+and once with the keyframe index, checks that both reach the same
+state, and reports how long a seek takes.
+
+How to Run:
+----------
+    python benchmarks/replay_seek.py
+    python benchmarks/replay_seek.py --pieces 2000 --piece-interval 100
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import snapshot  # noqa: E402
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.config import Config  # noqa: E402
+from src.replay import Replay, ReplayRecorder, index_path  # noqa: E402
+
+
+def record(path, pieces, seed, piece_interval, step_interval):
+    """
+    Record a game played with key presses and gravity.
+    
+    Returns:
+        ReplayRecorder: The finished recorder
+    """
+    recorder = ReplayRecorder(path, seed=seed,
+                              piece_interval=piece_interval,
+                              step_interval=step_interval)
+    engine = recorder.engine
+    player = AutoPlayer()
+    tick = 1000 // Config.FPS
+    while not engine.game_over and recorder.pieces < pieces:
+        rotation, x = player(engine)
+        for _ in range(rotation):
+            recorder.rotate()
+        while engine.current_piece.x != x:
+            if not recorder.move(1 if x > engine.current_piece.x else -1):
+                break
+        piece = engine.current_piece
+        while engine.current_piece is piece:
+            recorder.update(tick)
+    recorder.close()
+    return recorder
+
+
+def main():
+    """Record a replay and compare linear and indexed seeking."""
+    parser = argparse.ArgumentParser(description="Replay seek benchmark")
+    parser.add_argument("--pieces", type=int, default=1000)
+    parser.add_argument("--seeks", type=int, default=20)
+    parser.add_argument("--piece-interval", type=int, default=1000)
+    parser.add_argument("--step-interval", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "game.rpl")
+        start = time.perf_counter()
+        recorder = record(path, args.pieces, args.seed, args.piece_interval,
+                          args.step_interval)
+        print(f"Recorded {recorder.pieces} pieces, {recorder.steps:,} inputs "
+              f"in {time.perf_counter() - start:.1f} s "
+              f"({os.path.getsize(path) / 1024:.0f} KB replay, "
+              f"{os.path.getsize(index_path(path)) / 1024:.0f} KB index)")
+        
+        indexed = Replay(path)
+        os.rename(index_path(path), path + ".bak")
+        linear = Replay(path)
+        os.rename(path + ".bak", index_path(path))
+        print(f"{len(indexed.keyframes)} keyframes")
+        
+        rng = random.Random(args.seed)
+        targets = [rng.randrange(indexed.length + 1)
+                   for _ in range(args.seeks)]
+        times = {"linear": 0.0, "indexed": 0.0}
+        for target in targets:
+            start = time.perf_counter()
+            linear.restart()
+            linear.seek(target)
+            times["linear"] += time.perf_counter() - start
+            
+            start = time.perf_counter()
+            indexed.seek(target)
+            times["indexed"] += time.perf_counter() - start
+            
+            if (snapshot.save_state(linear.engine)
+                    != snapshot.save_state(indexed.engine)):
+                raise AssertionError(f"Seek to input {target} differs")
+        
+        for name, total in times.items():
+            print(f"{name:>8}: {total / args.seeks * 1000:9.2f} ms per seek")
+        print(f"speedup: {times['linear'] / times['indexed']:.0f}x")
+        
+        linear.close()
+        indexed.close()
+
+
+if __name__ == "__main__":
+    main()
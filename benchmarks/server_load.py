@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Game Server Load Generator
+==========================
+
+Opens many concurrent client connections to ``src.server``, sends
+random inputs at a fixed rate from each one, and reports how the
+server coped: sessions per CPU core and tick latency percentiles.
+
+How to Run:
+----------
+    # Start a server in a separate process and load it
+    python benchmarks/server_load.py --spawn --clients 2000 --duration 20
+    
+    # Or load a server that is already running
+    python -m src.server --port 8765 &
+    python benchmarks/server_load.py --port 8765 --clients 500
+
+Educational Purpose:
+-------------------
+Learn about:
+- Writing asyncio network clients
+- Load testing and interpreting percentiles
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+CLIENT_ACTIONS = [b"left\n", b"right\n", b"rotate\n", b"down\n", b"drop\n"]
+
+
+def raise_file_limit():
+    """Allow as many open sockets as the OS permits (best effort)."""
+    try:
+        import resource
+    except ImportError:
+        return
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft < hard:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+
+
+async def run_client(host, port, stop_at, input_rate, seed, counters):
+    """
+    Play one random game session until ``stop_at``.
+    
+    Args:
+        host (str): Server address
+        port (int): Server port
+        stop_at (float): perf_counter time to disconnect
+        input_rate (float): Actions sent per second
+        seed (int): Random seed for this client
+        counters (dict): Shared totals updated in place
+    """
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    counters["connected"] += 1
+    
+    async def read_updates():
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            counters["updates"] += 1
+            counters["bytes"] += len(line)
+            if b'"game_over":true' in line:
+                counters["games"] += 1
+                writer.write(b"reset\n")
+    
+    reader_task = asyncio.create_task(read_updates())
+    interval = 1.0 / input_rate
+    try:
+        # Spread clients out so they do not all send on the same tick
+        await asyncio.sleep(rng.random() * interval)
+        while time.perf_counter() < stop_at:
+            writer.write(rng.choice(CLIENT_ACTIONS))
+            counters["inputs"] += 1
+            await asyncio.sleep(interval)
+        writer.write(b"quit\n")
+        await writer.drain()
+    finally:
+        reader_task.cancel()
+        writer.close()
+
+
+async def query_stats(host, port):
+    """
+    Ask the server for its load statistics.
+    
+    Returns:
+        dict: The server's ``stats`` reply
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b"stats\n")
+    try:
+        while True:
+            line = await reader.readline()
+            if not line:
+                return {}
+            message = json.loads(line)
+            if "stats" in message:
+                return message["stats"]
+    finally:
+        writer.close()
+
+
+async def wait_for_server(host, port, timeout=10.0):
+    """Retry connecting until the server accepts connections."""
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.write(b"quit\n")
+            writer.close()
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def run_load(args):
+    """Connect all clients, run for the duration and print a report."""
+    await wait_for_server(args.host, args.port)
+    
+    counters = {"connected": 0, "inputs": 0, "updates": 0,
+                "bytes": 0, "games": 0}
+    stop_at = time.perf_counter() + args.ramp + args.duration
+    clients = []
+    for index in range(args.clients):
+        clients.append(asyncio.create_task(run_client(
+            args.host, args.port, stop_at, args.input_rate,
+            args.seed + index, counters
+        )))
+        # Ramp up gradually rather than opening every socket at once
+        if args.ramp and index % 50 == 49:
+            await asyncio.sleep(args.ramp * 50 / args.clients)
+    
+    # Measure near the end, while every client is still connected
+    await asyncio.sleep(max(0.0, stop_at - time.perf_counter() - 1.0))
+    stats = await query_stats(args.host, args.port)
+    await asyncio.gather(*clients, return_exceptions=True)
+    
+    sessions = stats.get("sessions", 0)
+    cpu_util = stats.get("cpu_util", 0.0)
+    print(f"clients connected : {counters['connected']}")
+    print(f"server sessions   : {sessions}")
+    print(f"server cpu        : {cpu_util * 100:.1f}% of one core")
+    if cpu_util > 0:
+        print(f"sessions per core : {sessions / cpu_util:.0f}")
+    print(f"tick p50 / p99    : {stats.get('p50_tick_ms', 0):.2f} / "
+          f"{stats.get('p99_tick_ms', 0):.2f} ms "
+          f"(max {stats.get('max_tick_ms', 0):.2f} ms)")
+    print(f"inputs sent       : {counters['inputs']}")
+    print(f"updates received  : {counters['updates']} "
+          f"({counters['bytes'] / 1e6:.1f} MB)")
+    print(f"games finished    : {counters['games']}")
+
+
+def main():
+    """Parse arguments, optionally spawn a server, and run the load."""
+    parser = argparse.ArgumentParser(description="Load test the game server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--duration", type=float, default=15.0,
+                        help="Seconds of full load after ramp-up")
+    parser.add_argument("--ramp", type=float, default=3.0,
+                        help="Seconds spent opening connections")
+    parser.add_argument("--input-rate", type=float, default=5.0,
+                        help="Actions per second per client")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn", action="store_true",
+                        help="Start a server subprocess for the test")
+    args = parser.parse_args()
+    
+    raise_file_limit()
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "src.server", "--host", args.host,
+             "--port", str(args.port)],
+            cwd=ROOT, stdout=subprocess.DEVNULL
+        )
+    try:
+        asyncio.run(run_load(args))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Spectator Wall Benchmark
+========================
+
+Draws a WallRenderer full of AutoPlayer games offscreen and measures
+the time per frame, once with per-board dirty tracking (only boards
+that changed are redrawn) and once redrawing every board every frame.
+
+Each bot places a piece every ``--interval`` frames, staggered, so a
+few boards change per frame - like a lobby wall at 60 FPS. At the end
+the dirty-tracked surface is compared with a full redraw to check that
+no change was missed.
+
+How to Run:
+----------
+    python benchmarks/spectator_wall.py
+    python benchmarks/spectator_wall.py --boards 16 36 64 --size 1920 1080
+"""
+
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pygame  # noqa: E402
+
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.wall import WallRenderer  # noqa: E402
+
+# pygame.image.tobytes is the pygame >= 2.1.3 name of tostring
+surface_bytes = (getattr(pygame.image, "tobytes", None)
+                 or pygame.image.tostring)
+
+
+def run(boards, size, frames, interval, full):
+    """
+    Play and draw a wall.
+    
+    Returns:
+        tuple: (mean draw ms, worst draw ms, pixels drawn per frame,
+                final surface, games)
+    """
+    games = [GameEngine(seed=seed) for seed in range(boards)]
+    wall = WallRenderer(size, games)
+    surface = pygame.Surface(size)
+    player = AutoPlayer()
+    total = worst = 0.0
+    pixels = 0
+    
+    for frame in range(frames):
+        for index, game in enumerate(games):
+            if (frame + index) % interval == 0:
+                if game.game_over:
+                    game.reset_game()
+                else:
+                    game.place(*player.choose(game))
+        
+        start = time.perf_counter()
+        if full:
+            wall.invalidate()
+        rects = wall.draw(surface)
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        worst = max(worst, elapsed)
+        pixels += sum(rect.width * rect.height for rect in rects)
+    return total / frames * 1000, worst * 1000, pixels // frames, surface, games
+
+
+def main():
+    """Compare dirty tracking with full redraws."""
+    parser = argparse.ArgumentParser(description="Spectator wall benchmark")
+    parser.add_argument("--boards", type=int, nargs="+", default=[16, 36, 64])
+    parser.add_argument("--size", type=int, nargs=2, default=(1280, 720))
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--interval", type=int, default=10,
+                        help="Frames between two pieces of one bot")
+    args = parser.parse_args()
+    
+    pygame.init()
+    size = tuple(args.size)
+    print(f"{size[0]}x{size[1]}, {args.frames} frames, a piece every "
+          f"{args.interval} frames per bot")
+    print(f"{'boards':>6} {'mode':>6} {'mean ms':>8} {'worst ms':>9} "
+          f"{'px/frame':>10}")
+    for boards in args.boards:
+        for mode in ("dirty", "full"):
+            mean, worst, pixels, surface, games = run(
+                boards, size, args.frames, args.interval, mode == "full"
+            )
+            print(f"{boards:6d} {mode:>6} {mean:8.3f} {worst:9.3f} "
+                  f"{pixels:10,d}")
+            if mode == "dirty":
+                reference = pygame.Surface(size)
+                WallRenderer(size, games).draw(reference)
+                if (surface_bytes(reference, "RGB")
+                        != surface_bytes(surface, "RGB")):
+                    raise AssertionError("Dirty tracking missed a change")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
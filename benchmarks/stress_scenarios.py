@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+Stress Scenarios for the Full Game Loop
+=======================================
+
+Drives a headless ``TetrisGame`` through the same steps as
+``run_playing`` (``handle_input``, ``update``, ``render``) as fast as
+possible, under conditions the game normally never reaches:
+
+- near_full:        stack filled up to a few rows below the top
+- swiss_cheese:     lower three quarters filled with random holes
+- alternating_full: lower half alternating full rows and rows with
+                    holes, with a shaft cut for the falling piece: when
+                    it lands it completes every row it fills, so each
+                    lock clears rows (a lock can only complete the
+                    rows its own piece is in)
+- max_gravity:      fall speed of 1 ms, far below Config.MIN_FALL_SPEED
+- bot_input:        hundreds of key presses per second, posted as real
+                    pygame events
+- worst_case:       near_full + max_gravity + bot_input together
+
+A scenario's board is rebuilt (in a fresh game) when the game ends and
+also as soon as its condition is gone - for example once the piece of
+alternating_full has cleared its rows, or the stack of near_full has
+been cleared down - so each scenario stays in its pathological state
+for the whole run. Skipping ``clock.tick`` removes the frame-rate cap;
+every tick still advances the game by one frame (1000 / FPS ms).
+
+For each scenario it reports:
+- Simulated ticks per second (wall clock)
+- Mean, p99 and worst frame time
+- Boards built and pieces locked
+- Generation 0 counts per frame and per lock: the garbage collector's
+  counter goes up for every new container object (list, dict, tuple,
+  instance...) and down for every one freed, and a collection runs when
+  it passes ``gc.get_threshold()[0]`` (collections are added back). So
+  this counts the containers a frame or lock allocates and keeps past
+  its end - the ones that lead to collections - not every short-lived
+  temporary; use --tracemalloc to see where memory is kept.
+- Memory blocks allocated and not freed by the end (leak indicator)
+- Garbage collections per generation
+- With --tracemalloc: peak traced memory, and the source lines that
+  allocated the most memory still alive at the end (slows everything
+  down)
+
+How to Run:
+----------
+    python benchmarks/stress_scenarios.py
+    python benchmarks/stress_scenarios.py --ticks 5000 --input-rate 600
+    python benchmarks/stress_scenarios.py --scenarios worst_case --palette
+"""
+
+import argparse
+import array
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pygame  # noqa: E402
+
+from src.config import Config  # noqa: E402
+from src.game import TetrisGame  # noqa: E402
+from src.leaderboard import Leaderboard  # noqa: E402
+
+BOT_KEYS = [pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN]
+
+
+def fill_rows(grid, start, holes, rng):
+    """
+    Fill rows from ``start`` to the bottom, leaving random holes.
+    
+    Args:
+        grid (Grid): Board to fill
+        start (int): First row to fill
+        holes (float): Chance of each cell staying empty
+        rng (random.Random): Random generator
+    """
+    for y in range(start, grid.rows):
+        # Keep one gap per row so no row starts out full
+        gap = rng.randrange(grid.cols)
+        for x in range(grid.cols):
+            if x != gap and rng.random() >= holes:
+                grid.set_cell(x, y, rng.choice(Config.COLORS))
+
+
+def near_full(game, rng):
+    """Stack reaching up to four rows below the top."""
+    fill_rows(game.grid, min(4, game.grid.rows - 1), 0.0, rng)
+
+
+def is_near_full(game):
+    """The stack is still within six rows of the top."""
+    return game.grid.top <= 6
+
+
+def swiss_cheese(game, rng):
+    """Lower three quarters of the board full of holes."""
+    fill_rows(game.grid, game.grid.rows // 4, 0.4, rng)
+
+
+def is_swiss_cheese(game):
+    """Clears have not lowered the stack by more than two rows."""
+    return game.grid.top <= game.grid.rows // 4 + 2
+
+
+def alternating_full(game, rng):
+    """
+    Alternating full and holey rows in the lower half, with a shaft the
+    current piece falls through to complete the rows at the bottom.
+    """
+    grid = game.grid
+    piece = game.current_piece
+    landing = grid.rows - len(piece.shape)
+    
+    # Lowest cell of the piece in each of its columns, where it lands
+    shaft = {}
+    for dy, row in enumerate(piece.shape):
+        for dx, cell in enumerate(row):
+            if cell:
+                shaft[piece.x + dx] = landing + dy
+    
+    for y in range(grid.rows // 2, grid.rows):
+        full = y >= landing or (y - grid.rows // 2) % 2 == 0
+        for x in range(grid.cols):
+            if y <= shaft.get(x, -1):
+                continue
+            if full or rng.random() < 0.5:
+                grid.set_cell(x, y, rng.choice(Config.COLORS))
+
+
+def waiting_for_clear(game):
+    """The piece the shaft was cut for has not landed yet."""
+    return game.lines_cleared == 0
+
+
+# name: (board setup, condition the board must keep, fall speed
+#        override in ms, bot input)
+SCENARIOS = {
+    "baseline": (None, None, None, False),
+    "near_full": (near_full, is_near_full, None, False),
+    "swiss_cheese": (swiss_cheese, is_swiss_cheese, None, False),
+    "alternating_full": (alternating_full, waiting_for_clear, None, False),
+    "max_gravity": (None, None, 1, False),
+    "bot_input": (None, None, None, True),
+    "worst_case": (near_full, is_near_full, 1, True),
+}
+
+
+def start_game(game, setup, rng):
+    """Start a fresh game and build the scenario's board."""
+    game.reset_game()
+    game.state = Config.STATE_PLAYING
+    if setup:
+        setup(game, rng)
+
+
+def run_scenario(game, name, ticks, input_rate, seed, trace):
+    """
+    Run one scenario through the real game loop.
+    
+    Args:
+        game (TetrisGame): Headless game
+        name (str): Key of SCENARIOS
+        ticks (int): Frames to simulate
+        input_rate (int): Bot key presses per simulated second
+        seed (int): Random seed for boards and inputs
+        trace (bool): Measure peak memory with tracemalloc
+    
+    Returns:
+        dict: Measurements
+    """
+    setup, condition, fall_speed, bot = SCENARIOS[name]
+    rng = random.Random(seed)
+    elapsed = 1000 / Config.FPS
+    presses_per_tick = input_rate / Config.FPS if bot else 0
+    presses_due = 0.0
+    
+    start_game(game, setup, rng)
+    pygame.event.clear()
+    # Preallocated so that measuring does not allocate during the run
+    frame_times = array.array("q", bytes(8 * ticks))
+    boards = 1
+    threshold = gc.get_threshold()[0]
+    # Collections so far, locks, and generation 0 counts of the locks
+    counters = [0, 0, 0]
+    
+    def on_collect(phase, info):
+        if phase == "stop":
+            counters[0] += 1
+    
+    def allocations_since(count, collections):
+        """Generation 0 counter increase, collections added back."""
+        return (gc.get_count()[0] - count
+                + (counters[0] - collections) * threshold)
+    
+    lock_current_piece = game.lock_current_piece
+    
+    def counting_lock():
+        count, collections = gc.get_count()[0], counters[0]
+        rows = lock_current_piece()
+        counters[1] += 1
+        counters[2] += allocations_since(count, collections)
+        return rows
+    game.lock_current_piece = counting_lock
+    frame_allocations = 0
+    
+    gc.collect()
+    gc.callbacks.append(on_collect)
+    gc_before = [stats["collections"] for stats in gc.get_stats()]
+    blocks_before = sys.getallocatedblocks()
+    if trace:
+        tracemalloc.start()
+        snapshot_before = tracemalloc.take_snapshot()
+    
+    start = time.perf_counter()
+    for tick in range(ticks):
+        frame_start = time.perf_counter_ns()
+        count, collections = gc.get_count()[0], counters[0]
+        
+        if fall_speed is not None:
+            game.fall_speed = fall_speed
+        presses_due += presses_per_tick
+        while presses_due >= 1:
+            presses_due -= 1
+            key = (pygame.K_SPACE if rng.random() < 0.05
+                   else rng.choice(BOT_KEYS))
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key))
+        
+        game.handle_input()
+        game.update(elapsed)
+        game.render()
+        
+        if (game.state != Config.STATE_PLAYING
+                or condition and not condition(game)):
+            start_game(game, setup, rng)
+            boards += 1
+        
+        frame_allocations += allocations_since(count, collections)
+        frame_times[tick] = time.perf_counter_ns() - frame_start
+    total = time.perf_counter() - start
+    
+    peak = None
+    top_lines = []
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        growth = tracemalloc.take_snapshot().compare_to(snapshot_before,
+                                                        "lineno")
+        top_lines = [stat for stat in growth if stat.size_diff > 0][:3]
+        tracemalloc.stop()
+    blocks_after = sys.getallocatedblocks()
+    gc_after = [stats["collections"] for stats in gc.get_stats()]
+    gc.callbacks.remove(on_collect)
+    del game.lock_current_piece
+    
+    frame_times = sorted(frame_times)
+    gc_counts = [after - before for before, after in zip(gc_before, gc_after)]
+    return {
+        "ticks_per_second": ticks / total,
+        "mean_ms": sum(frame_times) / len(frame_times) / 1e6,
+        "p99_ms": frame_times[int(len(frame_times) * 0.99)] / 1e6,
+        "worst_ms": frame_times[-1] / 1e6,
+        "boards": boards,
+        "locks": counters[1],
+        "gc0_per_frame": frame_allocations / ticks,
+        "gc0_per_lock": counters[2] / max(1, counters[1]),
+        "blocks": blocks_after - blocks_before,
+        "gc": gc_counts,
+        "peak_kb": None if peak is None else peak / 1024,
+        "top_lines": top_lines,
+    }
+
+
+def main():
+    """Run the selected scenarios and print one line each."""
+    parser = argparse.ArgumentParser(description="Game loop stress test")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS),
+                        choices=list(SCENARIOS))
+    parser.add_argument("--ticks", type=int, default=2000)
+    parser.add_argument("--input-rate", type=int, default=300,
+                        help="Bot key presses per simulated second")
+    parser.add_argument("--rows", type=int, default=None)
+    parser.add_argument("--cols", type=int, default=None)
+    parser.add_argument("--palette", action="store_true",
+                        help="Use the palette board renderer")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Also report peak traced memory")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    leaderboard = Leaderboard(":memory:")
+    game = TetrisGame(args.rows, args.cols, leaderboard=leaderboard,
+                      palette_renderer=args.palette, headless=True)
+    print(f"Board {game.grid.cols}x{game.grid.rows}, {args.ticks} ticks, "
+          f"{args.input_rate} inputs/s for bots, "
+          f"{'palette' if args.palette else 'per-cell'} renderer")
+    print(f"{'scenario':>17} {'ticks/s':>9} {'mean ms':>8} {'p99 ms':>7} "
+          f"{'worst ms':>9} {'boards':>6} {'locks':>6} {'gc0/frm':>8} "
+          f"{'gc0/lock':>8} {'blocks':>7} {'gc0/1/2':>11}"
+          + (f" {'peak KB':>8}" if args.tracemalloc else ""))
+    
+    for name in args.scenarios:
+        r = run_scenario(game, name, args.ticks, args.input_rate,
+                         args.seed, args.tracemalloc)
+        gc_counts = "/".join(str(count) for count in r["gc"])
+        line = (f"{name:>17} {r['ticks_per_second']:9.0f} "
+                f"{r['mean_ms']:8.3f} {r['p99_ms']:7.3f} "
+                f"{r['worst_ms']:9.3f} {r['boards']:6d} {r['locks']:6d} "
+                f"{r['gc0_per_frame']:8.1f} {r['gc0_per_lock']:8.1f} "
+                f"{r['blocks']:+7d} "
+                f"{gc_counts:>11}")
+        if r["peak_kb"] is not None:
+            line += f" {r['peak_kb']:8.1f}"
+        print(line)
+        for stat in r["top_lines"]:
+            frame = stat.traceback[0]
+            print(f"{'':>19}{stat.size_diff / 1024:+8.1f} KB in "
+                  f"{stat.count_diff:+d} blocks  "
+                  f"{os.path.relpath(frame.filename)}:{frame.lineno}")
+    
+    leaderboard.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
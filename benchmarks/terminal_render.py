@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Terminal Renderer Benchmark
+===========================
+
+Plays an AutoPlayer game with gravity, the way a person would see it,
+and renders every frame with the ANSI TerminalRenderer twice: once
+sending only the cells that changed, and once repainting the whole
+frame. It reports the bytes per frame (what a slow SSH link or a
+terminal emulator has to process) and the time spent per frame.
+
+The diffed output is fed into a small terminal emulator and compared
+with the full repaint after every frame, to check that no change was
+missed.
+
+How to Run:
+----------
+    python benchmarks/terminal_render.py
+    python benchmarks/terminal_render.py --frames 5000 --no-color
+"""
+
+import argparse
+import io
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.config import Config  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.terminal import TerminalRenderer  # noqa: E402
+
+# The escape sequences TerminalRenderer sends
+SEQUENCE = re.compile(r"\x1b\[([0-9;?]*)([A-Za-z])")
+
+
+class Screen:
+    """Minimal terminal emulator: cursor moves, colors and clearing."""
+    
+    def __init__(self):
+        self.cells = {}
+        self.row = self.col = 0
+        self.style = ""
+    
+    def feed(self, data):
+        """Apply the output of one frame."""
+        text = data.decode("utf-8")
+        position = 0
+        for match in SEQUENCE.finditer(text):
+            self._write(text[position:match.start()])
+            parameters, command = match.groups()
+            if command == "H":
+                row, col = parameters.split(";")
+                self.row, self.col = int(row) - 1, int(col) - 1
+            elif command == "m":
+                self.style = parameters
+            elif command == "J":
+                self.cells.clear()
+            position = match.end()
+        self._write(text[position:])
+    
+    def _write(self, text):
+        for char in text:
+            self.cells[(self.row, self.col)] = (char, self.style)
+            self.col += 1
+    
+    def contents(self):
+        """Visible cells (blank default cells are left out)."""
+        return {position: cell for position, cell in self.cells.items()
+                if cell[0] != " " or cell[1] not in ("", "0")}
+
+
+def main():
+    """Compare diffed and full-repaint terminal output."""
+    parser = argparse.ArgumentParser(description="Terminal renderer benchmark")
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-color", action="store_true")
+    args = parser.parse_args()
+    
+    engine = GameEngine(seed=args.seed)
+    player = AutoPlayer()
+    modes = {
+        name: TerminalRenderer(io.BytesIO(), color=not args.no_color)
+        for name in ("diff", "full")
+    }
+    screens = {name: Screen() for name in modes}
+    times = {name: 0.0 for name in modes}
+    tick = 1000 // Config.FPS
+    target = None
+    
+    for frame in range(args.frames):
+        # Steer the piece to the AutoPlayer's choice one key per frame
+        if engine.game_over:
+            engine.reset_game()
+        piece = engine.current_piece
+        if target is None or target[0] is not piece:
+            target = (piece,) + player.choose(engine)
+        if piece.rotation != target[1]:
+            engine.rotate()
+        elif piece.x != target[2]:
+            engine.move(1 if target[2] > piece.x else -1)
+        engine.update(tick)
+        
+        for name, renderer in modes.items():
+            out = renderer.out
+            out.seek(0)
+            out.truncate()
+            start = time.perf_counter()
+            if name == "full":
+                renderer.invalidate()
+            renderer.render(engine, "TETRIS")
+            times[name] += time.perf_counter() - start
+            screens[name].feed(out.getvalue())
+        
+        if screens["diff"].contents() != screens["full"].contents():
+            raise AssertionError(f"Frame {frame} differs from a full repaint")
+    
+    print(f"{args.frames} frames, final score {engine.score}")
+    for name, renderer in modes.items():
+        print(f"{name:>5}: {renderer.bytes_written / args.frames:8.1f} bytes "
+              f"per frame, {times[name] / args.frames * 1000:6.3f} ms per "
+              f"frame")
+    print(f"bytes saved: "
+          f"{1 - modes['diff'].bytes_written / modes['full'].bytes_written:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Value Network Benchmark
+=======================
+
+Times one decision (score every placement of the current piece, pick
+the best) of the NumPy value network in two ways:
+
+- batched: all candidate boards built as one array and scored in one
+  forward pass (NetworkPlayer)
+- per candidate: the same boards scored one forward pass at a time,
+  the way a Python evaluation loop works
+
+and, for reference, the heuristic AutoPlayer. Both network modes must
+pick the same placements.
+
+A randomly initialized network is used unless ``--weights`` names an
+``.npz`` file; the timing does not depend on the weights.
+
+How to Run:
+----------
+    python benchmarks/value_network.py
+    python benchmarks/value_network.py --weights value.npz --positions 500
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src import snapshot  # noqa: E402
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.value_network import (  # noqa: E402
+    NetworkPlayer, ValueNetwork, candidate_boards
+)
+
+
+def choose_one_by_one(network, engine):
+    """Score each candidate board with its own forward pass."""
+    placements, boards, lines = candidate_boards(engine)
+    best = best_value = None
+    for i, (rotation, x, _) in enumerate(placements):
+        value = network.evaluate(boards[i:i + 1], lines[i:i + 1])[0]
+        if best_value is None or value > best_value:
+            best, best_value = (rotation, x), value
+    return best
+
+
+def main():
+    """Compare batched and per-candidate network evaluation."""
+    parser = argparse.ArgumentParser(description="Value network benchmark")
+    parser.add_argument("--positions", type=int, default=200)
+    parser.add_argument("--weights", default=None,
+                        help=".npz file (default: random weights)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    network = (ValueNetwork.load(args.weights) if args.weights
+               else ValueNetwork.create(seed=args.seed))
+    player = NetworkPlayer(network)
+    heuristic = AutoPlayer()
+    
+    # Positions from a game played by the AutoPlayer
+    engine = GameEngine(network.rows, network.cols, seed=args.seed)
+    positions = []
+    while len(positions) < args.positions:
+        if engine.game_over:
+            engine.reset_game()
+        positions.append(snapshot.save_state(engine))
+        engine.place(*heuristic(engine))
+    games = [snapshot.load_state(state) for state in positions]
+    candidates = sum(len(candidate_boards(game)[0]) for game in games)
+    
+    times = {}
+    choices = {}
+    for name, choose in (
+        ("batched", player.choose),
+        ("per candidate", lambda game: choose_one_by_one(network, game)),
+        ("AutoPlayer", heuristic.choose),
+    ):
+        start = time.perf_counter()
+        choices[name] = [choose(game) for game in games]
+        times[name] = (time.perf_counter() - start) / len(games)
+    
+    if choices["batched"] != choices["per candidate"]:
+        raise AssertionError("Batched and per-candidate choices differ")
+    print(f"{len(games)} positions, {candidates / len(games):.1f} "
+          f"candidates each")
+    for name, seconds in times.items():
+        print(f"{name:>14}: {seconds * 1000:8.3f} ms per decision")
+    print(f"batched speedup: {times['per candidate'] / times['batched']:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,10 @@ This project demonstrates:
 How to Run:
 ----------
     python main.py
+    python main.py --resizable     # window can be resized
+    python main.py --fullscreen    # F11 switches back to a window
+    python main.py --async         # asyncio main loop (TetrisGame.run_async)
+    python main.py --gc-policy     # garbage collection only when pieces lock
 
 Or after installation:
     pip install -e .
@@ -37,6 +41,8 @@ Requirements:
 For more information, see README.md
 """
 
+import argparse
+import asyncio
 import sys
 import os
 
@@ -46,6 +52,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 try:
     from src.game import TetrisGame
+    from src.gc_policy import GCPolicy
+    from src.telemetry import Telemetry
 except ImportError as e:
     print("Error: Could not import game modules.")
     print(f"Details: {e}")
@@ -67,13 +75,37 @@ def main():
     
     The game will run until the player quits.
     """
+    parser = argparse.ArgumentParser(description="Play Tetris")
+    parser.add_argument("--resizable", action="store_true",
+                        help="Open a resizable window")
+    parser.add_argument("--fullscreen", action="store_true",
+                        help="Start in fullscreen")
+    parser.add_argument("--threaded", action="store_true",
+                        help="Run the game logic on its own thread")
+    parser.add_argument("--telemetry", metavar="DIR",
+                        help="Write gameplay and timing events to DIR")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Run the main loop as an asyncio coroutine")
+    parser.add_argument("--gc-policy", action="store_true",
+                        help="Freeze startup objects and collect garbage "
+                             "only when pieces lock")
+    args = parser.parse_args()
+    
     try:
         # Create game instance
-        game = TetrisGame()
+        telemetry = Telemetry(args.telemetry) if args.telemetry else None
+        game = TetrisGame(resizable=args.resizable,
+                          fullscreen=args.fullscreen,
+                          threaded=args.threaded,
+                          telemetry=telemetry,
+                          gc_policy=GCPolicy() if args.gc_policy else None)
         
         # Run the game
         # This enters the main game loop
-        game.run()
+        if args.use_async:
+            asyncio.run(game.run_async())
+        else:
+            game.run()
         
     except KeyboardInterrupt:
         # Handle Ctrl+C gracefully
@@ -56,6 +56,10 @@ setup(
         'pygame>=2.0.0',
     ],
     extras_require={
+        # Observations, datasets, the value network and board generation
+        'numpy': [
+            'numpy>=1.20.0',
+        ],
         'dev': [
             'pytest>=6.0',
             'black>=21.0',
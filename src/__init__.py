@@ -21,8 +21,9 @@ try:
     from .game import TetrisGame
     from .tetromino import Tetromino
     from .grid import Grid
+    from .engine import GameEngine
     
-    __all__ = ['Config', 'TetrisGame', 'Tetromino', 'Grid']
+    __all__ = ['Config', 'TetrisGame', 'Tetromino', 'Grid', 'GameEngine']
 except ImportError:
     # Allow package to be imported even if dependencies aren't installed
     __all__ = []
@@ -0,0 +1,483 @@
+"""
+Allocations Module - Per-Frame Allocation and GC Pause Tracking
+===============================================================
+
+Frame spikes in long sessions often come from the garbage collector,
+not from the game: every frame builds hundreds of short-lived lists
+and tuples (cell lists, rectangles, rendered text), and every so many
+allocations CPython stops to look for reference cycles. This module
+measures both, frame by frame, and shows where the allocations come
+from.
+
+``AllocationTracker`` has two parts:
+
+- ``gc.callbacks`` report the start and end of every collection, so
+  each pause (generation, duration, objects collected) is counted in
+  the frame it happened in
+- with tracing on, ``tracemalloc`` counts memory, and known sources
+  (``draw_grid``, ``Grid.get_filled_cells``, ``Tetromino.get_blocks``,
+  font renders, ...) are wrapped so each call reports the most memory
+  it had allocated at once (its temporaries) and what it left behind.
+  Nested sources are handled: a source's figures include the sources
+  it calls, the same way a profiler's cumulative time does.
+
+tracemalloc makes every allocation several times slower, so frame
+times measured with tracing on are only good for comparing sources;
+use ``--no-trace`` to measure frame times and GC pauses as they are.
+Memory that pygame allocates in C (surface pixels) is not seen by
+tracemalloc; the figures are Python objects only, which is also all
+the garbage collector deals with. Peaks need ``tracemalloc.reset_peak``
+(Python 3.9); on older versions they are measured only where calls
+start and end, so temporaries freed before a call returns are missed.
+
+``run_session`` plays a headless game like a person would (one key per
+frame towards the AutoPlayer's target, then a hard drop), so the
+numbers come from the real drawing code.
+
+How to Run:
+----------
+    python -m src.allocations --frames 3000
+    python -m src.allocations --frames 20000 --no-trace
+    python -m src.allocations --frames 20000 --no-trace --gc-policy
+
+Educational Purpose:
+-------------------
+Learn about:
+- tracemalloc and measuring memory per call
+- gc.callbacks and garbage collection pauses
+- Monkey-patching for instrumentation
+"""
+
+import argparse
+import collections
+import functools
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+import pygame
+
+from .autoplayer import AutoPlayer
+from .config import Config
+from .engine import GameEngine
+from .game import TetrisGame
+from .gc_policy import GCPolicy
+from .grid import Grid
+from .leaderboard import Leaderboard
+from .tetromino import Tetromino
+from .ui import UI
+
+# Methods wrapped when tracing: (class, method name)
+DEFAULT_SOURCES = (
+    (TetrisGame, "draw_grid"),
+    (TetrisGame, "draw_current_piece"),
+    (TetrisGame, "draw_ghost_piece"),
+    (Grid, "get_filled_cells"),
+    (Tetromino, "get_blocks"),
+    (GameEngine, "get_ghost_y"),
+    (GameEngine, "update"),
+    (UI, "draw_game_header"),
+    (UI, "draw_sidebar"),
+)
+
+# Fonts are C objects whose methods cannot be replaced, so the
+# Config fonts are swapped for wrappers while tracing
+FONT_NAMES = ("FONT_SMALL", "FONT_MEDIUM", "FONT_LARGE", "FONT_HUGE")
+FONT_SOURCE = "font.render"
+
+# tracemalloc.reset_peak is new in Python 3.9; without it the peak is
+# the whole session's, so only call boundaries can be measured
+_HAS_RESET_PEAK = hasattr(tracemalloc, "reset_peak")
+_reset_peak = getattr(tracemalloc, "reset_peak", None) or (lambda: None)
+
+FrameStats = collections.namedtuple("FrameStats", [
+    "duration_ns",      # begin_frame to end_frame
+    "peak_bytes",       # most memory allocated at once above the start
+    "retained_bytes",   # memory still allocated at the end
+    "collections",      # garbage collections during the frame
+    "gc_pause_ns",      # time spent in them
+])
+FrameStats.__doc__ = """Allocations and GC pauses of one frame."""
+
+
+def _traced_memory():
+    """Current traced bytes and the most since the last _reset_peak."""
+    current, peak = tracemalloc.get_traced_memory()
+    if not _HAS_RESET_PEAK:
+        return current, current
+    return current, peak
+
+
+class SourceStats:
+    """
+    Totals for one traced source.
+    
+    Attributes:
+        calls (int): Calls made
+        peak_bytes (int): Sum over calls of the most memory each call
+                          had allocated at once
+        retained_bytes (int): Sum over calls of memory still allocated
+                              when the call returned (e.g. its result)
+    """
+    
+    __slots__ = ("calls", "peak_bytes", "retained_bytes")
+    
+    def __init__(self):
+        """Start at zero."""
+        self.calls = 0
+        self.peak_bytes = 0
+        self.retained_bytes = 0
+
+
+class _TracedFont:
+    """Font stand-in whose ``render`` is measured."""
+    
+    def __init__(self, font, tracker):
+        self._font = font
+        self.render = tracker.wrap(FONT_SOURCE, font.render)
+    
+    def __getattr__(self, name):
+        return getattr(self._font, name)
+
+
+class AllocationTracker:
+    """
+    Per-frame allocation and garbage collection statistics.
+    
+    Attributes:
+        trace (bool): Measure memory with tracemalloc (slow)
+        frames (list): FrameStats of every finished frame
+        sources (dict): Source name -> SourceStats
+        pauses (list): (frame, generation, pause_ns, collected) per
+                       garbage collection; frame is None for
+                       collections between frames
+    """
+    
+    def __init__(self, trace=True, sources=DEFAULT_SOURCES):
+        """
+        Create a tracker (``install`` starts it).
+        
+        Args:
+            trace (bool): Measure memory per frame and per source
+            sources (sequence): (class, method name) pairs to measure
+        """
+        self.trace = trace
+        self.source_methods = sources
+        self.frames = []
+        self.sources = {}
+        self.pauses = []
+        self._patched = []
+        self._fonts = {}
+        # [start bytes, peak bytes] of the frame and of each traced
+        # call in progress, innermost last
+        self._stack = []
+        self._frame_start = None
+        self._in_frame = False
+        self._frame_collections = 0
+        self._frame_pause = 0
+        self._gc_start = 0
+    
+    def install(self):
+        """Start counting: register the GC callback and wrap sources."""
+        gc.callbacks.append(self._gc_callback)
+        if not self.trace:
+            return
+        tracemalloc.start()
+        for owner, name in self.source_methods:
+            original = vars(owner).get(name)
+            method = getattr(owner, name)
+            label = f"{owner.__name__}.{name}"
+            setattr(owner, name, self.wrap(label, method))
+            self._patched.append((owner, name, original))
+        for name in FONT_NAMES:
+            font = getattr(Config, name)
+            if font is not None:
+                self._fonts[name] = font
+                setattr(Config, name, _TracedFont(font, self))
+    
+    def uninstall(self):
+        """Stop counting and put every wrapped method back."""
+        if self._gc_callback in gc.callbacks:
+            gc.callbacks.remove(self._gc_callback)
+        for owner, name, original in reversed(self._patched):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._patched = []
+        for name, font in self._fonts.items():
+            setattr(Config, name, font)
+        self._fonts = {}
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+    
+    def wrap(self, label, function):
+        """
+        Wrap a function so its calls are measured under ``label``.
+        
+        Args:
+            label (str): Source name in the report
+            function (callable): Function or method to wrap
+        
+        Returns:
+            callable: The wrapper
+        """
+        stats = self.sources.setdefault(label, SourceStats())
+        stack = self._stack
+        
+        @functools.wraps(function)
+        def traced(*args, **kwargs):
+            # Close the caller's peak so far, then measure this call alone
+            current, peak = _traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            entry = [current, current]
+            stack.append(entry)
+            _reset_peak()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                current, peak = _traced_memory()
+                stack.pop()
+                peak = max(entry[1], peak)
+                stats.calls += 1
+                stats.peak_bytes += peak - entry[0]
+                stats.retained_bytes += current - entry[0]
+                if stack:
+                    stack[-1][1] = max(stack[-1][1], peak)
+                _reset_peak()
+        
+        return traced
+    
+    def begin_frame(self):
+        """Mark the start of a frame."""
+        self._frame_collections = 0
+        self._frame_pause = 0
+        if self.trace:
+            current, _ = tracemalloc.get_traced_memory()
+            self._stack[:] = [[current, current]]
+            _reset_peak()
+        self._in_frame = True
+        self._frame_start = time.perf_counter_ns()
+    
+    def end_frame(self):
+        """
+        Mark the end of a frame and record its statistics.
+        
+        Returns:
+            FrameStats: The frame just finished
+        """
+        duration = time.perf_counter_ns() - self._frame_start
+        self._in_frame = False
+        peak = retained = 0
+        if self.trace:
+            current, peak = _traced_memory()
+            start, inner_peak = self._stack.pop()
+            peak = max(peak, inner_peak) - start
+            retained = current - start
+        stats = FrameStats(duration, peak, retained,
+                           self._frame_collections, self._frame_pause)
+        self.frames.append(stats)
+        return stats
+    
+    def _gc_callback(self, phase, info):
+        """Time every collection (registered in ``gc.callbacks``)."""
+        if phase == "start":
+            self._gc_start = time.perf_counter_ns()
+            return
+        pause = time.perf_counter_ns() - self._gc_start
+        frame = None
+        if self._in_frame:
+            frame = len(self.frames)
+            self._frame_collections += 1
+            self._frame_pause += pause
+        self.pauses.append((frame, info["generation"], pause,
+                            info["collected"]))
+    
+    def summary(self):
+        """
+        Summarize all finished frames.
+        
+        Returns:
+            dict: Frame count, frame time percentiles (ms), mean and
+                  largest allocations per frame (bytes), GC collections
+                  per generation and pause totals (ms) inside frames,
+                  the share of frames that had a pause, and the
+                  collections and pause total between frames
+        """
+        count = len(self.frames)
+        durations = sorted(frame.duration_ns for frame in self.frames)
+        generations = [0, 0, 0]
+        pauses = []
+        between = []
+        for frame, generation, pause, _ in self.pauses:
+            if frame is None:
+                between.append(pause)
+                continue
+            generations[generation] += 1
+            pauses.append(pause)
+        
+        def percentile(fraction):
+            return durations[min(count - 1, int(count * fraction))] / 1e6
+        
+        return {
+            "frames": count,
+            "frame_p50_ms": percentile(0.5) if count else 0.0,
+            "frame_p99_ms": percentile(0.99) if count else 0.0,
+            "frame_max_ms": durations[-1] / 1e6 if count else 0.0,
+            "peak_bytes_mean": (sum(f.peak_bytes for f in self.frames)
+                                / max(1, count)),
+            "peak_bytes_max": max((f.peak_bytes for f in self.frames),
+                                  default=0),
+            "collections": generations,
+            "gc_pause_total_ms": sum(pauses) / 1e6,
+            "gc_pause_max_ms": max(pauses, default=0) / 1e6,
+            "frames_with_gc": (sum(1 for f in self.frames if f.collections)
+                               / max(1, count)),
+            "collections_between": len(between),
+            "gc_pause_between_ms": sum(between) / 1e6,
+        }
+    
+    def report(self):
+        """
+        Format the summary and the per-source table.
+        
+        Returns:
+            str: Multi-line report
+        """
+        s = self.summary()
+        frames = max(1, s["frames"])
+        lines = [
+            f"frames: {s['frames']}   frame time p50 {s['frame_p50_ms']:.2f}"
+            f" ms, p99 {s['frame_p99_ms']:.2f} ms, max "
+            f"{s['frame_max_ms']:.2f} ms",
+            f"gc: {s['collections'][0]}/{s['collections'][1]}/"
+            f"{s['collections'][2]} collections (gen 0/1/2) in "
+            f"{s['frames_with_gc']:.1%} of frames, "
+            f"{s['gc_pause_total_ms']:.1f} ms total, longest "
+            f"{s['gc_pause_max_ms']:.2f} ms",
+            f"gc between frames: {s['collections_between']} collections, "
+            f"{s['gc_pause_between_ms']:.1f} ms",
+        ]
+        if self.trace:
+            lines.append(
+                f"allocated per frame: {s['peak_bytes_mean'] / 1024:.1f} KB"
+                f" mean, {s['peak_bytes_max'] / 1024:.1f} KB max (peak "
+                f"above the frame's start)"
+            )
+            lines.append("")
+            lines.append(f"{'source':30s} {'calls/frame':>11s} "
+                         f"{'KB/frame':>9s} {'KB returned/frame':>17s}")
+            ranked = sorted(self.sources.items(),
+                            key=lambda item: -item[1].peak_bytes)
+            for label, stats in ranked:
+                lines.append(
+                    f"{label:30s} {stats.calls / frames:11.1f} "
+                    f"{stats.peak_bytes / frames / 1024:9.2f} "
+                    f"{stats.retained_bytes / frames / 1024:17.2f}"
+                )
+        return "\n".join(lines)
+
+
+def run_session(tracker, frames=3000, gc_policy=None, seed=0,
+                drop_after=20):
+    """
+    Play a headless game for a number of frames, measuring each one.
+    
+    Every frame applies at most one key press (rotate or move towards
+    the AutoPlayer's target for the current piece) and then runs
+    gravity and drawing like ``TetrisGame.run_playing``. A piece is
+    hard-dropped ``drop_after`` frames after it appeared. Choosing the
+    target happens outside the measured frames.
+    
+    Args:
+        tracker (AllocationTracker): Installed tracker
+        frames (int): Frames to play
+        gc_policy (GCPolicy, optional): Policy the game uses
+        seed (int): Piece sequence seed
+        drop_after (int): Frames each piece is shown before dropping
+    
+    Returns:
+        TetrisGame: The game, for its score and statistics
+    """
+    directory = tempfile.TemporaryDirectory(prefix="tetris-alloc-")
+    game = TetrisGame(
+        headless=True, gc_policy=gc_policy,
+        leaderboard=Leaderboard(os.path.join(directory.name, "scores.db"))
+    )
+    game.rng.seed(seed)
+    game.reset_game()
+    game.state = Config.STATE_PLAYING
+    player = AutoPlayer()
+    if gc_policy:
+        gc_policy.start()
+    
+    piece = target = None
+    age = 0
+    try:
+        for _ in range(frames):
+            if game.state != Config.STATE_PLAYING:
+                game.reset_game()
+                game.state = Config.STATE_PLAYING
+            if game.current_piece is not piece:
+                piece = game.current_piece
+                target = player.choose(game)
+                age = 0
+            age += 1
+            
+            tracker.begin_frame()
+            rotation, x = target
+            if piece.rotation != rotation:
+                game.handle_key(pygame.K_UP)
+            elif piece.x != x:
+                game.handle_key(pygame.K_LEFT if x < piece.x
+                                else pygame.K_RIGHT)
+            elif age >= drop_after:
+                game.handle_key(pygame.K_SPACE)
+            game.update(1000 // Config.FPS)
+            game.render()
+            tracker.end_frame()
+    finally:
+        if gc_policy:
+            gc_policy.stop()
+        game.leaderboard.close()
+        directory.cleanup()
+    return game
+
+
+def main():
+    """Command line entry point: ``python -m src.allocations``."""
+    parser = argparse.ArgumentParser(
+        description="Per-frame allocations and GC pauses"
+    )
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--no-trace", action="store_true",
+                        help="Only count GC pauses and frame times "
+                             "(no tracemalloc)")
+    parser.add_argument("--gc-policy", action="store_true",
+                        help="Freeze startup objects and collect only "
+                             "when pieces lock")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    tracker = AllocationTracker(trace=not args.no_trace)
+    policy = GCPolicy() if args.gc_policy else None
+    tracker.install()
+    try:
+        game = run_session(tracker, args.frames, policy, args.seed)
+    finally:
+        tracker.uninstall()
+    
+    print(tracker.report())
+    print(f"\nscore {game.score}, lines {game.lines_cleared}")
+    if policy:
+        print(f"policy: {policy.frozen} objects frozen, "
+              f"{sum(policy.collections)} collections at safe points "
+              f"({policy.forced} forced), longest "
+              f"{policy.max_pause_ns / 1e6:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
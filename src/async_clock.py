@@ -0,0 +1,125 @@
+"""
+Async Clock Module - Frame Pacing That Yields to the Event Loop
+===============================================================
+
+``pygame.time.Clock.tick`` keeps the frame rate by sleeping, which
+blocks the whole thread: nothing else runs until the next frame. In
+an asyncio program that means the event loop stops too, so the game
+could not share a process with network servers or other coroutines.
+
+``AsyncClock`` has the same interface (``tick``, ``get_rawtime``,
+``get_time``, ``get_fps``), but ``tick`` is a coroutine that awaits the
+next frame deadline. While the game waits, every other task on the
+event loop runs.
+
+Deadlines are fixed points in time (start + n * frame period), not
+"frame period after the last tick", so the time spent drawing does
+not slow the frame rate down. A loop that falls more than one frame
+behind starts a new schedule instead of rushing through the missed
+frames. ``tick`` always yields at least once, even when the frame is
+late, so a slow game cannot starve the other tasks.
+
+How to Run:
+----------
+    python main.py --async
+
+Educational Purpose:
+-------------------
+Learn about:
+- Cooperative multitasking with asyncio
+- Fixed-deadline frame scheduling
+- Keeping a game loop responsive to other work
+"""
+
+import asyncio
+import time
+
+
+class AsyncClock:
+    """
+    Frame clock whose ``tick`` is awaited instead of sleeping.
+    
+    Attributes:
+        frames (int): Ticks so far
+        late_frames (int): Ticks that found their deadline already past
+    """
+    
+    def __init__(self):
+        """Create a clock; the first tick starts the schedule."""
+        self.frames = 0
+        self.late_frames = 0
+        self._deadline = None
+        self._last_tick = time.perf_counter()
+        self._rawtime = 0
+        self._time = 0
+        self._frame_times = []
+    
+    async def tick(self, fps=0):
+        """
+        Wait until the next frame is due.
+        
+        Args:
+            fps (int): Frames per second to keep; 0 only yields to the
+                       event loop once
+        
+        Returns:
+            int: Milliseconds since the previous tick (as
+                 ``pygame.time.Clock.tick``)
+        """
+        now = time.perf_counter()
+        self._rawtime = int((now - self._last_tick) * 1000)
+        
+        if fps > 0:
+            period = 1 / fps
+            if self._deadline is None:
+                # First frame: due one period from now
+                self._deadline = now
+            self._deadline += period
+            if now - self._deadline > period:
+                # More than a frame behind: this frame is due now, and
+                # the schedule starts over from it
+                self._deadline = now
+            delay = self._deadline - now
+            if delay <= 0:
+                self.late_frames += 1
+            await asyncio.sleep(max(0, delay))
+        else:
+            await asyncio.sleep(0)
+        
+        now = time.perf_counter()
+        self._time = int((now - self._last_tick) * 1000)
+        self._last_tick = now
+        self.frames += 1
+        self._frame_times.append(self._time)
+        del self._frame_times[:-10]
+        return self._time
+    
+    def get_rawtime(self):
+        """
+        Milliseconds the previous frame took before its tick waited.
+        
+        Returns:
+            int: Work time of the last frame
+        """
+        return self._rawtime
+    
+    def get_time(self):
+        """
+        Milliseconds between the last two ticks.
+        
+        Returns:
+            int: Duration of the last frame, waiting included
+        """
+        return self._time
+    
+    def get_fps(self):
+        """
+        Frame rate over the last ten frames.
+        
+        Returns:
+            float: Frames per second (0 before the first frames)
+        """
+        total = sum(self._frame_times)
+        if not total:
+            return 0.0
+        return len(self._frame_times) * 1000 / total
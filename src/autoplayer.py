@@ -0,0 +1,219 @@
+"""
+AutoPlayer Module - Heuristic Computer Player
+=============================================
+
+This module provides a simple computer player. For every piece it tries
+each placement (rotation and column, see GameEngine.get_placements),
+scores the board that would result and picks the best one.
+
+A board is scored as a weighted sum of four features:
+
+- aggregate_height: Sum of all column heights
+- lines: Rows cleared by the placement
+- holes: Empty cells with a filled cell somewhere above them
+- bumpiness: Sum of height differences between neighbouring columns
+
+The boards are never built cell by cell: the placement is applied to a
+copy of ``Grid.row_masks`` and the features are computed with bitwise
+operations on whole rows.
+
+The weights can be tuned automatically, see src/tuner.py. Choices can
+be remembered across games and runs with a PlacementCache, see
+src/placement_cache.py.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Search over a small set of moves
+- Linear evaluation functions
+- Bit manipulation on integers
+"""
+
+import hashlib
+import struct
+
+from .engine import GameEngine
+from .placement_cache import position_key
+
+FEATURES = ("aggregate_height", "lines", "holes", "bumpiness")
+
+# Hand-tuned weights that clear lines reliably on a 10 wide board
+DEFAULT_WEIGHTS = (-0.510066, 0.760666, -0.35663, -0.184483)
+
+
+def board_features(masks, cols):
+    """
+    Compute the height, hole and bumpiness features of a board.
+    
+    Args:
+        masks (list): Row masks of the bottom rows, top to bottom; rows
+                      above them are empty
+        cols (int): Board width
+    
+    Returns:
+        tuple: (aggregate_height, holes, bumpiness)
+    """
+    heights = [0] * cols
+    seen = 0
+    holes = 0
+    stack_height = len(masks)
+    
+    for index, mask in enumerate(masks):
+        new = mask & ~seen
+        if new:
+            # Columns whose highest block is in this row
+            height = stack_height - index
+            while new:
+                lowest = new & -new
+                heights[lowest.bit_length() - 1] = height
+                new ^= lowest
+            seen |= mask
+        holes += bin(seen & ~mask).count("1")
+    
+    bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+    return sum(heights), holes, bumpiness
+
+
+def policy_fingerprint(weights=None):
+    """
+    Identify the placements a set of weights leads to.
+    
+    Args:
+        weights (sequence, optional): Feature weights. Defaults to
+                                      DEFAULT_WEIGHTS.
+    
+    Returns:
+        bytes: 16 byte fingerprint for PlacementCache
+    """
+    weights = DEFAULT_WEIGHTS if weights is None else weights
+    data = b"autoplayer-v1" + struct.pack(f"<{len(weights)}d", *weights)
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class AutoPlayer:
+    """
+    Picks placements by evaluating the board each one leads to.
+    
+    An AutoPlayer can be used directly as a policy:
+    ``rotation, x = player(engine)``.
+    
+    Attributes:
+        weights (tuple): One weight per entry of FEATURES
+        policy (bytes): Fingerprint of the weights, see policy_fingerprint
+        cache (PlacementCache): Consulted before searching, or None
+    """
+    
+    def __init__(self, weights=None, cache=None):
+        """
+        Create a player.
+        
+        Args:
+            weights (sequence, optional): Feature weights. Defaults to
+                                          DEFAULT_WEIGHTS.
+            cache (PlacementCache, optional): Cache opened with this
+                                              player's policy
+        """
+        self.weights = tuple(DEFAULT_WEIGHTS if weights is None else weights)
+        if len(self.weights) != len(FEATURES):
+            raise ValueError(
+                f"Expected {len(FEATURES)} weights, got {len(self.weights)}"
+            )
+        self.policy = policy_fingerprint(self.weights)
+        if cache is not None and cache.policy != self.policy:
+            raise ValueError("Placement cache belongs to a different player")
+        self.cache = cache
+    
+    def evaluate(self, grid, piece_masks, x, landing_y):
+        """
+        Score the board after dropping a piece.
+        
+        Args:
+            grid (Grid): Current board
+            piece_masks (list): Row masks of the (rotated) piece
+            x (int): Column of the piece's left edge
+            landing_y (int): Row the piece's top lands on
+        
+        Returns:
+            float: Weighted feature sum; higher is better
+        """
+        masks = grid.row_masks
+        start = min(grid.top, landing_y)
+        end = landing_y + len(piece_masks)
+        placed = [
+            mask | (piece_mask << x)
+            for mask, piece_mask in zip(masks[landing_y:end], piece_masks)
+        ]
+        
+        # Only the rows touched by the piece can become full
+        kept = [mask for mask in placed if mask != grid.full_mask]
+        lines = len(placed) - len(kept)
+        board = masks[start:landing_y] + kept + masks[end:]
+        
+        height, holes, bumpiness = board_features(board, grid.cols)
+        w_height, w_lines, w_holes, w_bumpiness = self.weights
+        return (w_height * height + w_lines * lines
+                + w_holes * holes + w_bumpiness * bumpiness)
+    
+    def choose(self, engine):
+        """
+        Pick the best placement for the current piece.
+        
+        Args:
+            engine (GameEngine): Game to act in
+        
+        Returns:
+            tuple: (rotation, x) for GameEngine.place
+        """
+        cache = self.cache
+        if cache is not None:
+            key = position_key(engine.grid, engine.current_piece,
+                               engine.next_piece.shape_type)
+            best = cache.get(key)
+            if best is not None:
+                return best
+        
+        grid = engine.grid
+        probe = engine.current_piece.clone()
+        rotation_masks = []
+        for _ in range(4):
+            rotation_masks.append(probe.get_row_masks())
+            probe.rotate_clockwise()
+        
+        best = None
+        best_value = None
+        for rotation, x, landing_y in engine.get_placements():
+            value = self.evaluate(grid, rotation_masks[rotation], x, landing_y)
+            if best_value is None or value > best_value:
+                best = (rotation, x)
+                best_value = value
+        
+        if cache is not None and best is not None:
+            cache.put(key, best)
+        return best
+    
+    __call__ = choose
+
+
+def play_game(weights=None, seed=None, rows=None, cols=None, max_pieces=None,
+              cache=None):
+    """
+    Let an AutoPlayer play one game from start to finish.
+    
+    Args:
+        weights (sequence, optional): Feature weights
+        seed (int, optional): Seed for the piece sequence
+        rows (int, optional): Board height
+        cols (int, optional): Board width
+        max_pieces (int, optional): Stop after this many pieces
+        cache (PlacementCache, optional): Placements to reuse and extend
+    
+    Returns:
+        tuple: (score, lines_cleared, pieces_placed)
+    """
+    engine = GameEngine(rows, cols, seed=seed)
+    player = AutoPlayer(weights, cache)
+    pieces = 0
+    while not engine.game_over and pieces != max_pieces:
+        engine.place(*player.choose(engine))
+        pieces += 1
+    return engine.score, engine.lines_cleared, pieces
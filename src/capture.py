@@ -0,0 +1,214 @@
+"""
+Capture Module - Offscreen Frames for Agents and Video
+======================================================
+
+This module turns a headless TetrisGame (``TetrisGame(headless=True)``)
+into a source of pixels:
+
+- FrameCapture renders the normal ``TetrisGame.render`` path into an
+  offscreen surface and hands out the pixels as NumPy arrays without
+  copying them
+- FrameWriter saves frames as a PNG sequence or one raw RGB file on a
+  background thread, so the game loop never waits for encoding
+
+Raw output can be turned into a video with, for example:
+    ffmpeg -f rawvideo -pix_fmt rgb24 -s 800x600 -r 60 -i frames.rgb out.mp4
+
+The offscreen surface is built on top of ``TetrisGame.frame_buffer``
+(a bytearray), so the NumPy view reads that memory directly. Unlike
+``pygame.surfarray.pixels3d``, this does not lock the surface, so an
+agent may keep the view while the next frame is drawn.
+
+NumPy is only needed for ``FrameCapture.observe``.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Offscreen rendering
+- Zero-copy array views of image memory
+- Moving slow work (encoding, disk) off the main loop
+"""
+
+import json
+import os
+import queue
+import threading
+
+import pygame
+
+from .config import Config
+
+# Marker telling the writer thread to finish
+_STOP = object()
+
+# pygame.image.tobytes is the pygame >= 2.1.3 name of tostring
+_surface_bytes = (getattr(pygame.image, "tobytes", None)
+                  or pygame.image.tostring)
+
+
+class FrameCapture:
+    """
+    Renders a headless game and exposes its pixels.
+    
+    Attributes:
+        game (TetrisGame): Game created with ``headless=True``
+        downsample (int): Keep every n-th pixel in each direction
+    """
+    
+    def __init__(self, game, downsample=1):
+        """
+        Create a capture for a headless game.
+        
+        Args:
+            game (TetrisGame): Game created with ``headless=True``
+            downsample (int): Keep every n-th pixel in each direction
+        """
+        if game.frame_buffer is None:
+            raise ValueError("FrameCapture needs TetrisGame(headless=True)")
+        self.game = game
+        self.downsample = downsample
+        self._view = None
+    
+    def render(self):
+        """Render the current game state into the offscreen surface."""
+        self.game.render()
+    
+    def observe(self):
+        """
+        Get the current frame as a NumPy array view.
+        
+        Returns:
+            numpy.ndarray: ``(height, width, 3)`` uint8 RGB view of the
+                           offscreen surface (strided when downsampling).
+                           It always shows the latest render; copy it to
+                           keep a frame.
+        """
+        if self._view is None:
+            import numpy
+            
+            width, height = self.game.screen.get_size()
+            pixels = numpy.frombuffer(self.game.frame_buffer, numpy.uint8)
+            pixels = pixels.reshape(height, width, 4)[:, :, :3]
+            step = self.downsample
+            self._view = pixels[::step, ::step]
+        return self._view
+    
+    def step(self):
+        """
+        Render and return the new frame in one call.
+        
+        Returns:
+            numpy.ndarray: See ``observe``
+        """
+        self.render()
+        return self.observe()
+
+
+class FrameWriter:
+    """
+    Writes frames to disk on a background thread.
+    
+    Attributes:
+        directory (str): Output directory
+        fmt (str): "png" for numbered PNG files, "raw" for one RGB file
+        downsample (int): Shrink frames by this factor before saving
+        written (int): Frames written so far
+        dropped (int): Frames skipped because the queue was full
+    """
+    
+    def __init__(self, directory, fmt="png", downsample=1, max_queue=120):
+        """
+        Start the writer thread.
+        
+        Args:
+            directory (str): Output directory (created if missing)
+            fmt (str): "png" or "raw"
+            downsample (int): Shrink frames by this factor before saving
+            max_queue (int): Frames buffered before new ones are dropped
+        """
+        if fmt not in ("png", "raw"):
+            raise ValueError(f"Unknown frame format: {fmt}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fmt = fmt
+        self.downsample = downsample
+        self.written = 0
+        self.dropped = 0
+        self._size = None
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(
+            target=self._write_loop, name="frame-writer", daemon=True
+        )
+        self._thread.start()
+    
+    def submit(self, surface):
+        """
+        Queue a copy of a surface for writing. Never blocks.
+        
+        Args:
+            surface (pygame.Surface): Frame to save
+        
+        Returns:
+            bool: False if the frame was dropped because the writer is
+                  behind
+        """
+        if self.downsample > 1:
+            width, height = surface.get_size()
+            surface = pygame.transform.scale(
+                surface, (width // self.downsample, height // self.downsample)
+            )
+        size = surface.get_size()
+        if self._size is None:
+            self._size = size
+        
+        # One C-level copy; the slow encoding happens on the thread
+        data = _surface_bytes(surface, "RGB")
+        try:
+            self._queue.put_nowait((data, size))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            return False
+    
+    def close(self):
+        """Write all queued frames, then stop the thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+    
+    def _write_loop(self):
+        """Writer thread: encode and save frames in order."""
+        raw_file = None
+        if self.fmt == "raw":
+            raw_file = open(os.path.join(self.directory, "frames.rgb"), "wb")
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                data, size = item
+                if raw_file:
+                    raw_file.write(data)
+                else:
+                    frame = pygame.image.frombuffer(data, size, "RGB")
+                    name = f"frame_{self.written:06d}.png"
+                    pygame.image.save(frame, os.path.join(self.directory, name))
+                self.written += 1
+        finally:
+            if raw_file:
+                raw_file.close()
+                self._write_manifest()
+    
+    def _write_manifest(self):
+        """Describe the raw file so it can be decoded later."""
+        width, height = self._size or (0, 0)
+        manifest = {
+            "file": "frames.rgb",
+            "pixel_format": "rgb24",
+            "width": width,
+            "height": height,
+            "frames": self.written,
+            "fps": Config.FPS,
+        }
+        with open(os.path.join(self.directory, "frames.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
@@ -17,10 +17,15 @@ Learn about:
 - Data structures for game shapes
 """
 
-import pygame
+try:
+    import pygame
+except ImportError:
+    # The headless engine and the terminal renderer work without pygame
+    pygame = None
 
 # Initialize pygame font module
-pygame.font.init()
+if pygame is not None:
+    pygame.font.init()
 
 class Config:
     """
@@ -43,6 +48,37 @@ class Config:
     # Frame rate for smooth gameplay
     FPS = 60
     
+    # Playing screen layout, shared by the UI and the scaled display
+    HEADER_HEIGHT = 80
+    HEADER_TITLE = (20, 20)
+    HEADER_PLAYER = (200, 25)
+    HEADER_SCORE = (200, 50)
+    HEADER_LEVEL = (400, 25)
+    HEADER_HIGH = (400, 50)
+    
+    # Sidebar panels as (top, height); other positions are relative to
+    # the sidebar's left edge
+    SIDEBAR_X = GAME_WIDTH + 20
+    SIDEBAR_WIDTH = 200
+    NEXT_PANEL = (100, 150)
+    STATS_PANEL = (270, 80)
+    CONTROLS_PANEL = (370, 200)
+    NEXT_LABEL = (70, 110)
+    PREVIEW_ORIGIN = (60, 160)
+    PREVIEW_BLOCK = 20
+    LINES_LABEL = (10, 285)
+    CONTROLS_LABEL = (50, 380)
+    CONTROLS_LIST = (10, 410)
+    CONTROLS_SPACING = 25
+    CONTROL_ITEMS = [
+        ("←/→", "Move"),
+        ("↓", "Soft Drop"),
+        ("↑", "Rotate"),
+        ("SPACE", "Hard Drop"),
+        ("P", "Pause"),
+        ("ESC", "Quit"),
+    ]
+    
     # Color Palette - RGB values
     # Primary Colors
     WHITE = (255, 255, 255)
@@ -70,11 +106,19 @@ class Config:
     # Tetromino color list
     COLORS = [RED, GREEN, BLUE, YELLOW, CYAN, MAGENTA, ORANGE]
     
-    # Font Configurations
-    FONT_SMALL = pygame.font.Font(None, 24)
-    FONT_MEDIUM = pygame.font.Font(None, 36)
-    FONT_LARGE = pygame.font.Font(None, 48)
-    FONT_HUGE = pygame.font.Font(None, 72)
+    # Palette for compact boards: index 0 = empty (drawn as background),
+    # then the tetromino colors, then gray for any other block color
+    PALETTE = [GAME_BG] + COLORS + [GRAY]
+    COLOR_INDEX = {color: index for index, color in enumerate(PALETTE) if index}
+    
+    # Font Configurations (None when pygame is not installed)
+    if pygame is not None:
+        FONT_SMALL = pygame.font.Font(None, 24)
+        FONT_MEDIUM = pygame.font.Font(None, 36)
+        FONT_LARGE = pygame.font.Font(None, 48)
+        FONT_HUGE = pygame.font.Font(None, 72)
+    else:
+        FONT_SMALL = FONT_MEDIUM = FONT_LARGE = FONT_HUGE = None
     
     # Tetromino Shapes
     # Each shape is represented as a 2D list where 1 = filled block, 0 = empty
@@ -114,6 +158,19 @@ class Config:
         4: 10    # Tetris!
     }
     
+    # Versus Mode - garbage rows sent to the opponent per row cleared,
+    # weighted like COMBO_MULTIPLIER: bigger clears are worth more
+    GARBAGE_MULTIPLIER = {
+        1: 0,      # Single sends nothing
+        2: 0.5,    # Double sends 1 row
+        3: 2 / 3,  # Triple sends 2 rows
+        4: 1       # Tetris sends 4 rows
+    }
+    GARBAGE_COLOR = GRAY
+    
+    # Persistence
+    LEADERBOARD_FILE = "tetris_scores.db"  # SQLite high score database
+    
     # Game States
     STATE_MENU = "menu"
     STATE_LOGIN = "login"
@@ -161,3 +218,17 @@ class Config:
             return 0
         multiplier = cls.COMBO_MULTIPLIER.get(rows_cleared, 1)
         return int(cls.POINTS_PER_ROW * rows_cleared * multiplier)
+    
+    @classmethod
+    def calculate_garbage(cls, rows_cleared):
+        """
+        Calculate garbage rows sent to the opponent in versus mode.
+        
+        Args:
+            rows_cleared (int): Number of rows cleared simultaneously
+        
+        Returns:
+            int: Garbage rows to send
+        """
+        multiplier = cls.GARBAGE_MULTIPLIER.get(rows_cleared, 1)
+        return round(rows_cleared * multiplier)
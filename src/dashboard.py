@@ -0,0 +1,558 @@
+"""
+Dashboard Module - Live View of Parallel Headless Games
+=======================================================
+
+When many headless games run in worker processes (bot evaluation, load
+tests), this module lets you watch all of them live without slowing
+them down.
+
+Every worker owns one slot in a ``multiprocessing.shared_memory``
+segment and copies its state there after each piece: a few packed
+numbers and the raw board bytes (``Grid.cells``). A dashboard process
+maps the same segment and reads the slots at its own refresh rate.
+Nothing is pickled or sent through a pipe or queue, and the workers
+never wait for the dashboard: publishing is one ``struct.pack_into``
+and one slice copy into memory.
+
+To read a slot while its worker may be writing to it, every slot
+starts with a sequence number (a *seqlock*): the writer makes it odd
+before writing and even again afterwards. A reader copies the slot and
+keeps the copy only if the number was even and did not change
+meanwhile; otherwise it reads again, a bounded number of times (a
+worker that died while writing leaves its number odd for good).
+
+Segment layout (little endian, version 1):
+    header  <4sBxHHHI     magic, version, workers, rows, cols, slot size
+    slots   <IIIQIHIfd    sequence, state, games, pieces, score, level,
+                          lines, pieces per second, update time
+            then rows * cols palette indices (the board), padded to 8
+
+How to Run:
+----------
+    python -m src.dashboard --workers 64 --seconds 60
+    python -m src.dashboard --workers 8 --view terminal
+    python -m src.dashboard --attach <segment name>
+
+Educational Purpose:
+-------------------
+Learn about:
+- Shared memory between processes
+- Fixed binary layouts with the struct module
+- Seqlocks: lock-free reads of data that is being written
+"""
+
+import argparse
+import collections
+import math
+import shutil
+import struct
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:
+    # multiprocessing.shared_memory is new in Python 3.8
+    resource_tracker = shared_memory = None
+
+from .config import Config
+from .grid import BIT_TABLE
+
+MAGIC = b"TDSH"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBxHHHI")
+SLOT = struct.Struct("<IIIQIHIfd")
+SEQUENCE = struct.Struct("<I")
+
+# Worker states
+IDLE = 0
+PLAYING = 1
+GAME_OVER = 2
+FINISHED = 3
+STATE_NAMES = ("idle", "playing", "game over", "finished")
+
+# Seconds over which a worker measures its pieces per second
+RATE_WINDOW = 1.0
+
+# Reads of a slot before giving up on a writer that never finishes
+# (e.g. a worker that died in the middle of publishing)
+READ_ATTEMPTS = 1000
+
+WorkerStatus = collections.namedtuple(
+    "WorkerStatus",
+    "sequence state games pieces score level lines rate updated cells"
+)
+
+
+class SharedBoards:
+    """
+    Shared memory segment with one status slot per worker.
+    
+    Attributes:
+        name (str): Segment name; pass it to other processes to attach
+        workers (int): Number of slots
+        rows (int): Board height of every slot
+        cols (int): Board width of every slot
+        slot_size (int): Bytes per slot
+    """
+    
+    def __init__(self, name=None, create=False, workers=0, rows=None,
+                 cols=None, track=True):
+        """
+        Create a new segment or attach to an existing one.
+        
+        Args:
+            name (str, optional): Segment to attach to (or to create;
+                                  a unique name is picked if None)
+            create (bool): Create the segment instead of attaching
+            workers (int): Slots to create
+            rows (int, optional): Board height. Defaults to Config.ROWS.
+            cols (int, optional): Board width. Defaults to Config.COLUMNS.
+            track (bool): Let this process's resource tracker remove the
+                          segment when it exits. Pass False when
+                          attaching from a process that was not started
+                          by the creator (e.g. a separate dashboard).
+        
+        Raises:
+            RuntimeError: If shared memory is not available (Python < 3.8)
+            ValueError: If an attached segment has the wrong layout
+        """
+        if shared_memory is None:
+            raise RuntimeError("The dashboard needs Python 3.8 or newer "
+                               "(multiprocessing.shared_memory)")
+        if create:
+            rows = Config.ROWS if rows is None else rows
+            cols = Config.COLUMNS if cols is None else cols
+            slot_size = (SLOT.size + rows * cols + 7) // 8 * 8
+            self._memory = shared_memory.SharedMemory(
+                name, create=True, size=HEADER.size + workers * slot_size
+            )
+            HEADER.pack_into(self._memory.buf, 0, MAGIC, VERSION, workers,
+                             rows, cols, slot_size)
+        else:
+            self._memory = shared_memory.SharedMemory(name)
+            if not track:
+                # Otherwise the segment is removed when this process exits
+                resource_tracker.unregister(self._memory._name,
+                                            "shared_memory")
+        self.name = self._memory.name
+        self._buffer = self._memory.buf
+        
+        magic, version, self.workers, self.rows, self.cols, self.slot_size = (
+            HEADER.unpack_from(self._buffer, 0)
+        )
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.name} is not a dashboard segment")
+        self._sequences = [0] * self.workers
+    
+    def _offset(self, index):
+        """Byte offset of a worker's slot."""
+        if not 0 <= index < self.workers:
+            raise IndexError(f"No worker {index}")
+        return HEADER.size + index * self.slot_size
+    
+    def publish(self, index, engine, games, pieces, rate, state=PLAYING):
+        """
+        Write a worker's current state into its slot.
+        
+        Only the worker owning slot ``index`` may call this.
+        
+        Args:
+            index (int): Worker slot
+            engine (GameEngine): Game whose board and score to show
+            games (int): Games the worker has started
+            pieces (int): Pieces the worker has placed in total
+            rate (float): Pieces per second
+            state (int): PLAYING, GAME_OVER or FINISHED
+        """
+        buffer = self._buffer
+        offset = self._offset(index)
+        sequence = self._sequences[index]
+        cells = engine.grid.cells
+        if len(cells) != self.rows * self.cols:
+            raise ValueError("Board size does not match the segment")
+        
+        # Odd while writing, so readers know to retry
+        SEQUENCE.pack_into(buffer, offset, (sequence + 1) & 0xFFFFFFFF)
+        SLOT.pack_into(
+            buffer, offset, (sequence + 1) & 0xFFFFFFFF, state, games,
+            pieces, engine.score, engine.level, engine.lines_cleared, rate,
+            time.time()
+        )
+        start = offset + SLOT.size
+        buffer[start:start + len(cells)] = cells
+        sequence = (sequence + 2) & 0xFFFFFFFF
+        SEQUENCE.pack_into(buffer, offset, sequence)
+        self._sequences[index] = sequence
+    
+    def read(self, index):
+        """
+        Read a consistent copy of a worker's slot.
+        
+        Args:
+            index (int): Worker slot
+        
+        Returns:
+            WorkerStatus: The slot contents, ``cells`` being a bytes copy,
+                          or None if no consistent copy could be read
+                          within READ_ATTEMPTS tries
+        """
+        buffer = self._buffer
+        offset = self._offset(index)
+        start = offset + SLOT.size
+        end = start + self.rows * self.cols
+        for _ in range(READ_ATTEMPTS):
+            (before,) = SEQUENCE.unpack_from(buffer, offset)
+            if not before & 1:
+                fields = SLOT.unpack_from(buffer, offset)
+                cells = bytes(buffer[start:end])
+                if SEQUENCE.unpack_from(buffer, offset)[0] == before:
+                    return WorkerStatus(*fields, cells)
+            time.sleep(0)
+        return None
+    
+    def views(self):
+        """
+        Create one WorkerView per slot.
+        
+        Returns:
+            list: WorkerView objects, in slot order
+        """
+        return [WorkerView(self, index) for index in range(self.workers)]
+    
+    def close(self):
+        """Unmap the segment (it stays available to other processes)."""
+        if self._memory is not None:
+            self._buffer = None
+            self._memory.close()
+    
+    def unlink(self):
+        """Remove the segment; call once, from the creating process."""
+        self._memory.unlink()
+
+
+class WorkerView:
+    """
+    A worker's board as a drawable source.
+    
+    Has the attributes of a SpectatorView, so a WallRenderer or
+    TerminalRenderer can draw it. Call ``refresh`` to pick up the
+    worker's latest state.
+    
+    Attributes:
+        index (int): Worker slot
+        status (WorkerStatus): Last slot contents read, or None
+        version (int): Slot sequence number of the last read
+    """
+    
+    def __init__(self, boards, index):
+        """
+        Args:
+            boards (SharedBoards): Segment to read from
+            index (int): Worker slot
+        """
+        self.boards = boards
+        self.index = index
+        self.rows = boards.rows
+        self.cols = boards.cols
+        self.board = [bytes(self.cols)] * self.rows
+        self.row_masks = [0] * self.rows
+        self.piece = None
+        self.score = 0
+        self.level = 1
+        self.lines = 0
+        self.game_over = False
+        self.status = None
+        self.version = 0
+    
+    def refresh(self):
+        """
+        Read the worker's slot.
+        
+        Returns:
+            bool: True if the worker published something new (False
+                  also when the slot could not be read; the last state
+                  read is kept)
+        """
+        status = self.boards.read(self.index)
+        if status is None or status.sequence == self.version:
+            return False
+        self.status = status
+        self.version = status.sequence
+        cols = self.cols
+        cells = status.cells
+        self.board = [cells[y * cols:(y + 1) * cols] for y in range(self.rows)]
+        self.row_masks = [
+            int(row.translate(BIT_TABLE)[::-1], 2) for row in self.board
+        ]
+        self.score = status.score
+        self.level = status.level
+        self.lines = status.lines
+        self.game_over = status.state == GAME_OVER
+        return True
+    
+    def stack_height(self):
+        """
+        Returns:
+            int: Rows from the bottom that contain blocks
+        """
+        for y, mask in enumerate(self.row_masks):
+            if mask:
+                return self.rows - y
+        return 0
+
+
+def run_worker(name, index, seed=None, weights=None, seconds=60,
+               max_pieces=None):
+    """
+    Worker entry point: play AutoPlayer games and publish every piece.
+    
+    Args:
+        name (str): Segment to publish to
+        index (int): This worker's slot
+        seed (int, optional): Seed of the first game (later games use
+                              the following seeds)
+        weights (sequence, optional): AutoPlayer weights
+        seconds (float): Stop after this long
+        max_pieces (int, optional): Start a new game after this many
+                                    pieces
+    
+    Returns:
+        tuple: (games, pieces)
+    """
+    from .autoplayer import AutoPlayer
+    from .engine import GameEngine
+    
+    boards = SharedBoards(name)
+    engine = GameEngine(boards.rows, boards.cols, seed=seed)
+    games = 1
+    pieces = game_pieces = 0
+    try:
+        player = AutoPlayer(weights)
+        rate = 0.0
+        start = window_start = time.perf_counter()
+        window_pieces = 0
+        
+        while True:
+            now = time.perf_counter()
+            if now - start >= seconds:
+                break
+            if now - window_start >= RATE_WINDOW:
+                rate = window_pieces / (now - window_start)
+                window_start = now
+                window_pieces = 0
+            
+            if engine.game_over or game_pieces == max_pieces:
+                boards.publish(index, engine, games, pieces, rate, GAME_OVER)
+                if seed is not None:
+                    engine.rng.seed(seed + games)
+                engine.reset_game()
+                games += 1
+                game_pieces = 0
+            engine.place(*player.choose(engine))
+            pieces += 1
+            game_pieces += 1
+            window_pieces += 1
+            boards.publish(index, engine, games, pieces, rate)
+    finally:
+        # Also on errors, so a dashboard waiting for every worker ends
+        boards.publish(index, engine, games, pieces, 0.0, FINISHED)
+        boards.close()
+    return games, pieces
+
+
+def summary(statuses):
+    """
+    Totals over all workers.
+    
+    Args:
+        statuses (list): WorkerStatus per worker (None for unread)
+    
+    Returns:
+        tuple: (games, pieces, pieces per second, best score, workers
+               still playing)
+    """
+    statuses = [status for status in statuses if status is not None]
+    return (
+        sum(status.games for status in statuses),
+        sum(status.pieces for status in statuses),
+        sum(status.rate for status in statuses),
+        max((status.score for status in statuses), default=0),
+        sum(status.state in (PLAYING, GAME_OVER) for status in statuses),
+    )
+
+
+def show_pygame(boards, until, fps=30, size=(1280, 720)):
+    """
+    Show every worker's board on a WallRenderer until ``until()``.
+    
+    Args:
+        boards (SharedBoards): Segment to read
+        until (callable): Returns True when the dashboard should close
+        fps (int): Refresh rate
+        size (tuple): Window size
+    """
+    import pygame
+    
+    from .wall import WallRenderer
+    
+    pygame.init()
+    window = pygame.display.set_mode(size, pygame.RESIZABLE)
+    clock = pygame.time.Clock()
+    views = boards.views()
+    wall = WallRenderer(window.get_size())
+    for view in views:
+        wall.add(view, f"w{view.index}")
+    
+    while not until():
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                return
+            if event.type == pygame.VIDEORESIZE:
+                window = pygame.display.get_surface()
+                wall.resize(window.get_size())
+            elif event.type == pygame.WINDOWEXPOSED:
+                wall.invalidate()
+        for view in views:
+            view.refresh()
+        pygame.display.update(wall.draw(window))
+        games, pieces, rate, best, active = summary(
+            [view.status for view in views]
+        )
+        pygame.display.set_caption(
+            f"Tetris workers - {active} playing, {rate:,.0f} pieces/s, "
+            f"{games} games, best {best}"
+        )
+        clock.tick(fps)
+    pygame.quit()
+
+
+def show_terminal(boards, until, fps=10):
+    """
+    Show a table of the workers in the terminal until ``until()``.
+    
+    Args:
+        boards (SharedBoards): Segment to read
+        until (callable): Returns True when the dashboard should close
+        fps (int): Refresh rate
+    """
+    from .terminal import DIM, TEXT, TITLE, FrameClock, TerminalRenderer
+    
+    renderer = TerminalRenderer()
+    clock = FrameClock(renderer, fps)
+    views = boards.views()
+    header = f"{'#':>3} {'state':9} {'games':>5} {'score':>7} {'lvl':>3} " \
+             f"{'lines':>5} {'pcs/s':>7} {'stack':10}"
+    column_width = len(header) + 3
+    
+    renderer.open()
+    try:
+        while not until():
+            for view in views:
+                view.refresh()
+            width, height = shutil.get_terminal_size()
+            per_column = max(1, height - 3)
+            columns = math.ceil(len(views) / per_column)
+            renderer.begin(max(width, column_width * columns),
+                           min(height, len(views) + 3))
+            
+            games, pieces, rate, best, active = summary(
+                [view.status for view in views]
+            )
+            renderer.put(0, 0, f"TETRIS WORKERS  {active}/{len(views)} "
+                               f"playing  {rate:,.0f} pieces/s  {games:,} "
+                               f"games  {pieces:,} pieces  best {best:,}",
+                         TITLE)
+            for column in range(columns):
+                left = column * column_width
+                renderer.put(1, left, header, DIM)
+                for line, view in enumerate(
+                        views[column * per_column:(column + 1) * per_column],
+                        2):
+                    status = view.status
+                    if status is None:
+                        continue
+                    bar = "█" * round(10 * view.stack_height() / view.rows)
+                    renderer.put(
+                        line, left,
+                        f"{view.index:3d} {STATE_NAMES[status.state]:9} "
+                        f"{status.games:5d} {status.score:7d} "
+                        f"{status.level:3d} {status.lines:5d} "
+                        f"{status.rate:7.1f} ", TEXT
+                    )
+                    renderer.put(line, left + len(header) - 10, bar, DIM)
+            renderer.present()
+            clock.tick()
+    finally:
+        renderer.close()
+
+
+def main():
+    """Run workers and watch them, or attach to a running segment."""
+    parser = argparse.ArgumentParser(description="Live worker dashboard")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=30,
+                        help="How long the workers play")
+    parser.add_argument("--max-pieces", type=int, default=None,
+                        help="Pieces after which a worker starts a new game")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rows", type=int, default=None)
+    parser.add_argument("--cols", type=int, default=None)
+    parser.add_argument("--view", choices=("pygame", "terminal", "none"),
+                        default="pygame")
+    parser.add_argument("--fps", type=int, default=30,
+                        help="Dashboard refresh rate")
+    parser.add_argument("--attach", metavar="NAME", default=None,
+                        help="Watch the segment of a run started elsewhere")
+    args = parser.parse_args()
+    
+    if args.attach:
+        boards = SharedBoards(args.attach, track=False)
+        views = boards.views()
+        
+        def finished():
+            for view in views:
+                view.refresh()
+            return all(view.status and view.status.state == FINISHED
+                       for view in views)
+        
+        show = show_terminal if args.view == "terminal" else show_pygame
+        show(boards, finished, args.fps)
+        boards.close()
+        return
+    
+    boards = SharedBoards(create=True, workers=args.workers, rows=args.rows,
+                          cols=args.cols)
+    print(f"Shared memory segment: {boards.name}")
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = [
+                pool.submit(run_worker, boards.name, index,
+                            args.seed + index * 100003, None, args.seconds,
+                            args.max_pieces)
+                for index in range(args.workers)
+            ]
+            
+            def finished():
+                return all(future.done() for future in futures)
+            
+            if args.view == "pygame":
+                show_pygame(boards, finished, args.fps)
+            elif args.view == "terminal":
+                show_terminal(boards, finished, args.fps)
+            results = [future.result() for future in futures]
+    finally:
+        boards.close()
+        boards.unlink()
+    
+    games = sum(games for games, _ in results)
+    pieces = sum(pieces for _, pieces in results)
+    print(f"{args.workers} workers: {games} games, {pieces:,} pieces, "
+          f"{pieces / args.seconds:,.0f} pieces/s")
+
+
+if __name__ == "__main__":
+    main()
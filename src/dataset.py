@@ -0,0 +1,364 @@
+"""
+Dataset Module - Streaming Training Data in Shards
+==================================================
+
+This module plays games with a policy and records what happened, one
+transition per placed piece:
+
+    (board, piece, next_piece, action, reward, done, truncated)
+
+- ``board`` is the occupancy grid before the move (1 = filled)
+- ``action`` is the placement index ``rotation * cols + x``
+  (see GameEngine.get_placements / GameEngine.place)
+- ``reward`` is the score gained by the move: Config.calculate_score
+  for cleared lines plus the hard drop bonus
+- ``done`` is True when the move ended the game (topped out);
+  ``truncated`` is True when the game was cut off at ``max_pieces``
+  instead, so the board after it is not terminal
+
+``generate_transitions`` yields transitions lazily. ShardWriter packs
+them into fixed-size shards of contiguous NumPy arrays, one ``.npy``
+file per field, plus a ``manifest.json``. Shards are written by a
+background thread from a fixed pool of buffers: when every buffer is
+waiting for the disk, the producer blocks, so memory stays bounded no
+matter how many transitions are generated. ``load_shard`` opens a
+shard memory-mapped, so readers only page in what they touch.
+
+How to Run:
+----------
+    python -m src.dataset --out data/random --games 1000
+
+Educational Purpose:
+-------------------
+Learn about:
+- Generators for streaming data
+- Back-pressure between a producer and a slow consumer
+- Memory-mapped files
+"""
+
+import argparse
+import json
+import os
+import queue
+import random
+import threading
+
+import numpy
+
+from .engine import GameEngine
+
+# Fields of a transition and how they are stored
+FIELDS = ("board", "piece", "next_piece", "action", "reward", "done",
+          "truncated")
+DTYPES = {
+    "board": numpy.uint8,
+    "piece": numpy.int8,
+    "next_piece": numpy.int8,
+    "action": numpy.int32,  # rotation * cols + x outgrows int16
+    "reward": numpy.int32,
+    "done": numpy.bool_,
+    "truncated": numpy.bool_,
+}
+
+# Maps palette index bytes to 0 (empty) / 1 (filled)
+OCCUPANCY_TABLE = bytes([0] + [1] * 255)
+
+MANIFEST = "manifest.json"
+
+# Marker telling the writer thread to finish
+_STOP = object()
+
+
+def random_policy(engine, rng=random):
+    """
+    Pick a uniformly random placement.
+    
+    Args:
+        engine (GameEngine): Game to act in
+        rng (random.Random): Random generator
+    
+    Returns:
+        tuple: (rotation, x)
+    """
+    rotation, x, _ = rng.choice(engine.get_placements())
+    return rotation, x
+
+
+def generate_transitions(policy, games, rows=None, cols=None, seed=0,
+                         max_pieces=None):
+    """
+    Play games with a policy and yield one transition per piece.
+    
+    Args:
+        policy (callable): ``policy(engine) -> (rotation, x)``
+        games (int): Number of games to play
+        rows (int, optional): Board height
+        cols (int, optional): Board width
+        seed (int): Seed of the first game; game i uses ``seed + i``
+        max_pieces (int, optional): End a game after this many pieces
+    
+    Yields:
+        tuple: (board bytes, piece, next_piece, action, reward, done,
+               truncated)
+    """
+    for game in range(games):
+        engine = GameEngine(rows, cols, seed=seed + game)
+        grid = engine.grid
+        pieces = 0
+        
+        while not engine.game_over:
+            board = grid.cells.translate(OCCUPANCY_TABLE)
+            piece = engine.current_piece.shape_type
+            next_piece = engine.next_piece.shape_type
+            
+            rotation, x = policy(engine)
+            score_before = engine.score
+            if not engine.place(rotation, x):
+                raise ValueError(f"Policy chose a blocked placement: "
+                                 f"rotation={rotation}, x={x}")
+            pieces += 1
+            
+            done = engine.game_over
+            truncated = not done and pieces == max_pieces
+            yield (board, piece, next_piece, rotation * grid.cols + x,
+                   engine.score - score_before, done, truncated)
+            if truncated:
+                break
+
+
+class ShardWriter:
+    """
+    Writes transitions into fixed-size shards on a background thread.
+    
+    Attributes:
+        directory (str): Output directory
+        shard_size (int): Transitions per shard
+        rows (int): Board height
+        cols (int): Board width
+        shards (list): Manifest entries of the shards written so far
+    """
+    
+    def __init__(self, directory, rows, cols, shard_size=100000,
+                 max_pending=2):
+        """
+        Prepare the buffers and start the writer thread.
+        
+        Args:
+            directory (str): Output directory (created if missing)
+            rows (int): Board height
+            cols (int): Board width
+            shard_size (int): Transitions per shard
+            max_pending (int): Full shards allowed to wait for the disk
+                               before ``add`` blocks
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.rows = rows
+        self.cols = cols
+        self.shard_size = shard_size
+        self.shards = []
+        
+        # Every buffer that will ever exist is allocated here
+        self._free = queue.Queue()
+        for _ in range(max_pending + 1):
+            self._free.put(self._allocate())
+        self._pending = queue.Queue()
+        self._buffer = self._free.get()
+        self._count = 0
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._write_loop, name="shard-writer", daemon=True
+        )
+        self._thread.start()
+    
+    def _allocate(self):
+        """Allocate one shard's worth of arrays."""
+        buffer = {}
+        for field in FIELDS:
+            shape = (self.shard_size,)
+            if field == "board":
+                shape += (self.rows, self.cols)
+            buffer[field] = numpy.empty(shape, DTYPES[field])
+        return buffer
+    
+    def add(self, transition):
+        """
+        Append one transition, blocking if the disk has fallen behind.
+        
+        Args:
+            transition (tuple): As yielded by ``generate_transitions``
+        
+        Raises:
+            Exception: Whatever made the writer thread fail to save an
+                       earlier shard
+        """
+        board, piece, next_piece, action, reward, done, truncated = (
+            transition
+        )
+        buffer = self._buffer
+        index = self._count
+        buffer["board"][index].reshape(-1)[:] = numpy.frombuffer(
+            board, numpy.uint8
+        )
+        buffer["piece"][index] = piece
+        buffer["next_piece"][index] = next_piece
+        buffer["action"][index] = action
+        buffer["reward"][index] = reward
+        buffer["done"][index] = done
+        buffer["truncated"][index] = truncated
+        
+        self._count += 1
+        if self._count == self.shard_size:
+            self._submit()
+    
+    def write_all(self, transitions):
+        """
+        Consume a transition iterator completely.
+        
+        Args:
+            transitions (iterable): Transitions to write
+        
+        Returns:
+            int: Number of transitions written
+        """
+        total = 0
+        for transition in transitions:
+            self.add(transition)
+            total += 1
+        return total
+    
+    def _submit(self):
+        """Hand the current buffer to the writer and take a free one."""
+        if self._error:
+            raise self._error
+        self._pending.put((len(self.shards), self._buffer, self._count))
+        self.shards.append(None)  # filled in by the writer
+        self._buffer = self._free.get()  # blocks: back-pressure
+        self._count = 0
+        if self._error:
+            raise self._error
+    
+    def close(self):
+        """
+        Write the last partial shard and the manifest.
+        
+        Raises:
+            Exception: Whatever made the writer thread fail; no manifest
+                       is written then
+        """
+        try:
+            if self._count:
+                self._submit()
+        finally:
+            self._pending.put(_STOP)
+            self._thread.join()
+        if self._error:
+            raise self._error
+        
+        manifest = {
+            "rows": self.rows,
+            "cols": self.cols,
+            "shard_size": self.shard_size,
+            "fields": {field: numpy.dtype(DTYPES[field]).str
+                       for field in FIELDS},
+            "transitions": sum(shard["count"] for shard in self.shards),
+            "shards": self.shards,
+        }
+        with open(os.path.join(self.directory, MANIFEST), "w") as f:
+            json.dump(manifest, f, indent=2)
+    
+    def _write_loop(self):
+        """Writer thread: save full buffers and recycle them."""
+        while True:
+            item = self._pending.get()
+            if item is _STOP:
+                return
+            index, buffer, count = item
+            name = f"shard_{index:05d}"
+            try:
+                # After a failure, only recycle buffers so the producer
+                # wakes up and sees the error
+                if self._error is None:
+                    path = os.path.join(self.directory, name)
+                    os.makedirs(path, exist_ok=True)
+                    for field in FIELDS:
+                        numpy.save(os.path.join(path, f"{field}.npy"),
+                                   buffer[field][:count])
+                    self.shards[index] = {"name": name, "count": count}
+            except Exception as e:
+                self._error = e
+            finally:
+                self._free.put(buffer)
+
+
+def read_manifest(directory):
+    """
+    Read a dataset manifest.
+    
+    Args:
+        directory (str): Dataset directory
+    
+    Returns:
+        dict: The manifest written by ShardWriter.close
+    """
+    with open(os.path.join(directory, MANIFEST)) as f:
+        return json.load(f)
+
+
+def load_shard(directory, name, mmap=True):
+    """
+    Open one shard.
+    
+    Args:
+        directory (str): Dataset directory
+        name (str): Shard name from the manifest
+        mmap (bool): Memory-map the arrays instead of reading them
+    
+    Returns:
+        dict: Field name to NumPy array
+    """
+    mode = "r" if mmap else None
+    return {
+        field: numpy.load(os.path.join(directory, name, f"{field}.npy"),
+                          mmap_mode=mode)
+        for field in FIELDS
+    }
+
+
+def iter_shards(directory, mmap=True):
+    """
+    Open every shard of a dataset in order.
+    
+    Yields:
+        dict: Field name to NumPy array, as returned by ``load_shard``
+    """
+    for shard in read_manifest(directory)["shards"]:
+        yield load_shard(directory, shard["name"], mmap)
+
+
+def main():
+    """Command line entry point: ``python -m src.dataset``."""
+    parser = argparse.ArgumentParser(description="Generate training data")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=None)
+    parser.add_argument("--cols", type=int, default=None)
+    parser.add_argument("--shard-size", type=int, default=100000)
+    parser.add_argument("--max-pieces", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    
+    grid = GameEngine(args.rows, args.cols).grid
+    rng = random.Random(args.seed)
+    writer = ShardWriter(args.out, grid.rows, grid.cols, args.shard_size)
+    total = writer.write_all(generate_transitions(
+        lambda engine: random_policy(engine, rng), args.games,
+        grid.rows, grid.cols, args.seed, args.max_pieces
+    ))
+    writer.close()
+    print(f"Wrote {total} transitions in {len(writer.shards)} shards "
+          f"to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""
+Display Module - Resolution-Independent Rendering
+=================================================
+
+The game is designed for a logical screen of
+``Config.SCREEN_WIDTH x Config.SCREEN_HEIGHT`` pixels. On a large
+window (1080p, 4K) the simple approach - draw the logical screen and
+scale the whole frame up - costs a full-screen smoothscale every frame.
+
+ScaledRenderer draws the playing screen directly at the window's
+resolution instead:
+
+- Layout maps logical coordinates to window pixels (uniform scale,
+  centered with black bars) and is only recomputed when the window
+  size changes (``VIDEORESIZE``)
+- Everything that never changes during play (header, board background,
+  grid lines, sidebar panels, labels) is drawn once per layout into a
+  background layer, which is copied with one blit per frame
+- Blocks and text are rasterized once per scale factor at the final
+  size and cached; fonts are opened at the scaled point size, so text
+  stays sharp instead of being stretched
+
+Caches are kept for the last few scale factors, so switching back and
+forth between window and fullscreen does not rasterize anything again,
+while dragging the window edge through dozens of sizes does not keep
+a cache for every one of them.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Logical vs physical resolution
+- Layers and caching in 2D rendering
+- Why scaling text as bitmaps looks blurry
+"""
+
+import pygame
+
+from .config import Config
+
+LOGICAL_WIDTH = Config.SCREEN_WIDTH
+LOGICAL_HEIGHT = Config.SCREEN_HEIGHT
+
+# Point sizes of the Config fonts
+FONT_SIZES = {"small": 24, "medium": 36, "large": 48, "huge": 72}
+
+# Most text surfaces kept per scale factor
+TEXT_CACHE_SIZE = 256
+
+# Most scale factors whose fonts, text and tiles are kept
+SCALE_CACHE_SIZE = 3
+
+
+def _display_format(surface, alpha=False):
+    """Convert a surface to the window's pixel format, if there is one."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+
+class Layout:
+    """
+    Maps logical coordinates to window pixels.
+    
+    Attributes:
+        size (tuple): Window size in pixels
+        scale (float): Window pixels per logical pixel
+        viewport (pygame.Rect): Area of the window showing the game
+    """
+    
+    def __init__(self, size):
+        """
+        Fit the logical screen into a window.
+        
+        Args:
+            size (tuple): Window (width, height) in pixels
+        """
+        width, height = size
+        self.size = (width, height)
+        self.scale = min(width / LOGICAL_WIDTH, height / LOGICAL_HEIGHT)
+        view_width = round(LOGICAL_WIDTH * self.scale)
+        view_height = round(LOGICAL_HEIGHT * self.scale)
+        self.viewport = pygame.Rect(
+            (width - view_width) // 2, (height - view_height) // 2,
+            view_width, view_height
+        )
+    
+    def point(self, x, y):
+        """Window position of a logical point."""
+        return (self.viewport.x + round(x * self.scale),
+                self.viewport.y + round(y * self.scale))
+    
+    def rect(self, x, y, width, height):
+        """Window rectangle of a logical rectangle."""
+        left, top = self.point(x, y)
+        right, bottom = self.point(x + width, y + height)
+        return pygame.Rect(left, top, right - left, bottom - top)
+    
+    def length(self, value):
+        """Window length of a logical length (at least 1 pixel)."""
+        return max(1, round(value * self.scale))
+    
+    def to_logical(self, x, y):
+        """Logical point under a window position (e.g. a mouse click)."""
+        return (int((x - self.viewport.x) // self.scale),
+                int((y - self.viewport.y) // self.scale))
+
+
+class _ScaleCache:
+    """Fonts, text and tiles rasterized for one scale factor."""
+    
+    def __init__(self, scale):
+        self.fonts = {
+            name: pygame.font.Font(None, max(1, round(size * scale)))
+            for name, size in FONT_SIZES.items()
+        }
+        self.text = {}
+        self.tiles = {}
+
+
+class ScaledRenderer:
+    """
+    Draws the playing screen of a TetrisGame at any resolution.
+    
+    Attributes:
+        game (TetrisGame): Game being drawn
+        layout (Layout): Current window layout
+        cell (int): Board cell size in window pixels
+    """
+    
+    def __init__(self, game, size):
+        """
+        Prepare the renderer for a window size.
+        
+        Args:
+            game (TetrisGame): Game to draw
+            size (tuple): Window (width, height) in pixels
+        """
+        self.game = game
+        self._caches = {}
+        self.resize(size)
+    
+    def resize(self, size):
+        """
+        Recompute the layout and static layers for a new window size.
+        
+        Args:
+            size (tuple): Window (width, height) in pixels
+        """
+        self.layout = Layout(size)
+        scale = round(self.layout.scale, 4)
+        
+        # Least recently used first: re-insert the scale at the end
+        cache = self._caches.pop(scale, None) or _ScaleCache(scale)
+        self._caches[scale] = cache
+        while len(self._caches) > SCALE_CACHE_SIZE:
+            del self._caches[next(iter(self._caches))]
+        self._cache = cache
+        
+        self.cell = self.layout.length(self.game.block_size)
+        self.preview_cell = self.layout.length(Config.PREVIEW_BLOCK)
+        self.board_origin = self.layout.point(0, Config.HEADER_HEIGHT)
+        self.background = self._build_background()
+        self.dim_layer = None
+    
+    def text(self, font, string, color):
+        """
+        Get a rendered text surface, rasterizing it only once.
+        
+        Args:
+            font (str): Key of FONT_SIZES
+            string (str): Text
+            color (tuple): RGB color
+        
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        key = (font, string, color)
+        cache = self._cache.text
+        surface = cache.get(key)
+        if surface is None:
+            if len(cache) >= TEXT_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            surface = _display_format(
+                self._cache.fonts[font].render(string, True, color), True
+            )
+            cache[key] = surface
+        return surface
+    
+    def tile(self, color, size, outline=0):
+        """
+        Get a block tile, rasterizing it only once.
+        
+        Args:
+            color (tuple): Block color
+            size (int): Edge length in window pixels
+            outline (int): 0 for a filled block with a white border,
+                           otherwise the width of a hollow outline
+        
+        Returns:
+            pygame.Surface: The tile
+        """
+        key = (color, size, outline)
+        tile = self._cache.tiles.get(key)
+        if tile is None:
+            tile = _display_format(pygame.Surface((size, size)))
+            border = max(1, round(self.layout.scale))
+            if outline:
+                # Hollow ghost block: a color key is cheap to blit
+                tile.fill(Config.BLACK)
+                tile.set_colorkey(Config.BLACK, pygame.RLEACCEL)
+                pygame.draw.rect(tile, color, tile.get_rect(), outline)
+            else:
+                tile.fill(color)
+                pygame.draw.rect(tile, Config.WHITE, tile.get_rect(), border)
+            self._cache.tiles[key] = tile
+        return tile
+    
+    def _blit_text(self, surface, font, string, color, x, y, center=False):
+        """Draw text at a logical position (top-left or center)."""
+        rendered = self.text(font, string, color)
+        position = self.layout.point(x, y)
+        if center:
+            position = rendered.get_rect(center=position)
+        surface.blit(rendered, position)
+    
+    def _build_background(self):
+        """Draw everything that does not change during play."""
+        layout = self.layout
+        grid = self.game.grid
+        background = _display_format(pygame.Surface(layout.size))
+        background.fill(Config.BLACK)
+        
+        # Header
+        background.fill(Config.HEADER_BG,
+                        layout.rect(0, 0, LOGICAL_WIDTH, Config.HEADER_HEIGHT))
+        self._blit_text(background, "large", "TETRIS", Config.WHITE,
+                        *Config.HEADER_TITLE)
+        
+        # Board background and grid lines
+        cell = self.cell
+        left, top = self.board_origin
+        bottom = layout.viewport.bottom
+        board_width = grid.cols * cell
+        background.fill(Config.GAME_BG, (left, top, board_width, bottom - top))
+        for x in range(grid.cols + 1):
+            pygame.draw.line(background, Config.GRID_LINE,
+                             (left + x * cell, top), (left + x * cell, bottom))
+        for y in range(grid.rows + 1):
+            pygame.draw.line(background, Config.GRID_LINE,
+                             (left, top + y * cell),
+                             (left + board_width, top + y * cell))
+        
+        # Sidebar panels and labels
+        sidebar_x = Config.SIDEBAR_X
+        for panel_top, panel_height in (Config.NEXT_PANEL, Config.STATS_PANEL,
+                                        Config.CONTROLS_PANEL):
+            background.fill(Config.SIDEBAR_BG,
+                            layout.rect(sidebar_x, panel_top,
+                                        Config.SIDEBAR_WIDTH, panel_height))
+        label_x, label_y = Config.NEXT_LABEL
+        self._blit_text(background, "medium", "NEXT", Config.WHITE,
+                        sidebar_x + label_x, label_y)
+        label_x, label_y = Config.CONTROLS_LABEL
+        self._blit_text(background, "small", "CONTROLS", Config.CYAN,
+                        sidebar_x + label_x, label_y)
+        list_x, list_y = Config.CONTROLS_LIST
+        for index, (key, action) in enumerate(Config.CONTROL_ITEMS):
+            self._blit_text(background, "small", f"{key}: {action}",
+                            Config.LIGHT_GRAY, sidebar_x + list_x,
+                            list_y + index * Config.CONTROLS_SPACING)
+        return background
+    
+    def _piece_blits(self, piece, left, top, cell, y=None, outline=0):
+        """Tile blits for a piece whose grid origin is at (left, top)."""
+        tile = self.tile(piece.color, cell, outline)
+        piece_y = piece.y if y is None else y
+        return [
+            (tile, (left + (piece.x + col) * cell,
+                    top + (piece_y + row) * cell))
+            for row, line in enumerate(piece.shape)
+            for col, filled in enumerate(line) if filled
+        ]
+    
+    def draw(self, surface, snapshot=None):
+        """
+        Draw the playing screen.
+        
+        Args:
+            surface (pygame.Surface): Window surface
+            snapshot (FrameSnapshot, optional): Draw this frozen state
+                                                instead of the live game
+        """
+        if surface.get_size() != self.layout.size:
+            self.resize(surface.get_size())
+        game = snapshot or self.game
+        cell = self.cell
+        left, top = self.board_origin
+        
+        surface.blit(self.background, (0, 0))
+        
+        # Header values
+        self._blit_text(surface, "small", f"Player: {game.player_name}",
+                        Config.WHITE, *Config.HEADER_PLAYER)
+        self._blit_text(surface, "small", f"Score: {game.score}",
+                        Config.WHITE, *Config.HEADER_SCORE)
+        self._blit_text(surface, "small", f"Level: {game.level}",
+                        Config.WHITE, *Config.HEADER_LEVEL)
+        self._blit_text(surface, "small", f"High: {game.high_score}",
+                        Config.WHITE, *Config.HEADER_HIGH)
+        
+        # Board, ghost and falling piece
+        tile = self.tile
+        blits = [
+            (tile(color, cell), (left + x * cell, top + y * cell))
+            for (x, y), color in (snapshot.filled_cells() if snapshot
+                                  else game.grid.get_filled_cells())
+        ]
+        piece = game.current_piece
+        ghost_y = snapshot.ghost_y if snapshot else game.get_ghost_y()
+        blits += self._piece_blits(piece, left, top, cell, ghost_y,
+                                   self.layout.length(2))
+        blits += self._piece_blits(piece, left, top, cell)
+        
+        # Next piece preview (drawn as if it sat at x = 0, y = 0)
+        preview = game.next_piece
+        if preview:
+            origin_x, origin_y = Config.PREVIEW_ORIGIN
+            preview_left, preview_top = self.layout.point(
+                Config.SIDEBAR_X + origin_x, origin_y
+            )
+            size = self.preview_cell
+            preview_tile = tile(preview.color, size)
+            blits += [
+                (preview_tile, (preview_left + col * size,
+                                preview_top + row * size))
+                for row, line in enumerate(preview.shape)
+                for col, filled in enumerate(line) if filled
+            ]
+        surface.blits(blits, False)
+        
+        label_x, label_y = Config.LINES_LABEL
+        self._blit_text(surface, "small", f"Lines: {game.lines_cleared}",
+                        Config.WHITE, Config.SIDEBAR_X + label_x, label_y)
+        
+        if game.paused:
+            self._draw_pause(surface)
+    
+    def _draw_pause(self, surface):
+        """Dim the game and show the pause message."""
+        if self.dim_layer is None:
+            self.dim_layer = _display_format(
+                pygame.Surface(self.layout.viewport.size)
+            )
+            self.dim_layer.fill(Config.BLACK)
+            self.dim_layer.set_alpha(150)
+        surface.blit(self.dim_layer, self.layout.viewport)
+        self._blit_text(surface, "huge", "PAUSED", Config.YELLOW,
+                        LOGICAL_WIDTH // 2, LOGICAL_HEIGHT // 2, center=True)
+        self._blit_text(surface, "small", "Press P to Continue", Config.WHITE,
+                        LOGICAL_WIDTH // 2, LOGICAL_HEIGHT // 2 + 60,
+                        center=True)
+
+
+def present_canvas(canvas, window):
+    """
+    Show a logical-resolution surface in a window of any size.
+    
+    Used for the menu screens, which are drawn at the logical resolution
+    and only change on input.
+    
+    Args:
+        canvas (pygame.Surface): Logical screen
+        window (pygame.Surface): Window surface
+    """
+    layout = Layout(window.get_size())
+    window.fill(Config.BLACK)
+    if layout.viewport.size == canvas.get_size():
+        window.blit(canvas, layout.viewport)
+    else:
+        window.blit(pygame.transform.smoothscale(canvas, layout.viewport.size),
+                    layout.viewport)
+    pygame.display.flip()
@@ -0,0 +1,302 @@
+"""
+Engine Module - Headless Game Rules
+===================================
+
+This module contains the GameEngine class: the complete Tetris rules
+(movement, rotation, gravity, locking, scoring and levels) without any
+window, input device or drawing code.
+
+TetrisGame builds on top of it to add Pygame input and rendering, while
+benchmarks, bots and servers can drive the engine directly with any
+board size.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Separating game rules from presentation
+- Inheritance for sharing behavior between classes
+- Time-based simulation with explicit time steps
+"""
+
+import random
+
+from .config import Config
+from .tetromino import Tetromino
+from .grid import Grid
+
+
+class GameEngine:
+    """
+    Headless Tetris game state and rules.
+    
+    Attributes:
+        grid (Grid): Game grid/board
+        current_piece (Tetromino): Currently falling piece
+        next_piece (Tetromino): Next piece to spawn
+        score (int): Current score
+        level (int): Current level
+        lines_cleared (int): Total lines cleared
+        fall_time (int): Milliseconds accumulated since the last fall
+        fall_speed (int): Milliseconds between automatic falls
+        paused (bool): Whether gravity is paused
+        game_over (bool): True once a new piece cannot spawn
+        rng (random.Random): Source of every random piece in this game
+        telemetry (Telemetry): Receives game events, or None
+    """
+    
+    def __init__(self, rows=None, cols=None, seed=None, telemetry=None):
+        """
+        Initialize the engine.
+        
+        Args:
+            rows (int, optional): Board height. Defaults to Config.ROWS.
+            cols (int, optional): Board width. Defaults to Config.COLUMNS.
+            seed (int, optional): Seed for the piece sequence. Games with
+                                  the same seed get the same pieces.
+            telemetry (Telemetry, optional): Receives spawn, lock, clear,
+                                             level up and game over events
+        """
+        self.grid = Grid(rows, cols)
+        self.rng = random.Random(seed)
+        self.telemetry = telemetry
+        self.reset_game()
+    
+    def reset_game(self):
+        """Reset game state for a new game."""
+        self.grid.clear()
+        self.current_piece = self.spawn_piece()
+        self.next_piece = self.spawn_piece()
+        self.score = 0
+        self.level = 1
+        self.lines_cleared = 0
+        self.fall_time = 0
+        self.fall_speed = Config.get_level_speed(self.level)
+        self.paused = False
+        self.game_over = False
+        if self.telemetry:
+            self.telemetry.piece_spawned(self.current_piece)
+    
+    def spawn_piece(self):
+        """
+        Create a new random piece centered on this board.
+        
+        Returns:
+            Tetromino: The new piece
+        """
+        return Tetromino(columns=self.grid.cols, rng=self.rng)
+    
+    def move(self, dx):
+        """
+        Move the current piece horizontally.
+        
+        Args:
+            dx (int): Columns to move (negative = left)
+        
+        Returns:
+            bool: True if the piece moved
+        """
+        if self.grid.is_valid_position(self.current_piece, dx, 0):
+            self.current_piece.x += dx
+            return True
+        return False
+    
+    def soft_drop(self):
+        """
+        Move the current piece down one row, awarding one point.
+        
+        Returns:
+            bool: True if the piece moved
+        """
+        if self.grid.is_valid_position(self.current_piece, 0, 1):
+            self.current_piece.y += 1
+            self.score += 1  # Bonus point for soft drop
+            return True
+        return False
+    
+    def rotate(self):
+        """
+        Rotate the current piece clockwise with a simple wall kick.
+        
+        Returns:
+            bool: True if the rotation succeeded
+        """
+        original_shape = [row[:] for row in self.current_piece.shape]
+        original_rotation = self.current_piece.rotation
+        self.current_piece.rotate_clockwise()
+        
+        # Wall kick: try to adjust position if rotation causes collision
+        if self.grid.is_valid_position(self.current_piece, 0, 0):
+            return True
+        
+        # Try moving left or right
+        for offset in [1, -1, 2, -2]:
+            if self.grid.is_valid_position(self.current_piece, offset, 0):
+                self.current_piece.x += offset
+                return True
+        
+        # Can't rotate, revert
+        self.current_piece.shape = original_shape
+        self.current_piece.rotation = original_rotation
+        return False
+    
+    def hard_drop(self):
+        """
+        Drop the current piece to the bottom and lock it.
+        
+        Returns:
+            int: Number of rows the piece fell
+        """
+        drop_distance = self.grid.get_drop_distance(self.current_piece)
+        self.current_piece.y += drop_distance
+        self.score += drop_distance * 2  # Bonus points
+        self.lock_current_piece()
+        return drop_distance
+    
+    def get_placements(self):
+        """
+        List every spot the current piece can be hard-dropped into.
+        
+        A placement is described by how many clockwise turns to apply
+        to the current piece and the column of its left edge; the piece
+        then falls straight down from its current height.
+        
+        Returns:
+            list: (rotation, x, landing_y) tuples, one per distinct
+                  final position
+        """
+        placements = []
+        probe = self.current_piece.clone()
+        seen_shapes = set()
+        
+        for rotation in range(4):
+            key = tuple(map(tuple, probe.shape))
+            if key not in seen_shapes:
+                seen_shapes.add(key)
+                for x in range(self.grid.cols - probe.get_width() + 1):
+                    probe.x = x
+                    if self.grid.is_valid_position(probe):
+                        landing_y = probe.y + self.grid.get_drop_distance(probe)
+                        placements.append((rotation, x, landing_y))
+            probe.rotate_clockwise()
+        
+        return placements
+    
+    def place(self, rotation, x):
+        """
+        Rotate, move and hard-drop the current piece in one step.
+        
+        Args:
+            rotation (int): Clockwise quarter turns to apply
+            x (int): Column of the piece's left edge
+        
+        Returns:
+            bool: False (and nothing changes) if the position is blocked
+        """
+        piece = self.current_piece
+        original = ([row[:] for row in piece.shape], piece.rotation, piece.x)
+        for _ in range(rotation):
+            piece.rotate_clockwise()
+        piece.x = x
+        
+        if not self.grid.is_valid_position(piece):
+            piece.shape, piece.rotation, piece.x = original
+            return False
+        
+        self.hard_drop()
+        return True
+    
+    def lock_current_piece(self):
+        """
+        Lock the current piece into the grid and spawn next piece.
+        
+        This method:
+        1. Places current piece on grid
+        2. Clears full rows
+        3. Updates score
+        4. Spawns next piece
+        5. Checks for game over
+        
+        Returns:
+            int: Number of rows cleared by this piece
+        """
+        telemetry = self.telemetry
+        
+        # Lock piece into grid
+        touched = self.grid.lock_tetromino(self.current_piece)
+        if telemetry:
+            telemetry.piece_locked(self.current_piece)
+        
+        # Clear full rows (only the piece's rows can be full) and score
+        rows = self.grid.clear_full_rows(touched)
+        if rows > 0:
+            self.lines_cleared += rows
+            points = Config.calculate_score(rows)
+            self.score += points
+            if telemetry:
+                telemetry.rows_cleared(rows, points, self.lines_cleared,
+                                       self.score)
+            
+            # Level up every 10 lines
+            new_level = (self.lines_cleared // 10) + 1
+            if new_level > self.level:
+                self.level = new_level
+                self.fall_speed = Config.get_level_speed(self.level)
+                if telemetry:
+                    telemetry.level_up(self.level, self.fall_speed,
+                                       self.lines_cleared)
+        
+        # Spawn next piece
+        self.current_piece = self.next_piece
+        self.next_piece = self.spawn_piece()
+        
+        # Check game over
+        if not self.grid.is_valid_position(self.current_piece, 0, 0):
+            self.game_over = True
+            if telemetry:
+                telemetry.game_over(self.score, self.level,
+                                    self.lines_cleared)
+        elif telemetry:
+            telemetry.piece_spawned(self.current_piece)
+        
+        return rows
+    
+    def update(self, elapsed):
+        """
+        Advance gravity by a number of milliseconds.
+        
+        Args:
+            elapsed (int): Milliseconds since the previous update
+        
+        Returns:
+            bool: True if the piece fell or locked during this update
+        """
+        if self.paused:
+            return False
+        
+        # Update fall timer
+        self.fall_time += elapsed
+        
+        # Check if piece should fall
+        if self.fall_time >= self.fall_speed:
+            self.fall_time = 0
+            
+            # Try to move piece down
+            if self.grid.is_valid_position(self.current_piece, 0, 1):
+                self.current_piece.y += 1
+            else:
+                # Piece has landed
+                self.lock_current_piece()
+            return True
+        
+        return False
+    
+    def get_ghost_y(self):
+        """
+        Find the row the current piece would land on.
+        
+        Returns:
+            int: Landing y position of the current piece
+        """
+        return self.current_piece.y + self.grid.get_drop_distance(
+            self.current_piece
+        )
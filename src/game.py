@@ -9,6 +9,13 @@ This module contains the TetrisGame class that orchestrates all game components:
 - Scoring system
 - Game state management
 
+``run`` is the classic blocking loop. ``run_async`` runs the same
+states as a coroutine whose frames are awaited (see
+src/async_clock.py), so the game can share an asyncio event loop with
+servers and other tasks:
+
+    asyncio.run(TetrisGame().run_async())
+
 Educational Purpose:
 -------------------
 Learn about:
@@ -18,20 +25,27 @@ Learn about:
 - Game physics and timing
 """
 
+import os
 import pygame
 import sys
+import time
+from .async_clock import AsyncClock
 from .config import Config
-from .tetromino import Tetromino
-from .grid import Grid
+from .display import Layout, ScaledRenderer, present_canvas
+from .engine import GameEngine
+from .leaderboard import Leaderboard
+from .renderer import PaletteBoardRenderer
+from .threaded import SimulationThread
 from .ui import UI
 
 
-class TetrisGame:
+class TetrisGame(GameEngine):
     """
     Main game class that manages the Tetris game flow.
     
     This class implements the game loop pattern and coordinates
-    all game components (grid, pieces, UI, input).
+    all game components (grid, pieces, UI, input). The game rules
+    themselves are inherited from GameEngine.
     
     Attributes:
         screen (pygame.Surface): Game display surface
@@ -46,44 +60,118 @@ class TetrisGame:
         lines_cleared (int): Total lines cleared
         high_score (int): Highest score achieved
         player_name (str): Player's name
+        leaderboard (Leaderboard): Persistent score storage
+        block_size (int): Pixel size of one cell, shrunk to fit large boards
+        window (pygame.Surface): Real window in resizable/fullscreen mode,
+                                 where ``screen`` is a logical-size canvas
+        running (bool): True while ``run_async`` drives the game; quitting
+                        then ends the coroutine instead of the process
     """
     
-    def __init__(self):
-        """Initialize the game."""
+    def __init__(self, rows=None, cols=None, leaderboard=None,
+                 palette_renderer=False, headless=False, resizable=False,
+                 fullscreen=False, threaded=False, telemetry=None,
+                 gc_policy=None):
+        """
+        Initialize the game.
+        
+        Args:
+            rows (int, optional): Board height. Defaults to Config.ROWS.
+            cols (int, optional): Board width. Defaults to Config.COLUMNS.
+            leaderboard (Leaderboard, optional): Score storage. Defaults
+                                                 to Config.LEADERBOARD_FILE.
+            palette_renderer (bool): Draw the board through one scaled
+                                     8-bit surface instead of per cell
+            headless (bool): Render into an offscreen surface without
+                             opening a window (uses the SDL dummy driver)
+            resizable (bool): Open a resizable window; the game is drawn
+                              at the window's resolution
+            fullscreen (bool): Start in fullscreen at the desktop
+                               resolution (implies ``resizable``)
+            threaded (bool): Run input and gravity on a simulation
+                             thread while the main thread only draws
+            telemetry (Telemetry, optional): Receives game events and
+                                             per-second timing summaries
+            gc_policy (GCPolicy, optional): Runs garbage collection when
+                                            pieces lock instead of in
+                                            random frames
+        """
+        self.headless = headless
+        self.gc_policy = gc_policy
+        self.threaded = threaded
+        if headless:
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        
         # Initialize Pygame
         pygame.init()
         
-        # Setup display
-        self.screen = pygame.display.set_mode(
-            (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
-        )
-        pygame.display.set_caption("Tetris - Python Game Development Project")
+        # Setup display (or an offscreen surface of the same size whose
+        # pixels live in frame_buffer, so they can be read without locks)
+        self.frame_buffer = None
+        self.window = None
+        self.fullscreen = fullscreen
+        if headless:
+            self.frame_buffer = bytearray(
+                Config.SCREEN_WIDTH * Config.SCREEN_HEIGHT * 4
+            )
+            self.screen = pygame.image.frombuffer(
+                self.frame_buffer,
+                (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), "RGBX"
+            )
+        elif resizable or fullscreen:
+            # Menus draw on a logical canvas that is scaled when shown;
+            # play is drawn directly at window resolution
+            self.window = self._open_window()
+            self.screen = pygame.Surface(
+                (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+            )
+        else:
+            self.screen = pygame.display.set_mode(
+                (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT)
+            )
+        if not headless:
+            pygame.display.set_caption(
+                "Tetris - Python Game Development Project"
+            )
         
         # Game clock
         self.clock = pygame.time.Clock()
         
         # Initialize components
-        self.grid = Grid()
-        self.ui = UI(self.screen, self.clock)
+        present = self.present_canvas if self.window else None
+        to_screen = self.canvas_position if self.window else None
+        if headless:
+            # Offscreen surfaces have nothing to flip
+            present = self._present_nothing
+        self.ui = UI(self.screen, self.clock, present, to_screen)
         
         # Game state
         self.state = Config.STATE_MENU
-        self.reset_game()
+        self.running = False
+        GameEngine.__init__(self, rows, cols, telemetry=telemetry)
         
-        # High score (persists across games)
-        self.high_score = 0
+        # Shrink cells so that wide or tall boards still fit the play area
+        self.block_size = max(1, min(
+            Config.BLOCK_SIZE,
+            Config.GAME_WIDTH // self.grid.cols,
+            (Config.SCREEN_HEIGHT - 80) // self.grid.rows
+        ))
+        self.board_renderer = None
+        self.scaled_renderer = None
+        if self.window:
+            self.scaled_renderer = ScaledRenderer(self, self.window.get_size())
+        elif palette_renderer:
+            self.board_renderer = PaletteBoardRenderer(
+                self.grid, self.block_size
+            )
+        
+        # High score (persists across games and restarts)
+        self.leaderboard = leaderboard or Leaderboard()
+        self.high_score = self.leaderboard.high_score()
     
     def reset_game(self):
         """Reset game state for a new game."""
-        self.grid.clear()
-        self.current_piece = Tetromino()
-        self.next_piece = Tetromino()
-        self.score = 0
-        self.level = 1
-        self.lines_cleared = 0
-        self.fall_time = 0
-        self.fall_speed = Config.get_level_speed(self.level)
-        self.paused = False
+        super().reset_game()
         self.player_name = "Player"
     
     def handle_input(self):
@@ -96,232 +184,336 @@ class TetrisGame:
         - Hard drop
         - Pause
         - Quit
+        
+        Key presses are applied by ``handle_key``.
         """
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.quit_game()
             
+            if event.type == pygame.VIDEORESIZE and self.window:
+                self.resize()
+            
             if event.type == pygame.KEYDOWN:
-                # Pause toggle
-                if event.key == pygame.K_p:
-                    self.paused = not self.paused
-                    if self.paused:
-                        self.ui.draw_pause_screen()
-                    return
-                
-                # Quit
-                if event.key == pygame.K_ESCAPE:
-                    self.state = Config.STATE_GAME_OVER
+                # Fullscreen toggle (resizable/fullscreen mode only)
+                if event.key == pygame.K_F11 and self.window:
+                    self.toggle_fullscreen()
                     return
                 
-                # Skip if paused
-                if self.paused:
+                if self.handle_key(event.key):
+                    if event.key == pygame.K_p and self.paused:
+                        self.ui.draw_pause_screen()
                     return
-                
-                # Move left
-                if event.key == pygame.K_LEFT:
-                    if self.grid.is_valid_position(self.current_piece, -1, 0):
-                        self.current_piece.x -= 1
-                
-                # Move right
-                if event.key == pygame.K_RIGHT:
-                    if self.grid.is_valid_position(self.current_piece, 1, 0):
-                        self.current_piece.x += 1
-                
-                # Soft drop (move down faster)
-                if event.key == pygame.K_DOWN:
-                    if self.grid.is_valid_position(self.current_piece, 0, 1):
-                        self.current_piece.y += 1
-                        self.score += 1  # Bonus point for soft drop
-                
-                # Rotate
-                if event.key == pygame.K_UP:
-                    original_shape = [row[:] for row in self.current_piece.shape]
-                    self.current_piece.rotate_clockwise()
-                    
-                    # Wall kick: try to adjust position if rotation causes collision
-                    if not self.grid.is_valid_position(self.current_piece, 0, 0):
-                        # Try moving left or right
-                        for offset in [1, -1, 2, -2]:
-                            if self.grid.is_valid_position(
-                                self.current_piece, offset, 0
-                            ):
-                                self.current_piece.x += offset
-                                break
-                        else:
-                            # Can't rotate, revert
-                            self.current_piece.shape = original_shape
-                
-                # Hard drop (instant drop to bottom)
-                if event.key == pygame.K_SPACE:
-                    drop_distance = 0
-                    while self.grid.is_valid_position(self.current_piece, 0, 1):
-                        self.current_piece.y += 1
-                        drop_distance += 1
-                    self.score += drop_distance * 2  # Bonus points
-                    self.lock_current_piece()
+    
+    def handle_key(self, key):
+        """
+        Apply one key press to the game.
+        
+        Args:
+            key (int): Pygame key code
+        
+        Returns:
+            bool: True if the rest of this frame's input should be
+                  ignored (pause toggled, game ended, or paused)
+        """
+        # Pause toggle
+        if key == pygame.K_p:
+            self.paused = not self.paused
+            return True
+        
+        # Quit
+        if key == pygame.K_ESCAPE:
+            self.finish_game()
+            return True
+        
+        # Skip if paused
+        if self.paused:
+            return True
+        
+        # Move left
+        if key == pygame.K_LEFT:
+            self.move(-1)
+        
+        # Move right
+        if key == pygame.K_RIGHT:
+            self.move(1)
+        
+        # Soft drop (move down faster)
+        if key == pygame.K_DOWN:
+            self.soft_drop()
+        
+        # Rotate
+        if key == pygame.K_UP:
+            self.rotate()
+        
+        # Hard drop (instant drop to bottom)
+        if key == pygame.K_SPACE:
+            self.hard_drop()
+        
+        return False
     
     def lock_current_piece(self):
         """
         Lock the current piece into the grid and spawn next piece.
         
-        This method:
-        1. Places current piece on grid
-        2. Clears full rows
-        3. Updates score
-        4. Spawns next piece
-        5. Checks for game over
-        """
-        # Lock piece into grid
-        self.grid.lock_tetromino(self.current_piece)
-        
-        # Clear full rows and update score
-        rows = self.grid.clear_full_rows()
-        if rows > 0:
-            self.lines_cleared += rows
-            points = Config.calculate_score(rows)
-            self.score += points
-            
-            # Level up every 10 lines
-            new_level = (self.lines_cleared // 10) + 1
-            if new_level > self.level:
-                self.level = new_level
-                self.fall_speed = Config.get_level_speed(self.level)
+        Extends GameEngine.lock_current_piece by switching to the
+        game over state and recording the high score.
+        
+        Returns:
+            int: Number of rows cleared by this piece
+        """
+        rows = super().lock_current_piece()
+        
+        # A piece just landed: a short pause here is not noticed
+        if self.gc_policy:
+            self.gc_policy.safe_point()
         
-        # Spawn next piece
-        self.current_piece = self.next_piece
-        self.next_piece = Tetromino()
+        if self.game_over:
+            self.finish_game()
         
-        # Check game over
-        if not self.grid.is_valid_position(self.current_piece, 0, 0):
-            self.state = Config.STATE_GAME_OVER
-            if self.score > self.high_score:
-                self.high_score = self.score
+        return rows
     
-    def update(self):
+    def finish_game(self):
+        """
+        End the current game and record its result.
+        
+        The leaderboard write happens on a background thread, so this
+        never waits for the disk.
+        """
+        if self.telemetry and not self.game_over:
+            # Ended by the player; topping out is recorded by the engine
+            self.telemetry.game_over(self.score, self.level,
+                                     self.lines_cleared, quit=True)
+        self.state = Config.STATE_GAME_OVER
+        self.leaderboard.record(
+            self.player_name, self.score, self.level, self.lines_cleared
+        )
+        if self.score > self.high_score:
+            self.high_score = self.score
+    
+    def update(self, elapsed=None):
         """
         Update game state.
         
         This method handles automatic piece falling based on the game timer.
+        
+        Args:
+            elapsed (int, optional): Milliseconds to advance. Defaults to
+                                     the duration of the last frame.
+        
+        Returns:
+            bool: True if the piece fell or locked during this update
         """
-        if self.paused:
+        if elapsed is None:
+            elapsed = self.clock.get_rawtime()
+        if self.telemetry is None:
+            return super().update(elapsed)
+        
+        start = time.perf_counter_ns()
+        moved = super().update(elapsed)
+        self.telemetry.tick(time.perf_counter_ns() - start)
+        return moved
+    
+    def draw_grid(self, filled_cells=None):
+        """
+        Draw the game grid and all placed blocks.
+        
+        Args:
+            filled_cells (iterable, optional): ((x, y), color) pairs to
+                                               draw instead of the grid's
+                                               own cells (e.g. from a
+                                               FrameSnapshot)
+        """
+        if filled_cells is None and self.board_renderer:
+            self.board_renderer.draw(self.screen)
             return
         
-        # Update fall timer
-        self.fall_time += self.clock.get_rawtime()
+        size = self.block_size
+        board_width = self.grid.cols * size
         
-        # Check if piece should fall
-        if self.fall_time >= self.fall_speed:
-            self.fall_time = 0
-            
-            # Try to move piece down
-            if self.grid.is_valid_position(self.current_piece, 0, 1):
-                self.current_piece.y += 1
-            else:
-                # Piece has landed
-                self.lock_current_piece()
-    
-    def draw_grid(self):
-        """Draw the game grid and all placed blocks."""
         # Draw grid background
         pygame.draw.rect(
             self.screen, Config.GAME_BG,
-            (0, 80, Config.GAME_WIDTH, Config.SCREEN_HEIGHT - 80)
+            (0, 80, board_width, Config.SCREEN_HEIGHT - 80)
         )
         
         # Draw grid lines
-        for x in range(Config.COLUMNS + 1):
+        for x in range(self.grid.cols + 1):
             pygame.draw.line(
                 self.screen, Config.GRID_LINE,
-                (x * Config.BLOCK_SIZE, 80),
-                (x * Config.BLOCK_SIZE, Config.SCREEN_HEIGHT),
+                (x * size, 80),
+                (x * size, Config.SCREEN_HEIGHT),
                 1
             )
         
-        for y in range(Config.ROWS + 1):
+        for y in range(self.grid.rows + 1):
             pygame.draw.line(
                 self.screen, Config.GRID_LINE,
-                (0, y * Config.BLOCK_SIZE + 80),
-                (Config.GAME_WIDTH, y * Config.BLOCK_SIZE + 80),
+                (0, y * size + 80),
+                (board_width, y * size + 80),
                 1
             )
         
         # Draw placed blocks
-        for (x, y), color in self.grid.get_filled_cells():
+        if filled_cells is None:
+            filled_cells = self.grid.get_filled_cells()
+        for (x, y), color in filled_cells:
             pygame.draw.rect(
                 self.screen, color,
-                (x * Config.BLOCK_SIZE, y * Config.BLOCK_SIZE + 80,
-                 Config.BLOCK_SIZE, Config.BLOCK_SIZE)
+                (x * size, y * size + 80, size, size)
             )
             pygame.draw.rect(
                 self.screen, Config.WHITE,
-                (x * Config.BLOCK_SIZE, y * Config.BLOCK_SIZE + 80,
-                 Config.BLOCK_SIZE, Config.BLOCK_SIZE),
+                (x * size, y * size + 80, size, size),
                 1
             )
     
-    def draw_current_piece(self):
-        """Draw the currently falling piece."""
-        for row_idx, row in enumerate(self.current_piece.shape):
+    def draw_current_piece(self, piece=None):
+        """
+        Draw the currently falling piece.
+        
+        Args:
+            piece (optional): Piece to draw instead of ``current_piece``;
+                              anything with shape, color, x and y
+        """
+        piece = piece or self.current_piece
+        size = self.block_size
+        for row_idx, row in enumerate(piece.shape):
             for col_idx, cell in enumerate(row):
                 if cell:
-                    x = (self.current_piece.x + col_idx) * Config.BLOCK_SIZE
-                    y = (self.current_piece.y + row_idx) * Config.BLOCK_SIZE + 80
+                    x = (piece.x + col_idx) * size
+                    y = (piece.y + row_idx) * size + 80
                     
                     pygame.draw.rect(
-                        self.screen, self.current_piece.color,
-                        (x, y, Config.BLOCK_SIZE, Config.BLOCK_SIZE)
+                        self.screen, piece.color,
+                        (x, y, size, size)
                     )
                     pygame.draw.rect(
                         self.screen, Config.WHITE,
-                        (x, y, Config.BLOCK_SIZE, Config.BLOCK_SIZE),
+                        (x, y, size, size),
                         1
                     )
     
-    def draw_ghost_piece(self):
-        """Draw a ghost/shadow of where the piece will land."""
+    def draw_ghost_piece(self, piece=None, ghost_y=None):
+        """
+        Draw a ghost/shadow of where the piece will land.
+        
+        Args:
+            piece (optional): Piece to draw instead of ``current_piece``
+            ghost_y (int, optional): Landing row, if already known
+        """
+        piece = piece or self.current_piece
+        size = self.block_size
+        
         # Find landing position
-        ghost_y = self.current_piece.y
-        while self.grid.is_valid_position(self.current_piece, 0, ghost_y - self.current_piece.y + 1):
-            ghost_y += 1
+        if ghost_y is None:
+            ghost_y = self.get_ghost_y()
         
         # Draw ghost piece (semi-transparent)
-        for row_idx, row in enumerate(self.current_piece.shape):
+        for row_idx, row in enumerate(piece.shape):
             for col_idx, cell in enumerate(row):
                 if cell:
-                    x = (self.current_piece.x + col_idx) * Config.BLOCK_SIZE
-                    y = (ghost_y + row_idx) * Config.BLOCK_SIZE + 80
+                    x = (piece.x + col_idx) * size
+                    y = (ghost_y + row_idx) * size + 80
                     
                     # Draw as outline only
                     pygame.draw.rect(
-                        self.screen, self.current_piece.color,
-                        (x, y, Config.BLOCK_SIZE, Config.BLOCK_SIZE),
+                        self.screen, piece.color,
+                        (x, y, size, size),
                         2
                     )
     
-    def render(self):
-        """Render all game elements."""
+    def _open_window(self):
+        """Open the resizable window or the fullscreen display."""
+        if self.fullscreen:
+            return pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        return pygame.display.set_mode(
+            (Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT), pygame.RESIZABLE
+        )
+    
+    def resize(self):
+        """Recompute the layout after the window changed size."""
+        self.window = pygame.display.get_surface()
+        self.scaled_renderer.resize(self.window.get_size())
+    
+    def toggle_fullscreen(self):
+        """Switch between fullscreen and a resizable window."""
+        self.fullscreen = not self.fullscreen
+        self._open_window()
+        self.resize()
+    
+    def _present_nothing(self):
+        """Menu ``present`` in headless mode: the frame stays offscreen."""
+    
+    def present_canvas(self):
+        """Show the logical canvas (menus) scaled to the window."""
+        present_canvas(self.screen, self.window)
+    
+    def canvas_position(self, position):
+        """
+        Map a window position to the logical canvas of the menus.
+        
+        Args:
+            position (tuple): (x, y) in window pixels
+        
+        Returns:
+            tuple: (x, y) on the canvas, as shown by ``present_canvas``
+        """
+        return Layout(self.window.get_size()).to_logical(*position)
+    
+    def render(self, snapshot=None):
+        """
+        Render all game elements.
+        
+        Args:
+            snapshot (FrameSnapshot, optional): Draw this frozen state
+                                                instead of the live game
+        """
+        if self.telemetry is None:
+            self._draw_frame(snapshot)
+        else:
+            start = time.perf_counter_ns()
+            self._draw_frame(snapshot)
+            self.telemetry.frame(time.perf_counter_ns() - start)
+        
+        if self.gc_policy:
+            self.gc_policy.frame_finished()
+    
+    def _draw_frame(self, snapshot):
+        """Draw and show one frame (see ``render``)."""
+        if self.scaled_renderer:
+            self.scaled_renderer.draw(self.window, snapshot)
+            pygame.display.flip()
+            return
+        
+        view = snapshot or self
+        filled_cells = ghost_y = None
+        if snapshot:
+            filled_cells = snapshot.filled_cells()
+            ghost_y = snapshot.ghost_y
+        
         self.screen.fill(Config.BLACK)
         
         # Draw header
         self.ui.draw_game_header(
-            self.player_name, self.score, 
-            self.level, self.high_score
+            view.player_name, view.score, 
+            view.level, view.high_score
         )
         
         # Draw game area
-        self.draw_grid()
-        self.draw_ghost_piece()
-        self.draw_current_piece()
+        self.draw_grid(filled_cells)
+        self.draw_ghost_piece(view.current_piece, ghost_y)
+        self.draw_current_piece(view.current_piece)
         
         # Draw sidebar
-        self.ui.draw_sidebar(self.next_piece, self.lines_cleared)
+        self.ui.draw_sidebar(view.next_piece, view.lines_cleared)
         
         # Draw pause overlay if paused
-        if self.paused:
+        if view.paused:
             self.ui.draw_pause_screen()
         
-        pygame.display.flip()
+        if not self.headless:
+            pygame.display.flip()
     
     def run_menu(self):
         """Run the menu state."""
@@ -332,25 +524,89 @@ class TetrisGame:
     
     def run_login(self):
         """Run the login state."""
-        self.player_name = self.ui.draw_login_screen()
+        player_name = self.ui.draw_login_screen()
         self.reset_game()
+        self.player_name = player_name
         self.state = Config.STATE_PLAYING
     
     def run_playing(self):
         """Run the main game loop."""
+        if self.threaded:
+            self.run_playing_threaded()
+            return
+        
         self.handle_input()
         self.update()
         self.render()
         self.clock.tick(Config.FPS)
     
+    def run_playing_threaded(self):
+        """
+        Run one game with the simulation on its own thread.
+        
+        The main thread only collects events and draws the newest
+        snapshot, so slow frames no longer delay gravity or input.
+        Returns when the game leaves the playing state.
+        """
+        simulation = SimulationThread(self)
+        simulation.start()
+        shown = None
+        try:
+            while self.state == Config.STATE_PLAYING:
+                shown = self._show_simulation(simulation, shown)
+                self.clock.tick(Config.FPS)
+        finally:
+            simulation.stop()
+    
+    def _show_simulation(self, simulation, shown):
+        """
+        Pass this frame's events to the simulation thread and draw its
+        newest snapshot if it changed.
+        
+        Args:
+            simulation (SimulationThread): Running simulation
+            shown (FrameSnapshot): Snapshot drawn last
+        
+        Returns:
+            FrameSnapshot: Snapshot drawn now
+        """
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                simulation.stop()
+                self.quit_game()
+                return shown
+            if event.type == pygame.VIDEORESIZE and self.window:
+                self.resize()
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F11 and self.window:
+                    self.toggle_fullscreen()
+                else:
+                    simulation.send_key(event.key)
+        
+        snapshot = simulation.buffer.latest()
+        if snapshot is not shown:
+            self.render(snapshot)
+        return snapshot
+    
     def run_game_over(self):
         """Run the game over state."""
+        self._copy_last_frame()
         action = self.ui.draw_game_over_screen(self.score, self.high_score)
         if action == "restart":
             self.state = Config.STATE_LOGIN
         else:
             self.quit_game()
     
+    def _copy_last_frame(self):
+        """Put the last frame of play on the canvas (scaled mode only)."""
+        if self.scaled_renderer:
+            # The game over screen darkens the last frame of play, which
+            # was drawn straight to the window; copy it to the canvas
+            pygame.transform.smoothscale(
+                self.window.subsurface(self.scaled_renderer.layout.viewport),
+                self.screen.get_size(), self.screen
+            )
+    
     def run(self):
         """
         Main game loop.
@@ -359,6 +615,8 @@ class TetrisGame:
         logic for each state.
         """
         running = True
+        if self.gc_policy:
+            self.gc_policy.start()
         
         while running:
             if self.state == Config.STATE_MENU:
@@ -370,10 +628,114 @@ class TetrisGame:
             elif self.state == Config.STATE_GAME_OVER:
                 self.run_game_over()
         
+        self.close()
         pygame.quit()
         sys.exit()
     
+    async def run_async(self):
+        """
+        Main game loop as a coroutine.
+        
+        Runs the same states as ``run``, but every screen is a coroutine
+        that awaits its next frame on an AsyncClock instead of blocking
+        in ``clock.tick``, so other tasks on the event loop run between
+        frames. Quitting returns from this coroutine (after closing the
+        leaderboard, telemetry and pygame) instead of exiting the
+        process.
+        """
+        clock = AsyncClock()
+        self.running = True
+        if self.gc_policy:
+            self.gc_policy.start()
+        try:
+            while self.running:
+                if self.state == Config.STATE_MENU:
+                    await self.run_menu_async(clock)
+                elif self.state == Config.STATE_LOGIN:
+                    await self.run_login_async(clock)
+                elif self.state == Config.STATE_PLAYING:
+                    await self.run_playing_async(clock)
+                elif self.state == Config.STATE_GAME_OVER:
+                    await self.run_game_over_async(clock)
+        finally:
+            self.running = False
+            self.close()
+            pygame.quit()
+    
+    async def run_menu_async(self, clock):
+        """Run the menu state (see ``run_async``)."""
+        if await self.ui.welcome_screen(clock):
+            self.state = Config.STATE_LOGIN
+        else:
+            self.quit_game()
+    
+    async def run_login_async(self, clock):
+        """Run the login state (see ``run_async``)."""
+        player_name = await self.ui.login_screen(clock)
+        if player_name is None:
+            self.quit_game()
+            return
+        self.reset_game()
+        self.player_name = player_name
+        self.state = Config.STATE_PLAYING
+    
+    async def run_playing_async(self, clock):
+        """Run one frame of play (see ``run_async``)."""
+        if self.threaded:
+            await self.run_playing_threaded_async(clock)
+            return
+        
+        self.handle_input()
+        if not self.running:
+            return
+        self.update(clock.get_rawtime())
+        self.render()
+        await clock.tick(Config.FPS)
+    
+    async def run_playing_threaded_async(self, clock):
+        """
+        Run one game with the simulation on its own thread (see
+        ``run_playing_threaded`` and ``run_async``).
+        """
+        simulation = SimulationThread(self)
+        simulation.start()
+        shown = None
+        try:
+            while self.running and self.state == Config.STATE_PLAYING:
+                shown = self._show_simulation(simulation, shown)
+                await clock.tick(Config.FPS)
+        finally:
+            simulation.stop()
+    
+    async def run_game_over_async(self, clock):
+        """Run the game over state (see ``run_async``)."""
+        self._copy_last_frame()
+        action = await self.ui.game_over_screen(
+            clock, self.score, self.high_score
+        )
+        if action == "restart":
+            self.state = Config.STATE_LOGIN
+        else:
+            self.quit_game()
+    
+    def close(self):
+        """Write out pending leaderboard results and telemetry."""
+        if self.gc_policy:
+            self.gc_policy.stop()
+        self.leaderboard.close()
+        if self.telemetry:
+            self.telemetry.close()
+    
     def quit_game(self):
-        """Quit the game cleanly."""
+        """
+        Quit the game cleanly.
+        
+        Under ``run_async`` only the loop is stopped; ``run_async``
+        cleans up when it returns.
+        """
+        if self.running:
+            self.running = False
+            return
+        self.close()
         pygame.quit()
         sys.exit()
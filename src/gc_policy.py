@@ -0,0 +1,171 @@
+"""
+GC Policy Module - Garbage Collection at Safe Points
+====================================================
+
+CPython frees most objects immediately by reference counting; the
+cyclic garbage collector only exists for reference cycles. It runs
+automatically whenever enough container objects (lists, tuples,
+dicts, ...) were allocated since the last collection, so a game that
+builds a few hundred short-lived lists and tuples per frame triggers a
+young-generation collection every few frames, and every few hundred
+frames an older, much slower one. Those pauses land in random frames
+and show up as periodic frame spikes in long sessions.
+
+``GCPolicy`` moves collections to moments where a pause is harmless:
+
+- ``start`` collects once and then freezes everything that exists
+  after startup (fonts, surfaces, modules, the game itself) with
+  ``gc.freeze``, so later collections never scan it again
+- automatic collection is disabled; ``safe_point`` (called when a piece
+  locks) collects the oldest generation whose allocation count is over
+  its threshold. CPython also holds full (generation 2) collections
+  back until enough objects have survived since the last one; Python
+  code cannot see that count, so safe points may run generation 2
+  more often than CPython would, never less often
+- ``frame_finished`` is a safety valve: if no safe point came for a
+  long time (paused game, a very slow level) and garbage piled up to
+  ``max_backlog`` times the threshold, it collects anyway
+- ``stop`` restores automatic collection
+
+Nothing is lost by deferring: reference-counted objects are still
+freed immediately, only cycles wait until the next safe point.
+
+How to Run:
+----------
+    python main.py --gc-policy
+    python -m src.allocations --frames 3000 --gc-policy
+
+Educational Purpose:
+-------------------
+Learn about:
+- Reference counting and the generational cycle collector
+- gc.freeze and the permanent generation
+- Moving unavoidable work to where it does not hurt
+"""
+
+import gc
+import time
+
+
+class GCPolicy:
+    """
+    Runs cyclic garbage collection at safe points instead of at random.
+    
+    Attributes:
+        max_backlog (int): Multiple of the young-generation threshold
+                           at which ``frame_finished`` collects even
+                           without a safe point
+        collections (list): Collections run per generation
+        forced (int): Collections run by the safety valve
+        pause_ns (int): Total time spent collecting, in nanoseconds
+        max_pause_ns (int): Longest single collection, in nanoseconds
+        frozen (int): Objects moved to the permanent generation
+        active (bool): True between ``start`` and ``stop``
+    """
+    
+    def __init__(self, max_backlog=20):
+        """
+        Create an inactive policy.
+        
+        Args:
+            max_backlog (int): See ``max_backlog``
+        """
+        self.max_backlog = max_backlog
+        self.collections = [0, 0, 0]
+        self.forced = 0
+        self.pause_ns = 0
+        self.max_pause_ns = 0
+        self.frozen = 0
+        self.active = False
+        self._was_enabled = True
+    
+    def start(self, freeze=True):
+        """
+        Take over garbage collection.
+        
+        Call after startup, once fonts, surfaces and the game exist.
+        
+        Args:
+            freeze (bool): Collect once and freeze all surviving objects
+        """
+        if self.active:
+            return
+        self._was_enabled = gc.isenabled()
+        if freeze:
+            gc.collect()
+            gc.freeze()
+            self.frozen = gc.get_freeze_count()
+        gc.disable()
+        self.active = True
+    
+    def stop(self):
+        """Give collection back to CPython (the frozen objects stay)."""
+        if not self.active:
+            return
+        self.active = False
+        if self._was_enabled:
+            gc.enable()
+    
+    def due_generation(self):
+        """
+        Oldest generation whose count is over its threshold.
+        
+        This is the generation automatic GC would pick next, except
+        that CPython may also postpone a generation 2 collection (its
+        long-lived object ratio is not visible from Python).
+        
+        Returns:
+            int: Oldest generation over its threshold, or None
+        """
+        counts = gc.get_count()
+        thresholds = gc.get_threshold()
+        for generation in (2, 1, 0):
+            if thresholds[generation] and (
+                    counts[generation] > thresholds[generation]):
+                return generation
+        return None
+    
+    def safe_point(self):
+        """
+        Collect if a collection is due; cheap when none is.
+        
+        Returns:
+            int: Generation collected, or None
+        """
+        if not self.active:
+            return None
+        generation = self.due_generation()
+        if generation is not None:
+            self._collect(generation)
+        return generation
+    
+    def frame_finished(self):
+        """
+        Safety valve, called once per frame.
+        
+        Returns:
+            int: Generation collected, or None (the usual case)
+        """
+        if not self.active:
+            return None
+        threshold = gc.get_threshold()[0]
+        if not threshold or gc.get_count()[0] < threshold * self.max_backlog:
+            return None
+        self.forced += 1
+        
+        # With max_backlog <= 1 the young count may equal its threshold
+        # without being over it; collect the young generation then
+        generation = self.due_generation()
+        if generation is None:
+            generation = 0
+        self._collect(generation)
+        return generation
+    
+    def _collect(self, generation):
+        """Run one collection and count its pause."""
+        start = time.perf_counter_ns()
+        gc.collect(generation)
+        pause = time.perf_counter_ns() - start
+        self.collections[generation] += 1
+        self.pause_ns += pause
+        self.max_pause_ns = max(self.max_pause_ns, pause)
@@ -12,10 +12,20 @@ Learn about:
 - Collision detection algorithms
 - Grid-based game mechanics
 - List comprehensions in Python
+- Bitmasks: storing each row as a single Python integer
 """
 
 from .config import Config
 
+# Value stored in ``Grid.grid`` for each palette index (0 = empty)
+CELL_VALUES = [0] + Config.PALETTE[1:]
+
+# Palette index used for block colors that are not in the palette
+OTHER_COLOR = len(Config.PALETTE) - 1
+
+# Maps each palette index byte to b"0" (empty) or b"1" (filled)
+BIT_TABLE = bytes([48] + [49] * 255)
+
 
 class Grid:
     """
@@ -25,17 +35,45 @@ class Grid:
     - 0 represents an empty cell
     - A color tuple represents a filled cell
     
+    Alongside the colors, every row is also kept as an integer bitmask
+    (bit ``x`` set when column ``x`` is filled). Collision checks and
+    line clears only look at these masks, so their cost does not grow
+    with the board width - Python integers have no upper size limit, so
+    a 64 or 1000 column board works exactly like a 10 column one.
+    
+    The board is also packed into ``cells``, a bytearray holding one
+    Config.PALETTE index per cell (row by row). It is cheap to copy,
+    save and hand to NumPy without converting any tuples.
+    
     Attributes:
         grid (list): 2D list representing the game board
         rows (int): Number of rows in the grid
         cols (int): Number of columns in the grid
+        row_masks (list): One integer bitmask per row
+        full_mask (int): Bitmask of a completely filled row
+        top (int): Index of the highest row that may contain blocks;
+                   every row above it is guaranteed to be empty
+        cells (bytearray): Palette index of every cell, row-major
     """
     
-    def __init__(self):
-        """Initialize an empty grid."""
-        self.rows = Config.ROWS
-        self.cols = Config.COLUMNS
-        self.grid = [[0] * self.cols for _ in range(self.rows)]
+    def __init__(self, rows=None, cols=None):
+        """
+        Initialize an empty grid.
+        
+        Args:
+            rows (int, optional): Number of rows. Defaults to Config.ROWS.
+            cols (int, optional): Number of columns. Defaults to Config.COLUMNS.
+        """
+        self.rows = Config.ROWS if rows is None else rows
+        self.cols = Config.COLUMNS if cols is None else cols
+        if self.rows < 1 or self.cols < 1:
+            raise ValueError(
+                f"Grid needs at least one row and column, got "
+                f"{self.rows}x{self.cols}"
+            )
+        self.full_mask = (1 << self.cols) - 1
+        self.cells = bytearray(self.rows * self.cols)
+        self.clear()
     
     def is_valid_position(self, tetromino, offset_x=0, offset_y=0):
         """
@@ -52,70 +90,213 @@ class Grid:
         A position is invalid if:
         - Any block is outside grid bounds
         - Any block overlaps with a filled cell
+        
+        Each shape row is checked as one bitmask against the matching
+        grid row, instead of cell by cell.
         """
-        for row_idx, row in enumerate(tetromino.shape):
-            for col_idx, cell in enumerate(row):
-                if cell:  # If this cell is filled
-                    new_x = tetromino.x + col_idx + offset_x
-                    new_y = tetromino.y + row_idx + offset_y
-                    
-                    # Check horizontal bounds
-                    if new_x < 0 or new_x >= self.cols:
-                        return False
-                    
-                    # Check bottom bound
-                    if new_y >= self.rows:
-                        return False
-                    
-                    # Check collision with placed blocks (ignore if above grid)
-                    if new_y >= 0 and self.grid[new_y][new_x]:
-                        return False
+        x = tetromino.x + offset_x
+        y = tetromino.y + offset_y
+        
+        for row_idx, mask in enumerate(tetromino.get_row_masks()):
+            if not mask:
+                continue
+            
+            # Shift the shape row to its column; bits pushed past the
+            # left edge mean the piece is out of bounds
+            if x >= 0:
+                shifted = mask << x
+            elif mask & ((1 << -x) - 1):
+                return False
+            else:
+                shifted = mask >> -x
+            
+            # Check right bound
+            if shifted > self.full_mask:
+                return False
+            
+            # Check bottom bound
+            grid_y = y + row_idx
+            if grid_y >= self.rows:
+                return False
+            
+            # Check collision with placed blocks (ignore if above grid)
+            if grid_y >= 0 and self.row_masks[grid_y] & shifted:
+                return False
         
         return True
     
+    def get_drop_distance(self, tetromino):
+        """
+        Count how many rows a tetromino can fall before it lands.
+        
+        Args:
+            tetromino (Tetromino): The tetromino to drop
+            
+        Returns:
+            int: Number of rows it can move down
+        
+        Rows above ``top`` are empty, so the piece first jumps straight
+        through that region and only steps row by row near the stack.
+        """
+        if not self.is_valid_position(tetromino):
+            return 0
+        
+        distance = max(0, self.top - tetromino.get_height() - tetromino.y)
+        while self.is_valid_position(tetromino, 0, distance + 1):
+            distance += 1
+        return distance
+    
     def lock_tetromino(self, tetromino):
         """
         Lock a tetromino into the grid permanently.
         
         Args:
             tetromino (Tetromino): The tetromino to lock in place
+        
+        Returns:
+            list: Rows the piece filled cells in, top to bottom; only
+                  these can have become full (see ``clear_full_rows``)
             
         This is called when a tetromino can no longer fall.
         """
+        touched = []
         for row_idx, row in enumerate(tetromino.shape):
+            grid_y = tetromino.y + row_idx
+            if not 0 <= grid_y < self.rows or not any(row):
+                continue
             for col_idx, cell in enumerate(row):
                 if cell:
-                    grid_x = tetromino.x + col_idx
-                    grid_y = tetromino.y + row_idx
-                    if 0 <= grid_y < self.rows:
-                        self.grid[grid_y][grid_x] = tetromino.color
+                    self.set_cell(tetromino.x + col_idx, grid_y,
+                                  tetromino.color)
+            touched.append(grid_y)
+        return touched
+    
+    def set_cell(self, x, y, color):
+        """
+        Fill or empty a single cell, keeping the row mask in sync.
+        
+        Args:
+            x (int): Column index
+            y (int): Row index
+            color: Color tuple to fill with, or 0 to empty the cell
+        """
+        self.grid[y][x] = color
+        if color:
+            self.row_masks[y] |= 1 << x
+            self.cells[y * self.cols + x] = Config.COLOR_INDEX.get(
+                color, OTHER_COLOR
+            )
+            if y < self.top:
+                self.top = y
+        else:
+            self.row_masks[y] &= ~(1 << x)
+            self.cells[y * self.cols + x] = 0
+    
+    def rebuild_masks(self):
+        """
+        Recompute row masks, cells and the top marker from ``grid``.
+        
+        Call this after writing to ``grid`` directly instead of going
+        through ``set_cell`` / ``lock_tetromino``.
+        """
+        self.row_masks = [
+            sum(1 << x for x, cell in enumerate(row) if cell)
+            for row in self.grid
+        ]
+        self.cells[:] = bytes(
+            Config.COLOR_INDEX.get(cell, OTHER_COLOR) if cell else 0
+            for row in self.grid for cell in row
+        )
+        self.top = self.rows
+        for y, mask in enumerate(self.row_masks):
+            if mask:
+                self.top = y
+                break
     
-    def clear_full_rows(self):
+    def clear_full_rows(self, rows=None):
         """
         Clear all full rows and move rows above down.
         
+        Args:
+            rows (iterable, optional): The only rows that can be full,
+                                       such as the rows returned by
+                                       ``lock_tetromino``. Defaults to
+                                       every row from ``top`` down.
+        
         Returns:
             int: Number of rows cleared
             
         Algorithm:
-        1. Find all full rows (all cells filled)
+        1. Find all full rows (row mask equals the full mask)
         2. Remove full rows
         3. Add empty rows at the top
+        
+        After a lock only the 1-4 rows the piece touched are tested, so
+        a lock that clears nothing costs the same on any board height.
+        Removing and inserting rows are list operations done in C.
         """
-        rows_cleared = 0
-        row_idx = self.rows - 1
+        if rows is None:
+            rows = range(self.top, self.rows)
+        full_mask = self.full_mask
+        masks = self.row_masks
+        full = sorted({y for y in rows
+                       if 0 <= y < self.rows and masks[y] == full_mask},
+                      reverse=True)
+        if not full:
+            return 0
         
-        while row_idx >= 0:
-            if all(self.grid[row_idx]):  # Row is full
-                del self.grid[row_idx]
-                self.grid.insert(0, [0] * self.cols)  # Add empty row at top
-                rows_cleared += 1
-                # Don't decrement row_idx, check same position again
-            else:
-                row_idx -= 1
+        cols = self.cols
+        for y in full:
+            del self.grid[y]
+            del masks[y]
+            del self.cells[y * cols:(y + 1) * cols]
         
+        # Rows above ``top`` are empty, so new rows can go in at row 0
+        rows_cleared = len(full)
+        self.grid[:0] = [[0] * cols for _ in range(rows_cleared)]
+        masks[:0] = [0] * rows_cleared
+        self.cells[:0] = bytes(rows_cleared * cols)
+        self.top = min(self.rows, self.top + rows_cleared)
         return rows_cleared
     
+    def add_garbage(self, count, hole, color=None):
+        """
+        Push garbage rows in from the bottom, as in versus mode.
+        
+        Every garbage row is full except for one empty column. The
+        whole board moves up by ``count`` rows; rows pushed past the top
+        are lost.
+        
+        Args:
+            count (int): Number of garbage rows
+            hole (int): Column left empty in every garbage row
+            color (optional): Block color. Defaults to Config.GARBAGE_COLOR.
+        
+        Returns:
+            bool: True if blocks were pushed out of the top (the player
+                  has topped out)
+        """
+        count = min(count, self.rows)
+        if count <= 0:
+            return False
+        if color is None:
+            color = Config.GARBAGE_COLOR
+        cols = self.cols
+        overflow = any(self.row_masks[self.top:count])
+        
+        row = [color] * cols
+        row[hole] = 0
+        row_cells = bytearray([Config.COLOR_INDEX.get(color, OTHER_COLOR)]) * cols
+        row_cells[hole] = 0
+        
+        self.grid[:] = self.grid[count:] + [row[:] for _ in range(count)]
+        self.row_masks[:] = (
+            self.row_masks[count:] + [self.full_mask & ~(1 << hole)] * count
+        )
+        self.cells[:] = self.cells[count * cols:] + row_cells * count
+        self.top = max(0, self.top - count)
+        return overflow
+    
     def is_game_over(self):
         """
         Check if the game is over.
@@ -125,7 +306,7 @@ class Grid:
             
         Game over occurs when blocks stack to the top of the grid.
         """
-        return any(self.grid[0])
+        return self.row_masks[0] != 0
     
     def get_filled_cells(self):
         """
@@ -137,7 +318,7 @@ class Grid:
         Useful for rendering the grid.
         """
         filled = []
-        for y in range(self.rows):
+        for y in range(self.top, self.rows):
             for x in range(self.cols):
                 if self.grid[y][x]:
                     filled.append(((x, y), self.grid[y][x]))
@@ -146,6 +327,49 @@ class Grid:
     def clear(self):
         """Reset the grid to empty state."""
         self.grid = [[0] * self.cols for _ in range(self.rows)]
+        self.row_masks = [0] * self.rows
+        self.cells[:] = bytes(len(self.cells))
+        self.top = self.rows
+    
+    def load_cells(self, data):
+        """
+        Replace the board with packed palette indices.
+        
+        Args:
+            data (bytes-like): ``rows * cols`` palette indices, row-major
+        
+        The bytes are copied into ``cells`` in one step; rows and masks
+        are rebuilt row by row with C-level helpers, so no objects are
+        created per cell.
+        """
+        if len(data) != len(self.cells):
+            raise ValueError(
+                f"Expected {len(self.cells)} cells, got {len(data)}"
+            )
+        self.cells[:] = data
+        cols = self.cols
+        
+        first_filled = len(self.cells) - len(self.cells.lstrip(b"\0"))
+        self.top = first_filled // cols
+        for y in range(self.rows):
+            if y < self.top:
+                if self.row_masks[y]:
+                    self.grid[y] = [0] * cols
+                    self.row_masks[y] = 0
+                continue
+            row_cells = self.cells[y * cols:(y + 1) * cols]
+            self.grid[y] = list(map(CELL_VALUES.__getitem__, row_cells))
+            self.row_masks[y] = int(row_cells.translate(BIT_TABLE)[::-1], 2)
+    
+    def cells_view(self):
+        """
+        Get a live, zero-copy 2D view of the packed board.
+        
+        Returns:
+            memoryview: Unsigned bytes shaped ``(rows, cols)``; pass it to
+                        ``numpy.asarray`` to get an array without copying
+        """
+        return memoryview(self.cells).cast("B", (self.rows, self.cols))
     
     def get_height(self):
         """
@@ -154,8 +378,8 @@ class Grid:
         Returns:
             int: Number of rows from bottom containing blocks
         """
-        for y in range(self.rows):
-            if any(self.grid[y]):
+        for y in range(self.top, self.rows):
+            if self.row_masks[y]:
                 return self.rows - y
         return 0
     
@@ -0,0 +1,249 @@
+"""
+Leaderboard Module - Persistent High Scores
+===========================================
+
+This module stores finished games in an SQLite database so high scores
+survive restarts. Writing to disk can take milliseconds, which would
+show up as a hitch if it happened inside the game loop, so:
+
+- ``record`` only puts the result on a queue and returns immediately
+- A background writer thread commits queued results in batches
+- The best scores are kept in memory, so drawing the header never
+  touches the database
+
+The database runs in WAL (write-ahead log) mode, which lets readers
+query it while the writer thread is committing. An in-memory database
+(path ``":memory:"``, handy for benchmarks) only exists inside its one
+connection, so it is shared by the writer and the queries instead.
+
+Educational Purpose:
+-------------------
+Learn about:
+- SQLite databases and indexes
+- Producer/consumer queues between threads
+- Caching to keep slow I/O out of the hot path
+"""
+
+import bisect
+import queue
+import sqlite3
+import threading
+import time
+
+from .config import Config
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    lines INTEGER NOT NULL,
+    played_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC);
+CREATE INDEX IF NOT EXISTS idx_scores_player ON scores (player, score DESC);
+"""
+
+INSERT = ("INSERT INTO scores (player, score, level, lines, played_at) "
+          "VALUES (?, ?, ?, ?, ?)")
+
+COLUMNS = "player, score, level, lines, played_at"
+
+# Marker telling the writer thread to flush and exit
+_STOP = object()
+
+
+class Leaderboard:
+    """
+    SQLite-backed leaderboard with a background writer.
+    
+    Each entry is a tuple ``(player, score, level, lines, played_at)``.
+    
+    Attributes:
+        path (str): Database file path, or ":memory:"
+        cache_size (int): Number of top scores kept in memory
+        batch_size (int): Most results committed in one transaction
+    """
+    
+    def __init__(self, path=None, cache_size=10, batch_size=64,
+                 flush_interval=0.5):
+        """
+        Open (or create) the leaderboard and start the writer thread.
+        
+        Args:
+            path (str, optional): Database file, or ":memory:" for a
+                                  database that lives as long as this
+                                  object. Defaults to
+                                  Config.LEADERBOARD_FILE.
+            cache_size (int): Number of top scores kept in memory
+            batch_size (int): Most results committed in one transaction
+            flush_interval (float): Seconds the writer waits to gather
+                                    a batch before committing
+        """
+        self.path = path or Config.LEADERBOARD_FILE
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._closed = False
+        
+        # Guards the shared connection of an in-memory database
+        self._db_lock = threading.Lock()
+        self._memory = None
+        if self.path == ":memory:":
+            self._memory = self._connect()
+        
+        # Create the table once; later connections find it in the file
+        connection = self._memory or self._connect()
+        try:
+            connection.executescript(SCHEMA)
+        finally:
+            if connection is not self._memory:
+                connection.close()
+        
+        # Cached top scores, kept sorted by descending score
+        self._top = self._query(
+            f"SELECT {COLUMNS} FROM scores ORDER BY score DESC LIMIT ?",
+            (cache_size,)
+        )
+        self._lock = threading.Lock()
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="leaderboard-writer", daemon=True
+        )
+        self._writer.start()
+    
+    def _connect(self):
+        """Open a connection in WAL mode."""
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+    
+    def record(self, player, score, level, lines):
+        """
+        Record a finished game without blocking on disk.
+        
+        Args:
+            player (str): Player name
+            score (int): Final score
+            level (int): Level reached
+            lines (int): Lines cleared
+        
+        Raises:
+            RuntimeError: If the leaderboard was closed (nothing would
+                          ever write the result)
+        """
+        if self._closed:
+            raise RuntimeError("Leaderboard is closed")
+        entry = (player, score, level, lines, time.time())
+        with self._lock:
+            if len(self._top) < self.cache_size or score > self._top[-1][1]:
+                keys = [-cached[1] for cached in self._top]
+                self._top.insert(bisect.bisect_right(keys, -score), entry)
+                del self._top[self.cache_size:]
+        self._queue.put(entry)
+    
+    def high_score(self):
+        """
+        Get the best score ever recorded (from memory).
+        
+        Returns:
+            int: Highest score, or 0 if no games were recorded
+        """
+        with self._lock:
+            return self._top[0][1] if self._top else 0
+    
+    def top(self, n=None):
+        """
+        Get the best scores.
+        
+        Args:
+            n (int, optional): Number of entries. Defaults to cache_size.
+        
+        Returns:
+            list: Entries with the highest scores first
+        """
+        if n is None or n <= self.cache_size:
+            with self._lock:
+                return list(self._top[:n])
+        
+        # Larger requests go to the database; make sure it is current
+        self.flush()
+        return self._query(
+            f"SELECT {COLUMNS} FROM scores ORDER BY score DESC LIMIT ?",
+            (n,)
+        )
+    
+    def player_scores(self, player, n=10):
+        """
+        Get one player's best scores.
+        
+        Args:
+            player (str): Player name
+            n (int): Number of entries
+        
+        Returns:
+            list: The player's entries with the highest scores first
+        """
+        self.flush()
+        return self._query(
+            f"SELECT {COLUMNS} FROM scores WHERE player = ? "
+            f"ORDER BY score DESC LIMIT ?",
+            (player, n)
+        )
+    
+    def flush(self):
+        """Block until every recorded game has been committed."""
+        self._queue.join()
+    
+    def close(self):
+        """Commit pending results and stop the writer thread."""
+        self._closed = True
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+    
+    def _query(self, sql, params):
+        """Run a read query on a short-lived (or the shared) connection."""
+        if self._memory is not None:
+            with self._db_lock:
+                return [tuple(row)
+                        for row in self._memory.execute(sql, params)]
+        connection = self._connect()
+        try:
+            return [tuple(row) for row in connection.execute(sql, params)]
+        finally:
+            connection.close()
+    
+    def _write_loop(self):
+        """Writer thread: commit queued results in batches."""
+        connection = self._memory or self._connect()
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            
+            # Gather whatever else arrives shortly after, up to a batch
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            
+            entries = [entry for entry in batch if entry is not _STOP]
+            running = len(entries) == len(batch)
+            try:
+                if entries:
+                    with self._db_lock, connection:
+                        connection.executemany(INSERT, entries)
+            except sqlite3.Error as e:
+                print(f"Leaderboard: could not save scores: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        if connection is not self._memory:
+            connection.close()
@@ -0,0 +1,713 @@
+"""
+Netplay Module - Two-Player Rollback Netplay Over UDP
+=====================================================
+
+Two players on different machines play a versus match (see
+src/versus.py). Instead of a server sending board states, both peers
+run the whole match - both games and the garbage between them - and
+only exchange their inputs: one byte of buttons per player per tick.
+
+This works because the simulation is deterministic:
+
+- Both games use the same piece seed; all randomness comes from the
+  engines' own ``random.Random`` and the Versus hole generators, never
+  from the global ``random`` module
+- The match advances in fixed ticks of ``1000 // tick_rate`` ms of
+  gravity (never the real frame time, which differs per machine)
+- Inputs of a tick are applied in a fixed order: player 0 then 1;
+  rotate, left, right, soft drop, hard drop
+
+Waiting for the other player's input every tick would add the network
+round trip to every frame, so each peer uses rollback:
+
+1. Local inputs are applied ``input_delay`` ticks late, which hides
+   that much latency completely.
+2. The remote input of a tick that has not arrived yet is predicted
+   (as "no buttons", by far the most common input) and the tick is
+   simulated anyway. Every tick the state before it is saved with
+   ``snapshot.save_state`` (about 0.2 ms for the whole match).
+3. When a remote input arrives that differs from the prediction, the
+   state before that tick is restored and the ticks since are
+   simulated again with the real input. The player sees a piece
+   "jump" by a few frames at most.
+4. A peer never runs more than ``max_rollback`` ticks ahead of the
+   last remote input it has; it stalls instead, which also keeps two
+   peers with different clocks in step.
+
+Each packet carries all local inputs the peer has not acknowledged
+yet, so a lost UDP packet is repaired by the next one without
+retransmission logic. Every ``checksum_interval`` ticks, once a tick is
+confirmed (both inputs known), each peer sends a CRC-32 of its state
+after that tick; different checksums mean the simulations diverged and
+raise ``DesyncError``.
+
+A packet is about 20 bytes per tick, where the full match state is
+about 10 kB.
+
+Packet layout (little endian):
+    header   <IIIIB   first tick of the inputs, ack (next remote tick
+                      wanted), checksum tick + 1 (0 = none),
+                      checksum, input count
+    inputs   one byte of buttons per tick
+
+How to Run:
+----------
+    python -m src.netplay --local                  # both peers here
+    python -m src.netplay --local --delay 0.05 --loss 0.1
+    python -m src.netplay --player 0 --port 7000 --peer 127.0.0.1:7001
+    python -m src.netplay --player 1 --port 7001 --peer 127.0.0.1:7000
+
+Educational Purpose:
+-------------------
+Learn about:
+- Deterministic lockstep simulation
+- Input prediction and rollback (as in GGPO)
+- Unreliable transports and redundant sending
+- Desync detection with state checksums
+"""
+
+import argparse
+import collections
+import multiprocessing
+import random
+import socket
+import struct
+import time
+import zlib
+
+from . import snapshot
+from .autoplayer import AutoPlayer
+from .config import Config
+from .engine import GameEngine
+from .versus import Versus
+
+# Buttons, one bit each in an input byte
+ROTATE = 1
+LEFT = 2
+RIGHT = 4
+DOWN = 8
+DROP = 16
+
+# Order in which the buttons of one tick are applied
+BUTTON_ACTIONS = (
+    (ROTATE, lambda engine: engine.rotate()),
+    (LEFT, lambda engine: engine.move(-1)),
+    (RIGHT, lambda engine: engine.move(1)),
+    (DOWN, lambda engine: engine.soft_drop()),
+    (DROP, lambda engine: engine.hard_drop()),
+)
+
+# Remote input assumed for ticks whose input has not arrived
+PREDICTED_INPUT = 0
+
+PACKET = struct.Struct("<IIIIB")
+MAX_PACKET_INPUTS = 255
+
+# tick, pending, sent and received garbage of both players
+MATCH_HEADER = struct.Struct("<I6I")
+
+
+class DesyncError(RuntimeError):
+    """The two peers' simulations produced different states."""
+
+
+class NetMatch:
+    """
+    A versus match advanced one tick at a time from both players' inputs.
+    
+    Attributes:
+        engines (list): The two GameEngines
+        versus (Versus): Garbage exchange between them
+        tick (int): Ticks simulated
+        elapsed (int): Gravity milliseconds per tick
+    """
+    
+    def __init__(self, seed=0, rows=None, cols=None, tick_rate=Config.FPS):
+        """
+        Start a match.
+        
+        Args:
+            seed (int): Seed of both piece sequences and garbage holes
+            rows (int, optional): Board height
+            cols (int, optional): Board width
+            tick_rate (int): Ticks per second
+        """
+        self.engines = [GameEngine(rows, cols, seed=seed) for _ in range(2)]
+        self.versus = Versus(self.engines, seed)
+        self.tick = 0
+        self.elapsed = 1000 // tick_rate
+    
+    def step(self, inputs):
+        """
+        Simulate one tick.
+        
+        Args:
+            inputs (sequence): Button bits of player 0 and player 1
+        """
+        rows = [None, None]
+        for player, engine in enumerate(self.engines):
+            if engine.game_over:
+                continue
+            piece = engine.current_piece
+            lines = engine.lines_cleared
+            buttons = inputs[player]
+            for button, action in BUTTON_ACTIONS:
+                if buttons & button and not engine.game_over:
+                    action(engine)
+            if not engine.game_over:
+                engine.update(self.elapsed)
+            if engine.current_piece is not piece:
+                rows[player] = engine.lines_cleared - lines
+        if rows != [None, None]:
+            self.versus.pieces_locked(rows)
+        self.tick += 1
+    
+    def save(self):
+        """
+        Capture the whole match.
+        
+        Returns:
+            bytes: State for ``restore``
+        """
+        versus = self.versus
+        parts = [MATCH_HEADER.pack(self.tick, *versus.pending, *versus.sent,
+                                   *versus.received)]
+        for generator in versus._holes:
+            _, words, gauss = generator.getstate()
+            parts.append(snapshot.RNG.pack(*words, gauss is not None,
+                                           gauss or 0.0))
+        parts.extend(snapshot.save_state(engine) for engine in self.engines)
+        return b"".join(parts)
+    
+    def restore(self, state):
+        """
+        Go back to a state from ``save``.
+        
+        Args:
+            state (bytes): Saved match
+        """
+        versus = self.versus
+        values = MATCH_HEADER.unpack_from(state, 0)
+        self.tick = values[0]
+        versus.pending[:] = values[1:3]
+        versus.sent[:] = values[3:5]
+        versus.received[:] = values[5:7]
+        
+        offset = MATCH_HEADER.size
+        for generator in versus._holes:
+            words = snapshot.RNG.unpack_from(state, offset)
+            generator.setstate((3, words[:625],
+                                words[626] if words[625] else None))
+            offset += snapshot.RNG.size
+        size = (len(state) - offset) // 2
+        for engine in self.engines:
+            snapshot.load_state(memoryview(state)[offset:offset + size],
+                                engine)
+            offset += size
+    
+    def result(self):
+        """
+        Result for player 0, as Versus.result.
+        
+        Returns:
+            float: 1, 0.5 or 0; None while both are playing
+        """
+        return self.versus.result()
+
+
+def checksum(state):
+    """
+    Checksum of a saved match, compared between peers.
+    
+    Args:
+        state (bytes): From ``NetMatch.save``
+    
+    Returns:
+        int: CRC-32
+    """
+    return zlib.crc32(state)
+
+
+class UdpTransport:
+    """
+    Datagram socket to one peer, with optional simulated latency and loss.
+    
+    Attributes:
+        peer (tuple): (host, port) packets are sent to
+        delay (float): Seconds every outgoing packet is held back
+        loss (float): Fraction of outgoing packets dropped
+        bytes_sent (int): Payload bytes sent
+        packets_sent (int): Packets sent (dropped ones included)
+    """
+    
+    def __init__(self, address, peer, delay=0.0, loss=0.0, seed=None):
+        """
+        Bind the local socket.
+        
+        Args:
+            address (tuple): Local (host, port)
+            peer (tuple): Peer's (host, port)
+            delay (float): Simulated one-way latency in seconds
+            loss (float): Simulated packet loss, 0 to 1
+            seed (int, optional): Seed for the simulated loss
+        """
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.socket.bind(address)
+        self.socket.setblocking(False)
+        self.peer = peer
+        self.delay = delay
+        self.loss = loss
+        self.bytes_sent = 0
+        self.packets_sent = 0
+        self._rng = random.Random(seed)
+        self._outgoing = collections.deque()
+    
+    def send(self, data):
+        """
+        Send (or schedule) one packet.
+        
+        Args:
+            data (bytes): Packet
+        """
+        self.packets_sent += 1
+        self.bytes_sent += len(data)
+        if self.loss and self._rng.random() < self.loss:
+            return
+        self._outgoing.append((time.perf_counter() + self.delay, data))
+        self.pump()
+    
+    def pump(self):
+        """Send the held-back packets that are due."""
+        now = time.perf_counter()
+        while self._outgoing and self._outgoing[0][0] <= now:
+            _, data = self._outgoing.popleft()
+            try:
+                self.socket.sendto(data, self.peer)
+            except OSError:
+                # The peer is not listening (yet); later packets repeat
+                # everything this one carried
+                pass
+    
+    def receive(self):
+        """
+        Read every packet that has arrived.
+        
+        Returns:
+            list: Packets (bytes)
+        """
+        self.pump()
+        packets = []
+        while True:
+            try:
+                data, _ = self.socket.recvfrom(2048)
+            except (BlockingIOError, ConnectionRefusedError):
+                return packets
+            packets.append(data)
+    
+    def close(self):
+        """Close the socket."""
+        self.socket.close()
+
+
+class RollbackSession:
+    """
+    One peer of a netplay match: input exchange, prediction, rollback.
+    
+    Attributes:
+        match (NetMatch): Local simulation of the match
+        player (int): Local player (0 or 1)
+        tick (int): Next tick to simulate
+        confirmed (int): Ticks whose remote input is known
+        rollbacks (int): Times a misprediction was corrected
+        resimulated (int): Ticks simulated again by rollbacks
+        max_depth (int): Most ticks rolled back at once
+        stalls (int): Calls to ``advance`` that waited for the peer
+        checksums_verified (int): Checksums that matched the peer's
+    """
+    
+    def __init__(self, match, player, transport, input_delay=2,
+                 max_rollback=8, checksum_interval=30):
+        """
+        Set up a peer.
+        
+        Args:
+            match (NetMatch): Match at tick 0
+            player (int): Local player (0 or 1)
+            transport (UdpTransport): Connection to the other peer
+            input_delay (int): Ticks local inputs are delayed
+            max_rollback (int): Most ticks to run ahead of the peer
+            checksum_interval (int): Ticks between state checksums
+        """
+        self.match = match
+        self.player = player
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.checksum_interval = checksum_interval
+        
+        self.tick = 0
+        self.confirmed = 0
+        self.local_inputs = {tick: 0 for tick in range(input_delay)}
+        self.remote_inputs = {}
+        self._known = input_delay
+        self._pruned = 0
+        self.peer_ack = 0
+        self.states = {}
+        self._rollback_to = None
+        self._checked = 0
+        self._local_checksums = {}
+        self._remote_checksums = {}
+        self._last_checksum = None
+        
+        self.rollbacks = 0
+        self.resimulated = 0
+        self.max_depth = 0
+        self.stalls = 0
+        self.checksums_verified = 0
+    
+    def advance(self, buttons):
+        """
+        Read the network, then simulate the next tick.
+        
+        Args:
+            buttons (int): Local button bits for this tick (applied
+                           ``input_delay`` ticks later)
+        
+        Returns:
+            bool: False if the peer is too far behind; nothing was
+                  simulated and ``buttons`` were not used
+        
+        Raises:
+            DesyncError: If a checksum differs from the peer's
+        """
+        self.poll()
+        if self.tick - self.confirmed >= self.max_rollback:
+            self.stalls += 1
+            self.send()
+            return False
+        
+        self.local_inputs[self._known] = buttons
+        self._known += 1
+        self.send()
+        self._simulate(self.tick)
+        self.tick += 1
+        self._verify()
+        return True
+    
+    def poll(self):
+        """
+        Apply every packet that arrived (inputs, acks, checksums),
+        rolling back if a prediction was wrong.
+        
+        Raises:
+            DesyncError: If a checksum differs from the peer's
+        """
+        for data in self.transport.receive():
+            (first, ack, checked, crc,
+             count) = PACKET.unpack_from(data, 0)
+            self.peer_ack = max(self.peer_ack, ack)
+            if checked:
+                self._remote_checksums[checked - 1] = crc
+            inputs = data[PACKET.size:PACKET.size + count]
+            for tick, buttons in enumerate(inputs, first):
+                if tick < self.confirmed or tick in self.remote_inputs:
+                    continue
+                self.remote_inputs[tick] = buttons
+                if tick < self.tick and buttons != PREDICTED_INPUT:
+                    if self._rollback_to is None or tick < self._rollback_to:
+                        self._rollback_to = tick
+        while self.confirmed in self.remote_inputs:
+            self.confirmed += 1
+        
+        if self._rollback_to is not None:
+            self._resimulate()
+        self._verify()
+    
+    def send(self):
+        """Send every input the peer has not acknowledged."""
+        first = self.peer_ack
+        last = min(self._known, first + MAX_PACKET_INPUTS)
+        inputs = bytes(self.local_inputs[tick] for tick in range(first, last))
+        checked, crc = self._last_checksum or (-1, 0)
+        self.transport.send(
+            PACKET.pack(first, self.confirmed, checked + 1, crc, len(inputs))
+            + inputs
+        )
+        
+        # Inputs the peer has, already simulated and out of reach of
+        # any rollback are not needed
+        keep = min(self.peer_ack, self.confirmed, self.tick)
+        for tick in range(self._pruned, keep):
+            del self.local_inputs[tick]
+        self._pruned = max(self._pruned, keep)
+    
+    def _inputs(self, tick):
+        """Both players' inputs for a tick (remote predicted if unknown)."""
+        remote = self.remote_inputs.get(tick, PREDICTED_INPUT)
+        local = self.local_inputs[tick]
+        return (local, remote) if self.player == 0 else (remote, local)
+    
+    def _simulate(self, tick):
+        """Save the state before a tick, then simulate it."""
+        self.states[tick] = self.match.save()
+        self.match.step(self._inputs(tick))
+    
+    def _resimulate(self):
+        """Restore the first mispredicted tick and simulate forward."""
+        start = self._rollback_to
+        self._rollback_to = None
+        self.match.restore(self.states[start])
+        self.match.step(self._inputs(start))
+        for tick in range(start + 1, self.tick):
+            self._simulate(tick)
+        depth = self.tick - start
+        self.rollbacks += 1
+        self.resimulated += depth
+        self.max_depth = max(self.max_depth, depth)
+    
+    def _verify(self):
+        """Checksum newly confirmed ticks and compare with the peer."""
+        final = min(self.confirmed, self.tick)
+        for tick in range(self._checked, final):
+            if (tick + 1) % self.checksum_interval == 0:
+                after = (self.states[tick + 1] if tick + 1 < self.tick
+                         else self.match.save())
+                self._local_checksums[tick] = checksum(after)
+                self._last_checksum = (tick, self._local_checksums[tick])
+        self._checked = max(self._checked, final)
+        
+        # Rollbacks never go back before the first unconfirmed tick
+        for tick in [t for t in self.states if t < final]:
+            del self.states[tick]
+        
+        for tick in [t for t in self._remote_checksums
+                     if t in self._local_checksums]:
+            remote = self._remote_checksums.pop(tick)
+            local = self._local_checksums.pop(tick)
+            if remote != local:
+                raise DesyncError(
+                    f"State after tick {tick} differs from the peer's "
+                    f"({local:08x} != {remote:08x})"
+                )
+            self.checksums_verified += 1
+
+
+class BotController:
+    """
+    Produces button presses for an AutoPlayer, one per tick.
+    
+    Each new piece gets a target from the AutoPlayer; the bot rotates,
+    then moves towards it one step per tick and drops the piece after
+    it was shown for ``drop_after`` ticks, like a (fast) person.
+    """
+    
+    def __init__(self, player=None, drop_after=10):
+        """
+        Args:
+            player (AutoPlayer, optional): Chooses the targets
+            drop_after (int): Ticks before a piece is dropped
+        """
+        self.player = player or AutoPlayer()
+        self.drop_after = drop_after
+        self._key = None
+        self._target = None
+        self._age = 0
+    
+    def buttons(self, engine):
+        """
+        Buttons to press this tick.
+        
+        Args:
+            engine (GameEngine): The bot's game as the local peer sees it
+        
+        Returns:
+            int: Button bits
+        """
+        if engine.game_over:
+            return 0
+        # A new piece means a changed board. (A rollback replaces the
+        # piece object too, but restores the same board and piece.)
+        piece = engine.current_piece
+        key = (bytes(engine.grid.cells), piece.shape_type)
+        if key != self._key:
+            self._key = key
+            turns, x = self.player.choose(engine)
+            self._target = ((piece.rotation + turns) % 4, x)
+            self._age = 0
+        self._age += 1
+        rotation, x = self._target
+        if piece.rotation != rotation:
+            return ROTATE
+        if piece.x != x:
+            return LEFT if x < piece.x else RIGHT
+        if self._age >= self.drop_after:
+            return DROP
+        return 0
+
+
+def run_peer(player, port, peer, ticks=600, seed=0, tick_rate=Config.FPS,
+             delay=0.0, loss=0.0, input_delay=2, max_rollback=8,
+             corrupt_at=None, timeout=5.0):
+    """
+    Play one side of a bot match in real time.
+    
+    Args:
+        player (int): Local player (0 or 1)
+        port (int): Local UDP port (on 127.0.0.1)
+        peer (tuple): Peer's (host, port)
+        ticks (int): Ticks the match lasts
+        seed (int): Match seed (both peers must use the same)
+        tick_rate (int): Ticks per second
+        delay (float): Simulated one-way latency in seconds
+        loss (float): Simulated packet loss, 0 to 1
+        input_delay (int): Ticks local inputs are delayed
+        max_rollback (int): Most ticks to run ahead of the peer
+        corrupt_at (int, optional): From this tick on, simulate 1 ms
+                                    more gravity per tick than the peer
+                                    (a timing bug), to see a desync
+                                    being detected
+        timeout (float): Seconds to wait for a silent peer
+    
+    Returns:
+        dict: Statistics, the result and the final checksum
+    """
+    transport = UdpTransport(("127.0.0.1", port), peer, delay, loss,
+                             seed=seed + player)
+    match = NetMatch(seed, tick_rate=tick_rate)
+    session = RollbackSession(match, player, transport, input_delay,
+                              max_rollback)
+    bot = BotController()
+    period = 1 / tick_rate
+    next_tick = time.perf_counter()
+    last_progress = time.perf_counter()
+    error = None
+    try:
+        while not (session.tick >= ticks and session.confirmed >= ticks
+                   and session.peer_ack >= ticks):
+            if session.tick < ticks:
+                buttons = bot.buttons(match.engines[player])
+                if session.advance(buttons):
+                    last_progress = time.perf_counter()
+                if session.tick == corrupt_at:
+                    match.elapsed += 1
+            else:
+                confirmed = session.confirmed
+                session.poll()
+                session.send()
+                if session.confirmed != confirmed:
+                    last_progress = time.perf_counter()
+            if time.perf_counter() - last_progress > timeout:
+                raise TimeoutError("The peer stopped sending")
+            next_tick += period
+            time.sleep(max(0.0, next_tick - time.perf_counter()))
+        
+        # Keep acknowledging for a moment, in case our last packets
+        # were lost and the peer still waits for them
+        linger = time.perf_counter() + 0.2
+        while time.perf_counter() < linger:
+            session.poll()
+            session.send()
+            time.sleep(period)
+    except (DesyncError, TimeoutError) as e:
+        error = f"{type(e).__name__}: {e}"
+    finally:
+        transport.close()
+    
+    result = match.result()
+    if result is None:
+        sent = match.versus.sent
+        result = 0.5 if sent[0] == sent[1] else float(sent[0] > sent[1])
+    return {
+        "player": player,
+        "ticks": session.tick,
+        "result": result,
+        "checksum": checksum(match.save()),
+        "rollbacks": session.rollbacks,
+        "resimulated": session.resimulated,
+        "max_depth": session.max_depth,
+        "stalls": session.stalls,
+        "checksums_verified": session.checksums_verified,
+        "bytes_per_tick": transport.bytes_sent / max(1, session.tick),
+        "state_bytes": len(match.save()),
+        "scores": [engine.score for engine in match.engines],
+        "error": error,
+    }
+
+
+def _run_peer_process(queue, args, kwargs):
+    """Process entry point for ``--local``."""
+    queue.put(run_peer(*args, **kwargs))
+
+
+def _print_summary(summary):
+    """Print one peer's statistics."""
+    print(f"player {summary['player']}: {summary['ticks']} ticks, "
+          f"result {summary['result']}, scores {summary['scores']}, "
+          f"checksum {summary['checksum']:08x}")
+    print(f"  {summary['rollbacks']} rollbacks "
+          f"({summary['resimulated']} ticks resimulated, deepest "
+          f"{summary['max_depth']}), {summary['stalls']} stalls, "
+          f"{summary['checksums_verified']} checksums matched")
+    print(f"  {summary['bytes_per_tick']:.1f} bytes sent per tick "
+          f"(a full state is {summary['state_bytes']} bytes)")
+    if summary["error"]:
+        print(f"  stopped by {summary['error']}")
+
+
+def main():
+    """Command line entry point: ``python -m src.netplay``."""
+    parser = argparse.ArgumentParser(description="Rollback netplay")
+    parser.add_argument("--local", action="store_true",
+                        help="Run both peers on this machine")
+    parser.add_argument("--player", type=int, choices=(0, 1), default=0)
+    parser.add_argument("--port", type=int, default=7000)
+    parser.add_argument("--peer", default="127.0.0.1:7001",
+                        help="HOST:PORT of the other peer")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--tick-rate", type=int, default=Config.FPS)
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Simulated one-way latency (seconds)")
+    parser.add_argument("--loss", type=float, default=0.0,
+                        help="Simulated packet loss (0-1)")
+    parser.add_argument("--input-delay", type=int, default=2)
+    parser.add_argument("--max-rollback", type=int, default=8)
+    parser.add_argument("--corrupt-at", type=int, default=None,
+                        help="Give player 1 a gravity timing bug from "
+                             "this tick (tests desync detection)")
+    args = parser.parse_args()
+    
+    options = dict(ticks=args.ticks, seed=args.seed,
+                   tick_rate=args.tick_rate, delay=args.delay,
+                   loss=args.loss, input_delay=args.input_delay,
+                   max_rollback=args.max_rollback)
+    if not args.local:
+        host, _, port = args.peer.rpartition(":")
+        corrupt = args.corrupt_at if args.player == 1 else None
+        _print_summary(run_peer(args.player, args.port, (host, int(port)),
+                                corrupt_at=corrupt, **options))
+        return
+    
+    queue = multiprocessing.Queue()
+    ports = (args.port, args.port + 1)
+    processes = [
+        multiprocessing.Process(target=_run_peer_process, args=(
+            queue, (player, ports[player], ("127.0.0.1", ports[1 - player])),
+            dict(options, corrupt_at=args.corrupt_at if player else None)
+        ))
+        for player in (0, 1)
+    ]
+    for process in processes:
+        process.start()
+    summaries = sorted((queue.get() for _ in processes),
+                       key=lambda summary: summary["player"])
+    for process in processes:
+        process.join()
+    for summary in summaries:
+        _print_summary(summary)
+    same = summaries[0]["checksum"] == summaries[1]["checksum"]
+    print("final states match" if same else "final states DIFFER")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Placement Cache Module - Persistent Opening Book for Computer Players
+=====================================================================
+
+Computer players keep meeting the same positions: every game starts on
+an empty board, and low stacks early in a game repeat across thousands
+of simulated games. This module remembers the placement a search chose
+for a position so it never has to be searched again:
+
+- A position is the board (the filled rows), the current piece (type,
+  rotation and position) and the type of the next piece, hashed into a
+  16 byte key with BLAKE2b. The hash is stable across runs and Python
+  versions, unlike ``hash()``.
+- On disk the cache is one file holding an open-addressing hash table
+  of fixed-size slots. The file is memory-mapped, so opening it is
+  instant and only the pages that are looked up are ever read (lazy
+  loading). It doubles in size when it gets 70% full.
+- In memory, an LRU dictionary of the most recently used positions
+  answers the hottest lookups without touching the map at all.
+
+A placement is only valid for the player that chose it, so the file
+records a fingerprint of that player (see ``AutoPlayer.policy``) and
+refuses to open with a different one.
+
+File layout (little endian, version 1):
+    header   <4sB3xQQ16s   magic, version, slots, entries, policy
+    slots    <16sBBh       key, used, rotation, x
+
+Only one process should write to a cache file at a time; any number
+may open it with ``readonly=True``.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Memoization across program runs
+- Memory-mapped files
+- Open-addressing hash tables
+- LRU caches
+"""
+
+import collections
+import hashlib
+import mmap
+import os
+import struct
+
+MAGIC = b"TPLC"
+VERSION = 1
+
+HEADER = struct.Struct("<4sB3xQQ16s")
+SLOT = struct.Struct("<16sBBh")
+
+# Grow the table once this share of its slots is used
+MAX_LOAD = 0.7
+
+
+def position_key(grid, piece, next_type):
+    """
+    Hash a decision point into a cache key.
+    
+    Args:
+        grid (Grid): Current board
+        piece (Tetromino): Current piece
+        next_type (int): Shape type of the next piece
+    
+    Returns:
+        bytes: 16 byte key
+    """
+    width = (grid.cols + 7) // 8
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(struct.pack(
+        "<HHBBhhB", grid.rows, grid.cols, piece.shape_type, piece.rotation,
+        piece.x, piece.y, next_type
+    ))
+    for mask in grid.row_masks[grid.top:]:
+        digest.update(mask.to_bytes(width, "little"))
+    return digest.digest()
+
+
+class PlacementCache:
+    """
+    Memory-mapped hash table of placements with an LRU front.
+    
+    Attributes:
+        path (str): Cache file
+        policy (bytes): Fingerprint of the player the entries belong to
+        memory_size (int): Positions kept in the in-memory LRU
+        hits (int): Lookups answered by the LRU
+        disk_hits (int): Lookups answered by the file
+        misses (int): Lookups not in the cache
+    """
+    
+    def __init__(self, path, policy=b"", slots=1 << 16, memory_size=4096,
+                 readonly=False):
+        """
+        Open a cache file, creating it if needed.
+        
+        Args:
+            path (str): Cache file
+            policy (bytes): Fingerprint of the player (up to 16 bytes)
+            slots (int): Initial table size of a new file
+            memory_size (int): Positions kept in the in-memory LRU
+            readonly (bool): Never write to the file; new placements
+                             are only kept in memory
+        
+        Raises:
+            ValueError: If the file is not a cache, or belongs to a
+                        different policy
+        """
+        self.path = path
+        self.policy = policy.ljust(16, b"\0")[:16]
+        self.memory_size = memory_size
+        self.readonly = readonly
+        self.hits = self.disk_hits = self.misses = 0
+        self._memory = collections.OrderedDict()
+        
+        if not os.path.exists(path):
+            if readonly:
+                raise FileNotFoundError(path)
+            self._create(path, slots)
+        self._open()
+    
+    def _create(self, path, slots):
+        """Write an empty table."""
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, slots, 0, self.policy))
+            f.truncate(HEADER.size + slots * SLOT.size)
+    
+    def _open(self):
+        """Map the file and check its header."""
+        self._file = open(self.path, "rb" if self.readonly else "r+b")
+        access = mmap.ACCESS_READ if self.readonly else mmap.ACCESS_WRITE
+        self._map = mmap.mmap(self._file.fileno(), 0, access=access)
+        magic, version, self.slots, self.entries, policy = (
+            HEADER.unpack_from(self._map, 0)
+        )
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("Not a placement cache")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Unsupported placement cache version {version}")
+        if policy != self.policy:
+            self.close()
+            raise ValueError("Placement cache belongs to a different player")
+    
+    def __len__(self):
+        """Number of positions stored in the file."""
+        return self.entries
+    
+    def _find(self, key):
+        """
+        Probe the table for a key.
+        
+        Returns:
+            tuple: (offset of its slot or of the empty slot where it
+                   belongs, slot contents or None)
+        """
+        index = int.from_bytes(key[:8], "little") % self.slots
+        while True:
+            offset = HEADER.size + index * SLOT.size
+            slot = SLOT.unpack_from(self._map, offset)
+            if not slot[1]:
+                return offset, None
+            if slot[0] == key:
+                return offset, slot
+            index = (index + 1) % self.slots
+    
+    def get(self, key):
+        """
+        Look up the placement for a position.
+        
+        Args:
+            key (bytes): From ``position_key``
+        
+        Returns:
+            tuple: (rotation, x), or None if the position is unknown
+        """
+        placement = self._memory.get(key)
+        if placement is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return placement
+        
+        slot = self._find(key)[1]
+        if slot is None:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        placement = (slot[2], slot[3])
+        self._remember(key, placement)
+        return placement
+    
+    def put(self, key, placement):
+        """
+        Store the placement chosen for a position.
+        
+        Args:
+            key (bytes): From ``position_key``
+            placement (tuple): (rotation, x)
+        """
+        self._remember(key, placement)
+        if self.readonly:
+            return
+        
+        offset, slot = self._find(key)
+        rotation, x = placement
+        SLOT.pack_into(self._map, offset, key, 1, rotation, x)
+        if slot is None:
+            self.entries += 1
+            HEADER.pack_into(self._map, 0, MAGIC, VERSION, self.slots,
+                             self.entries, self.policy)
+            if self.entries > self.slots * MAX_LOAD:
+                self._grow()
+    
+    def _remember(self, key, placement):
+        """Put a position in the LRU, evicting the oldest one."""
+        memory = self._memory
+        memory[key] = placement
+        memory.move_to_end(key)
+        if len(memory) > self.memory_size:
+            memory.popitem(last=False)
+    
+    def _grow(self):
+        """Rebuild the table with twice as many slots."""
+        old_map, old_slots = self._map, self.slots
+        temporary = self.path + ".tmp"
+        self._create(temporary, old_slots * 2)
+        with open(temporary, "r+b") as f:
+            new_map = mmap.mmap(f.fileno(), 0)
+            new_slots = old_slots * 2
+            for index in range(old_slots):
+                slot = SLOT.unpack_from(old_map, HEADER.size + index * SLOT.size)
+                if not slot[1]:
+                    continue
+                target = int.from_bytes(slot[0][:8], "little") % new_slots
+                while True:
+                    offset = HEADER.size + target * SLOT.size
+                    if not new_map[offset + 16]:
+                        break
+                    target = (target + 1) % new_slots
+                SLOT.pack_into(new_map, offset, *slot)
+            HEADER.pack_into(new_map, 0, MAGIC, VERSION, new_slots,
+                             self.entries, self.policy)
+            new_map.close()
+        self.close()
+        os.replace(temporary, self.path)
+        self._open()
+    
+    def flush(self):
+        """Write changed pages to disk."""
+        if not self.readonly:
+            self._map.flush()
+    
+    def close(self):
+        """Flush and unmap the file."""
+        if self._map is not None:
+            self.flush()
+            self._map.close()
+            self._file.close()
+            self._map = None
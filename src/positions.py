@@ -0,0 +1,467 @@
+"""
+Positions Module - Random Mid-Game Boards in Batches
+====================================================
+
+Training a value network or benchmarking a player needs many different
+starting positions. Playing every game from an empty board spends most
+of the time on the first, almost empty boards, and a Python game loop
+places only a few thousand pieces per second.
+
+``generate`` builds thousands of boards at once with NumPy. Every
+board is the result of real hard drops, so it can be reached in a
+game; nothing is painted cell by cell:
+
+- Each step, every unfinished board gets a random piece and tries
+  all of its (rotation, column) placements at once. A
+  straight drop from above stops on the highest filled cell of the
+  columns under the piece, so landing rows come from a per-column
+  "top" array, and the holes a drop covers are the gaps between the
+  piece's lowest cells and those tops.
+- A board steers towards its own targets, drawn from the given
+  ranges: the candidate whose hole count and stack height come
+  closest wins, lower landings and random ``noise`` breaking ties.
+  Boards with a well keep one column free (so they
+  never clear rows); the others clear full rows like Grid does.
+- A board stops as soon as it reaches its targets (early cutoff), or
+  after ``max_pieces`` pieces. A piece none of whose candidates fits
+  is skipped; the replay simply never sees it.
+- A board that stops outside the ranges (its last piece overshot, or
+  it ran out of pieces) starts over with new targets, so every board
+  returned has its height and holes within both ranges.
+
+The stack never reaches the four spawn rows, so every placement is
+one GameEngine.place would accept: the piece spawns, turns and moves
+in empty rows, then drops. ``verify`` proves it by replaying the
+recorded placements through GameEngine and comparing the cells byte
+for byte; ``validate`` checks the Grid rules (no full rows, known
+palette colors, free spawn rows) for a whole batch.
+
+Boards are palette indices like Grid.cells (``Grid.load_cells``
+accepts a row directly); ``occupancy`` turns them into 0/1 arrays.
+
+How to Run:
+----------
+    python -m src.positions --count 100000 --out positions.npz
+    python -m src.positions --count 20000 --height 8 12 --holes 2 6 \\
+        --well 1 --verify 200
+
+Educational Purpose:
+-------------------
+Learn about:
+- Vectorizing a simulation over many independent games
+- Steering random generation towards target statistics
+- Checking generated data against the real rules
+"""
+
+import argparse
+import collections
+import random
+import time
+
+import numpy
+
+from .config import Config
+from .engine import GameEngine
+from .tetromino import Tetromino
+
+# Rows at the top that stay empty so any piece can spawn and turn
+SPAWN_ROWS = 4
+
+# Palette indices a piece can have
+PIECE_COLORS = numpy.array([Config.COLOR_INDEX[color]
+                            for color in Config.COLORS], numpy.uint8)
+
+Batch = collections.namedtuple(
+    "Batch", "boards heights holes lines pieces wells"
+)
+Batch.__doc__ = """
+Generated boards (palette indices, ``(n, rows, cols)``) with their
+stack heights, holes, lines cleared, pieces placed and well column
+(-1 for none).
+"""
+
+
+def _shape_tables():
+    """
+    Cell offsets of every piece in every orientation.
+    
+    Returns:
+        tuple: int arrays ``(dy, dx)`` of shape (types, 4, 4 cells),
+               ``width`` (types, 4) and ``bottom`` (types, 4, 4 columns:
+               lowest cell row of each piece column, -1 past the width)
+    """
+    types = len(Config.SHAPES)
+    dy = numpy.zeros((types, 4, 4), int)
+    dx = numpy.zeros((types, 4, 4), int)
+    width = numpy.zeros((types, 4), int)
+    bottom = numpy.full((types, 4, 4), -1)
+    for shape_type in range(types):
+        piece = Tetromino(shape_type, rng=random.Random(0))
+        for turns in range(4):
+            cells = [(y, x) for y, row in enumerate(piece.shape)
+                     for x, cell in enumerate(row) if cell]
+            dy[shape_type, turns] = [y for y, _ in cells]
+            dx[shape_type, turns] = [x for _, x in cells]
+            width[shape_type, turns] = len(piece.shape[0])
+            for y, x in cells:
+                bottom[shape_type, turns, x] = max(
+                    bottom[shape_type, turns, x], y
+                )
+            piece.rotate_clockwise()
+    return dy, dx, width, bottom
+
+
+CELL_DY, CELL_DX, WIDTH, BOTTOM = _shape_tables()
+
+
+def occupancy(boards):
+    """
+    Filled cells of boards.
+    
+    Args:
+        boards (numpy.ndarray): Palette indices
+    
+    Returns:
+        numpy.ndarray: uint8 array of the same shape, 1 where filled
+    """
+    return (boards != 0).view(numpy.uint8)
+
+
+def _tops(filled):
+    """Row of the highest filled cell of each column (rows if empty)."""
+    rows = filled.shape[1]
+    return numpy.where(filled.any(axis=1), filled.argmax(axis=1), rows)
+
+
+def _holes(filled):
+    """Empty cells with a filled cell somewhere above them, per board."""
+    covered = numpy.logical_or.accumulate(filled, axis=1)
+    return (covered & ~filled).sum(axis=(1, 2))
+
+
+def generate(count, rows=None, cols=None, height=(4, 10), holes=(0, 6),
+             well=0.5, noise=4.0, max_pieces=200, seed=0,
+             record=False, attempts=20):
+    """
+    Generate a batch of mid-game boards.
+    
+    Args:
+        count (int): Boards to generate
+        rows (int, optional): Board height. Defaults to Config.ROWS.
+        cols (int, optional): Board width. Defaults to Config.COLUMNS.
+        height (tuple): Range of target stack heights (inclusive)
+        holes (tuple): Range of target hole counts (inclusive)
+        well (float): Fraction of boards that keep a well column free
+        noise (float): Random rows added to each candidate's score;
+                       0 always takes the lowest landing that meets
+                       the targets, larger values give rougher stacks
+        max_pieces (int): Pieces drawn after which a board stops anyway
+        seed (int): Seed; the same arguments give the same boards
+        record (bool): Also return every placement, for ``verify``
+        attempts (int): Times a board may start over after ending
+                        outside a range
+    
+    Returns:
+        Batch: The boards and their statistics; with ``record``, a
+               tuple (Batch, placements) where placements is a list of
+               per-step arrays (board, shape type, turns, x, color)
+    
+    Raises:
+        ValueError: If a range is empty, the lowest target height
+                    does not fit below the spawn rows, or a board still
+                    ends outside a range after ``attempts`` tries
+    """
+    rows = rows or Config.ROWS
+    cols = cols or Config.COLUMNS
+    highest = rows - SPAWN_ROWS
+    if not 0 <= height[0] <= height[1]:
+        raise ValueError(f"Height range {height[0]}..{height[1]} is empty "
+                         f"or negative")
+    if height[0] > highest:
+        raise ValueError(f"Target height {height[0]} does not fit a "
+                         f"{rows}-row board: at most {highest} rows, the "
+                         f"top {SPAWN_ROWS} stay free for spawning")
+    if not 0 <= holes[0] <= holes[1]:
+        raise ValueError(f"Holes range {holes[0]}..{holes[1]} is empty "
+                         f"or negative")
+    rng = numpy.random.default_rng(seed)
+    lowest, highest = height[0], min(height[1], highest)
+    
+    boards = numpy.zeros((count, rows, cols), numpy.uint8)
+    tops = numpy.full((count, cols), rows)
+    hole_counts = numpy.zeros(count, int)
+    lines = numpy.zeros(count, int)
+    pieces = numpy.zeros(count, int)
+    steps = numpy.zeros(count, int)
+    target_height = numpy.zeros(count, int)
+    target_holes = numpy.zeros(count, int)
+    wells = numpy.full(count, -1)
+    tries = numpy.zeros(count, int)
+    active = numpy.zeros(count, bool)
+    placements = []
+    offsets = numpy.arange(4)
+    candidates = 4 * cols
+    all_turns = numpy.repeat(numpy.arange(4), cols)
+    all_x = numpy.tile(numpy.arange(cols), 4)
+    
+    playing = numpy.arange(count)
+    while True:
+        # Unstarted boards, and boards that just stopped outside a
+        # range, start (over) with new targets: the cutoff stops a board
+        # once it reaches its targets, so the last piece can overshoot
+        # them, and running out of pieces can leave a board short
+        stopped = playing[~active[playing]]
+        heights = rows - tops[stopped].min(axis=1)
+        count_holes = hole_counts[stopped]
+        start = stopped[
+            (tries[stopped] == 0) | (heights < lowest) | (heights > highest)
+            | (count_holes < holes[0]) | (count_holes > holes[1])
+        ]
+        if (tries[start] == attempts).any():
+            raise ValueError(f"Could not fill {count} boards: one still "
+                             f"missed the height range {lowest}..{highest} "
+                             f"or the holes range {holes[0]}..{holes[1]} "
+                             f"after {attempts} attempts")
+        if record and tries[start].any():
+            # Forget the placements of the boards starting over
+            placements = [
+                tuple(field[keep] for field in step) for step in placements
+                for keep in [~numpy.isin(step[0], start)] if keep.any()
+            ]
+        if len(start):
+            n = len(start)
+            boards[start] = 0
+            tops[start] = rows
+            for counter in (hole_counts, lines, pieces, steps):
+                counter[start] = 0
+            target_height[start] = rng.integers(lowest, highest + 1, n)
+            target_holes[start] = rng.integers(holes[0], holes[1] + 1, n)
+            wells[start] = numpy.where(rng.random(n) < well,
+                                       rng.integers(0, cols, n), -1)
+            tries[start] += 1
+            active[start] = True
+        if not active.any():
+            break
+        
+        index = playing = numpy.flatnonzero(active)
+        n = len(index)
+        shape_type = rng.integers(0, len(Config.SHAPES), n)
+        color = rng.choice(PIECE_COLORS, n)
+        
+        # Every (turns, x) as a candidate: (n, 4 * cols)
+        turns = numpy.broadcast_to(all_turns, (n, candidates))
+        x = numpy.broadcast_to(all_x, (n, candidates))
+        types = shape_type[:, None]
+        width = WIDTH[types, turns]
+        bottom = BOTTOM[types, turns]                   # (n, c, 4)
+        used = bottom >= 0
+        columns = numpy.minimum(x[:, :, None] + offsets, cols - 1)
+        column_tops = tops[index[:, None, None], columns]
+        
+        # The piece rests where the first of its columns meets the stack
+        gaps = numpy.where(used, column_tops - 1 - bottom, rows)
+        y = gaps.min(axis=2)
+        covered = numpy.where(used, gaps - y[:, :, None], 0).sum(axis=2)
+        
+        legal = (x + width <= cols) & (y >= SPAWN_ROWS)
+        has_well = wells[index] >= 0
+        legal &= ~(has_well[:, None]
+                   & (used & (columns == wells[index, None, None])).any(axis=2))
+        
+        # Closest to the hole target first, then to the height target
+        stack = rows - numpy.minimum(tops[index].min(axis=1)[:, None], y)
+        miss_holes = numpy.abs(hole_counts[index, None] + covered
+                               - target_holes[index, None])
+        over_height = numpy.maximum(0, stack - target_height[index, None])
+        # Lower landings keep the stack compact instead of towering
+        score = (y - (miss_holes * 4 + over_height * 3) * rows
+                 + rng.random((n, candidates)) * noise)
+        score[~legal] = -numpy.inf
+        best = score.argmax(axis=1)
+        steps[index] += 1
+        active[index[steps[index] >= max_pieces]] = False
+        stuck = ~legal[numpy.arange(n), best]
+        
+        go = ~stuck
+        index = index[go]
+        pick = best[go]
+        shape_type = shape_type[go]
+        color = color[go]
+        turns = turns[go, pick]
+        x = x[go, pick]
+        y = y[go, pick]
+        if not len(index):
+            continue
+        if record:
+            placements.append((index, shape_type, turns, x, color))
+        
+        cell_rows = y[:, None] + CELL_DY[shape_type, turns]
+        cell_cols = x[:, None] + CELL_DX[shape_type, turns]
+        boards[index[:, None], cell_rows, cell_cols] = color[:, None]
+        
+        # Clear full rows: move them to the top (stable, so the other
+        # rows keep their order), then empty them
+        sub = boards[index]
+        filled = sub != 0
+        full = filled.all(axis=2)
+        cleared = full.sum(axis=1)
+        if cleared.any():
+            order = numpy.argsort(~full, axis=1, kind="stable")
+            sub = numpy.take_along_axis(sub, order[:, :, None], axis=1)
+            sub[numpy.arange(rows)[None, :] < cleared[:, None]] = 0
+            boards[index] = sub
+            filled = sub != 0
+            lines[index] += cleared
+        
+        tops[index] = _tops(filled)
+        hole_counts[index] = _holes(filled)
+        pieces[index] += 1
+        
+        done = ((rows - tops[index].min(axis=1) >= target_height[index])
+                & (hole_counts[index] >= target_holes[index]))
+        active[index[done]] = False
+    
+    batch = Batch(boards, rows - tops.min(axis=1), hole_counts, lines,
+                  pieces, wells)
+    if record:
+        return batch, placements
+    return batch
+
+
+def validate(boards):
+    """
+    Check boards against the Grid rules.
+    
+    Args:
+        boards (numpy.ndarray): Palette indices, ``(n, rows, cols)``
+    
+    Returns:
+        numpy.ndarray: bool per board; True if no row is full, every
+                       cell is empty or a piece color, and the spawn
+                       rows are free
+    """
+    filled = boards != 0
+    no_full_rows = ~filled.all(axis=2).any(axis=1)
+    known_colors = (~filled | numpy.isin(boards, PIECE_COLORS)).all(
+        axis=(1, 2)
+    )
+    spawn_free = ~filled[:, :SPAWN_ROWS].any(axis=(1, 2))
+    return no_full_rows & known_colors & spawn_free
+
+
+def verify(batch, placements, boards):
+    """
+    Replay boards through GameEngine and compare them cell by cell.
+    
+    Args:
+        batch (Batch): From ``generate(..., record=True)``
+        placements (list): The placements returned with it
+        boards (iterable): Indices of the boards to check
+    
+    Returns:
+        int: Boards checked
+    
+    Raises:
+        ValueError: If the engine rejects a placement or ends up with a
+                    different board
+    """
+    _, rows, cols = batch.boards.shape
+    checked = 0
+    for board in boards:
+        engine = GameEngine(rows, cols, seed=0)
+        for index, shape_type, turns, x, color in placements:
+            at = numpy.searchsorted(index, board)
+            if at == len(index) or index[at] != board:
+                continue
+            piece = Tetromino(int(shape_type[at]), cols, rng=engine.rng)
+            piece.color = Config.PALETTE[color[at]]
+            engine.current_piece = piece
+            if not engine.place(int(turns[at]), int(x[at])):
+                raise ValueError(f"Board {board}: the engine rejected "
+                                 f"a placement")
+        cells = numpy.frombuffer(bytes(engine.grid.cells), numpy.uint8)
+        if not numpy.array_equal(cells.reshape(rows, cols),
+                                 batch.boards[board]):
+            raise ValueError(f"Board {board} differs from its replay")
+        checked += 1
+    return checked
+
+
+def save(path, batch):
+    """
+    Write a batch as one ``.npz`` file (one array per field).
+    
+    Args:
+        path (str): Destination
+        batch (Batch): Boards to save
+    """
+    numpy.savez_compressed(path, **batch._asdict())
+
+
+def load(path):
+    """
+    Read a batch written by ``save``.
+    
+    Args:
+        path (str): ``.npz`` file
+    
+    Returns:
+        Batch: The boards
+    """
+    with numpy.load(path) as data:
+        return Batch(**{field: data[field] for field in Batch._fields})
+
+
+def main():
+    """Command line entry point: ``python -m src.positions``."""
+    parser = argparse.ArgumentParser(description="Random mid-game boards")
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--out", default=None, help=".npz file to write")
+    parser.add_argument("--rows", type=int, default=None)
+    parser.add_argument("--cols", type=int, default=None)
+    parser.add_argument("--height", type=int, nargs=2, default=(4, 10),
+                        metavar=("MIN", "MAX"))
+    parser.add_argument("--holes", type=int, nargs=2, default=(0, 6),
+                        metavar=("MIN", "MAX"))
+    parser.add_argument("--well", type=float, default=0.5,
+                        help="Fraction of boards with a well column")
+    parser.add_argument("--max-pieces", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verify", type=int, default=0, metavar="N",
+                        help="Replay N boards through GameEngine")
+    args = parser.parse_args()
+    
+    start = time.perf_counter()
+    try:
+        result = generate(args.count, args.rows, args.cols, args.height,
+                          args.holes, args.well, max_pieces=args.max_pieces,
+                          seed=args.seed, record=bool(args.verify))
+    except ValueError as error:
+        parser.error(str(error))
+    elapsed = time.perf_counter() - start
+    batch, placements = result if args.verify else (result, None)
+    
+    pieces = batch.pieces.sum()
+    print(f"{args.count} boards in {elapsed:.2f} s: "
+          f"{args.count / elapsed:,.0f} boards/s, "
+          f"{pieces / elapsed:,.0f} pieces/s")
+    print(f"height {batch.heights.mean():.1f} (min {batch.heights.min()}, "
+          f"max {batch.heights.max()}), holes {batch.holes.mean():.1f} "
+          f"(max {batch.holes.max()}), {batch.pieces.mean():.1f} pieces "
+          f"and {batch.lines.mean():.2f} lines per board, "
+          f"{(batch.wells >= 0).mean():.0%} with a well")
+    valid = validate(batch.boards)
+    print(f"valid under Grid rules: {valid.sum()}/{len(valid)}")
+    if args.verify:
+        sample = numpy.random.default_rng(args.seed).choice(
+            args.count, min(args.verify, args.count), replace=False
+        )
+        checked = verify(batch, placements, sample)
+        print(f"replayed through GameEngine: {checked} boards identical")
+    if args.out:
+        save(args.out, batch)
+        print(f"wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
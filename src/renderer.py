@@ -0,0 +1,120 @@
+"""
+Renderer Module - Palette-Indexed Board Drawing
+===============================================
+
+This module provides an alternative way to draw the board. Instead of
+one ``pygame.draw.rect`` call per filled cell, the Grid's packed palette
+indices (``Grid.cells``, one byte per cell) are wrapped as a tiny 8-bit
+paletted surface of ``cols x rows`` pixels. Every frame the board is
+then drawn with:
+
+1. One ``pygame.transform.scale`` up to the block size
+2. One blit of the scaled board
+3. One blit of a pre-rendered grid-line overlay
+
+The small surface shares its memory with ``Grid.cells`` through
+``pygame.image.frombuffer``, so there is no per-cell Python work at all:
+changes to the grid show up in the surface automatically.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Indexed (paletted) color images
+- Sharing memory between Python objects via the buffer protocol
+- Trading many small draw calls for a few large ones
+"""
+
+import pygame
+
+from .config import Config
+
+
+def _display_format(surface):
+    """Convert a surface to the window's pixel format, if there is one."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+
+class PaletteBoardRenderer:
+    """
+    Draws a Grid through a single scaled 8-bit surface.
+    
+    Attributes:
+        grid (Grid): Board being drawn
+        block_size (int): Pixel size of one cell
+    """
+    
+    def __init__(self, grid, block_size):
+        """
+        Prepare the surfaces for one grid.
+        
+        Args:
+            grid (Grid): Board to draw
+            block_size (int): Pixel size of one cell
+        """
+        self.grid = grid
+        self.block_size = block_size
+        palette = Config.PALETTE + [Config.BLACK] * (256 - len(Config.PALETTE))
+        
+        # 1 pixel per cell, backed directly by grid.cells
+        self.board_surface = pygame.image.frombuffer(
+            grid.cells, (grid.cols, grid.rows), "P"
+        )
+        self.board_surface.set_palette(palette)
+        
+        # Reused intermediate surfaces in the display's pixel format:
+        # the tiny board is converted to RGB first (cols x rows pixels),
+        # so scaling and the final blit are plain same-format copies
+        size = (grid.cols * block_size, grid.rows * block_size)
+        self.rgb_surface = _display_format(
+            pygame.Surface((grid.cols, grid.rows))
+        )
+        self.scaled_surface = _display_format(pygame.Surface(size))
+        
+        self.overlay = self._build_overlay()
+    
+    def _build_overlay(self):
+        """Render the grid lines once onto a transparent surface."""
+        size = self.block_size
+        width = self.grid.cols * size
+        height = Config.SCREEN_HEIGHT - 80
+        # A color key is much cheaper to blit than per-pixel alpha
+        overlay = _display_format(pygame.Surface((width + 1, height)))
+        overlay.fill(Config.BLACK)
+        overlay.set_colorkey(Config.BLACK, pygame.RLEACCEL)
+        
+        for x in range(self.grid.cols + 1):
+            pygame.draw.line(
+                overlay, Config.GRID_LINE, (x * size, 0), (x * size, height), 1
+            )
+        for y in range(self.grid.rows + 1):
+            pygame.draw.line(
+                overlay, Config.GRID_LINE, (0, y * size), (width, y * size), 1
+            )
+        return overlay
+    
+    def draw(self, screen, top=80):
+        """
+        Draw the board background, placed blocks and grid lines.
+        
+        Args:
+            screen (pygame.Surface): Target surface
+            top (int): Y coordinate of the board's top edge
+        """
+        # The scaled board covers its own area; only fill below it
+        board_height = self.grid.rows * self.block_size
+        if top + board_height < Config.SCREEN_HEIGHT:
+            pygame.draw.rect(
+                screen, Config.GAME_BG,
+                (0, top + board_height, self.grid.cols * self.block_size,
+                 Config.SCREEN_HEIGHT - top - board_height)
+            )
+        
+        self.rgb_surface.blit(self.board_surface, (0, 0))
+        pygame.transform.scale(
+            self.rgb_surface, self.scaled_surface.get_size(),
+            self.scaled_surface
+        )
+        screen.blit(self.scaled_surface, (0, top))
+        screen.blit(self.overlay, (0, top))
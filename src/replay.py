@@ -0,0 +1,450 @@
+"""
+Replay Module - Recorded Games with Instant Seeking
+===================================================
+
+A game is fully determined by its board size, its piece seed and the
+inputs applied to it, so a replay only stores those: a short header and
+one fixed-size record per input (a move, a rotation, a drop, a gravity
+tick or a whole placement).
+
+Watching a replay means re-simulating it, and reaching piece 90,000 of
+a marathon game from the start takes a long time. A sidecar index
+(``<replay>.idx``) fixes that: while recording, a keyframe - a complete
+``snapshot.save_state`` blob plus the byte offset of the next input -
+is stored every ``piece_interval`` pieces or ``step_interval`` inputs.
+Seeking restores the nearest keyframe before the target and simulates
+at most one interval forward.
+
+Replay layout (little endian, version 1):
+    header   <4sBHHQ   magic, version, rows, cols, seed
+    inputs   <Bbh      action, small argument, argument (one per input)
+
+Index layout (little endian, version 1):
+    header   <4sB      magic, version
+    entries  <QQQI     step, byte offset into the replay, pieces
+                       placed, snapshot length; then the snapshot
+
+An index can also be built for an existing replay with ``build_index``.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Deterministic replays (record the inputs, not the states)
+- Keyframes and seeking, as in video files
+- Binary search over a sorted index
+"""
+
+import bisect
+import collections
+import os
+import random
+import struct
+
+from . import snapshot
+from .engine import GameEngine
+
+MAGIC = b"TRPL"
+INDEX_MAGIC = b"TRIX"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBHHQ")
+INPUT = struct.Struct("<Bbh")
+INDEX_HEADER = struct.Struct("<4sB")
+ENTRY = struct.Struct("<QQQI")
+
+# Input actions
+MOVE = 0        # small argument: dx
+ROTATE = 1
+SOFT_DROP = 2
+HARD_DROP = 3
+TICK = 4        # argument: elapsed milliseconds
+PLACE = 5       # small argument: rotation, argument: x
+
+# Inputs read from the file at a time while simulating forward
+_CHUNK = 4096
+
+Keyframe = collections.namedtuple("Keyframe", "step offset pieces state")
+Keyframe.__doc__ = """Saved game state before input number ``step``."""
+
+
+def index_path(path):
+    """Path of the sidecar index of a replay."""
+    return path + ".idx"
+
+
+def apply_input(engine, action, small, value):
+    """
+    Apply one recorded input to a game.
+    
+    Args:
+        engine (GameEngine): Game to change
+        action (int): One of the input actions
+        small (int): Small argument (dx or rotation)
+        value (int): Argument (elapsed ms or x)
+    
+    Returns:
+        The result of the GameEngine method the input stands for
+    """
+    if action == MOVE:
+        return engine.move(small)
+    elif action == ROTATE:
+        return engine.rotate()
+    elif action == SOFT_DROP:
+        return engine.soft_drop()
+    elif action == HARD_DROP:
+        return engine.hard_drop()
+    elif action == TICK:
+        return engine.update(value)
+    elif action == PLACE:
+        return engine.place(small, value)
+    else:
+        raise ValueError(f"Unknown replay action {action}")
+
+
+class _IndexWriter:
+    """Appends keyframes to a sidecar index."""
+    
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.file.write(INDEX_HEADER.pack(INDEX_MAGIC, VERSION))
+    
+    def add(self, engine, step, offset, pieces):
+        """Store the game's current state as the keyframe for ``step``."""
+        state = snapshot.save_state(engine)
+        self.file.write(ENTRY.pack(step, offset, pieces, len(state)))
+        self.file.write(state)
+    
+    def close(self):
+        """Close the index file."""
+        self.file.close()
+
+
+class ReplayRecorder:
+    """
+    Plays a game and records every input.
+    
+    The methods mirror GameEngine's, so a bot or input loop can call the
+    recorder instead of the engine.
+    
+    Attributes:
+        engine (GameEngine): The game being recorded
+        seed (int): Piece seed stored in the replay
+        steps (int): Inputs recorded so far
+        pieces (int): Pieces locked so far
+    """
+    
+    def __init__(self, path, rows=None, cols=None, seed=None,
+                 piece_interval=1000, step_interval=20000, index=True):
+        """
+        Start a new game and its replay file.
+        
+        Args:
+            path (str): Replay file to create
+            rows (int, optional): Board height
+            cols (int, optional): Board width
+            seed (int, optional): Piece seed. A random one is picked (and
+                                  recorded) when omitted.
+            piece_interval (int): Pieces between keyframes
+            step_interval (int): Inputs between keyframes, for stretches
+                                 where few pieces lock
+            index (bool): Also write the sidecar index
+        """
+        self.seed = random.getrandbits(63) if seed is None else seed
+        self.engine = GameEngine(rows, cols, self.seed)
+        self.piece_interval = piece_interval
+        self.step_interval = step_interval
+        self.steps = 0
+        self.pieces = 0
+        
+        grid = self.engine.grid
+        self.file = open(path, "wb")
+        self.file.write(
+            HEADER.pack(MAGIC, VERSION, grid.rows, grid.cols, self.seed)
+        )
+        self._index = _IndexWriter(index_path(path)) if index else None
+        if self._index:
+            self._keyframe()
+    
+    def _keyframe(self):
+        """Store a keyframe and schedule the next one."""
+        self._index.add(self.engine, self.steps,
+                        HEADER.size + self.steps * INPUT.size, self.pieces)
+        self._next_keyframe = (self.pieces + self.piece_interval,
+                               self.steps + self.step_interval)
+    
+    def record(self, action, small=0, value=0):
+        """
+        Apply an input to the game and append it to the replay.
+        
+        Args:
+            action (int): One of the input actions
+            small (int): Small argument (dx or rotation)
+            value (int): Argument (elapsed ms or x)
+        
+        Returns:
+            The result of the GameEngine method the input stands for
+        """
+        engine = self.engine
+        piece = engine.current_piece
+        result = apply_input(engine, action, small, value)
+        self.file.write(INPUT.pack(action, small, value))
+        self.steps += 1
+        if engine.current_piece is not piece:
+            self.pieces += 1
+        
+        if self._index:
+            next_pieces, next_steps = self._next_keyframe
+            if self.pieces >= next_pieces or self.steps >= next_steps:
+                self._keyframe()
+        return result
+    
+    def move(self, dx):
+        """Record ``GameEngine.move``."""
+        return self.record(MOVE, dx)
+    
+    def rotate(self):
+        """Record ``GameEngine.rotate``."""
+        return self.record(ROTATE)
+    
+    def soft_drop(self):
+        """Record ``GameEngine.soft_drop``."""
+        return self.record(SOFT_DROP)
+    
+    def hard_drop(self):
+        """Record ``GameEngine.hard_drop``."""
+        return self.record(HARD_DROP)
+    
+    def update(self, elapsed):
+        """Record ``GameEngine.update``."""
+        return self.record(TICK, 0, elapsed)
+    
+    def place(self, rotation, x):
+        """Record ``GameEngine.place``."""
+        return self.record(PLACE, rotation, x)
+    
+    def close(self):
+        """Finish the replay and its index."""
+        self.file.close()
+        if self._index:
+            self._index.close()
+
+
+def read_index(path):
+    """
+    Load the keyframes of a sidecar index.
+    
+    Args:
+        path (str): Index file
+    
+    Returns:
+        list: Keyframes, in step order
+    
+    Raises:
+        ValueError: If the file is not a supported index
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version = INDEX_HEADER.unpack_from(data, 0)
+    if magic != INDEX_MAGIC:
+        raise ValueError("Not a replay index")
+    if version != VERSION:
+        raise ValueError(f"Unsupported replay index version {version}")
+    
+    keyframes = []
+    offset = INDEX_HEADER.size
+    # A truncated last entry (recording interrupted) is ignored
+    while offset + ENTRY.size <= len(data):
+        step, position, pieces, length = ENTRY.unpack_from(data, offset)
+        offset += ENTRY.size
+        if offset + length > len(data):
+            break
+        keyframes.append(Keyframe(step, position, pieces,
+                                  data[offset:offset + length]))
+        offset += length
+    return keyframes
+
+
+class Replay:
+    """
+    Plays back a recorded game, with seeking.
+    
+    Attributes:
+        engine (GameEngine): Game at the current position
+        rows (int): Board height
+        cols (int): Board width
+        seed (int): Piece seed
+        length (int): Inputs in the replay
+        step (int): Inputs applied so far
+        pieces (int): Pieces locked so far
+        keyframes (list): Keyframes from the sidecar index
+    """
+    
+    def __init__(self, path):
+        """
+        Open a replay, and its index if there is one.
+        
+        Args:
+            path (str): Replay file
+        
+        Raises:
+            ValueError: If the file is not a supported replay
+        """
+        self.file = open(path, "rb")
+        magic, version, self.rows, self.cols, self.seed = HEADER.unpack(
+            self.file.read(HEADER.size)
+        )
+        if magic != MAGIC:
+            raise ValueError("Not a replay")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        size = os.fstat(self.file.fileno()).st_size
+        self.length = (size - HEADER.size) // INPUT.size
+        
+        self.keyframes = []
+        if os.path.exists(index_path(path)):
+            self.keyframes = read_index(index_path(path))
+        self._steps = [keyframe.step for keyframe in self.keyframes]
+        self._pieces = [keyframe.pieces for keyframe in self.keyframes]
+        self.restart()
+    
+    def restart(self):
+        """Go back to the start of the game."""
+        self.engine = GameEngine(self.rows, self.cols, self.seed)
+        self.step = 0
+        self.pieces = 0
+    
+    def _restore(self, keyframe):
+        """Jump to a keyframe."""
+        snapshot.load_state(keyframe.state, self.engine)
+        self.step = keyframe.step
+        self.pieces = keyframe.pieces
+    
+    def advance(self, count=1, until_pieces=None):
+        """
+        Simulate forward.
+        
+        Args:
+            count (int): Inputs to apply at most
+            until_pieces (int, optional): Stop as soon as this many pieces
+                                          have been locked
+        
+        Returns:
+            int: Inputs applied
+        """
+        count = min(count, self.length - self.step)
+        if until_pieces is not None and self.pieces >= until_pieces:
+            return 0
+        engine = self.engine
+        self.file.seek(HEADER.size + self.step * INPUT.size)
+        applied = 0
+        while applied < count:
+            data = self.file.read(min(count - applied, _CHUNK) * INPUT.size)
+            for action, small, value in INPUT.iter_unpack(data):
+                piece = engine.current_piece
+                apply_input(engine, action, small, value)
+                applied += 1
+                if engine.current_piece is not piece:
+                    self.pieces += 1
+                    if until_pieces is not None and self.pieces >= until_pieces:
+                        self.step += applied
+                        return applied
+        self.step += applied
+        return applied
+    
+    def seek(self, step):
+        """
+        Go to the state after ``step`` inputs.
+        
+        Restores the nearest keyframe at or before ``step`` (unless the
+        current position is closer) and simulates the rest.
+        
+        Args:
+            step (int): Target input count
+        
+        Returns:
+            GameEngine: The game at that point
+        """
+        step = max(0, min(step, self.length))
+        i = bisect.bisect_right(self._steps, step) - 1
+        if i >= 0:
+            keyframe = self.keyframes[i]
+            if not keyframe.step <= self.step <= step:
+                self._restore(keyframe)
+        elif self.step > step:
+            self.restart()
+        self.advance(step - self.step)
+        return self.engine
+    
+    def seek_piece(self, pieces):
+        """
+        Go to the moment the ``pieces``-th piece locks.
+        
+        Args:
+            pieces (int): Target number of locked pieces
+        
+        Returns:
+            GameEngine: The game at that point
+        """
+        # A keyframe with the target count may have been taken some
+        # inputs after the lock (step keyframes); start from the last one
+        # before it instead
+        i = bisect.bisect_left(self._pieces, pieces) - 1
+        if i >= 0:
+            keyframe = self.keyframes[i]
+            # Keep going from the current position if it is on the way
+            if not (keyframe.step <= self.step and self.pieces < pieces):
+                self._restore(keyframe)
+        elif self.pieces >= pieces:
+            self.restart()
+        self.advance(self.length, until_pieces=pieces)
+        return self.engine
+    
+    def close(self):
+        """Close the replay file."""
+        self.file.close()
+
+
+def build_index(path, piece_interval=1000, step_interval=20000):
+    """
+    Write the sidecar index for an existing replay.
+    
+    Args:
+        path (str): Replay file
+        piece_interval (int): Pieces between keyframes
+        step_interval (int): Inputs between keyframes
+    
+    Returns:
+        int: Keyframes written
+    """
+    with open(path, "rb") as f:
+        magic, version, rows, cols, seed = HEADER.unpack(f.read(HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a supported replay")
+        
+        engine = GameEngine(rows, cols, seed)
+        index = _IndexWriter(index_path(path))
+        index.add(engine, 0, HEADER.size, 0)
+        count = 1
+        step = pieces = 0
+        next_pieces, next_steps = piece_interval, step_interval
+        try:
+            while True:
+                data = f.read(_CHUNK * INPUT.size)
+                data = data[:len(data) - len(data) % INPUT.size]
+                if not data:
+                    break
+                for action, small, value in INPUT.iter_unpack(data):
+                    piece = engine.current_piece
+                    apply_input(engine, action, small, value)
+                    step += 1
+                    if engine.current_piece is not piece:
+                        pieces += 1
+                    if pieces >= next_pieces or step >= next_steps:
+                        index.add(engine, step,
+                                  HEADER.size + step * INPUT.size, pieces)
+                        count += 1
+                        next_pieces = pieces + piece_interval
+                        next_steps = step + step_interval
+        finally:
+            index.close()
+    return count
@@ -0,0 +1,431 @@
+"""
+Server Module - Headless Multiplayer Game Server
+================================================
+
+This module hosts many independent Tetris games in a single process
+using asyncio. Every TCP connection gets its own GameEngine; one shared
+tick loop advances all of them at Config.FPS, so thousands of players
+cost one Python process instead of one Pygame window each.
+
+Protocol (newline-delimited, UTF-8):
+-----------------------------------
+Client -> server: one action per line
+    left, right, down, rotate, drop, pause, reset, stats, quit,
+    watch <session id>
+
+Server -> client: one JSON object per line. The first line is
+{"session": <id>}; after that a line is sent whenever the game
+changed during a tick:
+    {"board": [row masks], "piece": {...}, "next": 3, "score": 0,
+     "level": 1, "lines": 0, "game_over": false}
+
+A "stats" request is answered with {"stats": {...}} describing the
+whole server (session count, tick latency percentiles, CPU use).
+
+"watch <id>" turns the connection into a spectator of another session:
+after a {"watching": <id>} line the server sends binary delta frames
+from the spectator module, each prefixed with its 4-byte length.
+
+How to Run:
+----------
+    python -m src.server --port 8765
+
+Educational Purpose:
+-------------------
+Learn about:
+- asyncio streams and cooperative multitasking
+- Fixed-rate simulation loops
+- Measuring latency percentiles
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+
+from .config import Config
+from .engine import GameEngine
+from .spectator import SpectatorFeed, FRAME_LENGTH
+
+# Actions a client may send, mapped to the engine call they trigger
+ACTIONS = {
+    "left": lambda engine: engine.move(-1),
+    "right": lambda engine: engine.move(1),
+    "down": lambda engine: engine.soft_drop(),
+    "rotate": lambda engine: engine.rotate(),
+    "drop": lambda engine: engine.hard_drop(),
+}
+
+# New inputs arriving while this many wait are rejected, so a flooding
+# client cannot grow memory. The queued ones are kept: dropping an old
+# move or rotate instead would change where the current piece lands.
+MAX_QUEUED_INPUTS = 64
+
+# Skip state updates to clients whose socket buffer is this full
+MAX_WRITE_BUFFER = 64 * 1024
+
+# Number of recent tick durations kept for percentile reporting
+TICK_SAMPLES = 4096
+
+
+class GameSession:
+    """
+    One connected client and the game it drives.
+    
+    Attributes:
+        session_id (int): Unique id within the server
+        engine (GameEngine): The session's game
+        inputs (deque): Actions received but not yet applied
+        dropped_inputs (int): Actions rejected because the queue was full
+        dirty (bool): True when the client has not seen the latest state
+        spectators (dict): Spectator writers, mapped to True while they
+                           need a resync after missing frames
+        feed (SpectatorFeed): Delta stream, created for the first viewer
+    """
+    
+    def __init__(self, session_id, writer, rows=None, cols=None):
+        """
+        Create a session.
+        
+        Args:
+            session_id (int): Unique id within the server
+            writer (asyncio.StreamWriter): Connection to the client
+            rows (int, optional): Board height
+            cols (int, optional): Board width
+        """
+        self.session_id = session_id
+        self.writer = writer
+        self.engine = GameEngine(rows, cols)
+        self.inputs = deque()
+        self.dropped_inputs = 0
+        self.dirty = True
+        self.spectators = {}
+        self.feed = None
+    
+    def queue_input(self, action):
+        """
+        Queue an action for the next tick.
+        
+        Args:
+            action (str): Name from ACTIONS, "reset" or "pause"
+        
+        Returns:
+            bool: False if the queue was full and the action was dropped
+        """
+        if len(self.inputs) >= MAX_QUEUED_INPUTS:
+            self.dropped_inputs += 1
+            return False
+        self.inputs.append(action)
+        return True
+    
+    def apply_inputs(self):
+        """Apply all queued actions to the engine in arrival order."""
+        engine = self.engine
+        while self.inputs:
+            action = self.inputs.popleft()
+            if action == "reset":
+                engine.reset_game()
+            elif action == "pause":
+                engine.paused = not engine.paused
+            elif engine.game_over or engine.paused:
+                continue
+            else:
+                ACTIONS[action](engine)
+            self.dirty = True
+    
+    def tick(self, elapsed):
+        """
+        Advance the game by one server tick and send the new state.
+        
+        Args:
+            elapsed (float): Milliseconds of game time per tick
+        """
+        self.apply_inputs()
+        
+        if not self.engine.game_over and self.engine.update(elapsed):
+            self.dirty = True
+        
+        # Slow readers keep the update pending instead of buffering more
+        if self.dirty:
+            transport = self.writer.transport
+            if transport.get_write_buffer_size() < MAX_WRITE_BUFFER:
+                self.writer.write(self.encode_state())
+                self.dirty = False
+        
+        if self.spectators:
+            self.broadcast()
+    
+    def add_spectator(self, writer):
+        """
+        Start streaming this game to a spectator connection.
+        
+        Args:
+            writer (asyncio.StreamWriter): The spectator's connection
+        """
+        # A feed that had no viewers has fallen behind; start a new one
+        if self.feed is None or not self.spectators:
+            self.feed = SpectatorFeed()
+        for frame in self.feed.catch_up():
+            writer.write(FRAME_LENGTH.pack(len(frame)) + frame)
+        self.spectators[writer] = False
+    
+    def broadcast(self):
+        """Encode one delta frame and fan it out to every spectator."""
+        frame = self.feed.publish(self.engine)
+        packet = None
+        if frame is not None:
+            packet = FRAME_LENGTH.pack(len(frame)) + frame
+        
+        for writer, needs_resync in self.spectators.items():
+            if writer.transport.get_write_buffer_size() >= MAX_WRITE_BUFFER:
+                # A dropped delta breaks the viewer's board, so resend
+                # from the last keyframe once it catches up
+                if packet is not None:
+                    self.spectators[writer] = True
+            elif needs_resync:
+                # Also when the game stopped changing (e.g. game over)
+                for missed in self.feed.catch_up():
+                    writer.write(FRAME_LENGTH.pack(len(missed)) + missed)
+                self.spectators[writer] = False
+            elif packet is not None:
+                writer.write(packet)
+    
+    def encode_state(self):
+        """
+        Serialize the game state as one JSON line.
+        
+        Returns:
+            bytes: Encoded state terminated by a newline
+        """
+        engine = self.engine
+        piece = engine.current_piece
+        state = {
+            "board": engine.grid.row_masks,
+            "piece": {
+                "type": piece.shape_type,
+                "x": piece.x,
+                "y": piece.y,
+                "rows": piece.get_row_masks(),
+            },
+            "next": engine.next_piece.shape_type,
+            "score": engine.score,
+            "level": engine.level,
+            "lines": engine.lines_cleared,
+            "game_over": engine.game_over,
+        }
+        return (json.dumps(state, separators=(",", ":")) + "\n").encode()
+
+
+class GameServer:
+    """
+    asyncio TCP server running one GameSession per connection.
+    
+    Attributes:
+        host (str): Interface to listen on
+        port (int): TCP port (0 picks a free port, see ``start``)
+        tick_rate (int): Simulation ticks per second
+        sessions (dict): Active sessions by id
+        ticks (int): Ticks run since start
+        tick_times (deque): Recent tick durations in seconds
+    """
+    
+    def __init__(self, host="127.0.0.1", port=8765, tick_rate=Config.FPS,
+                 rows=None, cols=None):
+        """
+        Configure the server. Nothing listens until ``start`` is awaited.
+        
+        Args:
+            host (str): Interface to listen on
+            port (int): TCP port, 0 for any free port
+            tick_rate (int): Simulation ticks per second
+            rows (int, optional): Board height for every session
+            cols (int, optional): Board width for every session
+        """
+        self.host = host
+        self.port = port
+        self.tick_rate = tick_rate
+        self.rows = rows
+        self.cols = cols
+        self.sessions = {}
+        self.ticks = 0
+        self.tick_times = deque(maxlen=TICK_SAMPLES)
+        self._next_id = 0
+        self._server = None
+        self._tick_task = None
+        self._started_wall = None
+        self._started_cpu = None
+    
+    async def start(self):
+        """Start listening and begin the tick loop."""
+        self._server = await asyncio.start_server(
+            self._handle_client, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started_wall = time.perf_counter()
+        self._started_cpu = time.process_time()
+        self._tick_task = asyncio.create_task(self._tick_loop())
+    
+    async def serve_forever(self):
+        """Start the server and run until cancelled."""
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+    
+    async def stop(self):
+        """Stop the tick loop and close every connection."""
+        if self._tick_task:
+            self._tick_task.cancel()
+            try:
+                await self._tick_task
+            except asyncio.CancelledError:
+                pass
+            self._tick_task = None
+        if self._server:
+            self._server.close()
+        for session in list(self.sessions.values()):
+            session.writer.close()
+        self.sessions.clear()
+        if self._server:
+            await self._server.wait_closed()
+            self._server = None
+    
+    def stats(self):
+        """
+        Summarize server load.
+        
+        Returns:
+            dict: Session count, tick count, tick latency percentiles in
+                  milliseconds and the fraction of one CPU core used
+        """
+        samples = sorted(self.tick_times)
+        
+        def percentile(fraction):
+            if not samples:
+                return 0.0
+            return samples[int(fraction * (len(samples) - 1))] * 1000
+        
+        wall = time.perf_counter() - self._started_wall
+        cpu = time.process_time() - self._started_cpu
+        return {
+            "sessions": len(self.sessions),
+            "ticks": self.ticks,
+            "p50_tick_ms": percentile(0.50),
+            "p99_tick_ms": percentile(0.99),
+            "max_tick_ms": percentile(1.0),
+            "cpu_util": cpu / wall if wall > 0 else 0.0,
+        }
+    
+    async def _handle_client(self, reader, writer):
+        """Read actions from one client until it disconnects."""
+        session_id = self._next_id
+        self._next_id += 1
+        session = GameSession(session_id, writer, self.rows, self.cols)
+        self.sessions[session_id] = session
+        writer.write((json.dumps({"session": session_id}) + "\n").encode())
+        watching = None
+        
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                action = line.decode("utf-8", "replace").strip().lower()
+                
+                if action == "quit":
+                    break
+                if action == "stats":
+                    reply = {"stats": self.stats()}
+                elif action.startswith("watch "):
+                    target = self._find_session(action[6:])
+                    if watching is not None or target is None:
+                        reply = {"error": f"cannot {action}"}
+                    else:
+                        # This connection stops playing and only watches
+                        self.sessions.pop(session_id, None)
+                        session = None
+                        watching = target
+                        writer.write((json.dumps(
+                            {"watching": target.session_id}
+                        ) + "\n").encode())
+                        target.add_spectator(writer)
+                        continue
+                elif session is None:
+                    continue
+                elif action in ACTIONS or action in ("reset", "pause"):
+                    session.queue_input(action)
+                    continue
+                elif action:
+                    reply = {"error": f"unknown action: {action}"}
+                else:
+                    continue
+                if watching is None:
+                    writer.write((json.dumps(reply) + "\n").encode())
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.pop(session_id, None)
+            if watching is not None:
+                watching.spectators.pop(writer, None)
+            if session is not None:
+                for spectator in session.spectators:
+                    spectator.close()
+            writer.close()
+    
+    def _find_session(self, text):
+        """Look up a session by its id as sent by a client."""
+        try:
+            return self.sessions.get(int(text))
+        except ValueError:
+            return None
+    
+    async def _tick_loop(self):
+        """Advance every session at a fixed rate."""
+        loop = asyncio.get_running_loop()
+        interval = 1.0 / self.tick_rate
+        elapsed_ms = 1000.0 / self.tick_rate
+        next_tick = loop.time()
+        
+        while True:
+            start = time.perf_counter()
+            for session in list(self.sessions.values()):
+                try:
+                    session.tick(elapsed_ms)
+                except ConnectionError:
+                    session.writer.close()
+            self.tick_times.append(time.perf_counter() - start)
+            self.ticks += 1
+            
+            # If a tick overran, restart the schedule instead of
+            # running a burst of catch-up ticks
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                next_tick = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+
+
+def main():
+    """Command line entry point: ``python -m src.server``."""
+    parser = argparse.ArgumentParser(description="Headless Tetris server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--tick-rate", type=int, default=Config.FPS)
+    parser.add_argument("--rows", type=int, default=None)
+    parser.add_argument("--cols", type=int, default=None)
+    args = parser.parse_args()
+    
+    server = GameServer(args.host, args.port, args.tick_rate,
+                        args.rows, args.cols)
+    print(f"Serving Tetris on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\nServer stopped.")
+
+
+if __name__ == "__main__":
+    main()
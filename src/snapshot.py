@@ -0,0 +1,204 @@
+"""
+Snapshot Module - Compact Binary Game State
+===========================================
+
+This module saves and restores the complete state of a GameEngine as a
+small, versioned binary blob: board, current and next piece, random
+number generator, score, level, lines and gravity timers.
+
+The board is stored as the Grid's packed palette indices (one byte per
+cell) at the end of the blob, so:
+
+- Loading copies the board bytes in one step instead of creating an
+  object for every cell
+- ``board_view`` exposes the board of a snapshot as a 2D memoryview
+  that NumPy can wrap without copying
+
+Layout (little endian, version 1):
+    header   <4sBHHIHIdIBB  magic, version, rows, cols, score, level,
+                            lines, fall_time, fall_speed, paused,
+                            game_over
+    current  <BBhhBBB4s     type, color, x, y, rotation, width,
+                            height, shape row masks
+    next     <BBhhBBB4s     same as current
+    rng      <625IBd        Mersenne Twister state, has gauss, gauss
+    board    rows * cols bytes of palette indices
+
+Educational Purpose:
+-------------------
+Learn about:
+- Designing versioned binary file formats
+- The buffer protocol and zero-copy memoryviews
+- Saving and restoring random number generator state
+"""
+
+import struct
+
+from .config import Config
+from .engine import GameEngine
+from .tetromino import Tetromino
+
+MAGIC = b"TSNP"
+VERSION = 1
+
+HEADER = struct.Struct("<4sBHHIHIdIBB")
+PIECE = struct.Struct("<BBhhBBB4s")
+RNG = struct.Struct("<625IBd")
+
+# Offset of the board bytes within a snapshot
+BOARD_OFFSET = HEADER.size + 2 * PIECE.size + RNG.size
+
+
+def _pack_piece(piece):
+    """Pack a tetromino, including its current (rotated) shape."""
+    masks = bytes(piece.get_row_masks()).ljust(4, b"\0")
+    return PIECE.pack(
+        piece.shape_type, Config.COLOR_INDEX[piece.color],
+        piece.x, piece.y, piece.rotation,
+        piece.get_width(), piece.get_height(), masks
+    )
+
+
+def _unpack_piece(data, offset, columns):
+    """Rebuild a tetromino packed by ``_pack_piece``."""
+    (shape_type, color, x, y, rotation,
+     width, height, masks) = PIECE.unpack_from(data, offset)
+    piece = Tetromino(shape_type, columns)
+    piece.shape = [[(mask >> col) & 1 for col in range(width)]
+                   for mask in masks[:height]]
+    piece.color = Config.PALETTE[color]
+    piece.x = x
+    piece.y = y
+    piece.rotation = rotation
+    return piece
+
+
+def save_state(engine):
+    """
+    Serialize a game.
+    
+    Args:
+        engine (GameEngine): Game to save (TetrisGame works too)
+    
+    Returns:
+        bytes: The snapshot
+    """
+    grid = engine.grid
+    _, words, gauss = engine.rng.getstate()
+    return b"".join((
+        HEADER.pack(
+            MAGIC, VERSION, grid.rows, grid.cols,
+            engine.score, engine.level, engine.lines_cleared,
+            engine.fall_time, engine.fall_speed,
+            engine.paused, engine.game_over
+        ),
+        _pack_piece(engine.current_piece),
+        _pack_piece(engine.next_piece),
+        RNG.pack(*words, gauss is not None, gauss or 0.0),
+        grid.cells,
+    ))
+
+
+def read_header(data):
+    """
+    Read and validate a snapshot header.
+    
+    Args:
+        data (bytes-like): Snapshot
+    
+    Returns:
+        tuple: (rows, cols)
+    
+    Raises:
+        ValueError: If the data is not a supported snapshot
+    """
+    if len(data) < BOARD_OFFSET:
+        raise ValueError("Snapshot is truncated")
+    magic, version, rows, cols = HEADER.unpack_from(data, 0)[:4]
+    if magic != MAGIC:
+        raise ValueError("Not a game snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    if len(data) != BOARD_OFFSET + rows * cols:
+        raise ValueError("Snapshot board size does not match its header")
+    return rows, cols
+
+
+def load_state(data, engine=None):
+    """
+    Restore a game from a snapshot.
+    
+    Args:
+        data (bytes-like): Snapshot from ``save_state``
+        engine (GameEngine, optional): Engine to restore into. Its board
+                                       is reused when the size matches.
+    
+    Returns:
+        GameEngine: The restored game
+    """
+    rows, cols = read_header(data)
+    if engine is None:
+        engine = GameEngine(rows, cols)
+    elif (engine.grid.rows, engine.grid.cols) != (rows, cols):
+        engine.grid = type(engine.grid)(rows, cols)
+    
+    (_, _, _, _, engine.score, engine.level, engine.lines_cleared,
+     engine.fall_time, engine.fall_speed,
+     paused, game_over) = HEADER.unpack_from(data, 0)
+    engine.paused = bool(paused)
+    engine.game_over = bool(game_over)
+    
+    offset = HEADER.size
+    engine.current_piece = _unpack_piece(data, offset, cols)
+    offset += PIECE.size
+    engine.next_piece = _unpack_piece(data, offset, cols)
+    offset += PIECE.size
+    
+    state = RNG.unpack_from(data, offset)
+    gauss = state[626] if state[625] else None
+    engine.rng.setstate((3, state[:625], gauss))
+    
+    engine.grid.load_cells(memoryview(data)[BOARD_OFFSET:])
+    return engine
+
+
+def board_view(data):
+    """
+    Get the board of a snapshot without copying it.
+    
+    Args:
+        data (bytes-like): Snapshot from ``save_state``
+    
+    Returns:
+        memoryview: Palette indices shaped ``(rows, cols)``, e.g. for
+                    ``numpy.asarray(board_view(data))``
+    """
+    rows, cols = read_header(data)
+    return memoryview(data)[BOARD_OFFSET:].cast("B", (rows, cols))
+
+
+def save_file(engine, path):
+    """
+    Write a snapshot of a game to a file.
+    
+    Args:
+        engine (GameEngine): Game to save
+        path (str): Destination file
+    """
+    with open(path, "wb") as f:
+        f.write(save_state(engine))
+
+
+def load_file(path, engine=None):
+    """
+    Restore a game from a snapshot file.
+    
+    Args:
+        path (str): Snapshot file
+        engine (GameEngine, optional): Engine to restore into
+    
+    Returns:
+        GameEngine: The restored game
+    """
+    with open(path, "rb") as f:
+        return load_state(f.read(), engine)
@@ -0,0 +1,379 @@
+"""
+Solver Module - Perfect Clear Search
+====================================
+
+This module searches for a sequence of placements that empties the
+board completely (a "perfect clear"), given a board with only a few
+filled rows and the pieces that are coming: the current piece, the
+next piece and optionally a longer queue.
+
+Pieces are placed the way GameEngine.place does it: rotate, move to a
+column, hard drop. There is no hold, so the pieces are used in order.
+
+The search is a depth-first search over small bitboard states:
+
+- The board is the tuple of row masks of the bottom ``height`` rows
+  (every row above must stay empty), so states are cheap to copy,
+  compare and hash
+- Every state that turned out to be a dead end is remembered, so it is
+  never explored twice (different orders often reach the same board)
+- A state is pruned early when:
+    - more pieces are needed to fill it than are left in the queue
+    - a completely filled column splits it into parts whose empty
+      cells are not a multiple of 4
+    - its column parity cannot be fixed by the remaining pieces (see
+      ``_parity_values``)
+
+A time budget stops the search, and so does an optional limit on the
+number of states visited; the best partial sequence found so far (the
+one placing the most pieces, then leaving the fewest filled cells) is
+returned instead.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Depth-first search with memoization
+- Pruning with counting and parity arguments
+- Bitboards as hashable search states
+"""
+
+import time
+
+from .tetromino import Tetromino
+
+# Check the clock every this many search nodes
+_CLOCK_INTERVAL = 256
+
+# Number of set bits; int.bit_count is the fast way, but needs Python 3.10
+_bit_count = (getattr(int, "bit_count", None)
+              or (lambda mask: bin(mask).count("1")))
+
+
+class _OutOfTime(Exception):
+    """Raised inside the search when the time or node budget is used up."""
+
+
+class SolverResult:
+    """
+    Outcome of a perfect clear search.
+    
+    Attributes:
+        placements (list): (rotation, x) pairs for GameEngine.place, one
+                           per piece, in queue order
+        solved (bool): True if the placements empty the board
+        remaining_cells (int): Filled cells left after the placements
+        nodes (int): Search states visited
+        elapsed (float): Seconds spent searching
+        timed_out (bool): True if the time budget or node limit ran out
+    """
+    
+    def __init__(self, placements, solved, remaining_cells, nodes,
+                 elapsed, timed_out):
+        self.placements = placements
+        self.solved = solved
+        self.remaining_cells = remaining_cells
+        self.nodes = nodes
+        self.elapsed = elapsed
+        self.timed_out = timed_out
+    
+    def __repr__(self):
+        return (f"SolverResult(solved={self.solved}, "
+                f"pieces={len(self.placements)}, "
+                f"remaining_cells={self.remaining_cells}, "
+                f"nodes={self.nodes}, elapsed={self.elapsed:.3f})")
+
+
+def _orientations(piece):
+    """
+    Get the distinct orientations of a piece.
+    
+    Args:
+        piece (Tetromino or int): Piece, or a shape type at spawn
+    
+    Returns:
+        list: (rotation, width, row masks) per distinct orientation
+    """
+    if isinstance(piece, int):
+        piece = Tetromino(piece)
+    probe = piece.clone()
+    orientations = []
+    seen = set()
+    for rotation in range(4):
+        masks = tuple(probe.get_row_masks())
+        if masks not in seen:
+            seen.add(masks)
+            orientations.append((rotation, probe.get_width(), masks))
+        probe.rotate_clockwise()
+    return orientations
+
+
+def _parity_values(orientations, cols):
+    """
+    Column parity changes a piece can make.
+    
+    Columns are colored alternately; a piece changes the difference
+    between empty cells in even and odd columns by the same amount
+    wherever it lands vertically. Clearing a full row removes no empty
+    cells, so it does not change the difference either.
+    
+    Returns:
+        frozenset: Every possible change, over orientations and columns
+    """
+    values = set()
+    for _, width, masks in orientations:
+        for x in range(min(2, cols - width + 1)):
+            even = odd = 0
+            for mask in masks:
+                for col in range(width):
+                    if mask >> col & 1:
+                        if (x + col) % 2:
+                            odd += 1
+                        else:
+                            even += 1
+            values.add(even - odd)
+    return frozenset(values)
+
+
+class PerfectClearSolver:
+    """
+    Searches for placement sequences that empty the board.
+    
+    Attributes:
+        cols (int): Board width
+        pieces (list): Orientations of every piece in the queue
+        moves (list): Drops to try for every piece in the queue
+        nodes (int): States visited by the last search
+    """
+    
+    def __init__(self, cols, pieces):
+        """
+        Prepare a solver for one piece queue.
+        
+        Args:
+            cols (int): Board width
+            pieces (list): Tetromino objects or shape types, in the order
+                           they will be played. A Tetromino's rotations
+                           are counted from its current shape.
+        """
+        self.cols = cols
+        self.full_mask = (1 << cols) - 1
+        self.pieces = [_orientations(piece) for piece in pieces]
+        self.parity = [_parity_values(o, cols) for o in self.pieces]
+        
+        # Every (rotation, x, shifted row masks) a piece can be dropped
+        # with, computed once instead of at every search node
+        self.moves = [
+            [(rotation, x, tuple(mask << x for mask in masks))
+             for rotation, width, masks in orientations
+             for x in range(cols - width + 1)]
+            for orientations in self.pieces
+        ]
+        self._even_columns = sum(1 << x for x in range(0, cols, 2))
+        self._reachable = {}
+        self.nodes = 0
+    
+    def solve(self, masks, max_height=4, time_budget=1.0, node_limit=None):
+        """
+        Search for a perfect clear.
+        
+        Args:
+            masks (sequence): Row masks of the board, top to bottom. Only
+                              the filled rows at the bottom matter.
+            max_height (int): Highest stack the search may build
+            time_budget (float): Seconds before giving up
+            node_limit (int): States to visit before giving up, or None
+                              for no limit
+        
+        Returns:
+            SolverResult: The solution, or the best partial sequence
+        """
+        masks = list(masks)
+        while masks and not masks[0]:
+            masks.pop(0)
+        filled = sum(_bit_count(mask) for mask in masks)
+        
+        self.nodes = 0
+        self._failed = set()
+        self._path = []
+        self._best = ((0, -filled), [])
+        self._deadline = time.perf_counter() + time_budget
+        self._node_limit = node_limit
+        start = time.perf_counter()
+        solution = None
+        timed_out = False
+        
+        # Try the lowest stack heights first: they need the fewest pieces
+        try:
+            for height in range(max(len(masks), 1), max_height + 1):
+                empty = height * self.cols - filled
+                if empty % 4 or empty // 4 > len(self.pieces):
+                    continue
+                board = (0,) * (height - len(masks)) + tuple(masks)
+                if self._search(board, 0):
+                    solution = list(self._path)
+                    break
+        except _OutOfTime:
+            timed_out = True
+        
+        elapsed = time.perf_counter() - start
+        if solution is not None:
+            return SolverResult(solution, True, 0, self.nodes, elapsed,
+                                timed_out)
+        (_, remaining), placements = self._best
+        return SolverResult(placements, False, -remaining, self.nodes,
+                            elapsed, timed_out)
+    
+    def _search(self, board, index):
+        """Depth-first search from one state; True if it clears."""
+        if not board:
+            return True
+        if (board, index) in self._failed:
+            return False
+        
+        if self.nodes == self._node_limit:
+            raise _OutOfTime
+        self.nodes += 1
+        if self.nodes % _CLOCK_INTERVAL == 0:
+            if time.perf_counter() > self._deadline:
+                raise _OutOfTime
+        
+        # Best partial result: most pieces placed, then fewest cells left
+        progress = (index, -sum(_bit_count(mask) for mask in board))
+        if progress > self._best[0]:
+            self._best = (progress, list(self._path))
+        
+        if not self._feasible(board, index):
+            self._failed.add((board, index))
+            return False
+        
+        for rotation, x, shifted in self.moves[index]:
+            result = self._drop(board, shifted)
+            if result is None:
+                continue
+            self._path.append((rotation, x))
+            if self._search(result, index + 1):
+                return True
+            self._path.pop()
+        
+        self._failed.add((board, index))
+        return False
+    
+    def _feasible(self, board, index):
+        """Cheap checks that rule out states which cannot clear."""
+        cols = self.cols
+        full = self.full_mask
+        empty = len(board) * cols - sum(_bit_count(mask) for mask in board)
+        needed = empty // 4
+        if needed > len(self.pieces) - index:
+            return False
+        
+        # Columns filled from top to bottom split the board into parts
+        # that must each be filled by whole pieces
+        walls = full
+        for mask in board:
+            walls &= mask
+        if walls:
+            start = 0
+            for x in range(cols + 1):
+                if x == cols or walls >> x & 1:
+                    if x > start:
+                        part = ((1 << x) - 1) ^ ((1 << start) - 1)
+                        count = sum(_bit_count(part & ~mask)
+                                    for mask in board)
+                        if count % 4:
+                            return False
+                    start = x + 1
+        
+        even = self._even_columns
+        difference = sum(
+            _bit_count(even & ~mask) - _bit_count(full & ~even & ~mask)
+            for mask in board
+        )
+        return difference in self._reachable_parity(index, needed)
+    
+    def _reachable_parity(self, index, count):
+        """Parity differences the next ``count`` pieces can fill."""
+        key = (index, count)
+        reachable = self._reachable.get(key)
+        if reachable is None:
+            reachable = {0}
+            for values in self.parity[index:index + count]:
+                reachable = {total + value for total in reachable
+                             for value in values}
+            reachable = frozenset(reachable)
+            self._reachable[key] = reachable
+        return reachable
+    
+    def _drop(self, board, shifted):
+        """
+        Drop a piece into a board and clear full rows.
+        
+        Args:
+            board (tuple): Row masks, top to bottom
+            shifted (tuple): Piece row masks, already moved to its column
+        
+        Returns:
+            tuple: The new board, or None if the piece would stick out
+                   above the height limit
+        """
+        height = len(shifted)
+        rows = len(board)
+        if height > rows:
+            return None
+        
+        # Fall from fully above the board, like a real drop; rows above
+        # the board (negative y) are empty
+        y = -height
+        while y + height < rows:
+            below = y + 1
+            if any(board[below + i] & shifted[i]
+                   for i in range(max(0, -below), height)):
+                break
+            y = below
+        if y < 0:
+            return None
+        
+        placed = [board[y + i] | shifted[i] for i in range(height)]
+        kept = tuple(mask for mask in placed if mask != self.full_mask)
+        return board[:y] + kept + board[y + height:]
+
+
+def solve(grid, pieces, max_height=4, time_budget=1.0, node_limit=None):
+    """
+    Search for a perfect clear on a Grid.
+    
+    Args:
+        grid (Grid): Board; only rows up to ``max_height`` may be filled
+        pieces (list): Tetromino objects or shape types, in play order
+        max_height (int): Highest stack the search may build
+        time_budget (float): Seconds before giving up
+        node_limit (int): States to visit before giving up, or None
+    
+    Returns:
+        SolverResult: The solution, or the best partial sequence
+    """
+    solver = PerfectClearSolver(grid.cols, pieces)
+    return solver.solve(grid.row_masks[grid.top:], max_height, time_budget,
+                        node_limit)
+
+
+def solve_engine(engine, queue=(), max_height=4, time_budget=1.0,
+                 node_limit=None):
+    """
+    Search for a perfect clear in a running game.
+    
+    Args:
+        engine (GameEngine): Game whose current and next piece are used
+        queue (sequence): Shape types coming after the next piece
+        max_height (int): Highest stack the search may build
+        time_budget (float): Seconds before giving up
+        node_limit (int): States to visit before giving up, or None
+    
+    Returns:
+        SolverResult: Placements can be played with
+                      ``engine.place(rotation, x)`` one after another
+    """
+    pieces = [engine.current_piece, engine.next_piece.shape_type]
+    pieces.extend(queue)
+    return solve(engine.grid, pieces, max_height, time_budget, node_limit)
+
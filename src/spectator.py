@@ -0,0 +1,323 @@
+"""
+Spectator Module - Delta-Compressed State Stream
+================================================
+
+This module turns a running game into a compact binary stream for
+remote viewers. Instead of sending the whole board every tick, each
+frame only carries what changed since the previous one:
+
+- Rows whose contents changed (as a bitmask plus one color index per
+  filled cell)
+- The active piece, when its type, position or rotation changed
+- Score, level and lines, when any of them changed
+
+Every ``keyframe_interval`` ticks a full keyframe is sent instead, so a
+viewer that joins mid-game only needs the last keyframe and the deltas
+after it.
+
+Frame layout (little endian):
+    header  <BIH   flags, tick, number of row records
+    size    <HH    rows, cols                      (keyframes only)
+    rows    <H     y, then ceil(cols / 8) mask bytes,
+                   then one color index per set bit
+    piece   <BBBBhhB  type, color, next type, next color, x, y, rotation
+    hud     <IHI   score, level, lines
+
+Educational Purpose:
+-------------------
+Learn about:
+- Delta encoding and keyframes (as used by video codecs)
+- Packing binary data with the struct module
+- Encoding once and fanning out to many receivers
+"""
+
+import struct
+
+from .config import Config
+
+# Frame flags
+FLAG_KEYFRAME = 1
+FLAG_PIECE = 2
+FLAG_HUD = 4
+FLAG_GAME_OVER = 8
+
+HEADER = struct.Struct("<BIH")
+BOARD_SIZE = struct.Struct("<HH")
+ROW_HEADER = struct.Struct("<H")
+PIECE = struct.Struct("<BBBBhhB")
+HUD = struct.Struct("<IHI")
+
+# Length prefix used when frames are sent over a byte stream
+FRAME_LENGTH = struct.Struct("<I")
+
+# Two seconds of ticks at the default frame rate
+DEFAULT_KEYFRAME_INTERVAL = Config.FPS * 2
+
+
+class DeltaEncoder:
+    """
+    Encodes successive states of one game as delta frames.
+    
+    Attributes:
+        keyframe_interval (int): Ticks between forced keyframes
+        tick (int): Number of frames encoded so far
+    """
+    
+    def __init__(self, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Create an encoder.
+        
+        Args:
+            keyframe_interval (int): Ticks between forced keyframes
+        """
+        self.keyframe_interval = keyframe_interval
+        self.tick = 0
+        self._force_keyframe = True
+        self._rows = []
+        self._masks = []
+        self._top = 0
+        self._piece = None
+        self._hud = None
+        self._game_over = False
+    
+    def request_keyframe(self):
+        """Make the next encoded frame a keyframe."""
+        self._force_keyframe = True
+    
+    def encode(self, engine):
+        """
+        Encode the engine's current state relative to the last call.
+        
+        Args:
+            engine (GameEngine): Game to encode
+        
+        Returns:
+            bytes: The frame, or None if nothing changed
+        """
+        grid = engine.grid
+        keyframe = (
+            self._force_keyframe
+            or self.tick % self.keyframe_interval == 0
+            or len(self._rows) != grid.rows
+        )
+        self.tick += 1
+        
+        if keyframe:
+            self._force_keyframe = False
+            changed = [y for y in range(grid.top, grid.rows)
+                       if grid.row_masks[y]]
+            self._rows = list(grid.grid)
+            self._masks = list(grid.row_masks)
+        else:
+            # A row is unchanged when its mask is the same and it is
+            # either empty or still the very same list object
+            start = min(grid.top, self._top)
+            changed = []
+            for y in range(start, grid.rows):
+                mask = grid.row_masks[y]
+                row = grid.grid[y]
+                if (mask != self._masks[y]
+                        or (mask and row is not self._rows[y])):
+                    changed.append(y)
+                    self._masks[y] = mask
+                self._rows[y] = row
+        self._top = grid.top
+        
+        piece = self._piece_state(engine)
+        hud = (engine.score, engine.level, engine.lines_cleared)
+        flags = FLAG_KEYFRAME if keyframe else 0
+        if keyframe or piece != self._piece:
+            flags |= FLAG_PIECE
+            self._piece = piece
+        if keyframe or hud != self._hud:
+            flags |= FLAG_HUD
+            self._hud = hud
+        if engine.game_over:
+            flags |= FLAG_GAME_OVER
+        
+        if not (changed or flags & ~FLAG_GAME_OVER
+                or engine.game_over != self._game_over):
+            return None
+        self._game_over = engine.game_over
+        
+        parts = [HEADER.pack(flags, self.tick - 1, len(changed))]
+        if keyframe:
+            parts.append(BOARD_SIZE.pack(grid.rows, grid.cols))
+        mask_bytes = (grid.cols + 7) // 8
+        color_index = Config.COLOR_INDEX
+        for y in changed:
+            parts.append(ROW_HEADER.pack(y))
+            parts.append(grid.row_masks[y].to_bytes(mask_bytes, "little"))
+            parts.append(bytes([color_index[cell]
+                                for cell in grid.grid[y] if cell]))
+        if flags & FLAG_PIECE:
+            parts.append(PIECE.pack(*piece))
+        if flags & FLAG_HUD:
+            parts.append(HUD.pack(*hud))
+        return b"".join(parts)
+    
+    @staticmethod
+    def _piece_state(engine):
+        """Pack the active and next piece into a comparable tuple."""
+        piece = engine.current_piece
+        upcoming = engine.next_piece
+        return (
+            piece.shape_type, Config.COLOR_INDEX[piece.color],
+            upcoming.shape_type, Config.COLOR_INDEX[upcoming.color],
+            piece.x, piece.y, piece.rotation,
+        )
+
+
+class SpectatorFeed:
+    """
+    Encodes a game once per tick and keeps what late joiners need.
+    
+    Attributes:
+        encoder (DeltaEncoder): Encoder for the watched game
+        backlog (list): The latest keyframe and every delta after it
+    """
+    
+    def __init__(self, keyframe_interval=DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Create a feed.
+        
+        Args:
+            keyframe_interval (int): Ticks between forced keyframes
+        """
+        self.encoder = DeltaEncoder(keyframe_interval)
+        self.backlog = []
+    
+    def publish(self, engine):
+        """
+        Encode the current state for all viewers.
+        
+        Args:
+            engine (GameEngine): Game being watched
+        
+        Returns:
+            bytes: The new frame, or None if nothing changed
+        """
+        frame = self.encoder.encode(engine)
+        if frame is not None:
+            if frame[0] & FLAG_KEYFRAME:
+                self.backlog = [frame]
+            else:
+                self.backlog.append(frame)
+        return frame
+    
+    def catch_up(self):
+        """
+        Get the frames a new viewer needs to reach the current state.
+        
+        Returns:
+            list: Keyframe followed by deltas (empty if no keyframe yet,
+                  in which case the next published frame is a keyframe)
+        """
+        if not self.backlog:
+            self.encoder.request_keyframe()
+        return list(self.backlog)
+
+
+class SpectatorView:
+    """
+    Client-side reconstruction of a game from delta frames.
+    
+    Attributes:
+        rows (int): Board height (0 until the first keyframe)
+        cols (int): Board width
+        board (list): One bytearray of color indices per row
+        row_masks (list): One bitmask per row
+        piece (tuple): (type, color, next type, next color, x, y, rotation)
+        score (int): Current score
+        level (int): Current level
+        lines (int): Lines cleared
+        game_over (bool): Whether the game has ended
+        tick (int): Tick of the last applied frame
+        synced (bool): True once a keyframe has been applied
+        version (int): Incremented by every frame that changed something
+    """
+    
+    def __init__(self):
+        """Create an empty view waiting for its first keyframe."""
+        self.rows = 0
+        self.cols = 0
+        self.board = []
+        self.row_masks = []
+        self.piece = None
+        self.score = 0
+        self.level = 1
+        self.lines = 0
+        self.game_over = False
+        self.tick = -1
+        self.synced = False
+        self.version = 0
+    
+    def apply(self, frame):
+        """
+        Apply one frame.
+        
+        Args:
+            frame (bytes): Frame produced by DeltaEncoder
+        
+        Returns:
+            bool: False if the frame was skipped because no keyframe
+                  has been seen yet
+        """
+        flags, tick, row_count = HEADER.unpack_from(frame, 0)
+        offset = HEADER.size
+        
+        if flags & FLAG_KEYFRAME:
+            self.rows, self.cols = BOARD_SIZE.unpack_from(frame, offset)
+            offset += BOARD_SIZE.size
+            self.board = [bytearray(self.cols) for _ in range(self.rows)]
+            self.row_masks = [0] * self.rows
+            self.synced = True
+        elif not self.synced:
+            return False
+        
+        mask_bytes = (self.cols + 7) // 8
+        for _ in range(row_count):
+            (y,) = ROW_HEADER.unpack_from(frame, offset)
+            offset += ROW_HEADER.size
+            mask = int.from_bytes(frame[offset:offset + mask_bytes], "little")
+            offset += mask_bytes
+            
+            row = bytearray(self.cols)
+            bits = mask
+            while bits:
+                low = bits & -bits
+                row[low.bit_length() - 1] = frame[offset]
+                offset += 1
+                bits ^= low
+            self.board[y] = row
+            self.row_masks[y] = mask
+        
+        if flags & FLAG_PIECE:
+            self.piece = PIECE.unpack_from(frame, offset)
+            offset += PIECE.size
+        if flags & FLAG_HUD:
+            self.score, self.level, self.lines = HUD.unpack_from(frame, offset)
+            offset += HUD.size
+        
+        game_over = bool(flags & FLAG_GAME_OVER)
+        if (row_count or flags & ~FLAG_GAME_OVER
+                or game_over != self.game_over):
+            self.version += 1
+        self.game_over = game_over
+        self.tick = tick
+        return True
+    
+    def get_filled_cells(self):
+        """
+        Get all filled cells with their colors, like Grid.get_filled_cells.
+        
+        Returns:
+            list: List of ((x, y), color) tuples
+        """
+        filled = []
+        for y, row in enumerate(self.board):
+            if self.row_masks[y]:
+                for x, index in enumerate(row):
+                    if index:
+                        filled.append(((x, y), Config.PALETTE[index]))
+        return filled
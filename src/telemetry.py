@@ -0,0 +1,413 @@
+"""
+Telemetry Module - Structured Gameplay and Performance Events
+=============================================================
+
+This module records what happens in a game as a stream of small,
+structured events, so gameplay and performance trends can be followed
+across many machines:
+
+- spawn:     a piece became the current piece
+- lock:      a piece was locked (shape, rotation and position)
+- clear:     rows were cleared (single, double, triple or tetris)
+- level_up:  a new level was reached
+- game_over: a game ended by topping out or by quitting
+- ticks:     once per second, how many updates and frames ran and how
+             long they took (mean and worst, in microseconds)
+
+Recording must never slow down a frame, so:
+
+- Every event is one fixed-size record of integers written into a
+  preallocated ring buffer (an ``array`` of int64); recording does not
+  build dicts, format strings or touch files
+- A background thread wakes up a few times per second, copies the new
+  records out of the ring and writes them in one batch
+- Output files rotate when they reach a size limit, and the oldest ones
+  are deleted, so a long-running machine never fills its disk
+- If the writer falls a whole ring behind, the oldest events are
+  overwritten and counted in ``dropped`` instead of blocking the game
+
+Files are JSON Lines (one object per event, easy to ship to any log
+pipeline) or raw little-endian int64 records (compact and fast);
+``read_events`` reads either.
+
+How to Run:
+----------
+    python main.py --telemetry telemetry/
+    python -m src.telemetry telemetry/
+
+Educational Purpose:
+-------------------
+Learn about:
+- Ring buffers
+- Producer/consumer threads without locks
+- Batching and log rotation
+"""
+
+import argparse
+import array
+import glob
+import json
+import os
+import sys
+import threading
+import time
+
+from .config import Config
+
+# Event types (stored in the records)
+SPAWN = 0
+LOCK = 1
+CLEAR = 2
+LEVEL_UP = 3
+GAME_OVER = 4
+TICKS = 5
+
+EVENT_NAMES = ("spawn", "lock", "clear", "level_up", "game_over", "ticks")
+
+# Meaning of the value slots of each event type
+EVENT_FIELDS = (
+    ("piece", "x", "y"),
+    ("piece", "rotation", "x", "y"),
+    ("rows", "points", "lines", "score"),
+    ("level", "fall_speed", "lines"),
+    ("score", "level", "lines", "quit"),
+    ("ticks", "tick_mean_us", "tick_max_us",
+     "frames", "frame_mean_us", "frame_max_us"),
+)
+
+CLEAR_TYPES = {1: "single", 2: "double", 3: "triple", 4: "tetris"}
+
+# int64 slots per record: time (unix microseconds), type, six values
+RECORD_SIZE = 8
+
+FORMATS = ("jsonl", "bin")
+
+
+class Telemetry:
+    """
+    Records game events into a ring buffer and writes them to disk.
+    
+    Recording methods are called by the game; apart from the per-frame
+    timing they must be called from one thread (the one running
+    ``update``).
+    
+    Attributes:
+        directory (str): Output directory
+        fmt (str): "jsonl" or "bin"
+        session (str): Name shared by this run's files
+        capacity (int): Events the ring buffer holds
+        recorded (int): Events recorded so far
+        written (int): Events written to disk so far
+        dropped (int): Events overwritten before they were written
+    """
+    
+    def __init__(self, directory, fmt="jsonl", session=None,
+                 capacity=16384, flush_interval=0.25,
+                 max_bytes=8 * 1024 * 1024, max_files=10):
+        """
+        Create the ring buffer and start the writer thread.
+        
+        Args:
+            directory (str): Output directory (created if missing)
+            fmt (str): "jsonl" or "bin"
+            session (str, optional): Name for this run's files. Defaults
+                                     to the start time and process id.
+            capacity (int): Events the ring buffer holds
+            flush_interval (float): Seconds between writes
+            max_bytes (int): Start a new file once one reaches this size
+            max_files (int): Files kept per session; older ones are
+                             deleted (0 keeps all)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown telemetry format: {fmt}")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.fmt = fmt
+        self.session = session or (
+            f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        )
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        
+        self._records = array.array("q", bytes(8 * RECORD_SIZE * capacity))
+        self._flushed = 0
+        self._file = None
+        self._file_index = -1
+        self._files = []
+        
+        # Per-second timing summary, accumulated in plain integers
+        self._window_start = time.perf_counter_ns()
+        self._ticks = self._tick_ns = self._tick_max = 0
+        
+        # Frame timing comes from the render thread, so tick() must not
+        # reset it. frame() publishes (window, frames, total ns, worst ns
+        # in that window) as one tuple, replaced in a single assignment;
+        # tick() reads it once and takes the difference from the totals
+        # it saw at the end of the previous window.
+        self._window = 0
+        self._frame_stats = (0, 0, 0, 0)
+        self._frames_seen = self._frame_ns_seen = 0
+        
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._write_loop, name="telemetry-writer", daemon=True
+        )
+        self._thread.start()
+    
+    # Recording (called from the game loop)
+    
+    def _record(self, kind, a=0, b=0, c=0, d=0, e=0, f=0):
+        """Write one event into the next ring slot."""
+        records = self._records
+        i = (self.recorded % self.capacity) * RECORD_SIZE
+        records[i] = time.time_ns() // 1000
+        records[i + 1] = kind
+        records[i + 2] = a
+        records[i + 3] = b
+        records[i + 4] = c
+        records[i + 5] = d
+        records[i + 6] = e
+        records[i + 7] = f
+        # Publish the record only after all of its slots are written
+        self.recorded += 1
+    
+    def piece_spawned(self, piece):
+        """Record that a piece became the current piece."""
+        self._record(SPAWN, piece.shape_type, piece.x, piece.y)
+    
+    def piece_locked(self, piece):
+        """Record where a piece was locked."""
+        self._record(LOCK, piece.shape_type, piece.rotation, piece.x, piece.y)
+    
+    def rows_cleared(self, rows, points, lines, score):
+        """Record a line clear and the totals after it."""
+        self._record(CLEAR, rows, points, lines, score)
+    
+    def level_up(self, level, fall_speed, lines):
+        """Record a new level."""
+        self._record(LEVEL_UP, level, fall_speed, lines)
+    
+    def game_over(self, score, level, lines, quit=False):
+        """Record the end of a game (``quit`` if the player ended it)."""
+        self._record(GAME_OVER, score, level, lines, int(quit))
+    
+    def frame(self, duration_ns):
+        """
+        Count one rendered frame (may be called from the render thread).
+        
+        Args:
+            duration_ns (int): Time spent drawing it
+        """
+        window, frames, total, worst = self._frame_stats
+        if window != self._window:
+            window, worst = self._window, 0
+        self._frame_stats = (window, frames + 1, total + duration_ns,
+                             max(worst, duration_ns))
+    
+    def tick(self, duration_ns):
+        """
+        Count one game update, and record the summary once a second.
+        
+        Args:
+            duration_ns (int): Time spent in the update
+        """
+        self._ticks += 1
+        self._tick_ns += duration_ns
+        if duration_ns > self._tick_max:
+            self._tick_max = duration_ns
+        
+        now = time.perf_counter_ns()
+        if now - self._window_start >= 1_000_000_000:
+            self._window_start = now
+            window, frame_total, frame_ns_total, frame_max = \
+                self._frame_stats
+            if window != self._window:
+                frame_max = 0
+            self._window += 1
+            frames = frame_total - self._frames_seen
+            frame_ns = frame_ns_total - self._frame_ns_seen
+            self._frames_seen = frame_total
+            self._frame_ns_seen = frame_ns_total
+            
+            ticks = self._ticks
+            self._record(
+                TICKS, ticks, self._tick_ns // ticks // 1000,
+                self._tick_max // 1000, frames,
+                frame_ns // frames // 1000 if frames else 0,
+                frame_max // 1000,
+            )
+            self._ticks = self._tick_ns = self._tick_max = 0
+    
+    # Writing (background thread)
+    
+    def _take(self):
+        """
+        Copy the records not yet written out of the ring.
+        
+        Returns:
+            array.array: Whole records, oldest first
+        """
+        end = self.recorded
+        start = self._flushed
+        if end - start > self.capacity:
+            self.dropped += end - start - self.capacity
+            start = end - self.capacity
+        if end == start:
+            return array.array("q")
+        
+        first = (start % self.capacity) * RECORD_SIZE
+        last = (end % self.capacity) * RECORD_SIZE
+        if first < last:
+            batch = self._records[first:last]
+        else:
+            batch = self._records[first:] + self._records[:last]
+        
+        # Records the game overwrote while they were being copied are
+        # garbage; skip them
+        lost = self.recorded - self.capacity - start
+        if lost > 0:
+            self.dropped += lost
+            del batch[:lost * RECORD_SIZE]
+        self._flushed = end
+        return batch
+    
+    def flush(self):
+        """Write everything recorded so far (writer thread or after close)."""
+        batch = self._take()
+        if not batch:
+            return
+        
+        if self.fmt == "bin":
+            if sys.byteorder != "little":
+                batch.byteswap()
+            data = batch.tobytes()
+        else:
+            lines = []
+            for i in range(0, len(batch), RECORD_SIZE):
+                lines.append(json.dumps(_event(batch[i:i + RECORD_SIZE])))
+            data = ("\n".join(lines) + "\n").encode()
+        
+        f = self._current_file()
+        f.write(data)
+        f.flush()
+        self.written += len(batch) // RECORD_SIZE
+    
+    def close(self):
+        """Stop the writer thread and write the remaining events."""
+        if self._thread.is_alive():
+            self._stop.set()
+            self._thread.join()
+        self.flush()
+        if self._file:
+            self._file.close()
+            self._file = None
+    
+    def _write_loop(self):
+        """Writer thread: write a batch every flush interval."""
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+    
+    def _current_file(self):
+        """Open file to append to, rotating it when it is full."""
+        if self._file and self._file.tell() >= self.max_bytes:
+            self._file.close()
+            self._file = None
+        if self._file is None:
+            self._file_index += 1
+            name = f"telemetry_{self.session}_{self._file_index:05d}.{self.fmt}"
+            path = os.path.join(self.directory, name)
+            self._file = open(path, "ab")
+            self._files.append(path)
+            while self.max_files and len(self._files) > self.max_files:
+                os.remove(self._files.pop(0))
+        return self._file
+
+
+def _event(record):
+    """
+    Turn one record into a dict.
+    
+    Args:
+        record (sequence): RECORD_SIZE integers
+    
+    Returns:
+        dict: Event with named fields
+    """
+    kind = record[1]
+    fields = EVENT_FIELDS[kind]
+    event = {"time": record[0] / 1e6, "event": EVENT_NAMES[kind]}
+    event.update(zip(fields, record[2:2 + len(fields)]))
+    if kind == SPAWN or kind == LOCK:
+        event["piece"] = Config.SHAPE_NAMES[event["piece"]]
+    elif kind == CLEAR:
+        event["type"] = CLEAR_TYPES.get(event["rows"], "multi")
+    elif kind == GAME_OVER:
+        event["quit"] = bool(event["quit"])
+    return event
+
+
+def read_events(path):
+    """
+    Read a telemetry file of either format.
+    
+    Args:
+        path (str): ``.jsonl`` or ``.bin`` file
+    
+    Yields:
+        dict: Events, oldest first
+    """
+    if path.endswith(".bin"):
+        records = array.array("q")
+        with open(path, "rb") as f:
+            records.frombytes(f.read())
+        if sys.byteorder != "little":
+            records.byteswap()
+        for i in range(0, len(records), RECORD_SIZE):
+            yield _event(records[i:i + RECORD_SIZE])
+    else:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def main():
+    """Summarize the telemetry files in a directory."""
+    parser = argparse.ArgumentParser(description="Summarize telemetry")
+    parser.add_argument("directory")
+    args = parser.parse_args()
+    
+    paths = sorted(glob.glob(os.path.join(args.directory, "telemetry_*")))
+    counts = dict.fromkeys(EVENT_NAMES, 0)
+    clears = dict.fromkeys(CLEAR_TYPES.values(), 0)
+    tick_mean = frame_mean = tick_max = frame_max = 0
+    for path in paths:
+        for event in read_events(path):
+            counts[event["event"]] += 1
+            if event["event"] == "clear":
+                clears[event["type"]] = clears.get(event["type"], 0) + 1
+            elif event["event"] == "ticks":
+                tick_mean += event["tick_mean_us"]
+                frame_mean += event["frame_mean_us"]
+                tick_max = max(tick_max, event["tick_max_us"])
+                frame_max = max(frame_max, event["frame_max_us"])
+    
+    print(f"{len(paths)} files")
+    for name, count in counts.items():
+        print(f"{name:>10}: {count}")
+    print("clears: " + ", ".join(f"{k} {v}" for k, v in clears.items()))
+    seconds = counts["ticks"]
+    if seconds:
+        print(f"update: mean {tick_mean / seconds:.0f} us, "
+              f"worst {tick_max} us")
+        print(f"frame:  mean {frame_mean / seconds:.0f} us, "
+              f"worst {frame_max} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,730 @@
+"""
+Terminal Module - Play and Watch Tetris in a Text Terminal
+==========================================================
+
+This module draws the game with ANSI escape codes instead of Pygame, so
+it runs over SSH, inside tmux, or on a machine without a display or
+without Pygame installed. It uses the same glyphs as ``Grid.__str__``
+(``█`` for a block, ``·`` for an empty cell), two columns per cell so
+the board keeps its proportions.
+
+Repainting a whole terminal every frame is slow: at 60 FPS a full
+board with colors is over 100 KB per second, and a terminal that
+receives a frame in several pieces shows it half drawn (flicker).
+The renderer therefore works like a double-buffered screen:
+
+- Each frame is composed into a back buffer of characters and colors,
+  one entry per terminal column.
+- It is compared with what the terminal already shows. Only the cells
+  that changed are written, each run preceded by a cursor move
+  (``ESC[row;colH``) and a color change only when the color differs.
+- All of it is joined into one string and sent with a single ``write``
+  and ``flush``, so the terminal gets the frame at once.
+
+A falling piece usually changes a dozen cells per frame, which is a few
+hundred bytes instead of several kilobytes, and frames where nothing
+moved cost nothing.
+
+How to Run:
+----------
+    python -m src.terminal                      # play (arrows, space, p, q)
+    python -m src.terminal --bot                # watch the AutoPlayer
+    python -m src.terminal --watch localhost:8765 3   # watch a server game
+
+Educational Purpose:
+-------------------
+Learn about:
+- ANSI escape codes for cursor movement and colors
+- Diffing a frame against the previous one (double buffering)
+- Batching output into one system call
+- Raw (cbreak) keyboard input without a GUI toolkit
+"""
+
+import argparse
+import json
+import os
+import select
+import shutil
+import socket
+import sys
+import time
+
+from .config import Config
+from .engine import GameEngine
+from .spectator import SpectatorView, FRAME_LENGTH
+from .tetromino import Tetromino
+
+try:
+    import termios
+    import tty
+except ImportError:  # Windows
+    termios = None
+    try:
+        import msvcrt
+    except ImportError:
+        msvcrt = None
+
+# Glyphs of Grid.__str__, doubled for square-looking cells
+BLOCK = "██"
+EMPTY = "· "
+GHOST = "░░"
+
+# Border around the board
+WALL = "│"
+FLOOR = "─"
+
+# Terminal columns between the board and the side panel
+PANEL_GAP = 3
+PANEL_WIDTH = 14
+
+# Write unchanged cells instead of moving the cursor over gaps this
+# short; a cursor move costs 6-8 bytes
+MAX_SKIP_REWRITE = 3
+
+
+def _sgr(code):
+    """Escape sequence that resets attributes and sets ``code``."""
+    return f"\x1b[0;{code}m" if code else "\x1b[0m"
+
+
+DEFAULT = _sgr("")
+DIM = _sgr("90")
+TEXT = _sgr("97")
+TITLE = _sgr("1;97")
+WARNING = _sgr("1;93")
+ERROR = _sgr("1;91")
+
+# One style per Config.PALETTE index: empty cells first, then
+# red, green, blue, yellow, cyan, magenta, orange and gray blocks
+PALETTE_STYLES = [
+    DIM, _sgr("91"), _sgr("92"), _sgr("94"), _sgr("93"), _sgr("96"),
+    _sgr("95"), _sgr("38;5;208"), _sgr("37"),
+]
+
+ENTER = "\x1b[?1049h\x1b[?25l"  # alternate screen, hide cursor
+LEAVE = "\x1b[0m\x1b[?25h\x1b[?1049l"
+CLEAR = "\x1b[0m\x1b[2J"
+
+PLAY_HELP = ("←→  move", "↑   rotate", "↓   soft drop", "spc drop",
+             "p   pause", "q   quit")
+WATCH_HELP = ("q   quit",)
+
+_shape_cache = {}
+
+
+def _shape(shape_type, rotation):
+    """Shape rows of a piece type in a rotation (cached)."""
+    key = (shape_type, rotation)
+    shape = _shape_cache.get(key)
+    if shape is None:
+        piece = Tetromino(shape_type)
+        for _ in range(rotation):
+            piece.rotate_clockwise()
+        shape = _shape_cache[key] = [row[:] for row in piece.shape]
+    return shape
+
+
+def _landing_y(row_masks, shape, x, y):
+    """Row a piece shape lands on when dropped from y."""
+    masks = [sum(1 << i for i, cell in enumerate(row) if cell)
+             for row in shape]
+    rows = len(row_masks)
+    while y + len(masks) < rows:
+        below = y + 1
+        if any(row_masks[below + i] & (mask << x)
+               for i, mask in enumerate(masks) if below + i >= 0):
+            break
+        y = below
+    return y
+
+
+def _read_source(source):
+    """
+    Read what to draw from a GameEngine or a SpectatorView.
+    
+    Returns:
+        tuple: (rows, cols, board rows of palette indices,
+                (shape, x, y, ghost y, color index) or None,
+                (next shape, color index) or None,
+                (score, level, lines), status text)
+    """
+    if hasattr(source, "grid"):
+        grid = source.grid
+        cells, cols = grid.cells, grid.cols
+        board = [cells[y * cols:(y + 1) * cols] for y in range(grid.rows)]
+        piece = source.current_piece
+        color = Config.COLOR_INDEX[piece.color]
+        falling = (piece.shape, piece.x, piece.y, source.get_ghost_y(), color)
+        upcoming = (source.next_piece.shape,
+                    Config.COLOR_INDEX[source.next_piece.color])
+        hud = (source.score, source.level, source.lines_cleared)
+        status = "PAUSED" if source.paused else ""
+        rows, cols = grid.rows, grid.cols
+    else:
+        board = source.board
+        falling = upcoming = None
+        if source.piece:
+            shape_type, color, next_type, next_color, x, y, rotation = (
+                source.piece
+            )
+            shape = _shape(shape_type, rotation)
+            falling = (shape, x, y, _landing_y(source.row_masks, shape, x, y),
+                       color)
+            upcoming = (Config.SHAPES[next_type], next_color)
+        hud = (source.score, source.level, source.lines)
+        status = ""
+        rows, cols = source.rows, source.cols
+    if source.game_over:
+        status = "GAME OVER"
+        falling = None
+    return rows, cols, board, falling, upcoming, hud, status
+
+
+class TerminalRenderer:
+    """
+    Draws a board to an ANSI terminal, sending only what changed.
+    
+    Attributes:
+        out: Binary stream the frames are written to
+        color (bool): Whether to use colors
+        width (int): Frame width in terminal columns
+        height (int): Frame height in terminal rows
+        frames (int): Frames presented
+        bytes_written (int): Bytes sent to ``out``
+    """
+    
+    def __init__(self, out=None, color=True):
+        """
+        Create a renderer.
+        
+        Args:
+            out (optional): Binary stream with write() and flush().
+                            Defaults to standard output.
+            color (bool): Use colors (otherwise glyphs only)
+        """
+        self.out = out if out is not None else sys.stdout.buffer
+        self.color = color
+        self.width = 0
+        self.height = 0
+        self.frames = 0
+        self.bytes_written = 0
+        self._chars = []
+        self._styles = []
+        self._shown_chars = []
+        self._shown_styles = []
+        self._clear = True
+    
+    def open(self):
+        """Switch to the alternate screen and hide the cursor."""
+        self._send(ENTER)
+        self.invalidate()
+    
+    def close(self):
+        """Restore the normal screen and cursor."""
+        self._send(LEAVE)
+    
+    def invalidate(self):
+        """Forget what the terminal shows; the next frame repaints it all."""
+        size = self.width * self.height
+        self._shown_chars = [None] * size
+        self._shown_styles = [None] * size
+        self._clear = True
+    
+    def _resize(self, width, height):
+        """Reallocate the buffers for a new frame size."""
+        self.width = width
+        self.height = height
+        self._chars = [" "] * (width * height)
+        self._styles = [DEFAULT] * (width * height)
+        self.invalidate()
+    
+    def begin(self, width, height):
+        """
+        Start composing a blank frame of the given size.
+        
+        Args:
+            width (int): Frame width in terminal columns
+            height (int): Frame height in terminal rows
+        """
+        if (width, height) != (self.width, self.height):
+            self._resize(width, height)
+        self._chars[:] = [" "] * (width * height)
+        self._styles[:] = [DEFAULT] * (width * height)
+    
+    def put(self, row, col, text, style=DEFAULT):
+        """
+        Write text into the back buffer, clipped to the frame.
+        
+        Args:
+            row (int): Frame row
+            col (int): Frame column of the first character
+            text (str): Characters to write
+            style (str): Escape sequence setting the color
+        """
+        if not 0 <= row < self.height:
+            return
+        if not self.color:
+            style = DEFAULT
+        start = row * self.width
+        for i, char in enumerate(text[:self.width - col], start + col):
+            self._chars[i] = char
+            self._styles[i] = style
+    
+    def draw(self, source, title="", footer=()):
+        """
+        Compose a frame of a game into the back buffer.
+        
+        Args:
+            source: GameEngine or synced SpectatorView to draw
+            title (str): Shown above the side panel
+            footer (tuple): Help lines shown at the bottom of the panel
+        """
+        rows, cols, board, falling, upcoming, hud, status = (
+            _read_source(source)
+        )
+        panel = 2 * cols + 2 + PANEL_GAP
+        self.begin(panel + PANEL_WIDTH, max(rows + 1, 12 + len(footer)))
+        put = self.put
+        
+        # Board, with the ghost and the falling piece drawn over it
+        overlay = {}
+        if falling:
+            shape, x, y, ghost_y, color = falling
+            style = PALETTE_STYLES[color]
+            for piece_y, glyph in ((ghost_y, GHOST), (y, BLOCK)):
+                for i, row in enumerate(shape):
+                    for j, cell in enumerate(row):
+                        if cell:
+                            overlay[(x + j, piece_y + i)] = (glyph, style)
+        for y in range(rows):
+            put(y, 0, WALL, DIM)
+            put(y, 2 * cols + 1, WALL, DIM)
+            row = board[y]
+            for x in range(cols):
+                cell = overlay.get((x, y))
+                if cell is None:
+                    index = row[x]
+                    cell = (BLOCK if index else EMPTY, PALETTE_STYLES[index])
+                put(y, 1 + 2 * x, *cell)
+        put(rows, 0, "└" + FLOOR * (2 * cols) + "┘", DIM)
+        
+        # Side panel
+        put(0, panel, title[:PANEL_WIDTH], TITLE)
+        for line, (label, value) in enumerate(
+                zip(("Score", "Level", "Lines"), hud), 2):
+            put(line, panel, label, DIM)
+            put(line, panel + 6, f"{value:>{PANEL_WIDTH - 6}}", TEXT)
+        put(6, panel, "Next", DIM)
+        if upcoming:
+            shape, color = upcoming
+            for i, row in enumerate(shape):
+                put(7 + i, panel,
+                    "".join(BLOCK if cell else "  " for cell in row),
+                    PALETTE_STYLES[color])
+        if status:
+            put(10, panel, status, ERROR if source.game_over else WARNING)
+        for line, text in enumerate(footer, 12):
+            put(line, panel, text, DIM)
+    
+    def present(self):
+        """
+        Send the cells that changed since the last frame to the terminal.
+        
+        Returns:
+            int: Bytes written (0 if nothing changed)
+        """
+        chars, styles = self._chars, self._styles
+        shown_chars, shown_styles = self._shown_chars, self._shown_styles
+        width = self.width
+        parts = []
+        if self._clear:
+            parts.append(CLEAR)
+            self._clear = False
+        style = None
+        
+        for row in range(self.height):
+            start = row * width
+            end = start + width
+            if (chars[start:end] == shown_chars[start:end]
+                    and styles[start:end] == shown_styles[start:end]):
+                continue
+            
+            cursor = -1  # Index the terminal cursor is at, if in this row
+            for i in range(start, end):
+                if chars[i] == shown_chars[i] and styles[i] == shown_styles[i]:
+                    continue
+                if cursor < 0 or i - cursor > MAX_SKIP_REWRITE:
+                    parts.append(f"\x1b[{row + 1};{i - start + 1}H")
+                    cursor = i
+                # Rewriting a short unchanged gap is cheaper than a move
+                for j in range(cursor, i + 1):
+                    if styles[j] != style:
+                        style = styles[j]
+                        parts.append(style)
+                    parts.append(chars[j])
+                cursor = i + 1
+            shown_chars[start:end] = chars[start:end]
+            shown_styles[start:end] = styles[start:end]
+        
+        self.frames += 1
+        if not parts:
+            return 0
+        return self._send("".join(parts))
+    
+    def render(self, source, title="", footer=()):
+        """
+        Draw and present one frame.
+        
+        Returns:
+            int: Bytes written
+        """
+        self.draw(source, title, footer)
+        return self.present()
+    
+    def _send(self, text):
+        """Write text with one system call."""
+        data = text.encode("utf-8")
+        self.out.write(data)
+        self.out.flush()
+        self.bytes_written += len(data)
+        return len(data)
+
+
+class KeyReader:
+    """
+    Non-blocking keyboard input from the terminal.
+    
+    Use as a context manager: on entry the terminal is switched to
+    cbreak mode (keys arrive immediately, without echo), on exit it is
+    restored. When standard input is not a terminal no keys are read.
+    """
+    
+    # Final byte of the arrow key escape sequences
+    ARROWS = {"A": "up", "B": "down", "C": "right", "D": "left"}
+    # Second byte of the arrow keys on the Windows console
+    WINDOWS_ARROWS = {"H": "up", "P": "down", "M": "right", "K": "left"}
+    
+    def __init__(self, stream=None):
+        """
+        Args:
+            stream (optional): Input stream. Defaults to standard input.
+        """
+        self.stream = stream if stream is not None else sys.stdin
+        self.interactive = self.stream.isatty()
+        self._saved = None
+    
+    def __enter__(self):
+        if self.interactive and termios:
+            fd = self.stream.fileno()
+            self._saved = termios.tcgetattr(fd)
+            tty.setcbreak(fd)
+        return self
+    
+    def __exit__(self, *exc_info):
+        if self._saved is not None:
+            termios.tcsetattr(self.stream.fileno(), termios.TCSADRAIN,
+                              self._saved)
+            self._saved = None
+    
+    def read(self):
+        """
+        Read the keys pressed since the last call, without waiting.
+        
+        Returns:
+            list: Key names: "left", "right", "up", "down", "escape",
+                  or the character typed
+        """
+        if not self.interactive:
+            return []
+        if termios is None:
+            return self._read_windows()
+        
+        fd = self.stream.fileno()
+        data = ""
+        while select.select([fd], [], [], 0)[0]:
+            chunk = os.read(fd, 64)
+            if not chunk:
+                break
+            data += chunk.decode("utf-8", "ignore")
+        
+        keys = []
+        i = 0
+        while i < len(data):
+            if data[i] == "\x1b":
+                if data[i + 1:i + 2] in ("[", "O") and i + 2 < len(data):
+                    keys.append(self.ARROWS.get(data[i + 2], "escape"))
+                    i += 3
+                    continue
+                keys.append("escape")
+            else:
+                keys.append(data[i].lower())
+            i += 1
+        return keys
+    
+    def _read_windows(self):
+        """Read keys from the Windows console."""
+        keys = []
+        while msvcrt and msvcrt.kbhit():
+            char = msvcrt.getwch()
+            if char in ("\x00", "\xe0"):
+                keys.append(self.WINDOWS_ARROWS.get(msvcrt.getwch(), ""))
+            elif char == "\x1b":
+                keys.append("escape")
+            else:
+                keys.append(char.lower())
+        return keys
+
+
+# Keys that act on the game, mapped to the engine call they trigger
+KEY_ACTIONS = {
+    "left": lambda engine: engine.move(-1),
+    "right": lambda engine: engine.move(1),
+    "down": lambda engine: engine.soft_drop(),
+    "up": lambda engine: engine.rotate(),
+    " ": lambda engine: engine.hard_drop(),
+}
+KEY_ACTIONS.update({"a": KEY_ACTIONS["left"], "d": KEY_ACTIONS["right"],
+                    "s": KEY_ACTIONS["down"], "w": KEY_ACTIONS["up"]})
+
+QUIT_KEYS = ("q", "escape")
+
+
+class FrameClock:
+    """
+    Paces a loop to a fixed frame rate and notices terminal resizes.
+    """
+    
+    def __init__(self, renderer, fps=Config.FPS, frames=0):
+        """
+        Args:
+            renderer (TerminalRenderer): Repainted after a resize
+            fps (int): Frames per second
+            frames (int): Stop after this many frames (0 = never)
+        """
+        self.renderer = renderer
+        self.interval = 1 / fps
+        self.frames = frames
+        self.count = 0
+        self._next = time.perf_counter()
+        self._size = shutil.get_terminal_size()
+    
+    def tick(self):
+        """
+        Wait for the next frame.
+        
+        Returns:
+            bool: False once the frame limit is reached
+        """
+        size = shutil.get_terminal_size()
+        if size != self._size:
+            self._size = size
+            self.renderer.invalidate()
+        
+        self._next += self.interval
+        delay = self._next - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # Running late: do not try to catch up with a burst
+            self._next = time.perf_counter()
+        self.count += 1
+        return self.count != self.frames
+
+
+def play(renderer, keys, clock, seed=None, rows=None, cols=None):
+    """
+    Play a game in the terminal.
+    
+    Args:
+        renderer (TerminalRenderer): Output
+        keys (KeyReader): Input
+        clock (FrameClock): Frame pacing
+        seed (int, optional): Seed for the piece sequence
+        rows (int, optional): Board height
+        cols (int, optional): Board width
+    
+    Returns:
+        GameEngine: The game, as it was when the player quit
+    """
+    engine = GameEngine(rows, cols, seed)
+    last = time.perf_counter()
+    while True:
+        for key in keys.read():
+            if key in QUIT_KEYS:
+                return engine
+            if engine.game_over:
+                if key == "r":
+                    engine.reset_game()
+            elif key == "p":
+                engine.paused = not engine.paused
+            elif key in KEY_ACTIONS and not engine.paused:
+                KEY_ACTIONS[key](engine)
+        
+        # Gravity in whole milliseconds; the remainder carries over
+        now = time.perf_counter()
+        elapsed = int((now - last) * 1000)
+        last += elapsed / 1000
+        if not engine.game_over:
+            engine.update(elapsed)
+        
+        footer = ("r   restart",) + WATCH_HELP if engine.game_over else PLAY_HELP
+        renderer.render(engine, "TETRIS", footer)
+        if not clock.tick():
+            return engine
+
+
+def watch_bot(renderer, keys, clock, seed=None, interval=10):
+    """
+    Watch the AutoPlayer play a headless game.
+    
+    Args:
+        renderer (TerminalRenderer): Output
+        keys (KeyReader): Input (only quit is used)
+        clock (FrameClock): Frame pacing
+        seed (int, optional): Seed of the first game
+        interval (int): Frames between two pieces
+    
+    Returns:
+        GameEngine: The game being watched when the viewer quit
+    """
+    from .autoplayer import AutoPlayer
+    
+    player = AutoPlayer()
+    engine = GameEngine(seed=seed)
+    frame = waited = 0
+    while not any(key in QUIT_KEYS for key in keys.read()):
+        frame += 1
+        if engine.game_over:
+            # Show the final board for two seconds, then start over
+            waited += 1
+            if waited >= 2 * Config.FPS:
+                engine.reset_game()
+                waited = 0
+        elif frame % interval == 0:
+            engine.place(*player.choose(engine))
+        renderer.render(engine, "AUTOPLAYER", WATCH_HELP)
+        if not clock.tick():
+            break
+    return engine
+
+
+def watch_server(renderer, keys, clock, address, session):
+    """
+    Watch a game on a server (see src.server) through its spectator feed.
+    
+    Args:
+        renderer (TerminalRenderer): Output
+        keys (KeyReader): Input (only quit is used)
+        clock (FrameClock): Frame pacing
+        address (tuple): (host, port) of the server
+        session (int): Session id to watch
+    
+    Returns:
+        SpectatorView: The reconstructed game
+    
+    Raises:
+        ConnectionError: If the server refuses to stream the session
+    """
+    view = SpectatorView()
+    with socket.create_connection(address, timeout=5) as sock:
+        sock.sendall(f"watch {session}\n".encode())
+        
+        # Two JSON lines: our own session id, then the watch reply
+        buffer = bytearray()
+        replies = 0
+        while replies < 2:
+            if b"\n" not in buffer:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    raise ConnectionError("Server closed the connection")
+                buffer += chunk
+                continue
+            line, _, rest = buffer.partition(b"\n")
+            buffer = bytearray(rest)
+            reply = json.loads(line)
+            if "error" in reply:
+                raise ConnectionError(reply["error"])
+            replies += 1
+        
+        # Then length-prefixed delta frames
+        sock.setblocking(False)
+        title = f"WATCHING #{session}"
+        shown = None
+        connected = True
+        while connected and not any(key in QUIT_KEYS for key in keys.read()):
+            try:
+                while True:
+                    chunk = sock.recv(65536)
+                    if not chunk:
+                        connected = False
+                        break
+                    buffer += chunk
+            except BlockingIOError:
+                pass
+            
+            offset = 0
+            while len(buffer) - offset >= FRAME_LENGTH.size:
+                (length,) = FRAME_LENGTH.unpack_from(buffer, offset)
+                end = offset + FRAME_LENGTH.size + length
+                if len(buffer) < end:
+                    break
+                view.apply(bytes(buffer[offset + FRAME_LENGTH.size:end]))
+                offset = end
+            del buffer[:offset]
+            
+            # The game only changes on the server's ticks
+            if view.synced and view.version != shown:
+                shown = view.version
+                renderer.render(view, title, WATCH_HELP)
+            if not clock.tick():
+                break
+    return view
+
+
+def main():
+    """Run the terminal client."""
+    parser = argparse.ArgumentParser(description="Tetris in the terminal")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--bot", action="store_true",
+                      help="Watch the AutoPlayer instead of playing")
+    mode.add_argument("--watch", nargs=2, metavar=("HOST:PORT", "SESSION"),
+                      help="Watch a game on a server")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--interval", type=int, default=10,
+                        help="Frames between two bot pieces")
+    parser.add_argument("--fps", type=int, default=Config.FPS)
+    parser.add_argument("--frames", type=int, default=0,
+                        help="Stop after this many frames (0 = run until q)")
+    parser.add_argument("--no-color", action="store_true")
+    args = parser.parse_args()
+    
+    renderer = TerminalRenderer(color=not args.no_color)
+    clock = FrameClock(renderer, args.fps, args.frames)
+    error = None
+    renderer.open()
+    try:
+        with KeyReader() as keys:
+            if args.bot:
+                game = watch_bot(renderer, keys, clock, args.seed,
+                                 args.interval)
+            elif args.watch:
+                host, _, port = args.watch[0].rpartition(":")
+                game = watch_server(renderer, keys, clock,
+                                    (host or "localhost", int(port)),
+                                    int(args.watch[1]))
+            else:
+                game = play(renderer, keys, clock, args.seed)
+    except OSError as exc:  # Includes ConnectionError from watch_server
+        error = exc
+    finally:
+        renderer.close()
+    if error is not None:
+        parser.exit(1, f"{error}\n")
+    
+    frames = max(renderer.frames, 1)
+    print(f"Score: {game.score}  ({renderer.frames} frames, "
+          f"{renderer.bytes_written / frames:.0f} bytes per frame)")
+
+
+if __name__ == "__main__":
+    main()
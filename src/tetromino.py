@@ -28,28 +28,40 @@ class Tetromino:
         x (int): Horizontal position on grid
         y (int): Vertical position on grid
         shape_type (int): Index of shape in Config.SHAPES
+        rotation (int): Number of clockwise quarter turns from spawn (0-3)
     """
     
-    def __init__(self, shape_type=None):
+    def __init__(self, shape_type=None, columns=None, rng=None):
         """
         Initialize a new Tetromino.
         
         Args:
             shape_type (int, optional): Specific shape index. 
                                        Random if None.
-        """
+            columns (int, optional): Width of the board the piece spawns
+                                     on. Defaults to Config.COLUMNS.
+            rng (random.Random, optional): Random generator for shape and
+                                           color. Defaults to the global
+                                           ``random`` module.
+        """
+        if rng is None:
+            rng = random
+        
         if shape_type is None:
-            self.shape_type = random.randint(0, len(Config.SHAPES) - 1)
+            self.shape_type = rng.randint(0, len(Config.SHAPES) - 1)
         else:
             self.shape_type = shape_type
             
         # Deep copy the shape to avoid modifying the original
         self.shape = [row[:] for row in Config.SHAPES[self.shape_type]]
-        self.color = random.choice(Config.COLORS)
+        self.color = rng.choice(Config.COLORS)
         
         # Center the tetromino at the top of the grid
-        self.x = Config.COLUMNS // 2 - len(self.shape[0]) // 2
+        if columns is None:
+            columns = Config.COLUMNS
+        self.x = columns // 2 - len(self.shape[0]) // 2
         self.y = 0
+        self.rotation = 0
     
     def rotate_clockwise(self):
         """
@@ -66,6 +78,7 @@ class Tetromino:
         transposed = list(zip(*self.shape[::-1]))
         # Convert tuples back to lists
         self.shape = [list(row) for row in transposed]
+        self.rotation = (self.rotation + 1) % 4
     
     def rotate_counterclockwise(self):
         """
@@ -78,6 +91,7 @@ class Tetromino:
         # Then transpose
         transposed = list(zip(*reversed_rows[::-1]))
         self.shape = [list(row) for row in transposed]
+        self.rotation = (self.rotation - 1) % 4
     
     def get_blocks(self):
         """
@@ -98,6 +112,21 @@ class Tetromino:
                     ))
         return blocks
     
+    def get_row_masks(self):
+        """
+        Get each shape row as an integer bitmask.
+        
+        Returns:
+            list: One int per shape row, bit ``c`` set when column ``c``
+                  of that row is filled (relative to the piece)
+        
+        Used by Grid for fast bitwise collision checks.
+        """
+        return [
+            sum(1 << col_idx for col_idx, cell in enumerate(row) if cell)
+            for row in self.shape
+        ]
+    
     def get_width(self):
         """
         Get the width of the tetromino shape.
@@ -128,6 +157,7 @@ class Tetromino:
         new_tetromino.color = self.color
         new_tetromino.x = self.x
         new_tetromino.y = self.y
+        new_tetromino.rotation = self.rotation
         return new_tetromino
     
     def __str__(self):
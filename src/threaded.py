@@ -0,0 +1,228 @@
+"""
+Threaded Module - Simulation and Rendering on Separate Threads
+==============================================================
+
+In ``TetrisGame.run_playing`` input, gravity and drawing share one
+loop: when presenting a frame is slow (a remote or VNC-backed display),
+gravity and input handling are delayed with it.
+
+This module splits the loop in two:
+
+- SimulationThread applies key presses and gravity at a fixed rate on
+  its own thread, and after every tick publishes a FrameSnapshot
+- The pygame main thread collects events, hands key presses to the
+  simulation and draws the newest snapshot
+
+Snapshots are immutable and compact (the board is one ``bytes`` object
+of palette indices), so the renderer can read one while the simulation
+is already building the next. SnapshotBuffer holds two of them - the
+front one being shown and the back one being written - and swaps them
+on publish (double buffering).
+
+pygame releases the GIL while it blits and flips, so the simulation
+keeps ticking on time even while a slow frame is being presented.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Threads and the GIL
+- Immutable data for sharing state between threads
+- Double buffering
+- Fixed timestep simulation
+"""
+
+import collections
+import threading
+import time
+
+from .config import Config
+
+PieceView = collections.namedtuple("PieceView", "shape color x y")
+PieceView.__doc__ = """Immutable copy of a tetromino's drawable state."""
+
+
+class FrameSnapshot(collections.namedtuple("FrameSnapshot", [
+    "sequence", "cols", "rows", "cells", "current_piece", "ghost_y",
+    "next_piece", "score", "level", "lines_cleared", "high_score",
+    "player_name", "paused", "game_over",
+])):
+    """
+    Everything needed to draw one frame, frozen at one tick.
+    
+    Field names match the TetrisGame attributes they come from, so a
+    snapshot can be drawn by the same code as the live game.
+    """
+    
+    __slots__ = ()
+    
+    def filled_cells(self):
+        """
+        List the filled board cells.
+        
+        Returns:
+            list: ((x, y), color) pairs, like Grid.get_filled_cells
+        """
+        cols = self.cols
+        palette = Config.PALETTE
+        return [
+            ((index % cols, index // cols), palette[value])
+            for index, value in enumerate(self.cells) if value
+        ]
+
+
+def _piece_view(piece):
+    """Freeze a tetromino."""
+    return PieceView(tuple(map(tuple, piece.shape)), piece.color,
+                     piece.x, piece.y)
+
+
+def take_snapshot(game, sequence=0):
+    """
+    Capture the drawable state of a game.
+    
+    Args:
+        game (TetrisGame): Game to capture
+        sequence (int): Tick number stored in the snapshot
+    
+    Returns:
+        FrameSnapshot: The frozen state
+    """
+    grid = game.grid
+    return FrameSnapshot(
+        sequence, grid.cols, grid.rows, bytes(grid.cells),
+        _piece_view(game.current_piece), game.get_ghost_y(),
+        _piece_view(game.next_piece), game.score, game.level,
+        game.lines_cleared, game.high_score, game.player_name,
+        game.paused, game.game_over,
+    )
+
+
+class SnapshotBuffer:
+    """
+    Double buffer of snapshots shared by two threads.
+    
+    Attributes:
+        published (int): Number of snapshots published so far
+    """
+    
+    def __init__(self):
+        """Create an empty buffer."""
+        self._slots = [None, None]
+        self._front = 0
+        self._lock = threading.Lock()
+        self.published = 0
+    
+    def publish(self, snapshot):
+        """
+        Make a new snapshot the front buffer.
+        
+        Args:
+            snapshot (FrameSnapshot): Newest state
+        """
+        back = 1 - self._front
+        self._slots[back] = snapshot
+        with self._lock:
+            self._front = back
+            self.published += 1
+    
+    def latest(self):
+        """
+        Get the newest snapshot.
+        
+        Returns:
+            FrameSnapshot: Newest state, or None before the first tick
+        """
+        with self._lock:
+            return self._slots[self._front]
+
+
+class SimulationThread:
+    """
+    Runs input handling and gravity at a fixed rate.
+    
+    The thread owns the game state while it runs: other threads only
+    send key presses and read snapshots.
+    
+    Attributes:
+        game (TetrisGame): Game being simulated
+        buffer (SnapshotBuffer): Where snapshots are published
+        tick_rate (int): Ticks per second
+        ticks (int): Ticks run so far
+    """
+    
+    def __init__(self, game, buffer=None, tick_rate=Config.FPS):
+        """
+        Prepare (but do not start) the simulation.
+        
+        Args:
+            game (TetrisGame): Game to simulate
+            buffer (SnapshotBuffer, optional): Where to publish snapshots
+            tick_rate (int): Ticks per second
+        """
+        self.game = game
+        self.buffer = buffer or SnapshotBuffer()
+        self.tick_rate = tick_rate
+        self.ticks = 0
+        self._keys = collections.deque()
+        self._running = threading.Event()
+        self._thread = None
+    
+    def send_key(self, key):
+        """
+        Queue a key press for the next tick (safe from any thread).
+        
+        Args:
+            key (int): Pygame key code
+        """
+        self._keys.append(key)
+    
+    def start(self):
+        """Publish the current state and start ticking."""
+        self.buffer.publish(take_snapshot(self.game, self.ticks))
+        self._running.set()
+        self._thread = threading.Thread(
+            target=self._run, name="simulation", daemon=True
+        )
+        self._thread.start()
+    
+    def stop(self):
+        """Stop ticking and wait for the thread to finish."""
+        self._running.clear()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+    
+    def tick(self, elapsed):
+        """
+        Advance the game by one tick and publish a snapshot.
+        
+        Args:
+            elapsed (float): Milliseconds of game time per tick
+        """
+        game = self.game
+        while self._keys:
+            if game.handle_key(self._keys.popleft()):
+                # Same as handle_input: ignore the rest of this frame
+                self._keys.clear()
+                break
+        if game.state == Config.STATE_PLAYING:
+            game.update(elapsed)
+        self.ticks += 1
+        self.buffer.publish(take_snapshot(game, self.ticks))
+    
+    def _run(self):
+        """Thread body: tick at a fixed rate until stopped."""
+        interval = 1 / self.tick_rate
+        elapsed = 1000 / self.tick_rate
+        next_tick = time.perf_counter()
+        while self._running.is_set():
+            self.tick(elapsed)
+            if self.game.state != Config.STATE_PLAYING:
+                break
+            
+            next_tick += interval
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind: carry on from now instead of bursting
+                next_tick = time.perf_counter()
@@ -0,0 +1,276 @@
+"""
+Tournament Module - Round-Robin Versus Matches with Elo Ratings
+===============================================================
+
+Comparing computer players by their solo score says little about how
+they do against each other: a player that builds tall stacks for
+Tetrises scores well alone but dies quickly to garbage. This module
+plays every pair of players against each other in versus mode (see
+src/versus.py) and rates them with the Elo system.
+
+Scheduling:
+
+- Every round uses a new seed. In a round every pair plays twice, once
+  from each side, on that seed: both players see the same pieces, and
+  each side of the board is played by both (mirrored matches).
+- All matches are independent, so they run on a process pool; a
+  tournament takes about as long as its matches divided by the number
+  of CPU cores.
+- Ratings are updated in schedule order (round by round) after all
+  results are in, so the ratings do not depend on which worker
+  finished first, and a run is reproducible.
+
+A player that scores 1 (win) against an opponent rated 400 points
+higher was expected to score about 0.09; Elo moves both ratings by
+``k_factor`` times the difference between result and expectation.
+
+How to Run:
+----------
+    python -m src.tournament --rounds 8
+    python -m src.tournament --player tuned=tuner.json --max-pieces 300
+
+Educational Purpose:
+-------------------
+Learn about:
+- Round-robin scheduling
+- The Elo rating system
+- Process pools for CPU-bound parallel work
+"""
+
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .autoplayer import DEFAULT_WEIGHTS
+from .versus import play_match
+
+# A few hand-made players with different styles, to rate against
+# each other when no other players are given
+BUILTIN_PLAYERS = {
+    "default": DEFAULT_WEIGHTS,
+    "cleaner": (-0.4, 1.2, -0.35, -0.18),    # takes any line it can
+    "stacker": (-0.25, 0.3, -0.5, -0.25),    # keeps a clean, tall stack
+    "careless": (-0.5, 0.76, -0.05, -0.05),  # barely minds holes
+}
+
+INITIAL_RATING = 1500
+
+
+def expected_score(rating, opponent):
+    """
+    Expected result of a player against an opponent under Elo.
+    
+    Args:
+        rating (float): Player's rating
+        opponent (float): Opponent's rating
+    
+    Returns:
+        float: Between 0 (certain loss) and 1 (certain win)
+    """
+    return 1 / (1 + 10 ** ((opponent - rating) / 400))
+
+
+def _play(task):
+    """Worker entry point: play one match and return its result."""
+    weights_a, weights_b, seed, rows, cols, max_pieces = task
+    return play_match((weights_a, weights_b), seed, rows, cols, max_pieces)
+
+
+class Tournament:
+    """
+    Round-robin versus tournament between AutoPlayer weight sets.
+    
+    Attributes:
+        players (dict): Player name -> weights
+        ratings (dict): Player name -> Elo rating
+        records (dict): Player name -> [wins, draws, losses]
+        matches (list): (name, opponent, seed, result) per match played
+    """
+    
+    def __init__(self, players, rounds=4, max_pieces=500, rows=None,
+                 cols=None, workers=None, seed=0, k_factor=16):
+        """
+        Set up a tournament.
+        
+        Args:
+            players (dict): Player name -> feature weights
+            rounds (int): Seeds every pair plays on (twice per seed)
+            max_pieces (int): Turns after which a match is decided on
+                              garbage sent
+            rows (int, optional): Board height
+            cols (int, optional): Board width
+            workers (int, optional): Processes. Defaults to the CPU count.
+            seed (int): First match seed
+            k_factor (float): Largest rating change per match
+        
+        Raises:
+            ValueError: If there are fewer than two players
+        """
+        if len(players) < 2:
+            raise ValueError("A tournament needs at least two players")
+        self.players = dict(players)
+        self.rounds = rounds
+        self.max_pieces = max_pieces
+        self.rows = rows
+        self.cols = cols
+        self.workers = workers or os.cpu_count()
+        self.seed = seed
+        self.k_factor = k_factor
+        
+        self.ratings = {name: INITIAL_RATING for name in self.players}
+        self.records = {name: [0, 0, 0] for name in self.players}
+        self.matches = []
+    
+    def schedule(self):
+        """
+        List every match of the tournament, round by round.
+        
+        Returns:
+            list: (player 0 name, player 1 name, seed) tuples
+        """
+        pairs = list(itertools.combinations(self.players, 2))
+        return [
+            (first, second, self.seed + round_number)
+            for round_number in range(self.rounds)
+            for a, b in pairs
+            for first, second in ((a, b), (b, a))
+        ]
+    
+    def record(self, name, opponent, seed, result):
+        """
+        Count one result and update both ratings.
+        
+        Args:
+            name (str): Player 0
+            opponent (str): Player 1
+            seed (int): Seed the match was played on
+            result (float): Result for player 0 (1, 0.5 or 0)
+        """
+        expected = expected_score(self.ratings[name], self.ratings[opponent])
+        change = self.k_factor * (result - expected)
+        self.ratings[name] += change
+        self.ratings[opponent] -= change
+        
+        outcome = {1.0: 0, 0.5: 1, 0.0: 2}[result]
+        self.records[name][outcome] += 1
+        self.records[opponent][2 - outcome] += 1
+        self.matches.append((name, opponent, seed, result))
+    
+    def run(self, pool=None):
+        """
+        Play every scheduled match and rate the players.
+        
+        Args:
+            pool (Executor, optional): Pool to run matches on. A process
+                                       pool with ``workers`` processes
+                                       is created if not given.
+        
+        Returns:
+            dict: Summary with the match count, elapsed seconds,
+                  matches and pieces per second
+        """
+        schedule = self.schedule()
+        tasks = [
+            (self.players[a], self.players[b], seed, self.rows, self.cols,
+             self.max_pieces)
+            for a, b, seed in schedule
+        ]
+        chunksize = max(1, len(tasks) // (self.workers * 4))
+        
+        start = time.perf_counter()
+        if pool is None:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = list(pool.map(_play, tasks, chunksize=chunksize))
+        else:
+            results = list(pool.map(_play, tasks, chunksize=chunksize))
+        elapsed = time.perf_counter() - start
+        
+        for (a, b, seed), (result, _) in zip(schedule, results):
+            self.record(a, b, seed, result)
+        pieces = sum(pieces for _, pieces in results)
+        return {
+            "matches": len(results),
+            "seconds": elapsed,
+            "matches_per_second": len(results) / elapsed,
+            "pieces_per_second": pieces / elapsed,
+        }
+    
+    def standings(self):
+        """
+        Players sorted by rating, best first.
+        
+        Returns:
+            list: (name, rating, wins, draws, losses) tuples
+        """
+        return sorted(
+            ((name, rating, *self.records[name])
+             for name, rating in self.ratings.items()),
+            key=lambda row: -row[1]
+        )
+
+
+def load_player(text):
+    """
+    Parse a ``NAME=FILE`` player argument.
+    
+    The file holds either a JSON list of weights or a tuner checkpoint
+    (its ``best_weights`` are used).
+    
+    Args:
+        text (str): Command line argument
+    
+    Returns:
+        tuple: (name, weights)
+    """
+    name, _, path = text.partition("=")
+    if not path:
+        raise argparse.ArgumentTypeError(f"expected NAME=FILE, got {text}")
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data["best_weights"]
+    return name, tuple(data)
+
+
+def main():
+    """Command line entry point: ``python -m src.tournament``."""
+    parser = argparse.ArgumentParser(description="Versus bot tournament")
+    parser.add_argument("--player", type=load_player, action="append",
+                        default=[], metavar="NAME=FILE",
+                        help="Weights to enter (JSON list or tuner "
+                             "checkpoint). Two or more replace the "
+                             "built-in players; one joins them.")
+    parser.add_argument("--rounds", type=int, default=4,
+                        help="Seeds every pair plays on")
+    parser.add_argument("--max-pieces", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=None)
+    parser.add_argument("--cols", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--k-factor", type=float, default=16)
+    args = parser.parse_args()
+    
+    players = dict(args.player) if args.player else BUILTIN_PLAYERS
+    if len(players) == 1:
+        players = {**BUILTIN_PLAYERS, **players}
+    tournament = Tournament(
+        players, rounds=args.rounds, max_pieces=args.max_pieces,
+        rows=args.rows, cols=args.cols, workers=args.workers, seed=args.seed,
+        k_factor=args.k_factor
+    )
+    summary = tournament.run()
+    
+    print(f"{'player':12s} {'elo':>6s} {'won':>5s} {'drawn':>5s} {'lost':>5s}")
+    for name, rating, wins, draws, losses in tournament.standings():
+        print(f"{name:12s} {rating:6.0f} {wins:5d} {draws:5d} {losses:5d}")
+    print(f"{summary['matches']} matches in {summary['seconds']:.1f} s: "
+          f"{summary['matches_per_second']:.1f} matches/s, "
+          f"{summary['pieces_per_second']:.0f} pieces/s on "
+          f"{tournament.workers} processes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+"""
+Tuner Module - Parallel Weight Search for the AutoPlayer
+========================================================
+
+This module tunes the AutoPlayer's evaluation weights with the
+cross-entropy method:
+
+1. Sample a population of weight vectors from a normal distribution
+2. Let every candidate play the same batch of games
+3. Keep the best candidates (the elite)
+4. Move the distribution's mean and spread to the elite, and repeat
+
+Games are spread over a process pool, so a generation takes about as
+long as its slowest worker batch instead of the sum of all games.
+
+All candidates of a generation play the same seeds (common random
+numbers): they see identical piece sequences, so a difference in score
+comes from the weights and not from luck. Seeds and samples are derived
+from the tuner seed and the generation number, so a run is reproducible.
+
+After every generation the state is written to a JSON checkpoint.
+Starting again with the same checkpoint file continues where the last
+run stopped. The checkpoint also records the settings that decide what
+a generation measures (seed, population, elite size, games, piece
+limit, board size); resuming with different ones is refused instead of
+mixing two experiments in one run.
+
+How to Run:
+----------
+    python -m src.tuner --generations 50 --checkpoint tuner.json
+
+Educational Purpose:
+-------------------
+Learn about:
+- The cross-entropy method for black-box optimization
+- Process pools for CPU-bound parallel work
+- Variance reduction with common random numbers
+- Checkpointing long-running jobs
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .autoplayer import DEFAULT_WEIGHTS, FEATURES, play_game
+
+
+def _play(task):
+    """Worker entry point: play one game and return its result."""
+    weights, seed, rows, cols, max_pieces = task
+    return play_game(weights, seed, rows, cols, max_pieces)
+
+
+def _mean(values):
+    """Arithmetic mean as a float (statistics.fmean needs Python 3.8)."""
+    values = list(values)
+    return sum(values) / len(values)
+
+
+class CrossEntropyTuner:
+    """
+    Cross-entropy method over AutoPlayer weights.
+    
+    Attributes:
+        mean (list): Current mean weight vector
+        std (list): Current standard deviation per weight
+        generation (int): Generations completed so far
+        best_weights (list): Best candidate seen so far
+        best_fitness (float): Its mean score
+        history (list): One summary dict per generation
+    """
+    
+    def __init__(self, population=32, elite_fraction=0.25, games=8,
+                 max_pieces=500, rows=None, cols=None, workers=None,
+                 seed=0, initial_std=0.5, extra_noise=0.05,
+                 checkpoint=None):
+        """
+        Set up a tuner, resuming from the checkpoint if it exists.
+        
+        Args:
+            population (int): Candidates per generation
+            elite_fraction (float): Share of candidates kept as elite
+            games (int): Games each candidate plays per generation
+            max_pieces (int): Pieces after which a game is cut off
+            rows (int, optional): Board height
+            cols (int, optional): Board width
+            workers (int, optional): Processes. Defaults to the CPU count.
+            seed (int): Seed for sampling and for the game seeds
+            initial_std (float): Starting spread of every weight
+            extra_noise (float): Added to the spread each generation so
+                                 the search does not collapse too early
+            checkpoint (str, optional): JSON file to save/resume state
+        
+        Raises:
+            ValueError: If the checkpoint was made with other settings
+        """
+        self.population = population
+        self.elite_count = max(1, round(population * elite_fraction))
+        self.games = games
+        self.max_pieces = max_pieces
+        self.rows = rows
+        self.cols = cols
+        self.workers = workers or os.cpu_count()
+        self.seed = seed
+        self.extra_noise = extra_noise
+        self.checkpoint = checkpoint
+        
+        self.mean = list(DEFAULT_WEIGHTS)
+        self.std = [initial_std] * len(FEATURES)
+        self.generation = 0
+        self.best_weights = list(DEFAULT_WEIGHTS)
+        self.best_fitness = -math.inf
+        self.history = []
+        
+        if checkpoint and os.path.exists(checkpoint):
+            self.load(checkpoint)
+    
+    def settings(self):
+        """
+        Get the settings a checkpoint can only be resumed with.
+        
+        Returns:
+            dict: Seed, population, elite count, games per candidate,
+                  piece limit and board size
+        """
+        return {
+            "seed": self.seed,
+            "population": self.population,
+            "elite_count": self.elite_count,
+            "games": self.games,
+            "max_pieces": self.max_pieces,
+            "rows": self.rows,
+            "cols": self.cols,
+        }
+    
+    def sample(self):
+        """
+        Draw this generation's candidates.
+        
+        Returns:
+            list: ``population`` weight vectors
+        """
+        rng = random.Random(f"{self.seed}:{self.generation}")
+        return [
+            [rng.gauss(mean, std) for mean, std in zip(self.mean, self.std)]
+            for _ in range(self.population)
+        ]
+    
+    def game_seeds(self):
+        """
+        Seeds every candidate of this generation plays.
+        
+        Returns:
+            list: ``games`` integers, shared by all candidates
+        """
+        first = (self.seed * 1000003 + self.generation) * self.games
+        return list(range(first, first + self.games))
+    
+    def evaluate(self, candidates, pool):
+        """
+        Play every candidate on the generation's seeds.
+        
+        Args:
+            candidates (list): Weight vectors
+            pool (Executor): Pool to run games on
+        
+        Returns:
+            tuple: (fitness per candidate, total pieces placed)
+        """
+        seeds = self.game_seeds()
+        tasks = [
+            (weights, seed, self.rows, self.cols, self.max_pieces)
+            for weights in candidates for seed in seeds
+        ]
+        chunksize = max(1, len(tasks) // (self.workers * 4))
+        results = list(pool.map(_play, tasks, chunksize=chunksize))
+        
+        fitness = [
+            _mean(score for score, _, _ in
+                  results[i * self.games:(i + 1) * self.games])
+            for i in range(len(candidates))
+        ]
+        return fitness, sum(pieces for _, _, pieces in results)
+    
+    def step(self, pool):
+        """
+        Run one generation and update the distribution.
+        
+        Args:
+            pool (Executor): Pool to run games on
+        
+        Returns:
+            dict: Summary of the generation
+        """
+        candidates = self.sample()
+        start = time.perf_counter()
+        fitness, pieces = self.evaluate(candidates, pool)
+        elapsed = time.perf_counter() - start
+        
+        ranked = sorted(zip(fitness, candidates), key=lambda item: -item[0])
+        elite = [weights for _, weights in ranked[:self.elite_count]]
+        if ranked[0][0] > self.best_fitness:
+            self.best_fitness, self.best_weights = ranked[0]
+        
+        columns = list(zip(*elite))
+        self.mean = [_mean(column) for column in columns]
+        self.std = [
+            (statistics.pstdev(column) if len(column) > 1 else 0.0)
+            + self.extra_noise
+            for column in columns
+        ]
+        
+        games = len(candidates) * self.games
+        summary = {
+            "generation": self.generation,
+            "best": ranked[0][0],
+            "elite_mean": _mean(f for f, _ in ranked[:self.elite_count]),
+            "mean": _mean(fitness),
+            "games": games,
+            "seconds": elapsed,
+            "games_per_second": games / elapsed,
+            "pieces_per_second": pieces / elapsed,
+        }
+        self.history.append(summary)
+        self.generation += 1
+        if self.checkpoint:
+            self.save(self.checkpoint)
+        return summary
+    
+    def run(self, generations, report=print):
+        """
+        Tune until ``generations`` generations have been completed.
+        
+        Generations already in the checkpoint count towards the total.
+        
+        Args:
+            generations (int): Target number of generations
+            report (callable): Called with a line of text per generation
+        
+        Returns:
+            list: Best weights found
+        """
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            while self.generation < generations:
+                s = self.step(pool)
+                report(
+                    f"gen {s['generation']:3d}  best {s['best']:10.1f}  "
+                    f"elite {s['elite_mean']:10.1f}  mean {s['mean']:10.1f}  "
+                    f"{s['games_per_second']:6.1f} games/s  "
+                    f"{s['pieces_per_second']:8.0f} pieces/s"
+                )
+        return self.best_weights
+    
+    def save(self, path):
+        """
+        Write the tuner state to a JSON checkpoint.
+        
+        The file is replaced atomically, so an interrupted run never
+        leaves a half-written checkpoint behind.
+        
+        Args:
+            path (str): Checkpoint file
+        """
+        state = {
+            "features": list(FEATURES),
+            "settings": self.settings(),
+            "generation": self.generation,
+            "mean": self.mean,
+            "std": self.std,
+            "best_weights": self.best_weights,
+            "best_fitness": self.best_fitness,
+            "history": self.history,
+        }
+        temp_path = path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(state, f, indent=2)
+        os.replace(temp_path, path)
+    
+    def load(self, path):
+        """
+        Restore the tuner state from a checkpoint.
+        
+        Args:
+            path (str): Checkpoint file
+        
+        Raises:
+            ValueError: If the checkpoint was made for other features or
+                        with other settings
+        """
+        with open(path) as f:
+            state = json.load(f)
+        if state["features"] != list(FEATURES):
+            raise ValueError(f"Checkpoint {path} uses different features")
+        if "settings" not in state:
+            raise ValueError(f"Checkpoint {path} does not record its "
+                             f"settings, so it cannot be resumed safely")
+        settings = self.settings()
+        saved = state["settings"]
+        different = [
+            f"{name} {saved.get(name)} (now {value})"
+            for name, value in settings.items() if saved.get(name) != value
+        ]
+        if different:
+            raise ValueError(f"Checkpoint {path} was made with "
+                             f"{', '.join(different)}; resume with the "
+                             f"same settings or use another checkpoint")
+        self.generation = state["generation"]
+        self.mean = state["mean"]
+        self.std = state["std"]
+        self.best_weights = state["best_weights"]
+        self.best_fitness = state["best_fitness"]
+        self.history = state["history"]
+
+
+def main():
+    """Command line entry point: ``python -m src.tuner``."""
+    parser = argparse.ArgumentParser(description="Tune AutoPlayer weights")
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--population", type=int, default=32)
+    parser.add_argument("--elite", type=float, default=0.25,
+                        help="Elite fraction")
+    parser.add_argument("--games", type=int, default=8,
+                        help="Games per candidate per generation")
+    parser.add_argument("--max-pieces", type=int, default=500)
+    parser.add_argument("--rows", type=int, default=None)
+    parser.add_argument("--cols", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--checkpoint", default=None,
+                        help="JSON file to save progress to and resume from")
+    args = parser.parse_args()
+    
+    try:
+        tuner = CrossEntropyTuner(
+            population=args.population, elite_fraction=args.elite,
+            games=args.games, max_pieces=args.max_pieces, rows=args.rows,
+            cols=args.cols, workers=args.workers, seed=args.seed,
+            checkpoint=args.checkpoint
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    if tuner.generation:
+        print(f"Resuming at generation {tuner.generation}")
+    best = tuner.run(args.generations)
+    print(f"Best mean score {tuner.best_fitness:.1f} with weights:")
+    for name, weight in zip(FEATURES, best):
+        print(f"  {name:17s} {weight:+.6f}")
+
+
+if __name__ == "__main__":
+    main()
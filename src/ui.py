@@ -31,18 +31,30 @@ class UI:
     Attributes:
         screen (pygame.Surface): The game display surface
         clock (pygame.time.Clock): Game clock for timing
+        present (callable): Shows a finished screen (flips the display)
+        to_screen (callable): Maps a window position to ``screen``
+                              coordinates, or None if they are the same
     """
     
-    def __init__(self, screen, clock):
+    def __init__(self, screen, clock, present=None, to_screen=None):
         """
         Initialize UI manager.
         
         Args:
             screen (pygame.Surface): Pygame display surface
             clock (pygame.time.Clock): Game clock
+            present (callable, optional): Called instead of
+                                          ``pygame.display.flip`` when a
+                                          screen is finished, e.g. to
+                                          scale it to the window
+            to_screen (callable, optional): Maps mouse positions in the
+                                            window to ``screen`` when
+                                            the screen is scaled
         """
         self.screen = screen
         self.clock = clock
+        self.present = present or pygame.display.flip
+        self.to_screen = to_screen
     
     def draw_welcome_screen(self):
         """
@@ -51,69 +63,101 @@ class UI:
         Returns:
             bool: True to start game, False to quit
         """
-        running = True
-        
-        while running:
-            self.screen.fill(Config.GAME_BG)
-            
-            # Title
-            title = Config.FONT_HUGE.render("TETRIS", True, Config.CYAN)
-            title_rect = title.get_rect(center=(Config.SCREEN_WIDTH // 2, 150))
-            self.screen.blit(title, title_rect)
-            
-            # Subtitle
-            subtitle = Config.FONT_MEDIUM.render(
-                "Classic Puzzle Game", True, Config.WHITE
-            )
-            subtitle_rect = subtitle.get_rect(
-                center=(Config.SCREEN_WIDTH // 2, 220)
-            )
-            self.screen.blit(subtitle, subtitle_rect)
-            
-            # Instructions
-            instructions = [
-                "Press ENTER to Start",
-                "Press ESC to Quit",
-                "",
-                "A Python Game Development Project"
-            ]
-            
-            y_offset = 300
-            for text in instructions:
-                if text:
-                    rendered = Config.FONT_SMALL.render(text, True, Config.LIGHT_GRAY)
-                else:
-                    y_offset += 10
-                    continue
-                text_rect = rendered.get_rect(
-                    center=(Config.SCREEN_WIDTH // 2, y_offset)
-                )
-                self.screen.blit(rendered, text_rect)
-                y_offset += 35
-            
-            # Footer
-            footer = Config.FONT_SMALL.render(
-                "© 2025 - Educational Purpose", True, Config.GRAY
-            )
-            footer_rect = footer.get_rect(
-                center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30)
-            )
-            self.screen.blit(footer, footer_rect)
+        while True:
+            self._draw_welcome()
             
             # Event handling
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return False
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        return True
-                    if event.key == pygame.K_ESCAPE:
-                        return False
+                choice = self._welcome_choice(event)
+                if choice is not None:
+                    return choice
             
-            pygame.display.flip()
+            self.present()
             self.clock.tick(Config.FPS)
+    
+    async def welcome_screen(self, clock):
+        """
+        Coroutine version of ``draw_welcome_screen``.
+        
+        Args:
+            clock (AsyncClock): Awaited between frames
         
-        return False
+        Returns:
+            bool: True to start game, False to quit
+        """
+        while True:
+            self._draw_welcome()
+            for event in pygame.event.get():
+                choice = self._welcome_choice(event)
+                if choice is not None:
+                    return choice
+            
+            self.present()
+            await clock.tick(Config.FPS)
+    
+    def _draw_welcome(self):
+        """Draw one frame of the welcome screen."""
+        self.screen.fill(Config.GAME_BG)
+        
+        # Title
+        title = Config.FONT_HUGE.render("TETRIS", True, Config.CYAN)
+        title_rect = title.get_rect(center=(Config.SCREEN_WIDTH // 2, 150))
+        self.screen.blit(title, title_rect)
+        
+        # Subtitle
+        subtitle = Config.FONT_MEDIUM.render(
+            "Classic Puzzle Game", True, Config.WHITE
+        )
+        subtitle_rect = subtitle.get_rect(
+            center=(Config.SCREEN_WIDTH // 2, 220)
+        )
+        self.screen.blit(subtitle, subtitle_rect)
+        
+        # Instructions
+        instructions = [
+            "Press ENTER to Start",
+            "Press ESC to Quit",
+            "",
+            "A Python Game Development Project"
+        ]
+        
+        y_offset = 300
+        for text in instructions:
+            if text:
+                rendered = Config.FONT_SMALL.render(text, True, Config.LIGHT_GRAY)
+            else:
+                y_offset += 10
+                continue
+            text_rect = rendered.get_rect(
+                center=(Config.SCREEN_WIDTH // 2, y_offset)
+            )
+            self.screen.blit(rendered, text_rect)
+            y_offset += 35
+        
+        # Footer
+        footer = Config.FONT_SMALL.render(
+            "© 2025 - Educational Purpose", True, Config.GRAY
+        )
+        footer_rect = footer.get_rect(
+            center=(Config.SCREEN_WIDTH // 2, Config.SCREEN_HEIGHT - 30)
+        )
+        self.screen.blit(footer, footer_rect)
+    
+    def _welcome_choice(self, event):
+        """
+        Apply one event to the welcome screen.
+        
+        Returns:
+            bool: True to start, False to quit, None to keep waiting
+        """
+        if event.type == pygame.QUIT:
+            return False
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:
+                return True
+            if event.key == pygame.K_ESCAPE:
+                return False
+        return None
     
     def draw_login_screen(self):
         """
@@ -122,75 +166,70 @@ class UI:
         Returns:
             str: Player name (or "Player" if cancelled)
         """
-        input_box = pygame.Rect(
-            Config.SCREEN_WIDTH // 2 - 150,
-            Config.SCREEN_HEIGHT // 2 - 20,
-            300, 50
-        )
-        color_inactive = Config.GRAY
-        color_active = Config.CYAN
-        color = color_inactive
-        active = False
-        text = ""
-        
-        running = True
-        while running:
-            self.screen.fill(Config.GAME_BG)
-            
-            # Title
-            title = Config.FONT_LARGE.render(
-                "Enter Your Name", True, Config.WHITE
-            )
-            title_rect = title.get_rect(
-                center=(Config.SCREEN_WIDTH // 2, 150)
-            )
-            self.screen.blit(title, title_rect)
-            
-            # Instruction
-            instruction = Config.FONT_SMALL.render(
-                "Press ENTER to continue or ESC to skip", 
-                True, Config.LIGHT_GRAY
-            )
-            instr_rect = instruction.get_rect(
-                center=(Config.SCREEN_WIDTH // 2, 220)
-            )
-            self.screen.blit(instruction, instr_rect)
+        name_input = NameInput(self.to_screen)
+        while True:
+            self._draw_login_title()
             
             # Event handling
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                name = name_input.handle_event(event)
+                if name is False:
                     pygame.quit()
                     sys.exit()
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    active = input_box.collidepoint(event.pos)
-                    color = color_active if active else color_inactive
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        return text if text else "Player"
-                    elif event.key == pygame.K_ESCAPE:
-                        return "Player"
-                    elif active:
-                        if event.key == pygame.K_BACKSPACE:
-                            text = text[:-1]
-                        elif len(text) < 15:  # Max length
-                            text += event.unicode
+                if name is not None:
+                    return name
             
-            # Draw input box
-            txt_surface = Config.FONT_MEDIUM.render(text, True, Config.WHITE)
-            width = max(300, txt_surface.get_width() + 20)
-            input_box.w = width
-            input_box.centerx = Config.SCREEN_WIDTH // 2
-            
-            pygame.draw.rect(self.screen, color, input_box, 3)
-            self.screen.blit(
-                txt_surface, 
-                (input_box.x + 10, input_box.y + 10)
-            )
-            
-            pygame.display.flip()
+            name_input.draw(self.screen)
+            self.present()
             self.clock.tick(Config.FPS)
+    
+    async def login_screen(self, clock):
+        """
+        Coroutine version of ``draw_login_screen``.
+        
+        Args:
+            clock (AsyncClock): Awaited between frames
+        
+        Returns:
+            str: Player name ("Player" if cancelled), or None if the
+                 window was closed
+        """
+        name_input = NameInput(self.to_screen)
+        while True:
+            self._draw_login_title()
+            for event in pygame.event.get():
+                name = name_input.handle_event(event)
+                if name is False:
+                    return None
+                if name is not None:
+                    return name
+            
+            name_input.draw(self.screen)
+            self.present()
+            await clock.tick(Config.FPS)
+    
+    def _draw_login_title(self):
+        """Draw the login screen except for the input box."""
+        self.screen.fill(Config.GAME_BG)
+        
+        # Title
+        title = Config.FONT_LARGE.render(
+            "Enter Your Name", True, Config.WHITE
+        )
+        title_rect = title.get_rect(
+            center=(Config.SCREEN_WIDTH // 2, 150)
+        )
+        self.screen.blit(title, title_rect)
         
-        return "Player"
+        # Instruction
+        instruction = Config.FONT_SMALL.render(
+            "Press ENTER to continue or ESC to skip", 
+            True, Config.LIGHT_GRAY
+        )
+        instr_rect = instruction.get_rect(
+            center=(Config.SCREEN_WIDTH // 2, 220)
+        )
+        self.screen.blit(instruction, instr_rect)
     
     def draw_game_header(self, player_name, score, level, high_score):
         """
@@ -205,36 +244,36 @@ class UI:
         # Header background
         pygame.draw.rect(
             self.screen, Config.HEADER_BG,
-            (0, 0, Config.SCREEN_WIDTH, 80)
+            (0, 0, Config.SCREEN_WIDTH, Config.HEADER_HEIGHT)
         )
         
         # Title
         title = Config.FONT_LARGE.render("TETRIS", True, Config.WHITE)
-        self.screen.blit(title, (20, 20))
+        self.screen.blit(title, Config.HEADER_TITLE)
         
         # Player name
         name_text = Config.FONT_SMALL.render(
             f"Player: {player_name}", True, Config.WHITE
         )
-        self.screen.blit(name_text, (200, 25))
+        self.screen.blit(name_text, Config.HEADER_PLAYER)
         
         # Score
         score_text = Config.FONT_SMALL.render(
             f"Score: {score}", True, Config.WHITE
         )
-        self.screen.blit(score_text, (200, 50))
+        self.screen.blit(score_text, Config.HEADER_SCORE)
         
         # Level
         level_text = Config.FONT_SMALL.render(
             f"Level: {level}", True, Config.WHITE
         )
-        self.screen.blit(level_text, (400, 25))
+        self.screen.blit(level_text, Config.HEADER_LEVEL)
         
         # High Score
         high_text = Config.FONT_SMALL.render(
             f"High: {high_score}", True, Config.WHITE
         )
-        self.screen.blit(high_text, (400, 50))
+        self.screen.blit(high_text, Config.HEADER_HIGH)
     
     def draw_sidebar(self, next_tetromino, lines_cleared, controls_visible=True):
         """
@@ -245,76 +284,74 @@ class UI:
             lines_cleared (int): Total lines cleared
             controls_visible (bool): Whether to show controls
         """
-        sidebar_x = Config.GAME_WIDTH + 20
+        sidebar_x = Config.SIDEBAR_X
         
         # Next Piece Section
+        panel_top, panel_height = Config.NEXT_PANEL
         pygame.draw.rect(
             self.screen, Config.SIDEBAR_BG,
-            (sidebar_x, 100, 200, 150)
+            (sidebar_x, panel_top, Config.SIDEBAR_WIDTH, panel_height)
         )
         
         next_text = Config.FONT_MEDIUM.render("NEXT", True, Config.WHITE)
-        self.screen.blit(next_text, (sidebar_x + 70, 110))
+        label_x, label_y = Config.NEXT_LABEL
+        self.screen.blit(next_text, (sidebar_x + label_x, label_y))
         
         # Draw next tetromino preview
         if next_tetromino:
-            offset_x = sidebar_x + 60
-            offset_y = 160
+            offset_x = sidebar_x + Config.PREVIEW_ORIGIN[0]
+            offset_y = Config.PREVIEW_ORIGIN[1]
+            size = Config.PREVIEW_BLOCK
             for row_idx, row in enumerate(next_tetromino.shape):
                 for col_idx, cell in enumerate(row):
                     if cell:
                         pygame.draw.rect(
                             self.screen, next_tetromino.color,
-                            (offset_x + col_idx * 20, 
-                             offset_y + row_idx * 20, 
-                             20, 20)
+                            (offset_x + col_idx * size, 
+                             offset_y + row_idx * size, 
+                             size, size)
                         )
                         pygame.draw.rect(
                             self.screen, Config.WHITE,
-                            (offset_x + col_idx * 20, 
-                             offset_y + row_idx * 20, 
-                             20, 20), 1
+                            (offset_x + col_idx * size, 
+                             offset_y + row_idx * size, 
+                             size, size), 1
                         )
         
         # Stats Section
+        panel_top, panel_height = Config.STATS_PANEL
         pygame.draw.rect(
             self.screen, Config.SIDEBAR_BG,
-            (sidebar_x, 270, 200, 80)
+            (sidebar_x, panel_top, Config.SIDEBAR_WIDTH, panel_height)
         )
         
         lines_text = Config.FONT_SMALL.render(
             f"Lines: {lines_cleared}", True, Config.WHITE
         )
-        self.screen.blit(lines_text, (sidebar_x + 10, 285))
+        label_x, label_y = Config.LINES_LABEL
+        self.screen.blit(lines_text, (sidebar_x + label_x, label_y))
         
         # Controls Section
         if controls_visible:
+            panel_top, panel_height = Config.CONTROLS_PANEL
             pygame.draw.rect(
                 self.screen, Config.SIDEBAR_BG,
-                (sidebar_x, 370, 200, 200)
+                (sidebar_x, panel_top, Config.SIDEBAR_WIDTH, panel_height)
             )
             
             controls_title = Config.FONT_SMALL.render(
                 "CONTROLS", True, Config.CYAN
             )
-            self.screen.blit(controls_title, (sidebar_x + 50, 380))
-            
-            y_pos = 410
-            control_items = [
-                ("←/→", "Move"),
-                ("↓", "Soft Drop"),
-                ("↑", "Rotate"),
-                ("SPACE", "Hard Drop"),
-                ("P", "Pause"),
-                ("ESC", "Quit")
-            ]
+            label_x, label_y = Config.CONTROLS_LABEL
+            self.screen.blit(controls_title, (sidebar_x + label_x, label_y))
             
-            for key, action in control_items:
+            list_x, y_pos = Config.CONTROLS_LIST
+            for key, action in Config.CONTROL_ITEMS:
                 key_text = Config.FONT_SMALL.render(
                     f"{key}: {action}", True, Config.LIGHT_GRAY
                 )
-                self.screen.blit(key_text, (sidebar_x + 10, y_pos))
-                y_pos += 25
+                self.screen.blit(key_text, (sidebar_x + list_x, y_pos))
+                y_pos += Config.CONTROLS_SPACING
     
     def draw_game_over_screen(self, score, high_score):
         """
@@ -327,6 +364,40 @@ class UI:
         Returns:
             str: "restart" or "quit"
         """
+        self._draw_game_over(score, high_score)
+        self.present()
+        
+        # Wait for input
+        while True:
+            for event in pygame.event.get():
+                action = self._game_over_choice(event)
+                if action:
+                    return action
+            self.clock.tick(Config.FPS)
+    
+    async def game_over_screen(self, clock, score, high_score):
+        """
+        Coroutine version of ``draw_game_over_screen``.
+        
+        Args:
+            clock (AsyncClock): Awaited between frames
+            score (int): Final score
+            high_score (int): High score
+        
+        Returns:
+            str: "restart" or "quit"
+        """
+        self._draw_game_over(score, high_score)
+        self.present()
+        while True:
+            for event in pygame.event.get():
+                action = self._game_over_choice(event)
+                if action:
+                    return action
+            await clock.tick(Config.FPS)
+    
+    def _draw_game_over(self, score, high_score):
+        """Darken the screen and draw the game over text over it."""
         overlay = pygame.Surface((Config.SCREEN_WIDTH, Config.SCREEN_HEIGHT))
         overlay.set_alpha(200)
         overlay.fill(Config.BLACK)
@@ -380,23 +451,22 @@ class UI:
             center=(Config.SCREEN_WIDTH // 2, 460)
         )
         self.screen.blit(quit_text, quit_rect)
+    
+    def _game_over_choice(self, event):
+        """
+        Apply one event to the game over screen.
         
-        pygame.display.flip()
-        
-        # Wait for input
-        waiting = True
-        while waiting:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    return "quit"
-                if event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:
-                        return "restart"
-                    if event.key == pygame.K_ESCAPE:
-                        return "quit"
-            self.clock.tick(Config.FPS)
-        
-        return "quit"
+        Returns:
+            str: "restart", "quit", or None to keep waiting
+        """
+        if event.type == pygame.QUIT:
+            return "quit"
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:
+                return "restart"
+            if event.key == pygame.K_ESCAPE:
+                return "quit"
+        return None
     
     def draw_pause_screen(self):
         """Draw pause overlay."""
@@ -419,4 +489,90 @@ class UI:
         )
         self.screen.blit(continue_text, continue_rect)
         
-        pygame.display.flip()
+        # Offscreen surfaces (headless mode) have nothing to flip
+        if self.screen is pygame.display.get_surface():
+            pygame.display.flip()
+
+
+class NameInput:
+    """
+    Text box of the login screen.
+    
+    Attributes:
+        box (pygame.Rect): Box position, widened to fit the text
+        text (str): Name typed so far
+        active (bool): True once the box was clicked (typing goes in)
+        to_screen (callable): Maps window positions to screen positions,
+                              or None if they are the same
+    """
+    
+    # Longest name that can be typed
+    MAX_LENGTH = 15
+    
+    def __init__(self, to_screen=None):
+        """
+        Create an empty, inactive box in the middle of the screen.
+        
+        Args:
+            to_screen (callable, optional): Maps a mouse position in the
+                                            window to screen coordinates
+                                            (for scaled, letterboxed
+                                            screens)
+        """
+        self.to_screen = to_screen
+        self.box = pygame.Rect(
+            Config.SCREEN_WIDTH // 2 - 150,
+            Config.SCREEN_HEIGHT // 2 - 20,
+            300, 50
+        )
+        self.text = ""
+        self.active = False
+    
+    def handle_event(self, event):
+        """
+        Apply one event to the box.
+        
+        Args:
+            event (pygame.event.Event): Event to apply
+        
+        Returns:
+            str: The entered name once ENTER or ESC is pressed ("Player"
+                 if none), False if the window was closed, else None
+        """
+        if event.type == pygame.QUIT:
+            return False
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            position = event.pos
+            if self.to_screen:
+                position = self.to_screen(position)
+            self.active = self.box.collidepoint(position)
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:
+                return self.text if self.text else "Player"
+            elif event.key == pygame.K_ESCAPE:
+                return "Player"
+            elif self.active:
+                if event.key == pygame.K_BACKSPACE:
+                    self.text = self.text[:-1]
+                elif len(self.text) < self.MAX_LENGTH:
+                    self.text += event.unicode
+        return None
+    
+    def draw(self, screen):
+        """
+        Draw the box and the text typed so far.
+        
+        Args:
+            screen (pygame.Surface): Surface to draw on
+        """
+        color = Config.CYAN if self.active else Config.GRAY
+        txt_surface = Config.FONT_MEDIUM.render(self.text, True, Config.WHITE)
+        width = max(300, txt_surface.get_width() + 20)
+        self.box.w = width
+        self.box.centerx = Config.SCREEN_WIDTH // 2
+        
+        pygame.draw.rect(screen, color, self.box, 3)
+        screen.blit(
+            txt_surface, 
+            (self.box.x + 10, self.box.y + 10)
+        )
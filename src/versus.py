@@ -0,0 +1,203 @@
+"""
+Versus Module - Two-Player Garbage Exchange
+===========================================
+
+In versus mode two games run side by side and attack each other.
+Clearing several rows at once sends garbage to the opponent
+(Config.calculate_garbage: a double sends 1 row, a triple 2, a
+Tetris 4). A garbage row is full except for one hole, and it enters
+the bottom of the opponent's board, pushing the stack up.
+
+Rules:
+
+- Garbage waits in a queue until the receiver locks a piece without
+  clearing rows, then all of it enters at once with one hole column.
+- Rows sent by a player first cancel garbage waiting for that player;
+  only the rest is sent on. Clearing fast is also the defence.
+- A player loses when a new piece cannot spawn or garbage pushes
+  blocks out of the top.
+
+Both games use the same seed, so both players get the same pieces
+(mirrored piece sequences), and the hole columns each player receives
+come from two generators with that seed too. A result then depends on
+the players, not on which side got luckier pieces.
+
+Educational Purpose:
+-------------------
+Learn about:
+- Game rules that couple two independent simulations
+- Fair comparisons through mirrored randomness
+"""
+
+import random
+
+from .autoplayer import AutoPlayer
+from .config import Config
+from .engine import GameEngine
+
+
+class Versus:
+    """
+    Garbage exchange between two games.
+    
+    Attributes:
+        engines (list): The two GameEngines
+        pending (list): Garbage rows waiting to enter each board
+        sent (list): Garbage rows each player has sent to the other
+        received (list): Garbage rows that entered each board
+    """
+    
+    def __init__(self, engines, seed=None):
+        """
+        Couple two games.
+        
+        Args:
+            engines (sequence): Two GameEngines, usually made with the
+                                same seed
+            seed (int, optional): Seed for the garbage hole columns
+        
+        Raises:
+            ValueError: If not given exactly two games
+        """
+        self.engines = list(engines)
+        if len(self.engines) != 2:
+            raise ValueError(f"Versus needs 2 games, got {len(self.engines)}")
+        self.pending = [0, 0]
+        self.sent = [0, 0]
+        self.received = [0, 0]
+        self._holes = [random.Random(seed), random.Random(seed)]
+    
+    def piece_locked(self, player, rows):
+        """
+        Exchange garbage after one player's piece locked.
+        
+        Call this after every lock (GameEngine.lock_current_piece
+        returns ``rows``).
+        
+        Args:
+            player (int): 0 or 1
+            rows (int): Rows the piece cleared
+        
+        Returns:
+            int: Garbage rows that entered this player's board
+        """
+        self._send(player, self._attack(player, rows))
+        if rows or not self.pending[player]:
+            return 0
+        return self._receive(player)
+    
+    def pieces_locked(self, rows):
+        """
+        Exchange garbage after both players locked a piece at once.
+        
+        Both attacks are resolved before either is sent on, so neither
+        player gets an advantage from being handled first.
+        
+        Args:
+            rows (sequence): Rows cleared by each player, or None for a
+                             player who did not lock a piece
+        
+        Returns:
+            list: Garbage rows that entered each board
+        """
+        attacks = [0 if cleared is None else self._attack(player, cleared)
+                   for player, cleared in enumerate(rows)]
+        for player, attack in enumerate(attacks):
+            self._send(player, attack)
+        return [
+            self._receive(player)
+            if cleared == 0 and self.pending[player] else 0
+            for player, cleared in enumerate(rows)
+        ]
+    
+    def _attack(self, player, rows):
+        """Garbage a clear sends after cancelling the player's own queue."""
+        attack = Config.calculate_garbage(rows)
+        cancelled = min(attack, self.pending[player])
+        self.pending[player] -= cancelled
+        return attack - cancelled
+    
+    def _send(self, player, attack):
+        """Queue garbage for the opponent."""
+        if attack:
+            self.pending[1 - player] += attack
+            self.sent[player] += attack
+    
+    def _receive(self, player):
+        """Push a player's waiting garbage into their board."""
+        engine = self.engines[player]
+        count = self.pending[player]
+        self.pending[player] = 0
+        self.received[player] += count
+        
+        hole = self._holes[player].randrange(engine.grid.cols)
+        overflow = engine.grid.add_garbage(count, hole)
+        if (not engine.game_over and (
+                overflow
+                or not engine.grid.is_valid_position(engine.current_piece))):
+            engine.game_over = True
+            if engine.telemetry:
+                engine.telemetry.game_over(engine.score, engine.level,
+                                           engine.lines_cleared)
+        return count
+    
+    def result(self):
+        """
+        Score the match from player 0's point of view.
+        
+        Returns:
+            float: 1 if player 0 won, 0 if player 1 won, 0.5 if both
+                   topped out; None while both are still playing
+        """
+        over = [engine.game_over for engine in self.engines]
+        if over[0] and over[1]:
+            return 0.5
+        if over[1]:
+            return 1.0
+        if over[0]:
+            return 0.0
+        return None
+
+
+def play_match(weights=(None, None), seed=None, rows=None, cols=None,
+               max_pieces=500):
+    """
+    Let two AutoPlayers play a versus match.
+    
+    Every turn both players place one piece at the same time, then
+    garbage is exchanged. If nobody has topped out after ``max_pieces``
+    turns, the player who sent more garbage wins (equal garbage is a
+    draw).
+    
+    Args:
+        weights (tuple): Feature weights of player 0 and player 1
+                         (None for DEFAULT_WEIGHTS)
+        seed (int, optional): Seed for both piece sequences and holes
+        rows (int, optional): Board height
+        cols (int, optional): Board width
+        max_pieces (int): Turns after which the match is decided on
+                          garbage sent
+    
+    Returns:
+        tuple: (result for player 0 as in Versus.result, pieces placed)
+    """
+    engines = [GameEngine(rows, cols, seed=seed) for _ in range(2)]
+    versus = Versus(engines, seed)
+    players = [AutoPlayer(player_weights) for player_weights in weights]
+    pieces = 0
+    
+    for _ in range(max_pieces):
+        rows = [None, None]
+        for side, engine in enumerate(engines):
+            lines = engine.lines_cleared
+            engine.place(*players[side].choose(engine))
+            rows[side] = engine.lines_cleared - lines
+            pieces += 1
+        versus.pieces_locked(rows)
+        result = versus.result()
+        if result is not None:
+            return result, pieces
+    
+    if versus.sent[0] == versus.sent[1]:
+        return 0.5, pieces
+    return float(versus.sent[0] > versus.sent[1]), pieces
@@ -0,0 +1,476 @@
+"""
+Wall Module - Many Live Boards in One Window
+============================================
+
+The normal playing screen (TetrisGame, UI, ScaledRenderer) shows one
+board at fixed positions. WallRenderer tiles dozens of boards - local
+bot games or server sessions seen through a SpectatorView - into one
+window, for lobby screens and AI demos:
+
+- The window is split into a grid of equal tiles, choosing the number
+  of tile columns that gives the boards the largest cells; each board
+  is scaled to fit its tile
+- Blocks come from one shared atlas per cell size: a single surface
+  holding one block per palette color (plus a ghost outline row), so
+  every cell is one ``blits`` entry with a source area and nothing is
+  rasterized per board
+- Labels go through one shared LRU text cache
+- Each tile remembers a small key describing what it last showed and
+  is only redrawn when the key changes; ``draw`` returns the rectangles
+  it touched, for ``pygame.display.update``
+
+With most boards unchanged between two frames, a 64 board wall costs
+little more than the few boards that actually moved.
+
+How to Run:
+----------
+    python -m src.wall
+    python -m src.wall --boards 64 --interval 5
+
+Educational Purpose:
+-------------------
+Learn about:
+- Texture atlases
+- Dirty rectangles
+- Grid layouts that adapt to the window size
+"""
+
+import argparse
+import collections
+import math
+import os
+
+import pygame
+
+from .config import Config
+from .tetromino import Tetromino
+
+# Labels of different tiles share this many rendered strings
+TEXT_CACHE_SIZE = 1024
+
+# Pixels between tiles
+GAP = 4
+
+LABEL_COLOR = Config.WHITE
+
+
+def _display_format(surface):
+    """Convert a surface to the window's pixel format, if there is one."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+
+_shape_cache = {}
+
+
+def _shape_masks(shape_type, rotation):
+    """Row masks of a piece type in a rotation (cached)."""
+    key = (shape_type, rotation)
+    masks = _shape_cache.get(key)
+    if masks is None:
+        piece = Tetromino(shape_type)
+        for _ in range(rotation):
+            piece.rotate_clockwise()
+        masks = _shape_cache[key] = tuple(piece.get_row_masks())
+    return masks
+
+
+def _landing_y(row_masks, masks, x, y):
+    """Row a piece with these masks lands on when dropped from y."""
+    rows = len(row_masks)
+    while y + len(masks) < rows:
+        below = y + 1
+        if any(row_masks[below + i] & (mask << x)
+               for i, mask in enumerate(masks) if below + i >= 0):
+            break
+        y = below
+    return y
+
+
+class _Tile:
+    """One board on the wall and what it last showed."""
+    
+    def __init__(self, source, title):
+        self.source = source
+        self.title = title
+        self.rect = None
+        self.board_rect = None
+        self.dims = None
+        self.cell = 0
+        self.shown = None
+        self.pieces = 0
+        self._piece = None
+    
+    def state(self):
+        """
+        Read the drawable state of the source.
+        
+        Returns:
+            tuple: (key, rows, cols, row_masks, cells, piece, hud).
+                   ``key`` changes whenever anything visible changes;
+                   ``cells`` is a flat ``rows * cols`` buffer (GameEngine)
+                   or one buffer per row (SpectatorView).
+        """
+        source = self.source
+        if hasattr(source, "grid"):
+            # GameEngine: the board only changes when a piece locks,
+            # which also replaces the current piece object. Count those
+            # replacements; the tile holds on to the piece it last saw,
+            # so an id() recycled for a new piece cannot hide a lock.
+            grid = source.grid
+            piece = source.current_piece
+            if piece is not self._piece:
+                self._piece = piece
+                self.pieces += 1
+            hud = (source.score, source.level, source.lines_cleared,
+                   source.game_over)
+            piece_state = (piece.shape_type, piece.rotation, piece.x, piece.y,
+                           Config.COLOR_INDEX[piece.color])
+            key = (self.pieces, grid.top, piece_state, hud)
+            return (key, grid.rows, grid.cols, grid.row_masks, grid.cells,
+                    piece_state, hud)
+        
+        # SpectatorView
+        hud = (source.score, source.level, source.lines, source.game_over)
+        piece = source.piece
+        piece_state = None
+        if piece:
+            shape_type, color, _, _, x, y, rotation = piece
+            piece_state = (shape_type, rotation, x, y, color)
+        return (source.version, source.rows, source.cols, source.row_masks,
+                source.board, piece_state, hud)
+
+
+class WallRenderer:
+    """
+    Draws many boards tiled into one surface.
+    
+    Boards can be GameEngine objects (including TetrisGame) or
+    SpectatorView objects, and can be added or removed at any time.
+    
+    Attributes:
+        size (tuple): Surface size in pixels
+        tiles (list): One entry per board, in display order
+        columns (int): Tiles per row of the current layout
+    """
+    
+    def __init__(self, size, boards=()):
+        """
+        Create a wall.
+        
+        Args:
+            size (tuple): Surface (width, height) in pixels
+            boards (iterable): Boards to show
+        """
+        self.size = tuple(size)
+        self.tiles = []
+        self.columns = 1
+        self._atlases = {}
+        self._fonts = {}
+        self._text = collections.OrderedDict()
+        self._dim_layers = {}
+        self._full_redraw = True
+        for board in boards:
+            self.add(board)
+    
+    def add(self, source, title=None):
+        """
+        Add a board to the wall.
+        
+        Args:
+            source (GameEngine or SpectatorView): Board to show
+            title (str, optional): Label; defaults to the board number
+        """
+        self.tiles.append(_Tile(source, title or f"#{len(self.tiles) + 1}"))
+        self._layout()
+    
+    def remove(self, source):
+        """
+        Remove a board from the wall.
+        
+        Args:
+            source (GameEngine or SpectatorView): Board to remove
+        """
+        self.tiles = [tile for tile in self.tiles if tile.source is not source]
+        self._layout()
+    
+    def resize(self, size):
+        """
+        Lay the tiles out for a new surface size.
+        
+        Args:
+            size (tuple): Surface (width, height) in pixels
+        """
+        self.size = tuple(size)
+        self._layout()
+    
+    def invalidate(self):
+        """Redraw every tile on the next draw (e.g. after an expose)."""
+        self._full_redraw = True
+    
+    def _layout(self):
+        """Pick the tile grid that gives the largest cells."""
+        self._full_redraw = True
+        count = len(self.tiles)
+        if not count:
+            return
+        width, height = self.size
+        rows = max(self.tiles[0].state()[1], 1)
+        cols = max(self.tiles[0].state()[2], 1)
+        
+        best = None
+        for columns in range(1, count + 1):
+            tile_width = (width - GAP) // columns - GAP
+            tile_height = (height - GAP) // math.ceil(count / columns) - GAP
+            label = max(10, tile_height // 12)
+            cell = min(tile_width // cols, (tile_height - label) // rows)
+            if best is None or cell > best[0]:
+                best = (cell, columns, tile_width, tile_height, label)
+        _, self.columns, tile_width, tile_height, label = best
+        
+        for index, tile in enumerate(self.tiles):
+            row, column = divmod(index, self.columns)
+            left = GAP + column * (tile_width + GAP)
+            top = GAP + row * (tile_height + GAP)
+            tile.rect = pygame.Rect(left, top, tile_width, tile_height)
+            
+            _, board_rows, board_cols = tile.state()[:3]
+            cell = max(1, min(tile_width // max(board_cols, 1),
+                              (tile_height - label) // max(board_rows, 1)))
+            board_width, board_height = board_cols * cell, board_rows * cell
+            tile.cell = cell
+            # Label and board are centered together in the tile
+            board_left = left + (tile_width - board_width) // 2
+            label_top = top + (tile_height - label - board_height) // 2
+            tile.label_rect = pygame.Rect(board_left, label_top,
+                                          board_width, label)
+            tile.board_rect = pygame.Rect(board_left, label_top + label,
+                                          board_width, board_height)
+            tile.font_size = label
+            tile.dims = (board_rows, board_cols)
+            tile.shown = None
+    
+    def atlas(self, cell):
+        """
+        Get the block atlas for a cell size, building it only once.
+        
+        Row 0 holds a filled block and row 1 a ghost outline for every
+        palette index.
+        
+        Args:
+            cell (int): Block edge length in pixels
+        
+        Returns:
+            tuple: (surface, block areas, ghost areas) with one area per
+                   palette index
+        """
+        entry = self._atlases.get(cell)
+        if entry is None:
+            count = len(Config.PALETTE)
+            surface = _display_format(pygame.Surface((cell * count, cell * 2)))
+            surface.fill(Config.GAME_BG)
+            blocks, ghosts = [], []
+            for index, color in enumerate(Config.PALETTE):
+                block = pygame.Rect(index * cell, 0, cell, cell)
+                ghost = pygame.Rect(index * cell, cell, cell, cell)
+                surface.fill(color, block)
+                if cell >= 6:
+                    pygame.draw.rect(surface, Config.WHITE, block, 1)
+                pygame.draw.rect(surface, color, ghost, 1)
+                blocks.append(block)
+                ghosts.append(ghost)
+            entry = self._atlases[cell] = (surface, blocks, ghosts)
+        return entry
+    
+    def text(self, size, string, color=LABEL_COLOR):
+        """
+        Get a rendered label, shared by all tiles.
+        
+        Args:
+            size (int): Font size in pixels
+            string (str): Text
+            color (tuple): RGB color
+        
+        Returns:
+            pygame.Surface: The rendered text
+        """
+        key = (size, string, color)
+        cache = self._text
+        surface = cache.get(key)
+        if surface is None:
+            font = self._fonts.get(size)
+            if font is None:
+                font = self._fonts[size] = pygame.font.Font(None, size)
+            surface = font.render(string, True, color)
+            cache[key] = surface
+            if len(cache) > TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return surface
+    
+    def draw(self, surface):
+        """
+        Redraw the tiles whose boards changed.
+        
+        Args:
+            surface (pygame.Surface): Target, at least ``size`` big
+        
+        Returns:
+            list: Rectangles that were drawn (every tile after a
+                  layout change)
+        """
+        if self._full_redraw:
+            surface.fill(Config.BLACK)
+        
+        dirty = []
+        for tile in self.tiles:
+            state = tile.state()
+            if state[1:3] != tile.dims:
+                # Board size became known (first keyframe) or changed
+                self._layout()
+                return self.draw(surface)
+            if not self._full_redraw and state[0] == tile.shown:
+                continue
+            self._draw_tile(surface, tile, state)
+            tile.shown = state[0]
+            dirty.append(tile.rect)
+        
+        if self._full_redraw:
+            self._full_redraw = False
+            return [pygame.Rect((0, 0), self.size)]
+        return dirty
+    
+    def _draw_tile(self, surface, tile, state):
+        """Draw one tile: label, board, ghost and falling piece."""
+        _, rows, cols, row_masks, cells, piece, hud = state
+        flat = not isinstance(cells, list)
+        score, level, lines, game_over = hud
+        cell = tile.cell
+        left, top = tile.board_rect.topleft
+        atlas, blocks, ghosts = self.atlas(cell)
+        
+        # Label: title on the left, score on the right
+        label = tile.label_rect
+        surface.fill(Config.HEADER_BG, label)
+        clip = surface.get_clip()
+        surface.set_clip(label)
+        title = self.text(tile.font_size, f"{tile.title}  L{level}")
+        surface.blit(title, (label.x + 3, label.y + 1))
+        value = self.text(tile.font_size, str(score))
+        surface.blit(value, (label.right - value.get_width() - 3, label.y + 1))
+        surface.set_clip(clip)
+        
+        surface.fill(Config.GAME_BG, tile.board_rect)
+        
+        blits = []
+        for y, mask in enumerate(row_masks):
+            if not mask:
+                continue
+            if flat:
+                row, start = cells, y * cols
+            else:
+                row, start = cells[y], 0
+            y_pixel = top + y * cell
+            while mask:
+                low = mask & -mask
+                x = low.bit_length() - 1
+                blits.append((atlas, (left + x * cell, y_pixel),
+                              blocks[row[start + x]]))
+                mask ^= low
+        
+        if piece and not game_over:
+            shape_type, rotation, x, y, color = piece
+            masks = _shape_masks(shape_type, rotation)
+            ghost_y = _landing_y(row_masks, masks, x, y)
+            for areas, piece_y in ((ghosts, ghost_y), (blocks, y)):
+                for i, mask in enumerate(masks):
+                    if piece_y + i < 0:
+                        continue
+                    y_pixel = top + (piece_y + i) * cell
+                    while mask:
+                        low = mask & -mask
+                        column = x + low.bit_length() - 1
+                        blits.append((atlas, (left + column * cell, y_pixel),
+                                      areas[color]))
+                        mask ^= low
+        surface.blits(blits, False)
+        
+        if game_over:
+            size = tile.board_rect.size
+            dim = self._dim_layers.get(size)
+            if dim is None:
+                dim = _display_format(pygame.Surface(size))
+                dim.fill(Config.BLACK)
+                dim.set_alpha(150)
+                self._dim_layers[size] = dim
+            surface.blit(dim, tile.board_rect)
+            text = self.text(tile.font_size, "GAME OVER", Config.RED)
+            surface.blit(text, text.get_rect(center=tile.board_rect.center))
+
+
+def main():
+    """Show a wall of AutoPlayer games."""
+    from .autoplayer import AutoPlayer
+    from .engine import GameEngine
+    
+    parser = argparse.ArgumentParser(description="Wall of bot games")
+    parser.add_argument("--boards", type=int, default=36)
+    parser.add_argument("--interval", type=int, default=10,
+                        help="Frames between two pieces of one bot")
+    parser.add_argument("--size", type=int, nargs=2, default=(1280, 720))
+    parser.add_argument("--frames", type=int, default=0,
+                        help="Stop after this many frames (0 = run until "
+                             "the window is closed)")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+    
+    if args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    window = pygame.display.set_mode(args.size, pygame.RESIZABLE)
+    pygame.display.set_caption("Tetris - Bot Wall")
+    clock = pygame.time.Clock()
+    
+    player = AutoPlayer()
+    games = [GameEngine(seed=seed) for seed in range(args.boards)]
+    wall = WallRenderer(window.get_size(), games)
+    restart = [0] * len(games)
+    
+    frame = 0
+    running = True
+    while running and frame != args.frames:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.VIDEORESIZE:
+                window = pygame.display.get_surface()
+                wall.resize(window.get_size())
+            elif event.type == pygame.WINDOWEXPOSED:
+                wall.invalidate()
+        
+        # Bots take turns so that only a few boards change per frame
+        for index, game in enumerate(games):
+            if (frame + index) % args.interval:
+                continue
+            if game.game_over:
+                restart[index] += 1
+                if restart[index] * args.interval >= 2 * Config.FPS:
+                    game.reset_game()
+                    restart[index] = 0
+            else:
+                game.place(*player.choose(game))
+        
+        pygame.display.update(wall.draw(window))
+        clock.tick(Config.FPS)
+        frame += 1
+        if frame % Config.FPS == 0:
+            pygame.display.set_caption(
+                f"Tetris - Bot Wall ({clock.get_fps():.0f} FPS)"
+            )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,26 @@ Structure:
     test_tetromino.py - Tests for Tetromino class
     test_grid.py      - Tests for Grid class
     test_game.py      - Tests for TetrisGame class
+    test_spectator.py - Delta frames against full keyframes
+    test_leaderboard.py - SQLite leaderboard, on disk and in memory
+    test_snapshot.py  - Snapshot save/load round trips
+    test_ui.py        - Menus in scaled, letterboxed windows
+    test_replay.py    - Replay playback and seeking
+    test_versus.py    - Versus garbage rules
+    test_gc_policy.py - Garbage collection at safe points
+    test_netplay.py   - Rollback save/restore and peer agreement
+    test_positions.py - Generated boards replay through GameEngine
+    test_server.py    - Asyncio server sessions, inputs and spectators
+    test_dataset.py   - Training data shards, back-pressure, manifest
+    test_autoplayer.py - AutoPlayer features/choices and tuner resume
+    test_solver.py    - Perfect clear solutions replay, pruning, budgets
+    test_telemetry.py - Ring buffer loss, rotation, flushing, timing
+    test_placement_cache.py - Cache reopen, growth, policy, LRU
+    test_terminal.py  - Diffed terminal frames equal a full repaint
+    test_value_network.py - Batched candidate boards, features, network
+    test_async_clock.py - Frame deadlines, late frames, run_async
+    test_dashboard.py - Shared slots, bounded reads, WorkerView, workers
+    test_allocations.py - Call and frame peaks, GC pauses, uninstall
 """
 
 # Future: Add test fixtures and utilities here
@@ -0,0 +1,159 @@
+"""
+Unit Tests for Allocation Tracking
+==================================
+
+These tests verify that a traced call reports the temporaries it
+allocated and what it left behind (with nested calls counted in their
+callers), that frames report their own peaks and garbage collections,
+that uninstall puts every wrapped method and font back, and that a
+short headless session fills in the report.
+
+To run: pytest tests/test_allocations.py -v
+"""
+
+import sys
+import os
+import gc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pytest  # noqa: E402
+
+from src import allocations  # noqa: E402
+from src.allocations import AllocationTracker, run_session  # noqa: E402
+from src.config import Config  # noqa: E402
+from src.grid import Grid  # noqa: E402
+
+# Size of the temporary the test functions allocate and free
+TEMPORARY = 1 << 20
+
+# Size of what they return
+KEPT = 1 << 16
+
+
+def temporary_then_result():
+    """Allocate a large temporary, free it, and return a smaller object."""
+    temporary = bytes(TEMPORARY)
+    del temporary
+    return bytes(KEPT)
+
+
+@pytest.fixture
+def tracker():
+    """A tracing tracker with no wrapped sources, uninstalled afterwards."""
+    tracker = AllocationTracker(sources=())
+    tracker.install()
+    yield tracker
+    tracker.uninstall()
+
+
+class TestTracing:
+    def test_call_peak_and_retained(self, tracker):
+        """A call counts its freed temporary in the peak, not as retained"""
+        traced = tracker.wrap("work", temporary_then_result)
+        result = traced()
+        stats = tracker.sources["work"]
+        assert stats.calls == 1
+        assert stats.peak_bytes >= TEMPORARY
+        assert KEPT <= stats.retained_bytes < KEPT + 4096
+        del result
+    
+    def test_nested_calls_are_cumulative(self, tracker):
+        """A caller's peak includes the peak of the calls it makes"""
+        inner = tracker.wrap("inner", temporary_then_result)
+        
+        def outer_function():
+            kept = inner()
+            return len(kept)
+        outer = tracker.wrap("outer", outer_function)
+        outer()
+        sources = tracker.sources
+        assert sources["inner"].peak_bytes >= TEMPORARY
+        assert sources["outer"].peak_bytes >= sources["inner"].peak_bytes
+        assert sources["outer"].retained_bytes < KEPT
+    
+    def test_frame_peak(self, tracker):
+        """A frame reports the temporaries of its traced calls"""
+        traced = tracker.wrap("work", temporary_then_result)
+        tracker.begin_frame()
+        result = traced()
+        stats = tracker.end_frame()
+        assert stats.peak_bytes >= TEMPORARY
+        assert stats.retained_bytes >= KEPT
+        
+        # The next frame starts over
+        del result
+        tracker.begin_frame()
+        stats = tracker.end_frame()
+        assert stats.peak_bytes < TEMPORARY
+        assert tracker.frames[-1] is stats and len(tracker.frames) == 2
+    
+    def test_without_reset_peak(self, tracker, monkeypatch):
+        """Before Python 3.9 peaks fall back to what calls leave behind"""
+        monkeypatch.setattr(allocations, "_HAS_RESET_PEAK", False)
+        monkeypatch.setattr(allocations, "_reset_peak", lambda: None)
+        traced = tracker.wrap("work", temporary_then_result)
+        tracker.begin_frame()
+        traced()
+        frame = tracker.end_frame()
+        stats = tracker.sources["work"]
+        assert KEPT <= stats.peak_bytes < TEMPORARY
+        assert stats.peak_bytes >= stats.retained_bytes
+        assert frame.peak_bytes < TEMPORARY
+
+
+class TestCollections:
+    def test_pauses_are_counted_per_frame(self):
+        """Collections inside a frame count there; others do not"""
+        tracker = AllocationTracker(trace=False)
+        tracker.install()
+        try:
+            gc.collect()
+            tracker.begin_frame()
+            gc.collect(1)
+            gc.collect(2)
+            stats = tracker.end_frame()
+        finally:
+            tracker.uninstall()
+        gc.collect()
+        assert stats.collections == 2 and stats.gc_pause_ns > 0
+        assert (stats.peak_bytes, stats.retained_bytes) == (0, 0)
+        assert [(frame, generation) for frame, generation, _, _
+                in tracker.pauses] == [(None, 2), (0, 1), (0, 2)]
+        summary = tracker.summary()
+        assert summary["collections"] == [0, 1, 1]
+        assert summary["collections_between"] == 1
+        assert summary["frames_with_gc"] == 1.0
+
+
+class TestInstall:
+    def test_uninstall_restores_everything(self):
+        """Wrapped methods, fonts and tracing are all put back"""
+        method = vars(Grid)["get_filled_cells"]
+        font = Config.FONT_SMALL
+        callbacks = list(gc.callbacks)
+        tracker = AllocationTracker()
+        tracker.install()
+        assert vars(Grid)["get_filled_cells"] is not method
+        tracker.uninstall()
+        assert vars(Grid)["get_filled_cells"] is method
+        assert "get_ghost_y" not in vars(Grid)
+        assert Config.FONT_SMALL is font
+        assert gc.callbacks == callbacks
+        assert not allocations.tracemalloc.is_tracing()
+    
+    def test_session_report(self):
+        """A short headless session measures every frame and source"""
+        tracker = AllocationTracker()
+        tracker.install()
+        try:
+            game = run_session(tracker, frames=90, drop_after=5)
+        finally:
+            tracker.uninstall()
+        assert len(tracker.frames) == 90
+        assert game.score > 0
+        assert tracker.sources["Grid.get_filled_cells"].calls >= 90
+        assert tracker.sources["TetrisGame.draw_grid"].peak_bytes > 0
+        report = tracker.report()
+        assert report.startswith("frames: 90")
+        assert "Grid.get_filled_cells" in report
@@ -0,0 +1,178 @@
+"""
+Unit Tests for the Asyncio Main Loop
+====================================
+
+These tests drive AsyncClock with a fake clock to check its fixed
+frame deadlines and what it does with late frames, check that a slow
+frame still lets other tasks run, and run ``TetrisGame.run_async``
+from the menu into play and out again while another task keeps running.
+
+To run: pytest tests/test_async_clock.py -v
+"""
+
+import sys
+import os
+import asyncio
+import time
+import types
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+
+from src import async_clock  # noqa: E402
+from src.async_clock import AsyncClock  # noqa: E402
+from src.config import Config  # noqa: E402
+from src.game import TetrisGame  # noqa: E402
+from src.leaderboard import Leaderboard  # noqa: E402
+
+# Generous limit for a whole async scenario
+TIMEOUT = 20
+
+REAL_SLEEP = asyncio.sleep
+
+# A frame rate whose period, and half of it, are exact binary fractions,
+# so fake times add up without rounding
+FPS = 64
+PERIOD = 1 / FPS
+HALF = PERIOD / 2
+
+
+class FakeTime:
+    """Clock that only moves when the test or a sleep moves it."""
+    
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+    
+    def perf_counter(self):
+        return self.now
+    
+    async def sleep(self, delay):
+        self.sleeps.append(delay)
+        self.now += delay
+        await REAL_SLEEP(0)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    """Run AsyncClock on a FakeTime."""
+    clock = FakeTime()
+    monkeypatch.setattr(async_clock, "time", clock)
+    monkeypatch.setattr(async_clock, "asyncio",
+                        types.SimpleNamespace(sleep=clock.sleep))
+    return clock
+
+
+def frames(fake, work, fps=FPS):
+    """Tick once after each amount of work; the tick results."""
+    async def loop():
+        clock = AsyncClock()
+        results = []
+        for seconds in work:
+            fake.now += seconds
+            results.append(await clock.tick(fps))
+        return clock, results
+    return asyncio.run(loop())
+
+
+class TestAsyncClock:
+    def test_deadlines_are_fixed(self, fake):
+        """Drawing time comes out of the wait, not on top of it"""
+        clock, results = frames(fake, [HALF] * 12)
+        # The first frame is due one period after the first tick
+        assert fake.sleeps == [PERIOD] + [HALF] * 11
+        assert results[1:] == [int(PERIOD * 1000)] * 11
+        assert clock.late_frames == 0
+        assert clock.get_rawtime() == int(HALF * 1000)
+        assert clock.get_fps() == pytest.approx(1000 / int(PERIOD * 1000))
+    
+    def test_late_frame_does_not_wait(self, fake):
+        """A frame less than a period late runs at once and catches up"""
+        clock, _ = frames(fake, [0, 3 * HALF, 0, 0])
+        # Half a period late: no wait, then the next deadline is kept
+        assert fake.sleeps == [PERIOD, 0, HALF, PERIOD]
+        assert clock.late_frames == 1
+    
+    def test_far_behind_restarts_schedule(self, fake):
+        """More than a frame behind: no burst of catch-up frames"""
+        clock, results = frames(fake, [0, 20 * HALF, HALF, HALF])
+        assert fake.sleeps == [PERIOD, 0, HALF, HALF]
+        assert clock.late_frames == 1
+        assert results[1] == int(20 * HALF * 1000)
+    
+    def test_zero_fps_only_yields(self, fake):
+        """Without a frame rate tick just yields once"""
+        clock, _ = frames(fake, [0.005, 0.005], fps=0)
+        assert fake.sleeps == [0, 0]
+        assert clock.frames == 2
+    
+    def test_slow_frames_let_other_tasks_run(self):
+        """Every tick yields, even when every frame is late"""
+        async def scenario():
+            clock = AsyncClock()
+            other = 0
+            
+            async def count():
+                nonlocal other
+                while True:
+                    other += 1
+                    await asyncio.sleep(0)
+            task = asyncio.ensure_future(count())
+            for _ in range(5):
+                time.sleep(0.03)  # Blocking work longer than a frame
+                before = other
+                await clock.tick(60)
+                assert other > before
+            task.cancel()
+            return clock
+        clock = asyncio.run(scenario())
+        assert clock.late_frames >= 4
+
+
+@pytest.fixture
+def game():
+    """A game with its scores kept in memory."""
+    leaderboard = Leaderboard(":memory:")
+    tetris = TetrisGame(leaderboard=leaderboard)
+    yield tetris
+    leaderboard.close()
+    pygame.quit()
+
+
+def press(key):
+    """Queue a key press for the game."""
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key,
+                                         unicode="", mod=0, scancode=0))
+
+
+class TestRunAsync:
+    def test_menu_to_play_to_quit(self, game):
+        """run_async plays through its states, yields, and returns"""
+        seen = []
+        
+        async def until(state):
+            while game.state != state:
+                await asyncio.sleep(0.01)
+            seen.append(state)
+        
+        async def drive():
+            await asyncio.sleep(0.1)
+            assert game.state == Config.STATE_MENU and game.running
+            press(pygame.K_RETURN)
+            await until(Config.STATE_LOGIN)
+            press(pygame.K_RETURN)
+            await until(Config.STATE_PLAYING)
+            await asyncio.sleep(0.1)
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        
+        async def scenario():
+            await asyncio.wait_for(
+                asyncio.gather(game.run_async(), drive()), TIMEOUT
+            )
+        asyncio.run(scenario())
+        assert seen == [Config.STATE_LOGIN, Config.STATE_PLAYING]
+        assert game.player_name == "Player"
+        assert not game.running
+        assert not pygame.get_init()
@@ -0,0 +1,166 @@
+"""
+Unit Tests for the AutoPlayer and Tuner
+=======================================
+
+These tests verify the AutoPlayer's bitmask board features against a
+cell-by-cell reference, that ``choose`` picks the placement whose real
+result scores best, and that the tuner resumes a checkpoint exactly and
+refuses one made with other settings.
+
+To run: pytest tests/test_autoplayer.py -v
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src import snapshot  # noqa: E402
+from src.autoplayer import (  # noqa: E402
+    AutoPlayer, DEFAULT_WEIGHTS, board_features, play_game,
+)
+from src.engine import GameEngine  # noqa: E402
+from src.tuner import CrossEntropyTuner  # noqa: E402
+
+
+def naive_features(rows):
+    """Height, holes and bumpiness from a list of cell rows."""
+    cols = len(rows[0])
+    heights = []
+    holes = 0
+    for x in range(cols):
+        column = [row[x] for row in rows]
+        top = next((y for y, cell in enumerate(column) if cell), len(rows))
+        heights.append(len(rows) - top)
+        holes += sum(1 for cell in column[top:] if not cell)
+    bumpiness = sum(abs(a - b) for a, b in zip(heights, heights[1:]))
+    return sum(heights), holes, bumpiness
+
+
+def random_rows(rng, rows, cols):
+    """Random cell rows, denser towards the bottom."""
+    return [[rng.random() < y / rows for _ in range(cols)]
+            for y in range(rows)]
+
+
+def masks_of(rows):
+    """Row masks of cell rows."""
+    return [sum(1 << x for x, cell in enumerate(row) if cell)
+            for row in rows]
+
+
+class SerialPool:
+    """Stands in for a process pool: runs every task in this process."""
+    
+    def map(self, function, tasks, chunksize=1):
+        return map(function, tasks)
+
+
+def tuner(**kwargs):
+    """A tuner small enough to run generations in a test."""
+    settings = dict(population=4, games=2, max_pieces=15, rows=12, cols=6,
+                    seed=3, workers=1)
+    settings.update(kwargs)
+    return CrossEntropyTuner(**settings)
+
+
+def tuner_state(tuner):
+    """Everything a generation decides, without timings."""
+    history = [{key: value for key, value in summary.items()
+                if key not in ("seconds", "games_per_second",
+                               "pieces_per_second")}
+               for summary in tuner.history]
+    return (tuner.generation, tuner.mean, tuner.std, tuner.best_weights,
+            tuner.best_fitness, history)
+
+
+class TestAutoPlayer:
+    @pytest.mark.parametrize("rows,cols", [(1, 1), (16, 10), (30, 64)])
+    def test_board_features_match_naive(self, rows, cols):
+        """Bitmask features equal a cell-by-cell count"""
+        rng = random.Random(rows * cols)
+        for _ in range(50):
+            cells = random_rows(rng, rows, cols)
+            masks = masks_of(cells)
+            # The bitmask version only gets rows from the first filled one
+            first = next((y for y, mask in enumerate(masks) if mask), rows)
+            assert board_features(masks[first:], cols) == \
+                naive_features(cells)
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_choose_picks_best_real_result(self, seed):
+        """The chosen placement scores best when really played out"""
+        engine = GameEngine(16, 10, seed=seed)
+        player = AutoPlayer()
+        for _ in range(30):
+            if engine.game_over:
+                break
+            state = snapshot.save_state(engine)
+            values = {}
+            for rotation, x, _ in engine.get_placements():
+                trial = snapshot.load_state(state)
+                lines = trial.lines_cleared
+                assert trial.place(rotation, x)
+                features = naive_features(trial.grid.grid)
+                values[rotation, x] = sum(
+                    weight * value for weight, value in zip(
+                        player.weights,
+                        (features[0], trial.lines_cleared - lines,
+                         features[1], features[2])
+                    )
+                )
+            choice = player.choose(engine)
+            assert values[choice] == pytest.approx(max(values.values()))
+            engine.place(*choice)
+    
+    def test_weights_are_checked(self):
+        """A player needs one weight per feature"""
+        with pytest.raises(ValueError):
+            AutoPlayer(DEFAULT_WEIGHTS[:2])
+    
+    def test_play_game_is_deterministic(self):
+        """The same seed gives the same game"""
+        first = play_game(seed=5, max_pieces=80)
+        assert play_game(seed=5, max_pieces=80) == first
+        assert first[2] == 80 and first[1] > 0
+
+
+class TestTuner:
+    def test_step_updates_distribution(self):
+        """A generation moves the mean to the elite and records it"""
+        search = tuner()
+        summary = search.step(SerialPool())
+        assert search.generation == 1
+        assert summary["best"] == search.best_fitness
+        assert summary["best"] >= summary["elite_mean"] >= summary["mean"]
+        assert all(std >= search.extra_noise for std in search.std)
+    
+    def test_resume_continues_the_same_run(self, tmp_path):
+        """Stopping and resuming gives the same result as not stopping"""
+        pool = SerialPool()
+        straight = tuner()
+        for _ in range(3):
+            straight.step(pool)
+        
+        path = str(tmp_path / "tuner.json")
+        first = tuner(checkpoint=path)
+        first.step(pool)
+        resumed = tuner(checkpoint=path)
+        assert resumed.generation == 1
+        for _ in range(2):
+            resumed.step(pool)
+        assert tuner_state(resumed) == tuner_state(straight)
+    
+    @pytest.mark.parametrize("change", [
+        {"population": 6}, {"games": 3}, {"max_pieces": 20}, {"seed": 4},
+        {"cols": 7}, {"elite_fraction": 0.5},
+    ])
+    def test_resume_refuses_other_settings(self, tmp_path, change):
+        """A checkpoint is only resumed with the settings it was made with"""
+        path = str(tmp_path / "tuner.json")
+        tuner(checkpoint=path).step(SerialPool())
+        with pytest.raises(ValueError, match="made with"):
+            tuner(checkpoint=path, **change)
+        assert tuner(checkpoint=path, workers=2).generation == 1
@@ -0,0 +1,166 @@
+"""
+Unit Tests for the Worker Dashboard
+===================================
+
+These tests verify that a worker's published state reads back from the
+shared memory segment unchanged, that a slot left half written makes
+read() give up instead of spinning, that a WorkerView shows the board
+and score of the game it follows, and that run_worker marks its slot
+finished even when it fails.
+
+To run: pytest tests/test_dashboard.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src import dashboard  # noqa: E402
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.dashboard import (  # noqa: E402
+    FINISHED, GAME_OVER, IDLE, PLAYING, SEQUENCE, SharedBoards, WorkerView,
+    run_worker,
+)
+from src.engine import GameEngine  # noqa: E402
+
+
+@pytest.fixture
+def boards():
+    """A fresh segment with three 12x6 slots."""
+    segment = SharedBoards(create=True, workers=3, rows=12, cols=6)
+    yield segment
+    segment.close()
+    segment.unlink()
+
+
+def played(seed, count, rows=12, cols=6):
+    """An engine after an AutoPlayer has placed some pieces."""
+    engine = GameEngine(rows, cols, seed=seed)
+    player = AutoPlayer()
+    for _ in range(count):
+        engine.place(*player.choose(engine))
+    return engine
+
+
+class TestSharedBoards:
+    def test_publish_read_round_trip(self, boards):
+        """Every published field and cell reads back unchanged"""
+        engine = played(1, 12)
+        boards.publish(1, engine, 3, 40, 12.5, GAME_OVER)
+        status = boards.read(1)
+        assert status.sequence == 2
+        assert (status.state, status.games, status.pieces) == (GAME_OVER, 3,
+                                                               40)
+        assert (status.score, status.level, status.lines) == (
+            engine.score, engine.level, engine.lines_cleared
+        )
+        assert status.rate == 12.5
+        assert status.cells == bytes(engine.grid.cells)
+        
+        # Other slots are untouched, and a second publish bumps the sequence
+        assert boards.read(0).state == IDLE and boards.read(0).sequence == 0
+        boards.publish(1, engine, 3, 41, 0.0)
+        assert boards.read(1)[:2] == (4, PLAYING)
+    
+    def test_attach_sees_the_same_slots(self, boards):
+        """A second mapping of the segment reads what the first wrote"""
+        engine = played(2, 5)
+        boards.publish(2, engine, 1, 5, 1.0)
+        attached = SharedBoards(boards.name)
+        assert (attached.workers, attached.rows, attached.cols) == (3, 12, 6)
+        assert attached.read(2) == boards.read(2)
+        attached.close()
+    
+    def test_half_written_slot_gives_up(self, boards):
+        """An odd sequence number that never changes ends in None"""
+        boards.publish(0, played(3, 4), 1, 4, 0.0)
+        offset = boards._offset(0)
+        SEQUENCE.pack_into(boards._buffer, offset, 3)
+        assert boards.read(0) is None
+    
+    def test_bad_segments(self, boards):
+        """Wrong boards, slots and segments are refused"""
+        with pytest.raises(ValueError):
+            boards.publish(0, GameEngine(20, 10), 1, 0, 0.0)
+        with pytest.raises(IndexError):
+            boards.read(3)
+        other = SharedBoards(create=True, workers=1)
+        other._buffer[:4] = b"NOPE"
+        with pytest.raises(ValueError):
+            SharedBoards(other.name)
+        other.close()
+        other.unlink()
+
+
+class TestWorkerView:
+    def test_refresh_follows_the_game(self, boards):
+        """The view shows the published board, score and stack height"""
+        view = WorkerView(boards, 1)
+        assert view.stack_height() == 0
+        engine = GameEngine(12, 6, seed=4)
+        player = AutoPlayer()
+        for pieces in range(1, 30):
+            if engine.game_over:
+                break
+            engine.place(*player.choose(engine))
+            boards.publish(1, engine, 1, pieces, 0.0)
+            assert view.refresh()
+            assert not view.refresh()
+            assert view.status.pieces == pieces
+            assert view.row_masks == engine.grid.row_masks
+            assert b"".join(view.board) == bytes(engine.grid.cells)
+            assert (view.score, view.level, view.lines) == (
+                engine.score, engine.level, engine.lines_cleared
+            )
+            heights = [row for row, mask in enumerate(view.row_masks) if mask]
+            assert view.stack_height() == (12 - heights[0] if heights else 0)
+        assert engine.lines_cleared > 0
+    
+    def test_game_over_and_unreadable_slot(self, boards):
+        """Game over shows; an unreadable slot keeps the last state"""
+        view = boards.views()[2]
+        engine = played(5, 6)
+        boards.publish(2, engine, 1, 6, 0.0, GAME_OVER)
+        assert view.refresh() and view.game_over
+        status = view.status
+        SEQUENCE.pack_into(boards._buffer, boards._offset(2), 7)
+        assert not view.refresh()
+        assert view.status is status and view.version == 2
+
+
+class TestRunWorker:
+    def test_games_are_published(self, boards):
+        """A worker plays games and ends with its slot finished"""
+        games, pieces = run_worker(boards.name, 0, seed=1, seconds=0.3,
+                                   max_pieces=10)
+        status = boards.read(0)
+        assert (status.state, status.games, status.pieces) == (FINISHED, games,
+                                                               pieces)
+        assert pieces > 10 and games == 1 + (pieces - 1) // 10
+    
+    def test_finished_after_an_error(self, boards, monkeypatch):
+        """A worker that fails still marks its slot finished"""
+        calls = []
+        choose = AutoPlayer.choose
+        
+        def failing(self, engine):
+            calls.append(1)
+            if len(calls) == 5:
+                raise RuntimeError("boom")
+            return choose(self, engine)
+        monkeypatch.setattr(AutoPlayer, "choose", failing)
+        with pytest.raises(RuntimeError):
+            run_worker(boards.name, 1, seed=2, seconds=30)
+        status = boards.read(1)
+        assert (status.state, status.pieces, status.sequence % 2) == (
+            FINISHED, 4, 0
+        )
+
+
+def test_shared_memory_missing(monkeypatch):
+    """Without shared memory (Python < 3.8) the error says what is needed"""
+    monkeypatch.setattr(dashboard, "shared_memory", None)
+    with pytest.raises(RuntimeError, match="3.8"):
+        SharedBoards(create=True, workers=1)
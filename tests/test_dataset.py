@@ -0,0 +1,180 @@
+"""
+Unit Tests for Training Data Shards
+===================================
+
+These tests verify that ShardWriter stores every transition exactly,
+writes a manifest that describes the shards, keeps memory bounded by
+blocking the producer when the disk falls behind, and reports a failing
+writer thread instead of hanging.
+
+To run: pytest tests/test_dataset.py -v
+"""
+
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy  # noqa: E402
+import pytest  # noqa: E402
+
+from src import dataset  # noqa: E402
+from src.dataset import ShardWriter  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+
+# Generous limit for anything that waits on the writer thread
+TIMEOUT = 10
+
+
+def transitions(count, rows=4, cols=3):
+    """Synthetic transitions whose fields all encode their index."""
+    for index in range(count):
+        board = bytes((index + cell) % 2 for cell in range(rows * cols))
+        yield (board, index % 7, (index + 1) % 7, index * 1000,
+               index, index % 5 == 4, index % 5 == 3)
+
+
+def read_back(directory):
+    """Every transition of a dataset, in order, as tuples."""
+    rows = []
+    for shard in dataset.iter_shards(directory):
+        for index in range(len(shard["action"])):
+            rows.append((shard["board"][index].tobytes(),
+                         *(shard[field][index].item()
+                           for field in dataset.FIELDS[1:])))
+    return rows
+
+
+def run_in_thread(function):
+    """Start ``function`` on a thread; its error is kept in the result."""
+    result = {}
+    
+    def target():
+        try:
+            result["value"] = function()
+        except Exception as e:
+            result["error"] = e
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    return thread, result
+
+
+class TestShardWriter:
+    @pytest.mark.parametrize("count", [0, 7, 10, 23])
+    def test_round_trip_and_manifest(self, tmp_path, count):
+        """Transitions come back unchanged; the manifest lists the shards"""
+        directory = str(tmp_path)
+        writer = ShardWriter(directory, 4, 3, shard_size=10)
+        assert writer.write_all(transitions(count)) == count
+        writer.close()
+        
+        manifest = dataset.read_manifest(directory)
+        assert manifest["transitions"] == count
+        assert (manifest["rows"], manifest["cols"]) == (4, 3)
+        assert [shard["count"] for shard in manifest["shards"]] == (
+            [10] * (count // 10) + ([count % 10] if count % 10 else [])
+        )
+        assert set(manifest["fields"]) == set(dataset.FIELDS)
+        assert read_back(directory) == [
+            (board, *rest) for board, *rest in transitions(count)
+        ]
+    
+    def test_shards_are_memory_mapped(self, tmp_path):
+        """load_shard maps the files instead of reading them"""
+        writer = ShardWriter(str(tmp_path), 4, 3, shard_size=5)
+        writer.write_all(transitions(5))
+        writer.close()
+        shard = dataset.load_shard(str(tmp_path), "shard_00000")
+        assert isinstance(shard["board"], numpy.memmap)
+        assert shard["board"].shape == (5, 4, 3)
+    
+    def test_wide_board_actions(self, tmp_path):
+        """Placement indices of wide boards do not overflow"""
+        cols = 20000
+        writer = ShardWriter(str(tmp_path), 1, cols, shard_size=2)
+        action = 3 * cols + cols - 1
+        writer.add((bytes(cols), 0, 1, action, 0, False, False))
+        writer.close()
+        assert read_back(str(tmp_path))[0][3] == action
+    
+    def test_back_pressure(self, tmp_path, monkeypatch):
+        """The producer blocks while every buffer waits for the disk"""
+        release = threading.Event()
+        save = numpy.save
+        
+        def slow_save(*args):
+            release.wait(TIMEOUT)
+            save(*args)
+        monkeypatch.setattr(dataset.numpy, "save", slow_save)
+        
+        produced = []
+        
+        def produce():
+            for transition in transitions(100):
+                produced.append(transition)
+                yield transition
+        writer = ShardWriter(str(tmp_path), 4, 3, shard_size=5,
+                             max_pending=2)
+        thread, result = run_in_thread(lambda: writer.write_all(produce()))
+        thread.join(0.5)
+        # One shard being saved, one waiting, one filling: then blocked
+        assert thread.is_alive()
+        assert len(produced) == 3 * 5
+        
+        release.set()
+        thread.join(TIMEOUT)
+        assert result == {"value": 100}
+        writer.close()
+        assert dataset.read_manifest(str(tmp_path))["transitions"] == 100
+    
+    @pytest.mark.parametrize("error", [OSError, ValueError])
+    def test_writer_failure_is_raised(self, tmp_path, monkeypatch, error):
+        """A failing writer thread surfaces in the producer, no hang"""
+        def failing_save(*args):
+            raise error("disk trouble")
+        monkeypatch.setattr(dataset.numpy, "save", failing_save)
+        
+        writer = ShardWriter(str(tmp_path), 4, 3, shard_size=5,
+                             max_pending=1)
+        
+        def produce():
+            writer.write_all(transitions(100))
+            writer.close()
+        thread, result = run_in_thread(produce)
+        thread.join(TIMEOUT)
+        assert not thread.is_alive()
+        assert isinstance(result.get("error"), error)
+        with pytest.raises(error):
+            writer.close()
+        assert not os.path.exists(os.path.join(str(tmp_path),
+                                               dataset.MANIFEST))
+
+
+class TestGenerateTransitions:
+    def test_done_and_truncated(self):
+        """Game over sets done; the piece limit sets truncated instead"""
+        policy = dataset.random_policy
+        cut = list(dataset.generate_transitions(policy, 3, max_pieces=5))
+        assert len(cut) == 15
+        assert [t[-1] for t in cut] == ([False] * 4 + [True]) * 3
+        assert not any(t[-2] for t in cut)
+        
+        full = list(dataset.generate_transitions(policy, 2, seed=4))
+        assert [t[-2] for t in full].count(True) == 2
+        assert full[-1][-2] and not any(t[-1] for t in full)
+    
+    def test_actions_replay(self):
+        """Recorded actions reproduce the game's rewards"""
+        records = list(dataset.generate_transitions(
+            dataset.random_policy, 1, seed=9, max_pieces=40
+        ))
+        engine = GameEngine(seed=9)
+        cols = engine.grid.cols
+        for board, piece, _, action, reward, _, _ in records:
+            assert engine.current_piece.shape_type == piece
+            assert board == engine.grid.cells.translate(
+                dataset.OCCUPANCY_TABLE
+            )
+            before = engine.score
+            assert engine.place(action // cols, action % cols)
+            assert engine.score - before == reward
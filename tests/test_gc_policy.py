@@ -0,0 +1,81 @@
+"""
+Unit Tests for the GC Policy
+============================
+
+These tests verify that GCPolicy takes over and gives back automatic
+garbage collection, and that its collections run at the right time.
+
+To run: pytest tests/test_gc_policy.py -v
+"""
+
+import sys
+import os
+import gc
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.gc_policy import GCPolicy  # noqa: E402
+
+
+@pytest.fixture
+def thresholds():
+    """Small, known thresholds; the originals are restored afterwards."""
+    original = gc.get_threshold()
+    enabled = gc.isenabled()
+    gc.set_threshold(50, 10, 10)
+    yield
+    gc.set_threshold(*original)
+    if enabled:
+        gc.enable()
+
+
+def allocate_until(policy, method):
+    """Allocate containers until ``method`` collects; returns the result."""
+    junk = []
+    for _ in range(100000):
+        junk.append([])
+        generation = getattr(policy, method)()
+        if generation is not None:
+            return generation
+    return None
+
+
+class TestGCPolicy:
+    def test_start_and_stop(self, thresholds):
+        """Automatic collection is off only while the policy is active"""
+        policy = GCPolicy()
+        policy.start(freeze=False)
+        assert policy.active and not gc.isenabled()
+        policy.stop()
+        assert not policy.active and gc.isenabled()
+    
+    def test_safe_point_collects_when_due(self, thresholds):
+        """A safe point collects once the young generation is full"""
+        policy = GCPolicy()
+        policy.start(freeze=False)
+        try:
+            assert allocate_until(policy, "safe_point") is not None
+            assert sum(policy.collections) == 1
+            assert policy.forced == 0
+        finally:
+            policy.stop()
+    
+    @pytest.mark.parametrize("max_backlog", [0, 1, 2, 20])
+    def test_frame_finished_valve(self, thresholds, max_backlog):
+        """The safety valve collects for any backlog setting"""
+        policy = GCPolicy(max_backlog=max_backlog)
+        policy.start(freeze=False)
+        try:
+            generation = allocate_until(policy, "frame_finished")
+            assert generation in (0, 1, 2)
+            assert policy.forced == 1
+            assert policy.max_pause_ns <= policy.pause_ns
+        finally:
+            policy.stop()
+    
+    def test_inactive_policy_does_nothing(self):
+        """Safe points before start never collect"""
+        policy = GCPolicy()
+        assert policy.safe_point() is None
+        assert policy.frame_finished() is None
@@ -8,52 +8,219 @@ These tests verify the Grid class functionality including:
 - Piece locking
 - Game over detection
 
+The bitmask rows, packed cells and ``top`` marker are checked against
+a naive reference that only looks at ``grid`` cell by cell.
+
 To run: pytest tests/test_grid.py -v
 """
 
 import sys
 import os
+import random
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-# TODO: Add pytest and implement tests
-#
-# Example test structure:
-#
-# import pytest
-# from src.grid import Grid
-# from src.tetromino import Tetromino
-# from src.config import Config
-#
-# class TestGrid:
-#     def test_initialization(self):
-#         """Test grid initializes empty"""
-#         grid = Grid()
-#         assert len(grid.grid) == Config.ROWS
-#         assert len(grid.grid[0]) == Config.COLUMNS
-#         assert all(cell == 0 for row in grid.grid for cell in row)
-#     
-#     def test_valid_position(self):
-#         """Test position validation"""
-#         grid = Grid()
-#         piece = Tetromino(0)
-#         piece.x = 0
-#         piece.y = 0
-#         assert grid.is_valid_position(piece, 0, 0)
-#     
-#     def test_invalid_position_out_of_bounds(self):
-#         """Test out of bounds detection"""
-#         grid = Grid()
-#         piece = Tetromino(0)
-#         piece.x = -1  # Out of bounds
-#         assert not grid.is_valid_position(piece, 0, 0)
-#     
-#     def test_clear_full_rows(self):
-#         """Test row clearing"""
-#         grid = Grid()
-#         # Fill bottom row
-#         grid.grid[-1] = [Config.RED] * Config.COLUMNS
-#         rows_cleared = grid.clear_full_rows()
-#         assert rows_cleared == 1
-#         assert all(cell == 0 for cell in grid.grid[-1])
-
-print("Grid tests not yet implemented. Run: pip install pytest")
+import pytest  # noqa: E402
+
+from src.config import Config  # noqa: E402
+from src.grid import Grid  # noqa: E402
+from src.tetromino import Tetromino  # noqa: E402
+
+
+def naive_valid(grid, piece, offset_x=0, offset_y=0):
+    """Reference collision check, one cell at a time."""
+    for row_idx, row in enumerate(piece.shape):
+        for col_idx, cell in enumerate(row):
+            if not cell:
+                continue
+            x = piece.x + offset_x + col_idx
+            y = piece.y + offset_y + row_idx
+            if x < 0 or x >= grid.cols or y >= grid.rows:
+                return False
+            if y >= 0 and grid.grid[y][x]:
+                return False
+    return True
+
+
+def naive_clear(rows):
+    """Reference line clear on a list of rows."""
+    kept = [row for row in rows if not all(row)]
+    cleared = len(rows) - len(kept)
+    return cleared, [[0] * len(rows[0]) for _ in range(cleared)] + kept
+
+
+def check_invariants(grid):
+    """Masks, cells and ``top`` must all agree with ``grid``."""
+    for y, row in enumerate(grid.grid):
+        assert grid.row_masks[y] == sum(
+            1 << x for x, cell in enumerate(row) if cell
+        )
+        assert list(grid.cells[y * grid.cols:(y + 1) * grid.cols]) == [
+            Config.COLOR_INDEX[cell] if cell else 0 for cell in row
+        ]
+    # Every row above top is empty
+    assert not any(grid.row_masks[:grid.top])
+    assert 0 <= grid.top <= grid.rows
+
+
+def random_grid(rng, rows, cols, density=0.6):
+    """A grid with random filled cells below a random stack height."""
+    grid = Grid(rows, cols)
+    height = rng.randrange(rows)
+    for y in range(rows - height, rows):
+        for x in range(cols):
+            if rng.random() < density:
+                grid.set_cell(x, y, rng.choice(Config.COLORS))
+        if rng.random() < 0.3:
+            for x in range(cols):
+                grid.set_cell(x, y, rng.choice(Config.COLORS))
+    return grid
+
+
+class TestGrid:
+    def test_initialization(self):
+        """Test grid initializes empty"""
+        grid = Grid()
+        assert len(grid.grid) == Config.ROWS
+        assert len(grid.grid[0]) == Config.COLUMNS
+        assert all(cell == 0 for row in grid.grid for cell in row)
+        assert grid.top == grid.rows
+        check_invariants(grid)
+    
+    def test_rejects_empty_board(self):
+        """A board needs at least one row and one column"""
+        with pytest.raises(ValueError):
+            Grid(0, 10)
+    
+    @pytest.mark.parametrize("cols", [4, 10, 64, 200])
+    def test_collision_matches_naive(self, cols):
+        """Bitmask collision equals the cell-by-cell check"""
+        rng = random.Random(cols)
+        for _ in range(8):
+            grid = random_grid(rng, 12, cols)
+            for shape_type in range(len(Config.SHAPES)):
+                piece = Tetromino(shape_type, cols, rng)
+                for _ in range(rng.randrange(4)):
+                    piece.rotate_clockwise()
+                for x in range(-3, cols + 1):
+                    for y in range(-3, 13):
+                        piece.x, piece.y = x, y
+                        assert grid.is_valid_position(piece) == (
+                            naive_valid(grid, piece)
+                        )
+    
+    def test_drop_distance_matches_naive(self):
+        """Jumping through empty rows lands where stepping would"""
+        rng = random.Random(1)
+        for _ in range(100):
+            grid = random_grid(rng, 16, 10)
+            piece = Tetromino(rng.randrange(len(Config.SHAPES)), 10, rng)
+            piece.y = -2
+            if not grid.is_valid_position(piece):
+                continue
+            distance = 0
+            while naive_valid(grid, piece, 0, distance + 1):
+                distance += 1
+            assert grid.get_drop_distance(piece) == distance
+    
+    @pytest.mark.parametrize("rows,cols", [(1, 1), (16, 10), (40, 64)])
+    def test_clear_full_rows_matches_naive(self, rows, cols):
+        """Row clearing equals the naive list version"""
+        rng = random.Random(rows * cols)
+        for _ in range(50):
+            grid = random_grid(rng, rows, cols)
+            expected_cleared, expected = naive_clear(
+                [row[:] for row in grid.grid]
+            )
+            assert grid.clear_full_rows() == expected_cleared
+            assert grid.grid == expected
+            check_invariants(grid)
+    
+    def test_clear_bottom_row(self):
+        """Test row clearing"""
+        grid = Grid()
+        for x in range(grid.cols):
+            grid.set_cell(x, grid.rows - 1, Config.RED)
+        grid.set_cell(0, grid.rows - 2, Config.BLUE)
+        assert grid.clear_full_rows() == 1
+        assert grid.grid[-1][0] == Config.BLUE
+        assert all(cell == 0 for cell in grid.grid[-1][1:])
+        assert grid.top == grid.rows - 1
+        check_invariants(grid)
+    
+    def test_top_after_locks_and_clears(self):
+        """``top`` stays valid through a long random game"""
+        rng = random.Random(7)
+        grid = Grid(16, 10)
+        for _ in range(300):
+            piece = Tetromino(rng.randrange(len(Config.SHAPES)), 10, rng)
+            piece.x = rng.randrange(10 - piece.get_width() + 1)
+            if not grid.is_valid_position(piece):
+                grid.clear()
+                continue
+            piece.y += grid.get_drop_distance(piece)
+            touched = grid.lock_tetromino(piece)
+            check_invariants(grid)
+            grid.clear_full_rows(touched)
+            check_invariants(grid)
+    
+    @pytest.mark.parametrize("rows,cols", [(16, 10), (40, 4), (30, 64)])
+    def test_clear_touched_rows_matches_full_scan(self, rows, cols):
+        """Testing only the locked piece's rows finds every full row"""
+        rng = random.Random(rows + cols)
+        grid = Grid(rows, cols)
+        cleared = 0
+        for _ in range(400):
+            if not grid.row_masks[-1]:
+                # Rows missing one cell, so drops often complete them
+                for y in range(rows // 2, rows):
+                    hole = rng.randrange(cols)
+                    for x in range(cols):
+                        if x != hole:
+                            grid.set_cell(x, y, Config.RED)
+            piece = Tetromino(rng.randrange(len(Config.SHAPES)), cols, rng)
+            piece.x = rng.randrange(cols - piece.get_width() + 1)
+            if not grid.is_valid_position(piece):
+                grid.clear()
+                continue
+            piece.y += grid.get_drop_distance(piece)
+            touched = grid.lock_tetromino(piece)
+            assert touched == sorted({piece.y + dy for dy, row
+                                      in enumerate(piece.shape) if any(row)})
+            expected_cleared, expected = naive_clear(
+                [row[:] for row in grid.grid]
+            )
+            assert grid.clear_full_rows(touched) == expected_cleared
+            assert grid.grid == expected
+            check_invariants(grid)
+            cleared += expected_cleared
+        assert cleared
+    
+    def test_add_garbage(self):
+        """Garbage rows come in from the bottom with one hole"""
+        grid = Grid(6, 5)
+        grid.set_cell(2, 5, Config.RED)
+        assert not grid.add_garbage(2, hole=1)
+        assert grid.grid[3][2] == Config.RED
+        for y in (4, 5):
+            assert grid.grid[y][1] == 0
+            assert grid.row_masks[y] == grid.full_mask & ~(1 << 1)
+        check_invariants(grid)
+        assert grid.add_garbage(6, hole=0)
+    
+    def test_load_cells_round_trip(self):
+        """Packed cells rebuild the same grid, masks and top"""
+        rng = random.Random(3)
+        for _ in range(30):
+            grid = random_grid(rng, 16, 10)
+            copy = Grid(16, 10)
+            copy.load_cells(bytes(grid.cells))
+            assert copy.grid == grid.grid
+            assert copy.row_masks == grid.row_masks
+            check_invariants(copy)
+    
+    def test_game_over(self):
+        """Blocks in the top row end the game"""
+        grid = Grid()
+        assert not grid.is_game_over()
+        grid.set_cell(0, 0, Config.RED)
+        assert grid.is_game_over()
@@ -0,0 +1,69 @@
+"""
+Unit Tests for the Leaderboard
+==============================
+
+These tests verify the SQLite leaderboard with its background writer,
+for both a database file and an in-memory database.
+
+To run: pytest tests/test_leaderboard.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.leaderboard import Leaderboard  # noqa: E402
+
+
+@pytest.fixture(params=["file", "memory"])
+def board(request, tmp_path):
+    """A leaderboard on a temporary file or in memory."""
+    if request.param == "file":
+        path = str(tmp_path / "scores.db")
+    else:
+        path = ":memory:"
+    leaderboard = Leaderboard(path, cache_size=3, flush_interval=0.01)
+    yield leaderboard
+    leaderboard.close()
+
+
+class TestLeaderboard:
+    def test_top_scores(self, board):
+        """Cached and database reads agree on the order"""
+        for score in (50, 10, 90, 30, 70):
+            board.record("ann" if score % 20 else "bob", score, 1, 0)
+        assert board.high_score() == 90
+        assert [entry[1] for entry in board.top()] == [90, 70, 50]
+        assert [entry[1] for entry in board.top(5)] == [90, 70, 50, 30, 10]
+    
+    def test_player_scores(self, board):
+        """A player's best scores come from the database"""
+        for player, score in (("ann", 50), ("bob", 10), ("ann", 90),
+                              ("bob", 30), ("ann", 70)):
+            board.record(player, score, 1, 0)
+        assert [entry[1] for entry in board.player_scores("ann")] == [
+            90, 70, 50
+        ]
+        assert [entry[1] for entry in board.player_scores("bob", 1)] == [30]
+        assert board.player_scores("cid") == []
+    
+    def test_scores_survive_reopening(self, tmp_path):
+        """A database file keeps its scores"""
+        path = str(tmp_path / "scores.db")
+        board = Leaderboard(path)
+        board.record("ann", 40, 2, 5)
+        board.close()
+        reopened = Leaderboard(path)
+        try:
+            assert reopened.high_score() == 40
+        finally:
+            reopened.close()
+    
+    def test_record_after_close(self, board):
+        """Recording on a closed leaderboard fails instead of hanging"""
+        board.close()
+        with pytest.raises(RuntimeError):
+            board.record("ann", 10, 1, 0)
+        board.flush()
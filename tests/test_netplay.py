@@ -0,0 +1,170 @@
+"""
+Unit Tests for Rollback Netplay
+===============================
+
+These tests verify what rollback netplay depends on: a restored match
+continues exactly like the original, so resimulating mispredicted
+ticks reaches the same checksum as never mispredicting. Two sessions
+are also run against each other over an in-process network with
+latency and packet loss, and must end in identical states.
+
+To run: pytest tests/test_netplay.py -v
+"""
+
+import sys
+import os
+import collections
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.netplay import (  # noqa: E402
+    BotController, DesyncError, NetMatch, RollbackSession, checksum,
+    DOWN, DROP, LEFT, PREDICTED_INPUT, RIGHT, ROTATE,
+)
+
+BUTTONS = [ROTATE, LEFT, RIGHT, DOWN, DROP, LEFT | ROTATE, RIGHT | DOWN]
+
+
+def random_inputs(rng, ticks):
+    """Button pairs for a number of ticks, mostly no buttons."""
+    def buttons():
+        return rng.choice(BUTTONS) if rng.random() < 0.3 else 0
+    return [(buttons(), buttons()) for _ in range(ticks)]
+
+
+class FakeLink:
+    """
+    One direction of an in-process network: packets arrive a few
+    deliveries late, some never.
+    """
+    
+    def __init__(self, rng, latency, loss):
+        self.rng = rng
+        self.latency = latency
+        self.loss = loss
+        self.in_flight = collections.deque()
+        self.time = 0
+    
+    def send(self, data):
+        if self.rng.random() >= self.loss:
+            self.in_flight.append((self.time + self.latency, data))
+    
+    def deliver(self):
+        self.time += 1
+        packets = []
+        while self.in_flight and self.in_flight[0][0] <= self.time:
+            packets.append(self.in_flight.popleft()[1])
+        return packets
+
+
+class FakeTransport:
+    """Transport of one peer: sends on one link, receives from the other."""
+    
+    def __init__(self, outgoing, incoming):
+        self.outgoing = outgoing
+        self.incoming = incoming
+    
+    def send(self, data):
+        self.outgoing.send(data)
+    
+    def receive(self):
+        return self.incoming.deliver()
+
+
+def connected_sessions(seed, latency, loss, **kwargs):
+    """Two sessions of one match, linked by a lossy fake network."""
+    rng = random.Random(seed)
+    links = [FakeLink(rng, latency, loss), FakeLink(rng, latency, loss)]
+    return [
+        RollbackSession(NetMatch(seed), player,
+                        FakeTransport(links[player], links[1 - player]),
+                        **kwargs)
+        for player in (0, 1)
+    ]
+
+
+def play(sessions, ticks, corrupt_at=None):
+    """Let two bots play until both have confirmed ``ticks`` ticks."""
+    bots = [BotController(drop_after=3), BotController(drop_after=3)]
+    for _ in range(ticks * 20):
+        if all(session.confirmed >= ticks and session.tick >= ticks
+               for session in sessions):
+            return
+        for player, session in enumerate(sessions):
+            if session.tick < ticks:
+                engine = session.match.engines[player]
+                session.advance(bots[player].buttons(engine))
+                if session.tick == corrupt_at and player == 1:
+                    session.match.elapsed += 1
+            else:
+                session.poll()
+                session.send()
+    raise AssertionError("The sessions stopped making progress")
+
+
+class TestNetMatch:
+    def test_save_restore_round_trip(self):
+        """Saving a restored match gives the same bytes"""
+        match = NetMatch(seed=4)
+        for inputs in random_inputs(random.Random(4), 300):
+            match.step(inputs)
+        state = match.save()
+        other = NetMatch(seed=99)
+        other.restore(state)
+        assert other.save() == state
+        assert other.tick == match.tick
+    
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_resimulation_reaches_the_same_checksum(self, seed):
+        """Restore, then resimulate with the real inputs, as a rollback"""
+        rng = random.Random(seed)
+        inputs = random_inputs(rng, 900)
+        reference = NetMatch(seed)
+        expected = []
+        for pair in inputs:
+            reference.step(pair)
+            expected.append(checksum(reference.save()))
+        
+        match = NetMatch(seed)
+        tick = 0
+        while tick < len(inputs):
+            # Predict the remote player, then roll back and correct
+            depth = min(rng.randrange(1, 9), len(inputs) - tick)
+            state = match.save()
+            for pair in inputs[tick:tick + depth]:
+                match.step((pair[0], PREDICTED_INPUT))
+            match.restore(state)
+            for pair in inputs[tick:tick + depth]:
+                match.step(pair)
+                assert checksum(match.save()) == expected[tick]
+                tick += 1
+        assert match.save() == reference.save()
+    
+    def test_different_inputs_change_the_checksum(self):
+        """The checksum notices a diverged state"""
+        first, second = NetMatch(5), NetMatch(5)
+        first.step((LEFT, 0))
+        second.step((RIGHT, 0))
+        assert checksum(first.save()) != checksum(second.save())
+
+
+class TestRollbackSession:
+    @pytest.mark.parametrize("latency,loss", [(0, 0.0), (3, 0.1), (6, 0.3)])
+    def test_peers_end_in_the_same_state(self, latency, loss):
+        """Both peers agree despite latency, loss and rollbacks"""
+        sessions = connected_sessions(7, latency, loss,
+                                      checksum_interval=10)
+        play(sessions, 600)
+        states = [session.match.save() for session in sessions]
+        assert states[0] == states[1]
+        assert all(session.checksums_verified for session in sessions)
+        if latency:
+            assert any(session.rollbacks for session in sessions)
+    
+    def test_desync_is_detected(self):
+        """A peer whose simulation differs is caught by the checksums"""
+        sessions = connected_sessions(8, 2, 0.0, checksum_interval=10)
+        with pytest.raises(DesyncError):
+            play(sessions, 600, corrupt_at=100)
@@ -0,0 +1,170 @@
+"""
+Unit Tests for the Placement Cache
+==================================
+
+These tests verify that placements stored in a cache file come back
+after reopening it, that the table rehashes every entry when it grows
+past its load limit, that a cache only opens for the player it belongs
+to, that a read-only cache never changes its file, and that the
+in-memory LRU evicts the least recently used position.
+
+To run: pytest tests/test_placement_cache.py -v
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.autoplayer import AutoPlayer, play_game  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.placement_cache import (  # noqa: E402
+    HEADER, MAX_LOAD, SLOT, PlacementCache, position_key,
+)
+
+POLICY = b"test-policy"
+
+
+def keys(count, seed=0):
+    """Random distinct 16 byte keys."""
+    rng = random.Random(seed)
+    return [bytes(rng.randrange(256) for _ in range(16))
+            for _ in range(count)]
+
+
+def placement(index):
+    """A placement derived from an index."""
+    return (index % 4, index % 11 - 1)
+
+
+class TestPlacementCache:
+    def test_put_get_across_reopen(self, tmp_path):
+        """Stored placements are read back from the file after reopening"""
+        path = str(tmp_path / "book.cache")
+        cache = PlacementCache(path, POLICY)
+        for index, key in enumerate(keys(100)):
+            cache.put(key, placement(index))
+        cache.close()
+        
+        cache = PlacementCache(path, POLICY)
+        assert len(cache) == 100
+        for index, key in enumerate(keys(100)):
+            assert cache.get(key) == placement(index)
+        assert cache.disk_hits == 100 and cache.misses == 0
+        assert cache.get(keys(1, seed=9)[0]) is None
+        assert cache.misses == 1
+        cache.close()
+    
+    def test_overwrite_keeps_one_entry(self, tmp_path):
+        """Storing a known position again replaces its placement"""
+        cache = PlacementCache(str(tmp_path / "book.cache"), POLICY)
+        key = keys(1)[0]
+        cache.put(key, (1, 2))
+        cache.put(key, (3, 4))
+        assert len(cache) == 1
+        cache._memory.clear()
+        assert cache.get(key) == (3, 4)
+        cache.close()
+    
+    def test_grow_rehashes_every_entry(self, tmp_path):
+        """Past 70% load the table doubles and every key is still found"""
+        path = str(tmp_path / "book.cache")
+        cache = PlacementCache(path, POLICY, slots=8, memory_size=0)
+        stored = keys(200)
+        for index, key in enumerate(stored):
+            cache.put(key, placement(index))
+            assert cache.entries <= cache.slots * MAX_LOAD
+        assert cache.slots == 512
+        assert not os.path.exists(path + ".tmp")
+        cache.close()
+        
+        assert os.path.getsize(path) == HEADER.size + 512 * SLOT.size
+        cache = PlacementCache(path, POLICY, memory_size=0)
+        assert (cache.slots, len(cache)) == (512, 200)
+        for index, key in enumerate(stored):
+            assert cache.get(key) == placement(index)
+        cache.close()
+    
+    def test_policy_mismatch(self, tmp_path):
+        """A cache only opens for the player that filled it"""
+        path = str(tmp_path / "book.cache")
+        cache = PlacementCache(path, POLICY)
+        with pytest.raises(ValueError):
+            AutoPlayer(cache=cache)
+        cache.close()
+        with pytest.raises(ValueError):
+            PlacementCache(path, b"other-policy")
+        with pytest.raises(ValueError):
+            PlacementCache(path, b"other-policy", readonly=True)
+        
+        other = tmp_path / "other.cache"
+        other.write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError):
+            PlacementCache(str(other), POLICY)
+    
+    def test_readonly_never_writes(self, tmp_path):
+        """A read-only cache answers from memory and leaves the file alone"""
+        path = str(tmp_path / "book.cache")
+        cache = PlacementCache(path, POLICY, slots=8)
+        cache.put(keys(1)[0], (1, 1))
+        cache.close()
+        before = open(path, "rb").read()
+        
+        readonly = PlacementCache(path, POLICY, readonly=True)
+        for index, key in enumerate(keys(50, seed=1)):
+            readonly.put(key, placement(index))
+            assert readonly.get(key) == placement(index)
+        assert len(readonly) == 1 and readonly.slots == 8
+        readonly.close()
+        assert open(path, "rb").read() == before
+        
+        with pytest.raises(FileNotFoundError):
+            PlacementCache(str(tmp_path / "missing.cache"), POLICY,
+                           readonly=True)
+    
+    def test_lru_eviction(self, tmp_path):
+        """The least recently used position leaves memory first"""
+        cache = PlacementCache(str(tmp_path / "book.cache"), POLICY,
+                               memory_size=2)
+        a, b, c = keys(3)
+        cache.put(a, (0, 0))
+        cache.put(b, (1, 1))
+        assert cache.get(a) == (0, 0)
+        cache.put(c, (2, 2))
+        assert list(cache._memory) == [a, c]
+        
+        assert cache.get(c) == (2, 2)
+        assert cache.hits == 2 and cache.disk_hits == 0
+        # b was evicted from memory but is still in the file
+        assert cache.get(b) == (1, 1)
+        assert cache.disk_hits == 1
+        assert list(cache._memory) == [c, b]
+        cache.close()
+
+
+class TestPositionKey:
+    def test_key_depends_on_the_whole_position(self):
+        """Equal positions share a key; any difference changes it"""
+        first, second = GameEngine(seed=1), GameEngine(seed=1)
+        key = position_key(first.grid, first.current_piece, 2)
+        assert position_key(second.grid, second.current_piece, 2) == key
+        assert position_key(first.grid, first.current_piece, 3) != key
+        first.place(0, 0)
+        second.place(0, 1)
+        assert position_key(first.grid, first.current_piece, 2) != \
+            position_key(second.grid, second.current_piece, 2)
+    
+    def test_cached_player_plays_the_same_game(self, tmp_path):
+        """Replaying a game from the cache gives the same result"""
+        path = str(tmp_path / "book.cache")
+        policy = AutoPlayer().policy
+        cache = PlacementCache(path, policy)
+        first = play_game(seed=4, max_pieces=60, cache=cache)
+        cache.close()
+        
+        cache = PlacementCache(path, policy)
+        assert play_game(seed=4, max_pieces=60, cache=cache) == first
+        assert cache.misses == 0 and cache.disk_hits > 0
+        cache.close()
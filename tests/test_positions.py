@@ -0,0 +1,118 @@
+"""
+Unit Tests for Generated Positions
+==================================
+
+These tests verify that the batched board generator only produces
+boards a real game could reach: replaying the recorded placements
+through GameEngine must give the same cells, and every board must
+follow the Grid rules and meet the requested height and hole ranges.
+
+To run: pytest tests/test_positions.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy  # noqa: E402
+import pytest  # noqa: E402
+
+from src import positions  # noqa: E402
+
+
+class TestGenerate:
+    @pytest.mark.parametrize("rows,cols,well", [(20, 10, 0.5), (12, 6, 0.0),
+                                                (24, 14, 1.0)])
+    def test_verify_replays_every_board(self, rows, cols, well):
+        """Every recorded board is reproduced by GameEngine"""
+        batch, placements = positions.generate(
+            300, rows, cols, height=(2, 8), holes=(0, 5), well=well,
+            seed=rows, record=True
+        )
+        assert positions.verify(batch, placements, range(300)) == 300
+    
+    def test_verify_notices_a_changed_board(self):
+        """A board that differs from its replay raises ValueError"""
+        batch, placements = positions.generate(20, seed=1, record=True)
+        board = int(numpy.flatnonzero(batch.pieces)[0])
+        batch.boards[board] = 0
+        with pytest.raises(ValueError):
+            positions.verify(batch, placements, [board])
+    
+    def test_boards_follow_grid_rules(self):
+        """No full rows, only piece colors, free spawn rows"""
+        batch = positions.generate(2000, height=(6, 14), holes=(0, 8),
+                                   seed=2)
+        assert positions.validate(batch.boards).all()
+        assert (batch.heights <= batch.boards.shape[1]
+                - positions.SPAWN_ROWS).all()
+        assert (batch.holes >= 0).all()
+    
+    def test_wells_stay_empty(self):
+        """Boards with a well never fill that column"""
+        batch = positions.generate(500, well=1.0, seed=3)
+        filled = positions.occupancy(batch.boards)
+        for board, well in enumerate(batch.wells):
+            assert not filled[board, :, well].any()
+        assert not batch.lines.any()
+    
+    def test_same_seed_same_boards(self):
+        """The seed decides the batch"""
+        first = positions.generate(200, seed=4)
+        second = positions.generate(200, seed=4)
+        assert all(numpy.array_equal(a, b) for a, b in zip(first, second))
+        other = positions.generate(200, seed=5)
+        assert not numpy.array_equal(first.boards, other.boards)
+    
+    @pytest.mark.parametrize("rows,height,holes", [
+        (10, (20, 30), (0, 6)),
+        (20, (8, 4), (0, 6)),
+        (20, (-1, 4), (0, 6)),
+        (20, (4, 10), (6, 0)),
+    ])
+    def test_rejects_bad_ranges(self, rows, height, holes):
+        """Ranges that cannot be met raise a clear ValueError"""
+        with pytest.raises(ValueError, match="range|does not fit"):
+            positions.generate(10, rows, height=height, holes=holes)
+    
+    @pytest.mark.parametrize("rows,cols,height,holes,well", [
+        (20, 10, (4, 10), (0, 6), 0.5),
+        (20, 10, (4, 4), (0, 0), 0.0),
+        (12, 6, (2, 8), (1, 3), 1.0),
+        (24, 14, (8, 12), (2, 6), 0.5),
+    ])
+    def test_every_board_meets_its_ranges(self, rows, cols, height, holes,
+                                          well):
+        """Boards that overshoot or fall short are generated again"""
+        batch, placements = positions.generate(
+            1000, rows, cols, height=height, holes=holes, well=well,
+            seed=8, record=True
+        )
+        assert ((batch.heights >= height[0])
+                & (batch.heights <= height[1])).all()
+        assert ((batch.holes >= holes[0]) & (batch.holes <= holes[1])).all()
+        filled = positions.occupancy(batch.boards)
+        covered = numpy.logical_or.accumulate(filled, axis=1)
+        assert (batch.holes == (covered & ~filled).sum(axis=(1, 2))).all()
+        assert positions.verify(batch, placements, range(0, 1000, 7)) == 143
+    
+    def test_unreachable_ranges_raise(self):
+        """Ranges no board can meet fail instead of returning misses"""
+        with pytest.raises(ValueError, match="after 3 attempts"):
+            positions.generate(50, 12, 6, height=(2, 3), holes=(20, 30),
+                               attempts=3)
+    
+    def test_height_range_is_clamped_to_the_board(self):
+        """A maximum above the free rows is lowered, not rejected"""
+        batch = positions.generate(300, rows=10, height=(3, 30), seed=6)
+        assert (batch.heights <= 10 - positions.SPAWN_ROWS).all()
+        assert positions.validate(batch.boards).all()
+    
+    def test_file_round_trip(self, tmp_path):
+        """Batches survive a trip through a file"""
+        batch = positions.generate(100, seed=7)
+        path = str(tmp_path / "positions.npz")
+        positions.save(path, batch)
+        loaded = positions.load(path)
+        assert loaded._fields == batch._fields
+        assert all(numpy.array_equal(a, b) for a, b in zip(loaded, batch))
@@ -0,0 +1,151 @@
+"""
+Unit Tests for Replays
+======================
+
+These tests verify that seeking in a replay, with or without its
+keyframe index, reaches exactly the state the recorded game was in
+after the same number of inputs.
+
+To run: pytest tests/test_replay.py -v
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src import snapshot  # noqa: E402
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.replay import (  # noqa: E402
+    Replay, ReplayRecorder, build_index, index_path, read_index,
+)
+
+
+def record(path, seed, inputs=3000, piece_interval=5, step_interval=200):
+    """
+    Record a game played by the AutoPlayer through every kind of input.
+    
+    Returns:
+        tuple: (snapshot after every input, pieces locked after every
+               input); index 0 is the start of the game
+    """
+    rng = random.Random(seed)
+    recorder = ReplayRecorder(path, 16, 10, seed=seed,
+                              piece_interval=piece_interval,
+                              step_interval=step_interval)
+    engine = recorder.engine
+    player = AutoPlayer()
+    states = [snapshot.save_state(engine)]
+    pieces = [0]
+    
+    def send(action, *args):
+        result = getattr(recorder, action)(*args)
+        states.append(snapshot.save_state(engine))
+        pieces.append(recorder.pieces)
+        return result
+    
+    while recorder.steps < inputs and not engine.game_over:
+        rotation, x = player(engine)
+        style = rng.random()
+        if style < 0.2:
+            send("place", rotation, x)
+            continue
+        for _ in range(rotation):
+            send("rotate")
+        while engine.current_piece.x != x:
+            if not send("move", 1 if x > engine.current_piece.x else -1):
+                break
+        piece = engine.current_piece
+        if style < 0.4:
+            send("hard_drop")
+        while engine.current_piece is piece:
+            if rng.random() < 0.2:
+                send("soft_drop")
+            else:
+                send("update", rng.choice((16, 17, 100)))
+    recorder.close()
+    return states, pieces
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """A recorded replay with its expected states."""
+    path = str(tmp_path / "game.rpl")
+    states, pieces = record(path, seed=3)
+    return path, states, pieces
+
+
+class TestReplay:
+    def test_plays_back_every_input(self, recording):
+        """Stepping through the replay matches the recording"""
+        path, states, _ = recording
+        replay = Replay(path)
+        assert replay.length == len(states) - 1
+        for expected in states[1:]:
+            assert replay.advance() == 1
+            assert snapshot.save_state(replay.engine) == expected
+        assert replay.advance() == 0
+        replay.close()
+    
+    @pytest.mark.parametrize("indexed", [True, False])
+    def test_seek_equals_recording(self, recording, indexed):
+        """Random seeks, forwards and backwards, reach the same state"""
+        path, states, _ = recording
+        if not indexed:
+            os.remove(index_path(path))
+        replay = Replay(path)
+        assert bool(replay.keyframes) == indexed
+        rng = random.Random(1)
+        targets = [rng.randrange(len(states)) for _ in range(40)]
+        for target in targets + [0, len(states) - 1, len(states) + 10]:
+            replay.seek(target)
+            step = min(target, len(states) - 1)
+            assert replay.step == step
+            assert snapshot.save_state(replay.engine) == states[step]
+        replay.close()
+    
+    def test_seek_piece(self, recording):
+        """Seeking to a piece stops at the input that locked it"""
+        path, states, pieces = recording
+        replay = Replay(path)
+        rng = random.Random(2)
+        for target in rng.sample(range(1, pieces[-1] + 1), 15):
+            replay.seek_piece(target)
+            step = pieces.index(target)
+            assert replay.step == step
+            assert snapshot.save_state(replay.engine) == states[step]
+        replay.close()
+    
+    def test_seek_piece_every_count(self, tmp_path):
+        """Step keyframes taken after a lock never make a seek overshoot"""
+        path = str(tmp_path / "game.rpl")
+        states, pieces = record(path, seed=5, inputs=1500,
+                                piece_interval=1000, step_interval=7)
+        replay = Replay(path)
+        assert len(replay.keyframes) > 100
+        targets = list(range(pieces[-1] + 1))
+        random.Random(3).shuffle(targets)
+        for target in list(range(pieces[-1] + 1)) + targets:
+            replay.seek_piece(target)
+            step = pieces.index(target)
+            assert replay.step == step
+            assert snapshot.save_state(replay.engine) == states[step]
+        replay.close()
+    
+    def test_build_index_matches_recorder(self, recording):
+        """An index built afterwards equals the one written live"""
+        path, _, _ = recording
+        written = read_index(index_path(path))
+        os.remove(index_path(path))
+        assert build_index(path, piece_interval=5,
+                           step_interval=200) == len(written)
+        assert read_index(index_path(path)) == written
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Opening a file that is not a replay raises ValueError"""
+        path = tmp_path / "other.rpl"
+        path.write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError):
+            Replay(str(path))
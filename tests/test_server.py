@@ -0,0 +1,241 @@
+"""
+Unit Tests for the Game Server
+==============================
+
+These tests run a real GameServer on a free local port and talk to it
+over TCP: joining a game, sending inputs, asking for stats and watching
+another session. Input flooding and slow spectators are tested on a
+GameSession with a fake connection whose send buffer can be filled.
+
+To run: pytest tests/test_server.py -v
+"""
+
+import sys
+import os
+import asyncio
+import json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.server import (  # noqa: E402
+    GameServer, GameSession, MAX_QUEUED_INPUTS, MAX_WRITE_BUFFER,
+)
+from src.spectator import (  # noqa: E402
+    DeltaEncoder, SpectatorView, FRAME_LENGTH,
+)
+
+# Generous limit for every network read in these tests
+TIMEOUT = 5
+
+
+class FakeTransport:
+    """Transport whose send buffer size is set by the test."""
+    
+    def __init__(self):
+        self.buffered = 0
+    
+    def get_write_buffer_size(self):
+        return self.buffered
+
+
+class FakeWriter:
+    """Collects everything written to it."""
+    
+    def __init__(self):
+        self.transport = FakeTransport()
+        self.data = bytearray()
+        self.closed = False
+    
+    def write(self, data):
+        self.data += data
+    
+    def close(self):
+        self.closed = True
+
+
+def run(coroutine):
+    """Run a test coroutine against a fresh server on a free port."""
+    async def main():
+        server = GameServer(port=0, tick_rate=200)
+        await server.start()
+        try:
+            await asyncio.wait_for(coroutine(server), TIMEOUT)
+        finally:
+            await server.stop()
+    asyncio.run(main())
+
+
+async def connect(server):
+    """Open a client connection and read its session id."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+    session_id = json.loads(await reader.readline())["session"]
+    return reader, writer, session_id
+
+
+async def read_reply(reader, key):
+    """Skip state updates until a line with ``key`` arrives."""
+    while True:
+        message = json.loads(await reader.readline())
+        if key in message:
+            return message
+
+
+def frames(data):
+    """Split length-prefixed spectator frames."""
+    frames = []
+    offset = 0
+    while offset < len(data):
+        (length,) = FRAME_LENGTH.unpack_from(data, offset)
+        offset += FRAME_LENGTH.size
+        frames.append(bytes(data[offset:offset + length]))
+        offset += length
+    return frames
+
+
+def spectator_view(frames):
+    """A view with every frame applied."""
+    view = SpectatorView()
+    for frame in frames:
+        view.apply(frame)
+    return view
+
+
+def full_view(engine):
+    """A view built from one keyframe of the engine's state."""
+    return spectator_view([DeltaEncoder().encode(engine)])
+
+
+def view_state(view):
+    """Everything a viewer can see."""
+    return ([bytes(row) for row in view.board], view.piece, view.score,
+            view.level, view.lines, view.game_over)
+
+
+class TestGameServer:
+    def test_join_and_play(self):
+        """A client gets a session, states, and its inputs are applied"""
+        async def scenario(server):
+            reader, writer, session_id = await connect(server)
+            state = await read_reply(reader, "board")
+            assert len(state["board"]) == server.sessions[session_id] \
+                .engine.grid.rows
+            assert state["score"] == 0
+            
+            writer.write(b"drop\n")
+            while (await read_reply(reader, "score"))["score"] == 0:
+                pass
+            assert server.sessions[session_id].engine.score > 0
+            writer.close()
+        run(scenario)
+    
+    def test_stats_and_errors(self):
+        """Stats describe the server; bad requests get an error line"""
+        async def scenario(server):
+            reader, writer, _ = await connect(server)
+            await connect(server)
+            writer.write(b"stats\n")
+            stats = (await read_reply(reader, "stats"))["stats"]
+            assert stats["sessions"] == 2
+            assert stats["ticks"] >= 0
+            assert 0 <= stats["p50_tick_ms"] <= stats["max_tick_ms"]
+            
+            writer.write(b"jump\n")
+            assert "jump" in (await read_reply(reader, "error"))["error"]
+            writer.write(b"watch 99\n")
+            assert (await read_reply(reader, "error"))
+        run(scenario)
+    
+    def test_watch_follows_the_game(self):
+        """A spectator rebuilds the watched board from the delta stream"""
+        async def scenario(server):
+            _, player, session_id = await connect(server)
+            reader, watcher, _ = await connect(server)
+            watcher.write(f"watch {session_id}\n".encode())
+            assert (await read_reply(reader, "watching"))["watching"] \
+                == session_id
+            assert len(server.sessions) == 1
+            
+            engine = server.sessions[session_id].engine
+            view = SpectatorView()
+            for _ in range(6):
+                player.write(b"drop\n")
+            while view.score == 0 or view.tick < 0:
+                header = await reader.readexactly(FRAME_LENGTH.size)
+                (length,) = FRAME_LENGTH.unpack(header)
+                view.apply(await reader.readexactly(length))
+            assert view.synced
+            assert (view.rows, view.cols) == (engine.grid.rows,
+                                              engine.grid.cols)
+        run(scenario)
+    
+    def test_disconnect_removes_session(self):
+        """A client that quits leaves no session behind"""
+        async def scenario(server):
+            _, writer, session_id = await connect(server)
+            writer.write(b"quit\n")
+            await writer.drain()
+            while session_id in server.sessions:
+                await asyncio.sleep(0.01)
+        run(scenario)
+
+
+class TestGameSession:
+    def test_full_queue_rejects_new_inputs(self):
+        """A flooding client loses its newest inputs, not queued ones"""
+        session = GameSession(0, FakeWriter())
+        actions = ["left", "rotate"] * MAX_QUEUED_INPUTS
+        accepted = [session.queue_input(action) for action in actions]
+        assert accepted == ([True] * MAX_QUEUED_INPUTS
+                            + [False] * MAX_QUEUED_INPUTS)
+        assert list(session.inputs) == actions[:MAX_QUEUED_INPUTS]
+        assert session.dropped_inputs == MAX_QUEUED_INPUTS
+        
+        session.apply_inputs()
+        assert session.queue_input("drop")
+    
+    def test_slow_client_keeps_update_pending(self):
+        """No state is written while the client's buffer is full"""
+        writer = FakeWriter()
+        session = GameSession(0, writer)
+        writer.transport.buffered = MAX_WRITE_BUFFER
+        session.tick(16)
+        assert session.dirty and not writer.data
+        writer.transport.buffered = 0
+        session.tick(16)
+        assert not session.dirty
+        assert json.loads(writer.data)["score"] == 0
+    
+    def test_slow_spectator_resyncs(self):
+        """Frames dropped for a slow spectator are replaced by a resync"""
+        session = GameSession(0, FakeWriter())
+        slow, fast = FakeWriter(), FakeWriter()
+        session.add_spectator(slow)
+        session.add_spectator(fast)
+        engine = session.engine
+        
+        for tick in range(40):
+            slow.transport.buffered = MAX_WRITE_BUFFER if tick < 30 else 0
+            if tick % 3 == 0 and not engine.game_over:
+                engine.hard_drop()
+            if tick == 29:
+                # Frames for the slow viewer were skipped meanwhile
+                assert session.spectators[slow]
+                missed = len(frames(slow.data))
+            session.tick(16)
+        
+        assert not session.spectators[slow]
+        assert len(frames(slow.data)) > missed
+        expected = view_state(full_view(engine))
+        assert view_state(spectator_view(frames(fast.data))) == expected
+        assert view_state(spectator_view(frames(slow.data))) == expected
+    
+    def test_spectators_closed_with_session(self):
+        """Spectators of a session are kept in sync only while watching"""
+        session = GameSession(0, FakeWriter())
+        viewer = FakeWriter()
+        session.add_spectator(viewer)
+        session.tick(16)
+        del session.spectators[viewer]
+        written = len(viewer.data)
+        session.engine.hard_drop()
+        session.tick(16)
+        assert len(viewer.data) == written
@@ -0,0 +1,104 @@
+"""
+Unit Tests for Game Snapshots
+=============================
+
+These tests verify that ``save_state`` / ``load_state`` restore a game
+exactly: a restored game must continue identically to the original,
+pieces, random numbers and all.
+
+To run: pytest tests/test_snapshot.py -v
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.engine import GameEngine  # noqa: E402
+from src import snapshot  # noqa: E402
+
+
+def play(engine, rng, ticks):
+    """Random input for a number of ticks."""
+    for _ in range(ticks):
+        action = rng.random()
+        if action < 0.2:
+            engine.move(rng.choice((-1, 1)))
+        elif action < 0.3:
+            engine.rotate()
+        elif action < 0.33:
+            engine.hard_drop()
+        engine.update(rng.choice((16, 17, 150)))
+        if engine.game_over:
+            engine.reset_game()
+
+
+def state(engine):
+    """Everything that decides how a game continues."""
+    pieces = [(piece.shape_type, piece.color, piece.x, piece.y,
+               piece.rotation, piece.shape)
+              for piece in (engine.current_piece, engine.next_piece)]
+    return (bytes(engine.grid.cells), engine.grid.row_masks,
+            engine.grid.top, pieces, engine.score, engine.level,
+            engine.lines_cleared, engine.fall_time, engine.fall_speed,
+            engine.paused, engine.game_over, engine.rng.getstate())
+
+
+class TestSnapshot:
+    @pytest.mark.parametrize("rows,cols", [(16, 10), (24, 7), (40, 64)])
+    def test_round_trip(self, rows, cols):
+        """Saving a loaded snapshot gives the same bytes"""
+        engine = GameEngine(rows, cols, seed=rows)
+        play(engine, random.Random(rows), 800)
+        data = snapshot.save_state(engine)
+        restored = snapshot.load_state(data)
+        assert state(restored) == state(engine)
+        assert snapshot.save_state(restored) == data
+    
+    def test_restored_game_continues_identically(self):
+        """Original and restored game stay equal tick by tick"""
+        engine = GameEngine(16, 10, seed=11)
+        play(engine, random.Random(1), 500)
+        restored = snapshot.load_state(snapshot.save_state(engine))
+        first, second = random.Random(2), random.Random(2)
+        for _ in range(1000):
+            play(engine, first, 1)
+            play(restored, second, 1)
+            assert state(restored) == state(engine)
+    
+    def test_load_into_existing_engine(self):
+        """An engine of another size is resized and overwritten"""
+        engine = GameEngine(16, 10, seed=5)
+        play(engine, random.Random(5), 300)
+        data = snapshot.save_state(engine)
+        target = GameEngine(20, 12, seed=99)
+        assert snapshot.load_state(data, target) is target
+        assert state(target) == state(engine)
+    
+    def test_board_view(self):
+        """The board view is the engine's packed cells"""
+        engine = GameEngine(16, 10, seed=6)
+        play(engine, random.Random(6), 400)
+        view = snapshot.board_view(snapshot.save_state(engine))
+        assert view.shape == (16, 10)
+        assert view.tobytes() == bytes(engine.grid.cells)
+    
+    def test_file_round_trip(self, tmp_path):
+        """Snapshots survive a trip through a file"""
+        engine = GameEngine(16, 10, seed=7)
+        play(engine, random.Random(7), 200)
+        path = str(tmp_path / "game.snap")
+        snapshot.save_file(engine, path)
+        assert state(snapshot.load_file(path)) == state(engine)
+    
+    def test_rejects_bad_data(self):
+        """Truncated, foreign or mismatched data raises ValueError"""
+        data = snapshot.save_state(GameEngine(16, 10, seed=8))
+        with pytest.raises(ValueError):
+            snapshot.load_state(data[:10])
+        with pytest.raises(ValueError):
+            snapshot.load_state(b"XXXX" + data[4:])
+        with pytest.raises(ValueError):
+            snapshot.load_state(data[:-1])
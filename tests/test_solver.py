@@ -0,0 +1,153 @@
+"""
+Unit Tests for the Perfect Clear Solver
+=======================================
+
+These tests replay every placement sequence the solver returns through
+GameEngine.place and check that the board really ends up empty, that
+boards which cannot be cleared by counting or parity are rejected
+without searching, that the pruning never loses a solution, and that
+the time budget and node limit return the best partial sequence.
+
+To run: pytest tests/test_solver.py -v
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.engine import GameEngine  # noqa: E402
+from src.solver import (  # noqa: E402
+    PerfectClearSolver, solve_engine, _CLOCK_INTERVAL,
+)
+from src.tetromino import Tetromino  # noqa: E402
+
+# Shape types, in Config.SHAPES order
+I, O, T, Z, S, L, J = range(7)
+
+
+def replay(engine, queue, placements):
+    """Play placements, feeding the queue as the next pieces."""
+    for index, (rotation, x) in enumerate(placements):
+        assert engine.place(rotation, x)
+        if index < len(queue):
+            engine.next_piece = Tetromino(queue[index], engine.grid.cols)
+
+
+def filled_cells(engine):
+    """Number of filled cells on the engine's board."""
+    return sum(bin(mask).count("1") for mask in engine.grid.row_masks)
+
+
+def clears_without_pruning(solver, board):
+    """Try every placement sequence; True if one empties the board."""
+    def search(board, index):
+        if not board:
+            return True
+        if index == len(solver.moves):
+            return False
+        for _, _, shifted in solver.moves[index]:
+            result = solver._drop(board, shifted)
+            if result is not None and search(result, index + 1):
+                return True
+        return False
+    return search(tuple(board), 0)
+
+
+class TestSolutions:
+    @pytest.mark.parametrize("seed", range(12))
+    @pytest.mark.parametrize("prefix", [0, 1])
+    def test_small_boards_replay(self, seed, prefix):
+        """Solutions clear the board; partial results leave what they say"""
+        rng = random.Random(seed)
+        engine = GameEngine(8, 4, seed=seed)
+        for _ in range(prefix):
+            engine.place(*rng.choice(engine.get_placements())[:2])
+        queue = [rng.randrange(7) for _ in range(6)]
+        result = solve_engine(engine, queue, max_height=4)
+        assert not result.timed_out
+        replay(engine, queue, result.placements)
+        assert filled_cells(engine) == result.remaining_cells
+        assert result.solved == (result.remaining_cells == 0
+                                 and bool(result.placements))
+    
+    @pytest.mark.parametrize("seed", [2, 8])
+    def test_full_width_solution_replays(self, seed):
+        """A 10-wide perfect clear found by the solver empties the board"""
+        rng = random.Random(seed)
+        queue = [rng.randrange(7) for _ in range(10)]
+        engine = GameEngine(seed=seed)
+        result = solve_engine(engine, queue, time_budget=30)
+        assert result.solved
+        replay(engine, queue, result.placements)
+        assert not any(engine.grid.row_masks)
+        assert not engine.game_over
+
+
+class TestPruning:
+    def test_cell_count_rejected_without_search(self):
+        """No height leaves a multiple of 4 empty cells: nothing is searched"""
+        result = PerfectClearSolver(6, [I, O, T]).solve([0b000111],
+                                                        max_height=2)
+        assert not result.solved
+        assert result.nodes == 0
+        assert result.placements == []
+    
+    def test_parity_rejected_without_search(self):
+        """An L changes column parity by 2, O by 0: only the root is seen"""
+        solver = PerfectClearSolver(6, [L, O, O])
+        result = solver.solve([], max_height=2)
+        assert not result.solved
+        assert result.nodes == 1
+        assert not clears_without_pruning(solver, (0, 0))
+    
+    def test_pruning_keeps_every_solution(self):
+        """The solver clears exactly the boards an exhaustive search does"""
+        rng = random.Random(7)
+        checked = 0
+        while checked < 150:
+            height = rng.choice([2, 3])
+            board = [rng.randrange(16) for _ in range(height)]
+            empty = height * 4 - sum(bin(mask).count("1") for mask in board)
+            if not board[0] or 15 in board or empty % 4:
+                continue
+            pieces = [rng.randrange(7) for _ in range(empty // 4)]
+            solver = PerfectClearSolver(4, pieces)
+            result = solver.solve(board, max_height=height)
+            assert result.solved == clears_without_pruning(solver, board)
+            checked += 1
+
+
+class TestBudget:
+    def test_node_limit_returns_best_partial(self):
+        """Hitting the node limit returns a playable partial sequence"""
+        rng = random.Random(0)
+        queue = [rng.randrange(7) for _ in range(10)]
+        engine = GameEngine(seed=0)
+        result = solve_engine(engine, queue, time_budget=30, node_limit=50)
+        assert result.timed_out and not result.solved
+        assert result.nodes == 50
+        assert result.placements
+        replay(engine, queue, result.placements)
+        assert filled_cells(engine) == result.remaining_cells
+    
+    def test_node_limit_not_reached(self):
+        """A search that finishes under the limit is not cut off"""
+        engine = GameEngine(8, 4, seed=2)
+        queue = [O, O, I]
+        result = solve_engine(engine, queue, node_limit=1000)
+        assert not result.timed_out
+        assert result.nodes < 1000
+    
+    def test_time_budget_returns_best_partial(self):
+        """An exhausted time budget stops at the next clock check"""
+        rng = random.Random(0)
+        queue = [rng.randrange(7) for _ in range(10)]
+        engine = GameEngine(seed=0)
+        result = solve_engine(engine, queue, time_budget=0)
+        assert result.timed_out and not result.solved
+        assert result.nodes == _CLOCK_INTERVAL
+        replay(engine, queue, result.placements)
+        assert filled_cells(engine) == result.remaining_cells
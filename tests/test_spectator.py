@@ -0,0 +1,126 @@
+"""
+Unit Tests for the Spectator Stream
+===================================
+
+These tests verify that a SpectatorView fed delta frames ends up with
+exactly the board, piece and HUD a full keyframe of the same tick
+would give, through random play, line clears and game over.
+
+To run: pytest tests/test_spectator.py -v
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.engine import GameEngine  # noqa: E402
+from src.spectator import (  # noqa: E402
+    DeltaEncoder, SpectatorFeed, SpectatorView, FLAG_KEYFRAME,
+)
+
+
+def full_frame(engine):
+    """A view built from a single keyframe of the engine's state."""
+    view = SpectatorView()
+    view.apply(DeltaEncoder().encode(engine))
+    return view
+
+
+def view_state(view):
+    """Everything a viewer can see."""
+    return ([bytes(row) for row in view.board], view.row_masks, view.piece,
+            view.score, view.level, view.lines, view.game_over)
+
+
+def play(engine, rng):
+    """One tick of random input."""
+    action = rng.random()
+    if action < 0.2:
+        engine.move(rng.choice((-1, 1)))
+    elif action < 0.3:
+        engine.rotate()
+    elif action < 0.35:
+        engine.hard_drop()
+    engine.update(rng.choice((16, 17, 200)))
+
+
+class TestSpectator:
+    @pytest.mark.parametrize("rows,cols,interval",
+                             [(16, 10, 1000), (20, 13, 7), (8, 4, 1000)])
+    def test_deltas_match_full_frames(self, rows, cols, interval):
+        """Deltas rebuild the same state as a keyframe every tick"""
+        rng = random.Random(rows * cols)
+        engine = GameEngine(rows, cols, seed=1)
+        encoder = DeltaEncoder(interval)
+        view = SpectatorView()
+        games = 0
+        for _ in range(3000):
+            play(engine, rng)
+            frame = encoder.encode(engine)
+            if frame is not None:
+                assert view.apply(frame)
+            assert view_state(view) == view_state(full_frame(engine))
+            if engine.game_over:
+                games += 1
+                engine.reset_game()
+        assert games
+    
+    def test_board_matches_engine(self):
+        """The reconstructed board is the engine's packed cells"""
+        rng = random.Random(5)
+        engine = GameEngine(16, 10, seed=2)
+        encoder = DeltaEncoder(1000)
+        view = SpectatorView()
+        for _ in range(1500):
+            play(engine, rng)
+            frame = encoder.encode(engine)
+            if frame is not None:
+                view.apply(frame)
+            assert b"".join(bytes(row) for row in view.board) == (
+                bytes(engine.grid.cells)
+            )
+            assert (view.score, view.lines) == (
+                engine.score, engine.lines_cleared
+            )
+            if engine.game_over:
+                engine.reset_game()
+    
+    def test_late_joiner_catches_up(self):
+        """Keyframe plus backlog reach the live viewer's state"""
+        rng = random.Random(9)
+        engine = GameEngine(16, 10, seed=3)
+        feed = SpectatorFeed(keyframe_interval=50)
+        live = SpectatorView()
+        for tick in range(400):
+            play(engine, rng)
+            frame = feed.publish(engine)
+            if frame is not None:
+                live.apply(frame)
+            if tick % 37 == 0:
+                backlog = feed.catch_up()
+                assert backlog[0][0] & FLAG_KEYFRAME
+                late = SpectatorView()
+                for frame in backlog:
+                    late.apply(frame)
+                assert view_state(late) == view_state(live)
+            if engine.game_over:
+                engine.reset_game()
+    
+    def test_waits_for_keyframe(self):
+        """Deltas before the first keyframe are skipped"""
+        engine = GameEngine(16, 10, seed=4)
+        encoder = DeltaEncoder(1000)
+        encoder.encode(engine)
+        engine.move(1)
+        delta = encoder.encode(engine)
+        assert not SpectatorView().apply(delta)
+    
+    def test_unchanged_state_sends_nothing(self):
+        """A tick that changes nothing produces no frame"""
+        engine = GameEngine(16, 10, seed=4)
+        encoder = DeltaEncoder(1000)
+        assert encoder.encode(engine) is not None
+        assert encoder.encode(engine) is None
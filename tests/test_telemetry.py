@@ -0,0 +1,199 @@
+"""
+Unit Tests for Telemetry
+========================
+
+These tests verify that events come back from both file formats as they
+were recorded, that the ring buffer counts the events it had to drop
+when the writer falls behind (including while a concurrent producer
+keeps writing), that files rotate and old ones are deleted, that close()
+writes everything, and that per-second timing summaries count frames
+from another thread exactly.
+
+To run: pytest tests/test_telemetry.py -v
+"""
+
+import sys
+import os
+import glob
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src import telemetry  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.telemetry import Telemetry, read_events  # noqa: E402
+
+# Writer interval long enough that only explicit flushes write
+NEVER = 3600
+
+
+def events(directory):
+    """Every event in a directory's files, oldest file first."""
+    paths = sorted(glob.glob(os.path.join(directory, "telemetry_*")))
+    return [event for path in paths for event in read_events(path)]
+
+
+def end_window(recorder):
+    """Make the next tick() close the timing window."""
+    recorder._window_start -= 2_000_000_000
+
+
+class TestRecording:
+    @pytest.mark.parametrize("fmt", telemetry.FORMATS)
+    def test_round_trip(self, tmp_path, fmt):
+        """Both formats read back the recorded fields"""
+        recorder = Telemetry(str(tmp_path), fmt, flush_interval=NEVER)
+        recorder.rows_cleared(4, 800, 12, 2400)
+        recorder.level_up(2, 450, 12)
+        recorder.game_over(2400, 2, 12, quit=True)
+        recorder.close()
+        
+        read = events(str(tmp_path))
+        assert [event["event"] for event in read] == [
+            "clear", "level_up", "game_over"
+        ]
+        assert read[0]["type"] == "tetris" and read[0]["score"] == 2400
+        assert read[1]["fall_speed"] == 450
+        assert read[2]["quit"] is True
+        assert recorder.written == 3 and recorder.dropped == 0
+    
+    def test_engine_events(self, tmp_path):
+        """Every piece spawns and locks; the last lock ends the game"""
+        recorder = Telemetry(str(tmp_path), flush_interval=NEVER)
+        engine = GameEngine(seed=1, telemetry=recorder)
+        locks = 0
+        while not engine.game_over:
+            engine.hard_drop()
+            locks += 1
+        recorder.close()
+        names = [event["event"] for event in events(str(tmp_path))]
+        assert names == ["spawn", "lock"] * locks + ["game_over"]
+    
+    def test_close_flushes_and_is_repeatable(self, tmp_path):
+        """Events recorded before close() are written, even without a flush"""
+        recorder = Telemetry(str(tmp_path), flush_interval=NEVER)
+        for level in range(5):
+            recorder.level_up(level, 500, level)
+        recorder.close()
+        recorder.close()
+        assert [event["level"] for event in events(str(tmp_path))] == \
+            list(range(5))
+        assert not recorder._thread.is_alive()
+
+
+class TestRingBuffer:
+    def test_wraparound_in_order(self, tmp_path):
+        """Batches that wrap past the end of the ring keep their order"""
+        recorder = Telemetry(str(tmp_path), "bin", capacity=8,
+                             flush_interval=NEVER)
+        for level in range(5):
+            recorder.level_up(level, 0, 0)
+        recorder.flush()
+        for level in range(5, 12):
+            recorder.level_up(level, 0, 0)
+        recorder.close()
+        assert [event["level"] for event in events(str(tmp_path))] == \
+            list(range(12))
+        assert recorder.dropped == 0
+    
+    def test_overflow_counts_dropped(self, tmp_path):
+        """A writer a whole ring behind keeps the newest events"""
+        recorder = Telemetry(str(tmp_path), "bin", capacity=8,
+                             flush_interval=NEVER)
+        for level in range(20):
+            recorder.level_up(level, 0, 0)
+        recorder.close()
+        assert recorder.dropped == 12 and recorder.written == 8
+        assert [event["level"] for event in events(str(tmp_path))] == \
+            list(range(12, 20))
+    
+    def test_concurrent_writer_never_tears_records(self, tmp_path):
+        """Written events are whole and ordered; the rest are counted"""
+        recorder = Telemetry(str(tmp_path), "bin", capacity=64,
+                             flush_interval=0.0005)
+        total = 50000
+        for level in range(total):
+            recorder.level_up(level, level * 2, level * 3)
+        recorder.close()
+        
+        read = events(str(tmp_path))
+        levels = [event["level"] for event in read]
+        assert levels == sorted(set(levels))
+        assert all(event["fall_speed"] == event["level"] * 2
+                   and event["lines"] == event["level"] * 3
+                   for event in read)
+        assert recorder.written == len(read)
+        assert recorder.written + recorder.dropped == total
+
+
+class TestRotation:
+    @pytest.mark.parametrize("fmt", telemetry.FORMATS)
+    def test_files_rotate_and_old_ones_are_deleted(self, tmp_path, fmt):
+        """Full files are closed and only the newest max_files are kept"""
+        recorder = Telemetry(str(tmp_path), fmt, session="s",
+                             flush_interval=NEVER, max_bytes=300,
+                             max_files=3)
+        for level in range(60):
+            recorder.level_up(level, 0, 0)
+            recorder.flush()
+        recorder.close()
+        
+        paths = sorted(glob.glob(os.path.join(str(tmp_path), "*")))
+        assert len(paths) == 3
+        assert paths[-1].endswith(f"telemetry_s_{recorder._file_index:05d}"
+                                  f".{fmt}")
+        assert recorder._file_index > 3
+        # Every file but the newest stopped growing once it was full
+        assert all(os.path.getsize(path) >= 300 for path in paths[:-1])
+        levels = [event["level"] for event in events(str(tmp_path))]
+        assert levels == list(range(60 - len(levels), 60))
+
+
+class TestTiming:
+    def test_window_summary(self, tmp_path):
+        """Each window reports its own ticks and frames"""
+        recorder = Telemetry(str(tmp_path), flush_interval=NEVER)
+        for duration in (4000, 8000, 6000):
+            recorder.frame(duration)
+        recorder.tick(2000)
+        end_window(recorder)
+        recorder.tick(4000)
+        recorder.frame(1000)
+        end_window(recorder)
+        recorder.tick(3000)
+        recorder.close()
+        
+        first, second = [event for event in events(str(tmp_path))
+                         if event["event"] == "ticks"]
+        assert (first["ticks"], first["tick_mean_us"], first["tick_max_us"]) \
+            == (2, 3, 4)
+        assert (first["frames"], first["frame_mean_us"],
+                first["frame_max_us"]) == (3, 6, 8)
+        assert (second["ticks"], second["frames"], second["frame_max_us"]) \
+            == (1, 1, 1)
+    
+    def test_frames_from_render_thread_are_all_counted(self, tmp_path):
+        """Windows closing during frame() lose and double-count nothing"""
+        recorder = Telemetry(str(tmp_path), flush_interval=NEVER,
+                             capacity=1 << 16)
+        total = 200000
+        
+        def render():
+            for _ in range(total):
+                recorder.frame(1000)
+        thread = threading.Thread(target=render)
+        thread.start()
+        while thread.is_alive():
+            end_window(recorder)
+            recorder.tick(1000)
+        thread.join()
+        end_window(recorder)
+        recorder.tick(1000)
+        recorder.close()
+        
+        summaries = [event for event in events(str(tmp_path))
+                     if event["event"] == "ticks"]
+        assert sum(event["frames"] for event in summaries) == total
+        assert all(event["frame_mean_us"] == 1 for event in summaries
+                   if event["frames"])
@@ -0,0 +1,158 @@
+"""
+Unit Tests for the Terminal Renderer
+====================================
+
+These tests feed the renderer's output into a small terminal emulator
+(cursor moves, colors and characters) and check that a screen updated
+frame by frame with diffs always looks exactly like a full repaint of
+the same game, that unchanged frames send nothing, and that a spectator
+view is drawn like the game it follows.
+
+To run: pytest tests/test_terminal.py -v
+"""
+
+import sys
+import os
+import io
+import re
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.spectator import DeltaEncoder, SpectatorView  # noqa: E402
+from src.terminal import (  # noqa: E402
+    CLEAR, DEFAULT, PLAY_HELP, TerminalRenderer,
+)
+
+# Cursor moves and color changes, the only escapes present() sends
+ESCAPE = re.compile(r"\x1b\[(\d+);(\d+)H|(\x1b\[[0-9;]*m)")
+
+
+class Screen:
+    """Terminal emulator that understands what present() writes."""
+    
+    def __init__(self):
+        self.cells = {}
+        self.row = self.col = 0
+        self.style = DEFAULT
+    
+    def feed(self, data):
+        """Apply a chunk of output."""
+        text = data.decode("utf-8")
+        if text.startswith(CLEAR):
+            self.cells.clear()
+            text = text[len(CLEAR):]
+        position = 0
+        for match in ESCAPE.finditer(text):
+            self._write(text[position:match.start()])
+            if match.group(3):
+                self.style = match.group(3)
+            else:
+                self.row = int(match.group(1)) - 1
+                self.col = int(match.group(2)) - 1
+            position = match.end()
+        self._write(text[position:])
+    
+    def _write(self, text):
+        """Put characters at the cursor and move it along."""
+        for char in text:
+            self.cells[self.row, self.col] = (char, self.style)
+            self.col += 1
+    
+    def text(self, width, height):
+        """Visible cells, blanks where nothing was written."""
+        return [[self.cells.get((row, col), (" ", DEFAULT))
+                 for col in range(width)] for row in range(height)]
+
+
+class Output(io.BytesIO):
+    """Binary stream that also feeds a Screen."""
+    
+    def __init__(self):
+        super().__init__()
+        self.screen = Screen()
+    
+    def write(self, data):
+        self.screen.feed(data)
+        return super().write(data)
+
+
+def repaint(source, title="TETRIS", footer=PLAY_HELP):
+    """What a fresh renderer shows for a source (a full repaint)."""
+    out = Output()
+    renderer = TerminalRenderer(out)
+    renderer.render(source, title, footer)
+    return out.screen.text(renderer.width, renderer.height)
+
+
+class TestTerminalRenderer:
+    @pytest.mark.parametrize("color", [True, False])
+    def test_diffs_match_full_repaint(self, color):
+        """After every frame the diffed screen equals a full repaint"""
+        out = Output()
+        renderer = TerminalRenderer(out, color)
+        engine = GameEngine(12, 8, seed=4)
+        player = AutoPlayer()
+        frames = 0
+        while not engine.game_over and frames < 300:
+            if frames % 4 == 0:
+                engine.move(1 if frames % 8 else -1)
+            elif frames % 4 == 1:
+                engine.rotate()
+            elif frames % 16 == 2:
+                engine.place(*player.choose(engine))
+            engine.update(120)
+            renderer.render(engine, "TETRIS", PLAY_HELP)
+            frames += 1
+            
+            full = Output()
+            TerminalRenderer(full, color).render(engine, "TETRIS", PLAY_HELP)
+            assert out.screen.text(renderer.width, renderer.height) == \
+                full.screen.text(renderer.width, renderer.height)
+        assert engine.lines_cleared > 0
+    
+    def test_unchanged_frame_sends_nothing(self):
+        """A frame identical to the last one writes no bytes"""
+        out = Output()
+        renderer = TerminalRenderer(out)
+        engine = GameEngine(seed=1)
+        first = renderer.render(engine)
+        assert first > 0
+        written = len(out.getvalue())
+        assert renderer.render(engine) == 0
+        assert len(out.getvalue()) == written
+        
+        # A move only resends a few cells
+        engine.move(1)
+        assert 0 < renderer.render(engine) < first // 4
+    
+    def test_invalidate_repaints(self):
+        """After invalidate() the whole frame is sent again"""
+        out = Output()
+        renderer = TerminalRenderer(out)
+        engine = GameEngine(seed=1)
+        first = renderer.render(engine)
+        renderer.invalidate()
+        assert renderer.render(engine) == first
+    
+    def test_spectator_view_looks_like_the_game(self):
+        """A synced spectator is drawn like the game it watches"""
+        engine = GameEngine(seed=6)
+        player = AutoPlayer()
+        encoder = DeltaEncoder()
+        view = SpectatorView()
+        for _ in range(25):
+            engine.place(*player.choose(engine))
+            engine.move(-1)
+            view.apply(encoder.encode(engine))
+            assert repaint(view) == repaint(engine)
+    
+    def test_clipping(self):
+        """Text past the frame edge is cut off, not wrapped"""
+        renderer = TerminalRenderer(Output())
+        renderer.begin(5, 2)
+        renderer.put(0, 3, "abcdef")
+        renderer.put(5, 0, "ignored")
+        assert renderer._chars == list("   ab") + [" "] * 5
@@ -0,0 +1,120 @@
+"""
+Unit Tests for Scaled Screens
+=============================
+
+These tests verify that the menus keep working when the logical
+screen is scaled and letterboxed into a window of another size:
+mouse clicks must land on what is drawn under them.
+
+To run: pytest tests/test_ui.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+
+from src.config import Config  # noqa: E402
+from src.display import Layout, SCALE_CACHE_SIZE  # noqa: E402
+from src.game import TetrisGame  # noqa: E402
+from src.leaderboard import Leaderboard  # noqa: E402
+from src.ui import NameInput  # noqa: E402
+
+# Window sizes with bars left/right, bars top/bottom, and a smaller one
+WINDOW_SIZES = [(1920, 1080), (1000, 1000), (400, 300)]
+
+
+def click(position):
+    """A left mouse click at a window position."""
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=position, button=1)
+
+
+def key(code, text=""):
+    """A key press."""
+    return pygame.event.Event(pygame.KEYDOWN, key=code, unicode=text)
+
+
+@pytest.fixture
+def game():
+    """A game in a resizable window, with its scores kept in memory."""
+    leaderboard = Leaderboard(":memory:")
+    tetris = TetrisGame(leaderboard=leaderboard, resizable=True)
+    yield tetris
+    leaderboard.close()
+    pygame.display.quit()
+
+
+class TestLayout:
+    @pytest.mark.parametrize("size", WINDOW_SIZES)
+    def test_to_logical_inverts_point(self, size):
+        """Window positions map back to the logical points drawn there"""
+        layout = Layout(size)
+        for x, y in [(0, 0), (123, 456), (Config.SCREEN_WIDTH - 1,
+                                           Config.SCREEN_HEIGHT - 1)]:
+            window_x, window_y = layout.point(x + 0.5, y + 0.5)
+            logical = layout.to_logical(window_x, window_y)
+            if layout.scale >= 1:
+                assert logical == (x, y)
+            else:
+                # Several logical pixels share one window pixel
+                assert abs(logical[0] - x) <= 1 / layout.scale
+                assert abs(logical[1] - y) <= 1 / layout.scale
+    
+    def test_bars_are_outside_the_screen(self):
+        """Clicks on the letterbox bars map outside the logical screen"""
+        layout = Layout((1920, 1080))
+        x, y = layout.to_logical(5, 540)
+        assert x < 0
+        assert not pygame.Rect(0, 0, Config.SCREEN_WIDTH,
+                               Config.SCREEN_HEIGHT).collidepoint(x, y)
+
+
+class TestNameInput:
+    @pytest.mark.parametrize("size", WINDOW_SIZES)
+    def test_click_on_scaled_box_activates(self, size):
+        """Clicking where the box is shown activates it"""
+        layout = Layout(size)
+        name_input = NameInput(lambda position: layout.to_logical(*position))
+        name_input.handle_event(click(layout.point(*name_input.box.center)))
+        assert name_input.active
+        name_input.handle_event(key(pygame.K_a, "a"))
+        assert name_input.text == "a"
+        
+        # Where the box would be in an unscaled window is elsewhere now
+        name_input.handle_event(click(layout.point(0, 0)))
+        assert not name_input.active
+    
+    def test_unscaled_box(self):
+        """Without a mapping, window and screen coordinates are equal"""
+        name_input = NameInput()
+        name_input.handle_event(click(name_input.box.center))
+        assert name_input.active
+        name_input.handle_event(click((0, 0)))
+        assert not name_input.active
+
+
+class TestResizableGame:
+    def test_login_box_in_resized_window(self, game):
+        """The game maps clicks through the current window layout"""
+        game.window = pygame.display.set_mode((1280, 960), pygame.RESIZABLE)
+        game.resize()
+        name_input = NameInput(game.ui.to_screen)
+        layout = Layout(game.window.get_size())
+        name_input.handle_event(click(layout.point(*name_input.box.center)))
+        assert name_input.active
+    
+    def test_scale_caches_are_bounded(self, game):
+        """Dragging through many sizes keeps only a few scale caches"""
+        renderer = game.scaled_renderer
+        for width in range(400, 1600, 25):
+            renderer.resize((width, width * 3 // 4))
+        assert len(renderer._caches) <= SCALE_CACHE_SIZE
+        
+        # The most recent scales are kept and reused
+        current = renderer._cache
+        renderer.resize((1200, 700))
+        renderer.resize((width, width * 3 // 4))
+        assert renderer._cache is current
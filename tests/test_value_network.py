@@ -0,0 +1,141 @@
+"""
+Unit Tests for the Value Network
+================================
+
+These tests verify that the batched candidate boards are exactly the
+placements GameEngine.get_placements lists and the boards GameEngine
+really produces (line clears included), that the board features match
+a cell-by-cell count, that a batched forward pass scores every board
+like a single one, and that saved networks load back unchanged.
+
+To run: pytest tests/test_value_network.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy  # noqa: E402
+import pytest  # noqa: E402
+
+from src import snapshot  # noqa: E402
+from src.autoplayer import AutoPlayer  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.value_network import (  # noqa: E402
+    NetworkPlayer, ValueNetwork, board_features, candidate_boards,
+    distill, grid_boards, input_size,
+)
+
+
+def occupancy(grid):
+    """0/1 array of a grid's cells."""
+    return numpy.array([[1 if cell else 0 for cell in row]
+                        for row in grid.grid], numpy.uint8)
+
+
+def positions(rows, cols, seed, count):
+    """Engines at successive decisions of an AutoPlayer game."""
+    engine = GameEngine(rows, cols, seed=seed)
+    player = AutoPlayer()
+    for _ in range(count):
+        if engine.game_over:
+            return
+        yield engine
+        engine.place(*player.choose(engine))
+
+
+class TestCandidateBoards:
+    @pytest.mark.parametrize("rows,cols,seed", [
+        (20, 10, 1), (8, 4, 2), (12, 6, 3), (16, 17, 4),
+    ])
+    def test_matches_real_placements(self, rows, cols, seed):
+        """Placements, boards and cleared rows equal GameEngine's"""
+        cleared = 0
+        for engine in positions(rows, cols, seed, 60):
+            placements, boards, lines = candidate_boards(engine)
+            assert placements == engine.get_placements()
+            assert boards.shape == (len(placements), rows, cols)
+            state = snapshot.save_state(engine)
+            for (rotation, x, _), board, count in zip(placements, boards,
+                                                      lines):
+                trial = snapshot.load_state(state)
+                before = trial.lines_cleared
+                assert trial.place(rotation, x)
+                assert count == trial.lines_cleared - before
+                assert (board == occupancy(trial.grid)).all()
+                cleared += count
+        assert cleared > 0
+    
+    def test_grid_boards(self):
+        """Grids stack into the same 0/1 boards"""
+        grids = [snapshot.load_state(snapshot.save_state(engine)).grid
+                 for engine in positions(10, 6, 5, 20)]
+        boards = grid_boards(grids)
+        for grid, board in zip(grids, boards):
+            assert (board == occupancy(grid)).all()
+
+
+class TestNetwork:
+    def test_features_match_naive(self):
+        """Heights and holes equal a column-by-column count"""
+        rng = numpy.random.default_rng(0)
+        boards = (rng.random((30, 9, 5)) < 0.4).astype(numpy.uint8)
+        lines = rng.integers(0, 5, 30)
+        inputs = board_features(boards, lines)
+        assert inputs.shape == (30, input_size(9, 5))
+        for board, row, count in zip(boards, inputs, lines):
+            for x in range(5):
+                column = list(board[:, x])
+                top = column.index(1) if 1 in column else 9
+                height = 9 - top
+                holes = column[top:].count(0)
+                assert row[45 + x] == pytest.approx(height / 9)
+                assert row[50 + x] == pytest.approx(holes / 9)
+            assert (row[:45] == board.reshape(-1)).all()
+            assert row[-1] == pytest.approx(count / 4)
+    
+    def test_batch_equals_single(self):
+        """One forward pass scores each board like scoring it alone"""
+        network = ValueNetwork.create(8, 4, hidden=(16, 8), seed=1)
+        engine = GameEngine(8, 4, seed=3)
+        _, boards, lines = candidate_boards(engine)
+        batch = network.evaluate(boards, lines)
+        single = [network.evaluate(boards[i:i + 1], lines[i:i + 1])[0]
+                  for i in range(len(boards))]
+        assert batch == pytest.approx(single, rel=1e-5, abs=1e-6)
+    
+    def test_save_and_load(self, tmp_path):
+        """A saved network loads back with the same weights and size"""
+        network = ValueNetwork.create(8, 4, hidden=(5,), seed=2)
+        path = str(tmp_path / "value.npz")
+        network.save(path)
+        loaded = ValueNetwork.load(path)
+        assert (loaded.rows, loaded.cols) == (8, 4)
+        for (w, b), (w2, b2) in zip(network.layers, loaded.layers):
+            assert (w == w2).all() and (b == b2).all()
+    
+    def test_wrong_board_size(self):
+        """A network only accepts the board size it was made for"""
+        layers = ValueNetwork.create(8, 4, hidden=(5,)).layers
+        with pytest.raises(ValueError):
+            ValueNetwork(layers, 10, 4)
+    
+    def test_player_picks_highest_value(self):
+        """NetworkPlayer plays the candidate the network rates best"""
+        network = ValueNetwork.create(12, 6, hidden=(8,), seed=4)
+        player = NetworkPlayer(network)
+        for engine in positions(12, 6, 6, 15):
+            placements, boards, lines = candidate_boards(engine)
+            values = network.evaluate(boards, lines)
+            rotation, x, _ = placements[int(numpy.argmax(values))]
+            assert player(engine) == (rotation, x)
+    
+    def test_distill_lowers_loss(self):
+        """Training on the AutoPlayer's scores reduces the error"""
+        network = ValueNetwork.create(10, 6, hidden=(16,), seed=0)
+        losses = []
+        distill(network, positions=60, epochs=8, batch_size=64,
+                learning_rate=3e-3, report=losses.append)
+        first = float(losses[0].split("loss")[1].split()[0])
+        last = float(losses[-1].split("loss")[1].split()[0])
+        assert last < first
@@ -0,0 +1,141 @@
+"""
+Unit Tests for Versus Mode
+==========================
+
+These tests verify the garbage rules of versus mode: how much a clear
+sends, how sent rows cancel garbage waiting for the sender, when
+waiting garbage enters the board, and topping out.
+
+To run: pytest tests/test_versus.py -v
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import pytest  # noqa: E402
+
+from src.config import Config  # noqa: E402
+from src.engine import GameEngine  # noqa: E402
+from src.versus import Versus, play_match  # noqa: E402
+
+
+def match(seed=1, rows=16, cols=10):
+    """Two fresh games coupled by Versus."""
+    engines = [GameEngine(rows, cols, seed=seed) for _ in range(2)]
+    return Versus(engines, seed)
+
+
+def garbage_rows(engine):
+    """Number of garbage rows at the bottom of a board."""
+    grid = engine.grid
+    count = 0
+    for y in range(grid.rows - 1, -1, -1):
+        row = grid.grid[y]
+        if row.count(0) != 1 or any(
+                cell not in (0, Config.GARBAGE_COLOR) for cell in row):
+            break
+        count += 1
+    return count
+
+
+class TestVersus:
+    @pytest.mark.parametrize("rows,garbage", [(0, 0), (1, 0), (2, 1),
+                                              (3, 2), (4, 4)])
+    def test_garbage_per_clear(self, rows, garbage):
+        """Bigger clears send more garbage"""
+        assert Config.calculate_garbage(rows) == garbage
+    
+    def test_needs_two_games(self):
+        """Versus is for exactly two games"""
+        with pytest.raises(ValueError):
+            Versus([GameEngine(seed=1)])
+    
+    def test_attack_cancels_own_garbage_first(self):
+        """Sent rows first cancel garbage waiting for the sender"""
+        versus = match()
+        versus.pending[0] = 3
+        assert versus.piece_locked(0, 4) == 0
+        assert versus.pending == [0, 1]
+        assert versus.sent == [1, 0]
+    
+    def test_attack_fully_cancelled(self):
+        """An attack smaller than the queue only shrinks it"""
+        versus = match()
+        versus.pending[0] = 5
+        versus.piece_locked(0, 3)
+        assert versus.pending == [3, 0]
+        assert versus.sent == [0, 0]
+    
+    def test_garbage_waits_for_a_lock_without_clears(self):
+        """Garbage enters only when the receiver locks without clearing"""
+        versus = match()
+        versus.piece_locked(0, 4)
+        assert versus.piece_locked(1, 1) == 0
+        assert versus.pending[1] == 4
+        assert garbage_rows(versus.engines[1]) == 0
+        
+        assert versus.piece_locked(1, 0) == 4
+        assert versus.pending[1] == 0
+        assert versus.received == [0, 4]
+        assert garbage_rows(versus.engines[1]) == 4
+        grid = versus.engines[1].grid
+        assert grid.top == grid.rows - 4
+    
+    def test_simultaneous_locks_are_symmetric(self):
+        """Equal attacks at once cancel each other's queues"""
+        versus = match()
+        versus.pending = [1, 1]
+        assert versus.pieces_locked([2, 2]) == [0, 0]
+        assert versus.pending == [0, 0]
+        assert versus.sent == [0, 0]
+    
+    def test_simultaneous_attack_and_receive(self):
+        """Both attacks are resolved before anything is received"""
+        versus = match()
+        versus.pending = [2, 0]
+        assert versus.pieces_locked([4, 0]) == [0, 2]
+        assert versus.pending == [0, 0]
+        assert versus.sent == [2, 0]
+        assert versus.received == [0, 2]
+        
+        # A player who did not lock keeps their queue waiting
+        versus.pending = [0, 3]
+        assert versus.pieces_locked([0, None]) == [0, 0]
+        assert versus.pending == [0, 3]
+    
+    def test_mirrored_holes(self):
+        """Both players get the same hole columns"""
+        versus = match(seed=5)
+        holes = []
+        for player in (0, 1):
+            versus.pending[player] = 1
+            versus.piece_locked(player, 0)
+            row = versus.engines[player].grid.grid[-1]
+            holes.append(row.index(0))
+        assert holes[0] == holes[1]
+    
+    def test_topping_out_on_garbage(self):
+        """Garbage pushing blocks out of the top ends the game"""
+        versus = match(rows=8)
+        versus.engines[1].grid.set_cell(0, 7, Config.RED)
+        versus.pending[1] = 8
+        versus.piece_locked(1, 0)
+        assert versus.engines[1].game_over
+        assert not versus.engines[0].game_over
+        assert versus.result() == 1.0
+    
+    def test_result(self):
+        """Results are from player 0's point of view"""
+        versus = match()
+        assert versus.result() is None
+        versus.engines[0].game_over = True
+        assert versus.result() == 0.0
+        versus.engines[1].game_over = True
+        assert versus.result() == 0.5
+    
+    def test_play_match_is_deterministic(self):
+        """The same seed gives the same match"""
+        first = play_match(seed=3, max_pieces=60)
+        assert play_match(seed=3, max_pieces=60) == first
+        assert first[0] in (0.0, 0.5, 1.0)